@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import json
 from collections import deque
 from datetime import UTC, datetime
@@ -16,7 +15,7 @@ from sse_starlette.sse import EventSourceResponse
 
 from app.api.deps import ActorContext, require_admin_or_agent, require_org_member
 from app.core.time import utcnow
-from app.db.pagination import paginate
+from app.db.pagination import Keyset, paginate
 from app.db.session import async_session_maker, get_session
 from app.models.activity_events import ActivityEvent
 from app.models.agents import Agent
@@ -24,6 +23,7 @@ from app.models.boards import Board
 from app.models.tasks import Task
 from app.schemas.activity_events import ActivityEventRead, ActivityTaskCommentFeedItemRead
 from app.schemas.pagination import DefaultLimitOffsetPage
+from app.services.event_hub import board_topic, event_hub
 from app.services.organizations import (
     OrganizationContext,
     get_active_membership,
@@ -39,7 +39,6 @@ if TYPE_CHECKING:
 router = APIRouter(prefix="/activity", tags=["activity"])
 
 SSE_SEEN_MAX = 2000
-STREAM_POLL_SECONDS = 2
 TASK_COMMENT_ROW_LEN = 4
 SESSION_DEP = Depends(get_session)
 ACTOR_DEP = Depends(require_admin_or_agent)
@@ -184,7 +183,9 @@ async def list_activity(
                 col(ActivityEvent.task_id) == col(Task.id),
             ).where(col(Task.board_id).in_(board_ids))
     statement = statement.order_by(desc(col(ActivityEvent.created_at)))
-    return await paginate(session, statement)
+    return await paginate(
+        session, statement, keyset=Keyset(col(ActivityEvent.created_at), col(ActivityEvent.id))
+    )
 
 
 @router.get(
@@ -220,7 +221,12 @@ async def list_task_comment_feed(
         rows = _coerce_task_comment_rows(items)
         return [_feed_item(event, task, board, agent) for event, task, board, agent in rows]
 
-    return await paginate(session, statement, transformer=_transform)
+    return await paginate(
+        session,
+        statement,
+        transformer=_transform,
+        keyset=Keyset(col(ActivityEvent.created_at), col(ActivityEvent.id)),
+    )
 
 
 @router.get("/task-comments/stream")
@@ -244,42 +250,43 @@ async def stream_task_comment_feed(
     seen_ids: set[UUID] = set()
     seen_queue: deque[UUID] = deque()
 
+    watched_ids = [board_id] if board_id is not None else board_ids
+    topics = [board_topic(watched_id, "tasks") for watched_id in watched_ids]
+
     async def event_generator() -> AsyncIterator[dict[str, str]]:
         last_seen = since_dt
-        while True:
-            if await request.is_disconnected():
-                break
-            async with async_session_maker() as stream_session:
-                if board_id is not None:
-                    rows = await _fetch_task_comment_events(
-                        stream_session,
-                        last_seen,
-                        board_id=board_id,
-                    )
-                elif allowed_ids:
-                    rows = await _fetch_task_comment_events(stream_session, last_seen)
-                    rows = [row for row in rows if row[1].board_id in allowed_ids]
-                else:
-                    rows = []
-            for event, task, board, agent in rows:
-                event_id = event.id
-                if event_id in seen_ids:
-                    continue
-                seen_ids.add(event_id)
-                seen_queue.append(event_id)
-                if len(seen_queue) > SSE_SEEN_MAX:
-                    oldest = seen_queue.popleft()
-                    seen_ids.discard(oldest)
-                last_seen = max(event.created_at, last_seen)
-                payload = {
-                    "comment": _feed_item(
-                        event,
-                        task,
-                        board,
-                        agent,
-                    ).model_dump(mode="json"),
-                }
-                yield {"event": "comment", "data": json.dumps(payload)}
-            await asyncio.sleep(STREAM_POLL_SECONDS)
+        async with event_hub.subscribe(topics) as subscription:
+            while await subscription.ready(request):
+                async with async_session_maker() as stream_session:
+                    if board_id is not None:
+                        rows = await _fetch_task_comment_events(
+                            stream_session,
+                            last_seen,
+                            board_id=board_id,
+                        )
+                    elif allowed_ids:
+                        rows = await _fetch_task_comment_events(stream_session, last_seen)
+                        rows = [row for row in rows if row[1].board_id in allowed_ids]
+                    else:
+                        rows = []
+                for event, task, board, agent in rows:
+                    event_id = event.id
+                    if event_id in seen_ids:
+                        continue
+                    seen_ids.add(event_id)
+                    seen_queue.append(event_id)
+                    if len(seen_queue) > SSE_SEEN_MAX:
+                        oldest = seen_queue.popleft()
+                        seen_ids.discard(oldest)
+                    last_seen = max(event.created_at, last_seen)
+                    payload = {
+                        "comment": _feed_item(
+                            event,
+                            task,
+                            board,
+                            agent,
+                        ).model_dump(mode="json"),
+                    }
+                    yield {"event": "comment", "data": json.dumps(payload)}
 
     return EventSourceResponse(event_generator(), ping=15)
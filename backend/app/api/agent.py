@@ -9,6 +9,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import func
 from sqlmodel import SQLModel, col, select
+from sse_starlette.sse import EventSourceResponse
 
 from app.api import agents as agents_api
 from app.api import approvals as approvals_api
@@ -17,8 +18,8 @@ from app.api import board_onboarding as onboarding_api
 from app.api import tasks as tasks_api
 from app.api.deps import ActorContext, get_board_or_404, get_task_or_404
 from app.core.agent_auth import AgentAuthContext, get_agent_auth_context
-from app.db.pagination import paginate
-from app.db.session import get_session
+from app.db.pagination import Keyset, paginate
+from app.db.session import async_session_maker, get_session
 from app.models.agents import Agent
 from app.models.boards import Board
 from app.models.tags import Tag
@@ -37,6 +38,7 @@ from app.schemas.boards import BoardRead
 from app.schemas.common import OkResponse
 from app.schemas.errors import LLMErrorResponse
 from app.schemas.gateway_coordination import (
+    GatewayLeadBroadcastBoardResult,
     GatewayLeadBroadcastRequest,
     GatewayLeadBroadcastResponse,
     GatewayLeadMessageRequest,
@@ -60,7 +62,7 @@ from app.services.task_dependencies import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import AsyncIterator, Sequence
 
     from fastapi_pagination.limit_offset import LimitOffsetPage
     from sqlmodel.ext.asyncio.session import AsyncSession
@@ -319,7 +321,7 @@ async def list_boards(
     if agent_ctx.agent.board_id:
         statement = statement.where(col(Board.id) == agent_ctx.agent.board_id)
     statement = statement.order_by(col(Board.created_at).desc())
-    return await paginate(session, statement)
+    return await paginate(session, statement, keyset=Keyset(col(Board.created_at), col(Board.id)))
 
 
 @router.get(
@@ -470,7 +472,12 @@ async def list_agents(
             for agent in agents
         ]
 
-    return await paginate(session, statement, transformer=_transform)
+    return await paginate(
+        session,
+        statement,
+        transformer=_transform,
+        keyset=Keyset(col(Agent.created_at), col(Agent.id)),
+    )
 
 
 @router.get(
@@ -1888,3 +1895,102 @@ async def broadcast_gateway_lead_message(
         actor_agent=agent_ctx.agent,
         payload=payload,
     )
+
+
+@router.post(
+    "/gateway/leads/broadcast/stream",
+    tags=AGENT_MAIN_TAGS,
+    summary="Broadcast to board leads and stream per-board results",
+    description=(
+        "Same fan-out as the broadcast route, but streams each board result as a "
+        "server-sent `result` event as soon as it completes, followed by one "
+        "`summary` event carrying the GatewayLeadBroadcastResponse."
+    ),
+    operation_id="agent_main_stream_lead_broadcast",
+    openapi_extra={
+        "x-llm-intent": "lead_broadcast_streaming",
+        "x-when-to-use": [
+            "Broadcasting to many leads and acting on early per-board outcomes",
+            "Client needs progress while slow boards are still being messaged",
+        ],
+        "x-when-not-to-use": [
+            "Client cannot consume server-sent events",
+            "Single lead interaction is required",
+        ],
+        "x-required-actor": "agent_main",
+        "x-prerequisites": [
+            "Gateway-main routing identity available",
+            "GatewayLeadBroadcastRequest payload",
+        ],
+        "x-side-effects": [
+            "Creates multi-recipient dispatch",
+            "Streams per-board result events and a final summary event",
+        ],
+        "x-negative-guidance": [
+            "Do not use when a single JSON response is expected.",
+            "Do not use for consent flows requiring explicit end-user input.",
+        ],
+        "x-routing-policy": [
+            "Use instead of the broadcast route when partial results matter.",
+            "Use the plain broadcast route when only the final summary is needed.",
+        ],
+        "x-routing-policy-examples": [
+            {
+                "input": {
+                    "intent": "notify every lead and start follow-ups as each reply lands",
+                    "required_privilege": "agent_main",
+                },
+                "decision": "agent_main_stream_lead_broadcast",
+            },
+            {
+                "input": {
+                    "intent": "notify several leads and only report final counts",
+                    "required_privilege": "agent_main",
+                },
+                "decision": "agent_main_broadcast_lead_message",
+            },
+        ],
+    },
+    responses={
+        200: {"description": "Server-sent stream of per-board results"},
+        403: {
+            "model": LLMErrorResponse,
+            "description": "Caller cannot broadcast via gateway-main",
+        },
+        404: {
+            "model": LLMErrorResponse,
+            "description": "Gateway binding not found",
+        },
+        422: {
+            "model": LLMErrorResponse,
+            "description": "Gateway configuration missing or invalid",
+        },
+    },
+)
+async def stream_gateway_lead_broadcast(
+    payload: GatewayLeadBroadcastRequest,
+    session: AsyncSession = SESSION_DEP,
+    agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
+) -> EventSourceResponse:
+    """Broadcast to board leads, streaming each board result as it completes."""
+    coordination = GatewayCoordinationService(session)
+    # Lead resolution uses the request session; the stream itself only talks to
+    # the gateway and records the outcome on a fresh session at the end.
+    plan = await coordination.prepare_gateway_lead_broadcast(
+        actor_agent=agent_ctx.agent,
+        payload=payload,
+    )
+    await session.commit()
+
+    async def event_generator() -> AsyncIterator[dict[str, str]]:
+        results: list[GatewayLeadBroadcastBoardResult] = []
+        async for result in coordination.iter_gateway_lead_broadcast(plan):
+            results.append(result)
+            yield {"event": "result", "data": result.model_dump_json()}
+        async with async_session_maker() as stream_session:
+            summary = await GatewayCoordinationService(
+                stream_session,
+            ).finish_gateway_lead_broadcast(plan, results)
+        yield {"event": "summary", "data": summary.model_dump_json()}
+
+    return EventSourceResponse(event_generator(), ping=15)
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import json
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
@@ -23,7 +22,7 @@ from app.api.deps import (
 )
 from app.core.logging import get_logger
 from app.core.time import utcnow
-from app.db.pagination import paginate
+from app.db.pagination import Keyset, paginate
 from app.db.session import async_session_maker, get_session
 from app.models.agents import Agent
 from app.models.approvals import Approval
@@ -39,6 +38,7 @@ from app.services.approval_task_links import (
     replace_approval_task_links,
     task_counts_for_board,
 )
+from app.services.event_hub import board_topic, event_hub
 from app.services.openclaw.gateway_dispatch import GatewayDispatchService
 
 if TYPE_CHECKING:
@@ -52,7 +52,6 @@ if TYPE_CHECKING:
 router = APIRouter(prefix="/boards/{board_id}/approvals", tags=["approvals"])
 logger = get_logger(__name__)
 
-STREAM_POLL_SECONDS = 2
 STATUS_FILTER_QUERY = Query(default=None, alias="status")
 SINCE_QUERY = Query(default=None)
 BOARD_READ_DEP = Depends(get_board_for_actor_read)
@@ -319,7 +318,12 @@ async def list_approvals(
             approvals.append(item)
         return await _approval_reads(session, approvals)
 
-    return await paginate(session, statement.statement, transformer=_transform)
+    return await paginate(
+        session,
+        statement.statement,
+        transformer=_transform,
+        keyset=Keyset(col(Approval.created_at), col(Approval.id)),
+    )
 
 
 @router.get("/stream")
@@ -335,54 +339,52 @@ async def stream_approvals(
 
     async def event_generator() -> AsyncIterator[dict[str, str]]:
         nonlocal last_seen
-        while True:
-            if await request.is_disconnected():
-                break
-            async with async_session_maker() as session:
-                approvals = await _fetch_approval_events(session, board.id, last_seen)
-                approval_reads = await _approval_reads(session, approvals)
-                pending_approvals_count = int(
-                    (
-                        await session.exec(
-                            select(func.count(col(Approval.id)))
-                            .where(col(Approval.board_id) == board.id)
-                            .where(col(Approval.status) == "pending"),
-                        )
-                    ).one(),
-                )
-                task_ids = {
-                    task_id
-                    for approval_read in approval_reads
-                    for task_id in approval_read.task_ids
-                }
-                counts_by_task_id = await task_counts_for_board(
-                    session,
-                    board_id=board.id,
-                    task_ids=task_ids,
-                )
-            for approval, approval_read in zip(approvals, approval_reads, strict=True):
-                updated_at = _approval_updated_at(approval)
-                last_seen = max(updated_at, last_seen)
-                payload: dict[str, object] = {
-                    "approval": _serialize_approval(approval_read),
-                    "pending_approvals_count": pending_approvals_count,
-                }
-                task_counts = [
-                    {
-                        "task_id": str(task_id),
-                        "approvals_count": total,
-                        "approvals_pending_count": pending,
+        async with event_hub.subscribe([board_topic(board.id, "approvals")]) as subscription:
+            while await subscription.ready(request):
+                async with async_session_maker() as session:
+                    approvals = await _fetch_approval_events(session, board.id, last_seen)
+                    approval_reads = await _approval_reads(session, approvals)
+                    pending_approvals_count = int(
+                        (
+                            await session.exec(
+                                select(func.count(col(Approval.id)))
+                                .where(col(Approval.board_id) == board.id)
+                                .where(col(Approval.status) == "pending"),
+                            )
+                        ).one(),
+                    )
+                    task_ids = {
+                        task_id
+                        for approval_read in approval_reads
+                        for task_id in approval_read.task_ids
+                    }
+                    counts_by_task_id = await task_counts_for_board(
+                        session,
+                        board_id=board.id,
+                        task_ids=task_ids,
+                    )
+                for approval, approval_read in zip(approvals, approval_reads, strict=True):
+                    updated_at = _approval_updated_at(approval)
+                    last_seen = max(updated_at, last_seen)
+                    payload: dict[str, object] = {
+                        "approval": _serialize_approval(approval_read),
+                        "pending_approvals_count": pending_approvals_count,
                     }
-                    for task_id in approval_read.task_ids
-                    if (counts := counts_by_task_id.get(task_id)) is not None
-                    for total, pending in [counts]
-                ]
-                if len(task_counts) == 1:
-                    payload["task_counts"] = task_counts[0]
-                elif task_counts:
-                    payload["task_counts"] = task_counts
-                yield {"event": "approval", "data": json.dumps(payload)}
-            await asyncio.sleep(STREAM_POLL_SECONDS)
+                    task_counts = [
+                        {
+                            "task_id": str(task_id),
+                            "approvals_count": total,
+                            "approvals_pending_count": pending,
+                        }
+                        for task_id in approval_read.task_ids
+                        if (counts := counts_by_task_id.get(task_id)) is not None
+                        for total, pending in [counts]
+                    ]
+                    if len(task_counts) == 1:
+                        payload["task_counts"] = task_counts[0]
+                    elif task_counts:
+                        payload["task_counts"] = task_counts
+                    yield {"event": "approval", "data": json.dumps(payload)}
 
     return EventSourceResponse(event_generator(), ping=15)
 
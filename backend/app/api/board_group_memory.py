@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import json
 from dataclasses import dataclass
 from datetime import UTC, datetime
@@ -24,7 +23,7 @@ from app.api.deps import (
 )
 from app.core.config import settings
 from app.core.time import utcnow
-from app.db.pagination import paginate
+from app.db.pagination import Keyset, paginate
 from app.db.session import async_session_maker, get_session
 from app.models.agents import Agent
 from app.models.board_group_memory import BoardGroupMemory
@@ -33,6 +32,7 @@ from app.models.boards import Board
 from app.models.users import User
 from app.schemas.board_group_memory import BoardGroupMemoryCreate, BoardGroupMemoryRead
 from app.schemas.pagination import DefaultLimitOffsetPage
+from app.services.event_hub import board_group_memory_topic, event_hub
 from app.services.mentions import extract_mentions, matches_agent_mention
 from app.services.openclaw.gateway_dispatch import GatewayDispatchService
 from app.services.organizations import (
@@ -60,7 +60,6 @@ board_router = APIRouter(
     tags=["board-group-memory"],
 )
 MAX_SNIPPET_LENGTH = 800
-STREAM_POLL_SECONDS = 2
 SESSION_DEP = Depends(get_session)
 ORG_MEMBER_DEP = Depends(require_org_member)
 BOARD_READ_DEP = Depends(get_board_for_actor_read)
@@ -367,7 +366,11 @@ async def list_board_group_memory(
     if is_chat is not None:
         statement = statement.filter(col(BoardGroupMemory.is_chat) == is_chat)
     statement = statement.order_by(col(BoardGroupMemory.created_at).desc())
-    return await paginate(session, statement.statement)
+    return await paginate(
+        session,
+        statement.statement,
+        keyset=Keyset(col(BoardGroupMemory.created_at), col(BoardGroupMemory.id)),
+    )
 
 
 @group_router.get("/stream")
@@ -384,21 +387,19 @@ async def stream_board_group_memory(
 
     async def event_generator() -> AsyncIterator[dict[str, str]]:
         nonlocal last_seen
-        while True:
-            if await request.is_disconnected():
-                break
-            async with async_session_maker() as s:
-                memories = await _fetch_memory_events(
-                    s,
-                    group.id,
-                    last_seen,
-                    is_chat=is_chat,
-                )
-            for memory in memories:
-                last_seen = max(memory.created_at, last_seen)
-                payload = {"memory": _serialize_memory(memory)}
-                yield {"event": "memory", "data": json.dumps(payload)}
-            await asyncio.sleep(STREAM_POLL_SECONDS)
+        async with event_hub.subscribe([board_group_memory_topic(group.id)]) as subscription:
+            while await subscription.ready(request):
+                async with async_session_maker() as s:
+                    memories = await _fetch_memory_events(
+                        s,
+                        group.id,
+                        last_seen,
+                        is_chat=is_chat,
+                    )
+                for memory in memories:
+                    last_seen = max(memory.created_at, last_seen)
+                    payload = {"memory": _serialize_memory(memory)}
+                    yield {"event": "memory", "data": json.dumps(payload)}
 
     return EventSourceResponse(event_generator(), ping=15)
 
@@ -481,9 +482,14 @@ async def list_board_group_memory_for_board(
 
     Use this for cross-board context and coordination signals.
     """
+    keyset = Keyset(col(BoardGroupMemory.created_at), col(BoardGroupMemory.id))
     group_id = board.board_group_id
     if group_id is None:
-        return await paginate(session, BoardGroupMemory.objects.by_ids([]).statement)
+        return await paginate(
+            session,
+            BoardGroupMemory.objects.by_ids([]).statement,
+            keyset=keyset,
+        )
 
     queryset = (
         BoardGroupMemory.objects.filter_by(board_group_id=group_id)
@@ -494,7 +500,7 @@ async def list_board_group_memory_for_board(
     if is_chat is not None:
         queryset = queryset.filter(col(BoardGroupMemory.is_chat) == is_chat)
     queryset = queryset.order_by(col(BoardGroupMemory.created_at).desc())
-    return await paginate(session, queryset.statement)
+    return await paginate(session, queryset.statement, keyset=keyset)
 
 
 @board_router.get(
@@ -536,24 +542,22 @@ async def stream_board_group_memory_for_board(
 
     async def event_generator() -> AsyncIterator[dict[str, str]]:
         nonlocal last_seen
-        while True:
-            if await request.is_disconnected():
-                break
-            if group_id is None:
-                await asyncio.sleep(2)
-                continue
-            async with async_session_maker() as session:
-                memories = await _fetch_memory_events(
-                    session,
-                    group_id,
-                    last_seen,
-                    is_chat=is_chat,
-                )
-            for memory in memories:
-                last_seen = max(memory.created_at, last_seen)
-                payload = {"memory": _serialize_memory(memory)}
-                yield {"event": "memory", "data": json.dumps(payload)}
-            await asyncio.sleep(STREAM_POLL_SECONDS)
+        topics = [board_group_memory_topic(group_id)] if group_id is not None else []
+        async with event_hub.subscribe(topics) as subscription:
+            while await subscription.ready(request):
+                if group_id is None:
+                    continue
+                async with async_session_maker() as session:
+                    memories = await _fetch_memory_events(
+                        session,
+                        group_id,
+                        last_seen,
+                        is_chat=is_chat,
+                    )
+                for memory in memories:
+                    last_seen = max(memory.created_at, last_seen)
+                    payload = {"memory": _serialize_memory(memory)}
+                    yield {"event": "memory", "data": json.dumps(payload)}
 
     return EventSourceResponse(event_generator(), ping=15)
 
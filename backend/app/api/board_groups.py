@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
 from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
@@ -29,6 +30,7 @@ from app.schemas.common import OkResponse
 from app.schemas.pagination import DefaultLimitOffsetPage
 from app.schemas.view_models import BoardGroupSnapshot
 from app.services.board_group_snapshot import build_group_snapshot
+from app.services.board_versions import bump_board_version
 from app.services.openclaw.constants import DEFAULT_HEARTBEAT_CONFIG
 from app.services.openclaw.gateway_rpc import OpenClawGatewayError
 from app.services.openclaw.provisioning import OpenClawGatewayProvisioner
@@ -260,18 +262,28 @@ async def _sync_gateway_heartbeats(
     gateway_ids = list(agents_by_gateway_id.keys())
     gateways = await Gateway.objects.by_ids(gateway_ids).all(session)
     gateway_by_id = {gateway.id: gateway for gateway in gateways}
+    pending: list[tuple[Gateway, list[Agent]]] = []
     for gateway_id, gateway_agents in agents_by_gateway_id.items():
         gateway = gateway_by_id.get(gateway_id)
         if gateway is None or not gateway.url or not gateway.workspace_root:
             failed_agent_ids.extend([agent.id for agent in gateway_agents])
             continue
-        try:
-            await OpenClawGatewayProvisioner().sync_gateway_agent_heartbeats(
-                gateway,
-                gateway_agents,
-            )
-        except OpenClawGatewayError:
+        pending.append((gateway, gateway_agents))
+
+    # Each gateway is one config.get/config.patch round trip; run them side by side.
+    provisioner = OpenClawGatewayProvisioner()
+    outcomes = await asyncio.gather(
+        *(
+            provisioner.sync_gateway_agent_heartbeats(gateway, gateway_agents)
+            for gateway, gateway_agents in pending
+        ),
+        return_exceptions=True,
+    )
+    for (_, gateway_agents), outcome in zip(pending, outcomes, strict=True):
+        if isinstance(outcome, OpenClawGatewayError):
             failed_agent_ids.extend([agent.id for agent in gateway_agents])
+        elif isinstance(outcome, BaseException):
+            raise outcome
     return failed_agent_ids
 
 
@@ -362,6 +374,10 @@ async def delete_board_group(
     )
 
     # Boards reference groups, so clear the FK first to keep deletes simple.
+    for board_id in await session.exec(
+        select(col(Board.id)).where(col(Board.board_group_id) == group_id),
+    ):
+        bump_board_version(session, board_id)
     await crud.update_where(
         session,
         Board,
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import json
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
@@ -21,12 +20,13 @@ from app.api.deps import (
 )
 from app.core.config import settings
 from app.core.time import utcnow
-from app.db.pagination import paginate
+from app.db.pagination import Keyset, paginate
 from app.db.session import async_session_maker, get_session
 from app.models.agents import Agent
 from app.models.board_memory import BoardMemory
 from app.schemas.board_memory import BoardMemoryCreate, BoardMemoryRead
 from app.schemas.pagination import DefaultLimitOffsetPage
+from app.services.event_hub import board_topic, event_hub
 from app.services.mentions import extract_mentions, matches_agent_mention
 from app.services.openclaw.gateway_dispatch import GatewayDispatchService
 from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
@@ -41,7 +41,6 @@ if TYPE_CHECKING:
 
 router = APIRouter(prefix="/boards/{board_id}/memory", tags=["board-memory"])
 MAX_SNIPPET_LENGTH = 800
-STREAM_POLL_SECONDS = 2
 IS_CHAT_QUERY = Query(default=None)
 SINCE_QUERY = Query(default=None)
 BOARD_READ_DEP = Depends(get_board_for_actor_read)
@@ -234,7 +233,11 @@ async def list_board_memory(
     if is_chat is not None:
         statement = statement.filter(col(BoardMemory.is_chat) == is_chat)
     statement = statement.order_by(col(BoardMemory.created_at).desc())
-    return await paginate(session, statement.statement)
+    return await paginate(
+        session,
+        statement.statement,
+        keyset=Keyset(col(BoardMemory.created_at), col(BoardMemory.id)),
+    )
 
 
 @router.get("/stream")
@@ -252,21 +255,19 @@ async def stream_board_memory(
 
     async def event_generator() -> AsyncIterator[dict[str, str]]:
         nonlocal last_seen
-        while True:
-            if await request.is_disconnected():
-                break
-            async with async_session_maker() as session:
-                memories = await _fetch_memory_events(
-                    session,
-                    board.id,
-                    last_seen,
-                    is_chat=is_chat,
-                )
-            for memory in memories:
-                last_seen = max(memory.created_at, last_seen)
-                payload = {"memory": _serialize_memory(memory)}
-                yield {"event": "memory", "data": json.dumps(payload)}
-            await asyncio.sleep(STREAM_POLL_SECONDS)
+        async with event_hub.subscribe([board_topic(board.id, "memory")]) as subscription:
+            while await subscription.ready(request):
+                async with async_session_maker() as session:
+                    memories = await _fetch_memory_events(
+                        session,
+                        board.id,
+                        last_seen,
+                        is_chat=is_chat,
+                    )
+                for memory in memories:
+                    last_seen = max(memory.created_at, last_seen)
+                    payload = {"memory": _serialize_memory(memory)}
+                    yield {"event": "memory", "data": json.dumps(payload)}
 
     return EventSourceResponse(event_generator(), ping=15)
 
@@ -14,7 +14,7 @@ from app.core.config import settings
 from app.core.logging import get_logger
 from app.core.time import utcnow
 from app.db import crud
-from app.db.pagination import paginate
+from app.db.pagination import Keyset, paginate
 from app.db.session import get_session
 from app.models.agents import Agent
 from app.models.board_memory import BoardMemory
@@ -30,7 +30,7 @@ from app.schemas.board_webhooks import (
 from app.schemas.common import OkResponse
 from app.schemas.pagination import DefaultLimitOffsetPage
 from app.services.openclaw.gateway_dispatch import GatewayDispatchService
-from app.services.webhooks.queue import QueuedInboundDelivery, enqueue_webhook_delivery
+from app.services.webhooks.queue import QueuedInboundDelivery, enqueue_webhook_delivery_async
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -283,7 +283,12 @@ async def list_board_webhooks(
         webhooks = _coerce_webhook_items(items)
         return [_to_webhook_read(value) for value in webhooks]
 
-    return await paginate(session, statement, transformer=_transform)
+    return await paginate(
+        session,
+        statement,
+        transformer=_transform,
+        keyset=Keyset(col(BoardWebhook.created_at), col(BoardWebhook.id)),
+    )
 
 
 @router.post("", response_model=BoardWebhookRead)
@@ -397,7 +402,12 @@ async def list_board_webhook_payloads(
         payloads = _coerce_payload_items(items)
         return [_to_payload_read(value) for value in payloads]
 
-    return await paginate(session, statement, transformer=_transform)
+    return await paginate(
+        session,
+        statement,
+        transformer=_transform,
+        keyset=Keyset(col(BoardWebhookPayload.received_at), col(BoardWebhookPayload.id)),
+    )
 
 
 @router.get("/{webhook_id}/payloads/{payload_id}", response_model=BoardWebhookPayloadRead)
@@ -492,7 +502,7 @@ async def ingest_board_webhook(
         },
     )
 
-    enqueued = enqueue_webhook_delivery(
+    enqueued = await enqueue_webhook_delivery_async(
         QueuedInboundDelivery(
             board_id=board.id,
             webhook_id=webhook.id,
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import TYPE_CHECKING, Literal, cast
+from typing import TYPE_CHECKING, Literal, cast, get_args
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy import func
 from sqlmodel import col, select
 
@@ -29,11 +29,12 @@ from app.models.gateways import Gateway
 from app.schemas.boards import BoardCreate, BoardRead, BoardUpdate
 from app.schemas.common import OkResponse
 from app.schemas.pagination import DefaultLimitOffsetPage
-from app.schemas.view_models import BoardGroupSnapshot, BoardSnapshot
+from app.schemas.tasks import TaskStatus
+from app.schemas.view_models import BoardGroupSnapshot, BoardSnapshot, BoardSnapshotDelta
 from app.services.activity_log import record_activity
 from app.services.board_group_snapshot import build_board_group_snapshot
 from app.services.board_lifecycle import delete_board as delete_board_service
-from app.services.board_snapshot import build_board_snapshot
+from app.services.board_snapshot import build_board_snapshot_delta, versioned_board_snapshot
 from app.services.openclaw.gateway_dispatch import GatewayDispatchService
 from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
 from app.services.openclaw.gateway_rpc import OpenClawGatewayError
@@ -57,6 +58,9 @@ BOARD_GROUP_ID_QUERY = Query(default=None)
 INCLUDE_SELF_QUERY = Query(default=False)
 INCLUDE_DONE_QUERY = Query(default=False)
 PER_BOARD_TASK_LIMIT_QUERY = Query(default=5, ge=0, le=100)
+SNAPSHOT_TASK_STATUS_QUERY = Query(default=None, alias="task_status")
+SNAPSHOT_TASK_LIMIT_QUERY = Query(default=None, ge=1, le=10_000)
+SNAPSHOT_SINCE_VERSION_QUERY = Query(default=None, ge=0)
 AGENT_BOARD_ROLE_TAGS = cast("list[str | Enum]", ["agent-lead", "agent-worker"])
 
 
@@ -391,13 +395,68 @@ def get_board(
     return board
 
 
-@router.get("/{board_id}/snapshot", response_model=BoardSnapshot)
+def _snapshot_task_statuses(task_status: str | None) -> list[str]:
+    if not task_status:
+        return []
+    values = [value.strip() for value in task_status.split(",") if value.strip()]
+    if any(value not in get_args(TaskStatus) for value in values):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="Unsupported task status filter.",
+        )
+    return values
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {value.strip().removeprefix("W/") for value in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+@router.get("/{board_id}/snapshot", response_model=BoardSnapshot | BoardSnapshotDelta)
 async def get_board_snapshot(
+    request: Request,
+    response: Response,
     board: Board = BOARD_ACTOR_READ_DEP,
     session: AsyncSession = SESSION_DEP,
-) -> BoardSnapshot:
-    """Get a board snapshot view model."""
-    return await build_board_snapshot(session, board)
+    task_status: str | None = SNAPSHOT_TASK_STATUS_QUERY,
+    task_limit: int | None = SNAPSHOT_TASK_LIMIT_QUERY,
+    since_version: int | None = SNAPSHOT_SINCE_VERSION_QUERY,
+) -> BoardSnapshot | BoardSnapshotDelta | Response:
+    """Get a board snapshot view model.
+
+    `task_status` (comma-separated) and `task_limit` window the task list; the
+    newest matching tasks are returned and `tasks_truncated` reports a cut.
+    Responses carry an ETag; send it back in `If-None-Match` to get a 304 while
+    the board is unchanged. With `since_version` (the `version` of an earlier
+    snapshot) only the changes since then are returned, as a `BoardSnapshotDelta`;
+    a delta cannot be windowed by `task_limit`, so the two are mutually exclusive.
+    """
+    task_statuses = _snapshot_task_statuses(task_status)
+    if since_version is not None:
+        if task_limit is not None:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail="task_limit cannot be combined with since_version.",
+            )
+        return await build_board_snapshot_delta(
+            session,
+            board,
+            since_version=since_version,
+            task_statuses=task_statuses,
+        )
+    versioned = await versioned_board_snapshot(
+        session,
+        board,
+        task_statuses=task_statuses,
+        task_limit=task_limit,
+    )
+    headers = {"ETag": versioned.etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), versioned.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return versioned.snapshot
 
 
 @router.get(
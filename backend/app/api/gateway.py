@@ -31,6 +31,10 @@ SESSION_DEP = Depends(get_session)
 AUTH_DEP = Depends(get_auth_context)
 ORG_ADMIN_DEP = Depends(require_org_admin)
 BOARD_ID_QUERY = Query(default=None)
+REFRESH_QUERY = Query(
+    default=False,
+    description="Bypass the cached gateway status and ask the gateway now.",
+)
 
 
 def _query_to_resolve_input(
@@ -53,16 +57,18 @@ RESOLVE_INPUT_DEP = Depends(_query_to_resolve_input)
 @router.get("/status", response_model=GatewaysStatusResponse)
 async def gateways_status(
     params: GatewayResolveQuery = RESOLVE_INPUT_DEP,
+    refresh: bool = REFRESH_QUERY,
     session: AsyncSession = SESSION_DEP,
     auth: AuthContext = AUTH_DEP,
     ctx: OrganizationContext = ORG_ADMIN_DEP,
 ) -> GatewaysStatusResponse:
-    """Return gateway connectivity and session status."""
+    """Return gateway connectivity and session status (cached briefly per gateway)."""
     service = GatewaySessionService(session)
     return await service.get_status(
         params=params,
         organization_id=ctx.organization.id,
         user=auth.user,
+        refresh=refresh,
     )
 
 
@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
 from sqlmodel import col
+from sse_starlette.sse import EventSourceResponse
 
 from app.api.deps import require_org_admin
+from app.core.agent_token_cache import verified_agent_tokens
 from app.core.auth import AuthContext, get_auth_context
 from app.db import crud
-from app.db.pagination import paginate
+from app.db.pagination import Keyset, paginate
 from app.db.session import get_session
 from app.models.agents import Agent
 from app.models.gateways import Gateway
@@ -20,6 +24,7 @@ from app.schemas.common import OkResponse
 from app.schemas.gateways import (
     GatewayCreate,
     GatewayRead,
+    GatewayTemplatesSyncJobRead,
     GatewayTemplatesSyncResult,
     GatewayUpdate,
     MainAgentRead,
@@ -27,11 +32,20 @@ from app.schemas.gateways import (
 from app.schemas.pagination import DefaultLimitOffsetPage
 from app.services.openclaw.admin_service import GatewayAdminLifecycleService
 from app.services.openclaw.config_service import get_agents_list_main_key, get_gateway_config
-from app.services.openclaw.gateway_rpc import OpenClawGatewayError
 from app.services.openclaw.gateway_resolver import gateway_client_config
+from app.services.openclaw.gateway_rpc import OpenClawGatewayError
 from app.services.openclaw.session_service import GatewayTemplateSyncQuery
+from app.services.openclaw.template_sync_jobs import (
+    TERMINAL_JOB_STATUSES,
+    TemplateSyncJob,
+    get_template_sync_job,
+    list_template_sync_events,
+    resume_template_sync_job,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from fastapi_pagination.limit_offset import LimitOffsetPage
     from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -48,6 +62,10 @@ FORCE_BOOTSTRAP_QUERY = Query(default=False)
 OVERWRITE_QUERY = Query(default=False)
 LEAD_ONLY_QUERY = Query(default=False)
 BOARD_ID_QUERY = Query(default=None)
+SINCE_EVENT_QUERY = Query(default=0, ge=0)
+LAST_EVENT_ID_HEADER = Header(default=None)
+# How often a progress stream re-reads the job's event list.
+_TEMPLATE_SYNC_POLL_SECONDS = 1.0
 _RUNTIME_TYPE_REFERENCES = (UUID,)
 
 
@@ -86,7 +104,9 @@ async def list_gateways(
         .order_by(col(Gateway.created_at).desc())
         .statement
     )
-    return await paginate(session, statement)
+    return await paginate(
+        session, statement, keyset=Keyset(col(Gateway.created_at), col(Gateway.id))
+    )
 
 
 @router.post("", response_model=GatewayRead)
@@ -187,21 +207,131 @@ async def update_gateway(
     return gateway
 
 
-@router.post("/{gateway_id}/templates/sync", response_model=GatewayTemplatesSyncResult)
+def _template_sync_job_read(job: TemplateSyncJob) -> GatewayTemplatesSyncJobRead:
+    counters = job.counters()
+    return GatewayTemplatesSyncJobRead(
+        id=job.id,
+        gateway_id=job.gateway_id,
+        status=job.status,
+        total=counters["total"],
+        done=counters["done"],
+        skipped=counters["skipped"],
+        failed=counters["failed"],
+        runs=job.runs,
+        error=job.error,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+        result=(
+            GatewayTemplatesSyncResult.model_validate(job.result)
+            if job.result is not None
+            else None
+        ),
+    )
+
+
+async def _require_template_sync_job(
+    *,
+    gateway_id: UUID,
+    job_id: str,
+    ctx: OrganizationContext,
+) -> TemplateSyncJob:
+    job = await get_template_sync_job(job_id)
+    if job is None or job.gateway_id != gateway_id or job.organization_id != ctx.organization.id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    return job
+
+
+@router.post(
+    "/{gateway_id}/templates/sync",
+    response_model=GatewayTemplatesSyncJobRead,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def sync_gateway_templates(
     gateway_id: UUID,
     sync_query: GatewayTemplateSyncQuery = SYNC_QUERY_DEP,
     session: AsyncSession = SESSION_DEP,
     auth: AuthContext = AUTH_DEP,
     ctx: OrganizationContext = ORG_ADMIN_DEP,
-) -> GatewayTemplatesSyncResult:
-    """Sync templates for a gateway and optionally rotate runtime settings."""
+) -> GatewayTemplatesSyncJobRead:
+    """Queue a template sync for a gateway; poll or stream the returned job."""
     service = GatewayAdminLifecycleService(session)
     gateway = await service.require_gateway(
         gateway_id=gateway_id,
         organization_id=ctx.organization.id,
     )
-    return await service.sync_templates(gateway, query=sync_query, auth=auth)
+    job = await service.enqueue_template_sync(gateway, query=sync_query, auth=auth)
+    if job.status == "failed":
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=job.error)
+    return _template_sync_job_read(job)
+
+
+@router.get(
+    "/{gateway_id}/templates/sync/jobs/{job_id}",
+    response_model=GatewayTemplatesSyncJobRead,
+)
+async def get_gateway_template_sync_job(
+    gateway_id: UUID,
+    job_id: str,
+    ctx: OrganizationContext = ORG_ADMIN_DEP,
+) -> GatewayTemplatesSyncJobRead:
+    """Return a template sync job's status, progress counters and final result."""
+    job = await _require_template_sync_job(gateway_id=gateway_id, job_id=job_id, ctx=ctx)
+    return _template_sync_job_read(job)
+
+
+@router.post(
+    "/{gateway_id}/templates/sync/jobs/{job_id}/resume",
+    response_model=GatewayTemplatesSyncJobRead,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def resume_gateway_template_sync_job(
+    gateway_id: UUID,
+    job_id: str,
+    ctx: OrganizationContext = ORG_ADMIN_DEP,
+) -> GatewayTemplatesSyncJobRead:
+    """Re-queue a failed job; agents it already synced or skipped are not redone.
+
+    Jobs that are queued, running or waiting on a worker retry are rejected with 409
+    so a resume never races a pending run.
+    """
+    job = await _require_template_sync_job(gateway_id=gateway_id, job_id=job_id, ctx=ctx)
+    if job.status != "failed":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Only failed jobs can be resumed (job is {job.status}).",
+        )
+    job = await resume_template_sync_job(job)
+    if job.status == "failed":
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=job.error)
+    return _template_sync_job_read(job)
+
+
+@router.get("/{gateway_id}/templates/sync/jobs/{job_id}/events")
+async def stream_gateway_template_sync_job(
+    request: Request,
+    gateway_id: UUID,
+    job_id: str,
+    since: int = SINCE_EVENT_QUERY,
+    last_event_id: str | None = LAST_EVENT_ID_HEADER,
+    ctx: OrganizationContext = ORG_ADMIN_DEP,
+) -> EventSourceResponse:
+    """Stream a job's progress events over server-sent events until it finishes."""
+    await _require_template_sync_job(gateway_id=gateway_id, job_id=job_id, ctx=ctx)
+    if last_event_id and last_event_id.isdigit():
+        since = max(since, int(last_event_id) + 1)
+
+    async def event_generator() -> AsyncIterator[dict[str, str]]:
+        next_index = since
+        while not await request.is_disconnected():
+            job = await get_template_sync_job(job_id)
+            for event in await list_template_sync_events(job_id, start=next_index):
+                next_index = int(event["index"]) + 1
+                yield {"event": "progress", "id": str(event["index"]), "data": json.dumps(event)}
+            if job is None or (job.status in TERMINAL_JOB_STATUSES and next_index >= job.events):
+                break
+            await asyncio.sleep(_TEMPLATE_SYNC_POLL_SECONDS)
+
+    return EventSourceResponse(event_generator(), ping=15)
 
 
 @router.delete("/{gateway_id}", response_model=OkResponse)
@@ -242,4 +372,8 @@ async def delete_gateway(
 
     await session.delete(gateway)
     await session.commit()
+    deleted_agent_ids = {agent.id for agent in duplicate_main_agents}
+    if main_agent is not None:
+        deleted_agent_ids.add(main_agent.id)
+    verified_agent_tokens.invalidate_agents(deleted_agent_ids)
     return OkResponse()
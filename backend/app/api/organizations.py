@@ -14,7 +14,7 @@ from app.api.deps import require_org_admin, require_org_member
 from app.core.auth import get_auth_context
 from app.core.time import utcnow
 from app.db import crud
-from app.db.pagination import paginate
+from app.db.pagination import Keyset, paginate
 from app.db.session import get_session
 from app.models.activity_events import ActivityEvent
 from app.models.agents import Agent
@@ -602,7 +602,11 @@ async def list_org_invites(
         .order_by(col(OrganizationInvite.created_at).desc())
         .statement
     )
-    return await paginate(session, statement)
+    return await paginate(
+        session,
+        statement,
+        keyset=Keyset(col(OrganizationInvite.created_at), col(OrganizationInvite.id)),
+    )
 
 
 @router.post("/me/invites", response_model=OrganizationInviteRead)
@@ -0,0 +1,225 @@
+"""Background queue health and dead-letter management endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, cast
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi_pagination import paginate as paginate_sequence
+from sqlmodel import col, select
+
+from app.api.deps import require_org_admin
+from app.core.auth import AuthContext, get_auth_context
+from app.core.config import settings
+from app.db.session import get_session
+from app.models.gateways import Gateway
+from app.schemas.pagination import DefaultLimitOffsetPage
+from app.schemas.queue import (
+    DeadLetterActionResult,
+    DeadLetterRead,
+    DeadLetterSelection,
+    DeadLetterSummary,
+    QueueStatsRead,
+)
+from app.services.organizations import list_accessible_board_ids
+from app.services.queue import (
+    DeadLetter,
+    get_dead_letter,
+    list_dead_letters,
+    purge_dead_letters,
+    queue_stats,
+    replay_dead_letters,
+)
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from fastapi_pagination.limit_offset import LimitOffsetPage
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    from app.services.organizations import OrganizationContext
+
+router = APIRouter(prefix="/queue", tags=["queue"])
+SESSION_DEP = Depends(get_session)
+AUTH_DEP = Depends(get_auth_context)
+ORG_ADMIN_DEP = Depends(require_org_admin)
+
+
+@dataclass(frozen=True)
+class _DeadLetterScope:
+    """Which dead letters an organization admin may see and act on."""
+
+    board_ids: set[str]
+    gateway_ids: set[str]
+    # Entries naming neither a board nor a gateway belong to no tenant.
+    include_unscoped: bool
+
+    def allows(self, entry: DeadLetter) -> bool:
+        if entry.board_id is not None:
+            return entry.board_id in self.board_ids
+        if entry.gateway_id is not None:
+            return entry.gateway_id in self.gateway_ids
+        return self.include_unscoped
+
+
+def _is_super_admin(auth: AuthContext) -> bool:
+    return auth.user is not None and auth.user.is_super_admin
+
+
+async def _organization_gateway_ids(session: AsyncSession, organization_id: UUID) -> set[str]:
+    gateway_ids = await session.exec(
+        select(col(Gateway.id)).where(col(Gateway.organization_id) == organization_id),
+    )
+    return {str(gateway_id) for gateway_id in gateway_ids}
+
+
+async def _dead_letter_scope(
+    session: AsyncSession,
+    ctx: OrganizationContext,
+    auth: AuthContext,
+) -> _DeadLetterScope:
+    board_ids = await list_accessible_board_ids(session, member=ctx.member, write=True)
+    return _DeadLetterScope(
+        board_ids={str(board_id) for board_id in board_ids},
+        gateway_ids=await _organization_gateway_ids(session, ctx.organization.id),
+        include_unscoped=_is_super_admin(auth),
+    )
+
+
+async def _visible_dead_letters(
+    session: AsyncSession,
+    ctx: OrganizationContext,
+    auth: AuthContext,
+) -> list[DeadLetter]:
+    scope = await _dead_letter_scope(session, ctx, auth)
+    return await asyncio.to_thread(
+        list_dead_letters,
+        settings.rq_queue_name,
+        redis_url=settings.rq_redis_url,
+        visible=scope.allows,
+    )
+
+
+async def _selected_dead_letters(
+    payload: DeadLetterSelection,
+    session: AsyncSession,
+    ctx: OrganizationContext,
+    auth: AuthContext,
+) -> list[DeadLetter]:
+    entries = await _visible_dead_letters(session, ctx, auth)
+    if payload.all:
+        return entries
+    wanted = set(payload.ids)
+    return [entry for entry in entries if entry.id in wanted]
+
+
+def _dead_letter_read(entry: DeadLetter) -> DeadLetterRead:
+    return DeadLetterRead(
+        id=entry.id,
+        queue_name=entry.queue_name,
+        task_type=entry.task_type,
+        board_id=entry.board_id,
+        gateway_id=entry.gateway_id,
+        attempts=entry.attempts,
+        last_error=entry.last_error,
+        dead_at=entry.dead_at,
+        task=entry.task,
+        history=list(entry.history),
+    )
+
+
+@router.get("/stats", response_model=QueueStatsRead)
+async def get_queue_stats(
+    _ctx: OrganizationContext = ORG_ADMIN_DEP,
+    auth: AuthContext = AUTH_DEP,
+) -> QueueStatsRead:
+    """Return queue depth, scheduled, in-flight and dead-letter counts.
+
+    The queue is shared by every organization, so its counts are limited to
+    super admins.
+    """
+    if not _is_super_admin(auth):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+    stats = await asyncio.to_thread(
+        queue_stats,
+        settings.rq_queue_name,
+        redis_url=settings.rq_redis_url,
+    )
+    return QueueStatsRead(
+        queue_name=stats.queue_name,
+        queued=stats.queued,
+        scheduled=stats.scheduled,
+        processing=stats.processing,
+        dead=stats.dead,
+    )
+
+
+@router.get("/dead", response_model=DefaultLimitOffsetPage[DeadLetterSummary])
+async def list_queue_dead_letters(
+    session: AsyncSession = SESSION_DEP,
+    ctx: OrganizationContext = ORG_ADMIN_DEP,
+    auth: AuthContext = AUTH_DEP,
+) -> LimitOffsetPage[DeadLetterSummary]:
+    """List dead-lettered tasks for the organization's boards and gateways, newest first."""
+    entries = await _visible_dead_letters(session, ctx, auth)
+    summaries = [
+        DeadLetterSummary.model_validate(_dead_letter_read(entry), from_attributes=True)
+        for entry in entries
+    ]
+    return cast("LimitOffsetPage[DeadLetterSummary]", paginate_sequence(summaries))
+
+
+@router.get("/dead/{dead_letter_id}", response_model=DeadLetterRead)
+async def get_queue_dead_letter(
+    dead_letter_id: str,
+    session: AsyncSession = SESSION_DEP,
+    ctx: OrganizationContext = ORG_ADMIN_DEP,
+    auth: AuthContext = AUTH_DEP,
+) -> DeadLetterRead:
+    """Return one dead-lettered task with its payload and failure history."""
+    entry = await asyncio.to_thread(
+        get_dead_letter,
+        settings.rq_queue_name,
+        dead_letter_id,
+        redis_url=settings.rq_redis_url,
+    )
+    if entry is None or not (await _dead_letter_scope(session, ctx, auth)).allows(entry):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    return _dead_letter_read(entry)
+
+
+@router.post("/dead/replay", response_model=DeadLetterActionResult)
+async def replay_queue_dead_letters(
+    payload: DeadLetterSelection,
+    session: AsyncSession = SESSION_DEP,
+    ctx: OrganizationContext = ORG_ADMIN_DEP,
+    auth: AuthContext = AUTH_DEP,
+) -> DeadLetterActionResult:
+    """Requeue the selected dead letters with a fresh retry budget."""
+    entries = await _selected_dead_letters(payload, session, ctx, auth)
+    count = await asyncio.to_thread(
+        replay_dead_letters,
+        entries,
+        redis_url=settings.rq_redis_url,
+    )
+    return DeadLetterActionResult(count=count)
+
+
+@router.post("/dead/purge", response_model=DeadLetterActionResult)
+async def purge_queue_dead_letters(
+    payload: DeadLetterSelection,
+    session: AsyncSession = SESSION_DEP,
+    ctx: OrganizationContext = ORG_ADMIN_DEP,
+    auth: AuthContext = AUTH_DEP,
+) -> DeadLetterActionResult:
+    """Permanently delete the selected dead letters."""
+    entries = await _selected_dead_letters(payload, session, ctx, auth)
+    count = await asyncio.to_thread(
+        purge_dead_letters,
+        settings.rq_queue_name,
+        [entry.id for entry in entries],
+        redis_url=settings.rq_redis_url,
+    )
+    return DeadLetterActionResult(count=count)
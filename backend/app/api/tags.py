@@ -16,9 +16,11 @@ from app.db.pagination import paginate
 from app.db.session import get_session
 from app.models.tag_assignments import TagAssignment
 from app.models.tags import Tag
+from app.models.tasks import Task
 from app.schemas.common import OkResponse
 from app.schemas.pagination import DefaultLimitOffsetPage
 from app.schemas.tags import TagCreate, TagRead, TagUpdate
+from app.services.board_versions import bump_task_boards
 from app.services.organizations import OrganizationContext
 from app.services.tags import slugify_tag, task_counts_for_tags
 
@@ -209,6 +211,12 @@ async def delete_tag(
         tag_id=tag_id,
         ctx=ctx,
     )
+    await bump_task_boards(
+        session,
+        col(Task.id).in_(
+            select(col(TagAssignment.task_id)).where(col(TagAssignment.tag_id) == tag.id),
+        ),
+    )
     await crud.delete_where(
         session,
         TagAssignment,
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import json
 from collections import deque
 from dataclasses import dataclass
@@ -25,7 +24,7 @@ from app.api.deps import (
 )
 from app.core.time import utcnow
 from app.db import crud
-from app.db.pagination import paginate
+from app.db.pagination import Keyset, paginate
 from app.db.session import async_session_maker, get_session
 from app.models.activity_events import ActivityEvent
 from app.models.agents import Agent
@@ -56,6 +55,8 @@ from app.services.approval_task_links import (
     load_task_ids_by_approval,
     pending_approval_conflicts_by_task,
 )
+from app.services.board_versions import bump_task_boards
+from app.services.event_hub import board_topic, event_hub
 from app.services.mentions import extract_mentions, matches_agent_mention
 from app.services.openclaw.gateway_dispatch import GatewayDispatchService
 from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
@@ -1184,40 +1185,37 @@ async def _task_event_generator(
     seen_ids: set[UUID] = set()
     seen_queue: deque[UUID] = deque()
 
-    while True:
-        if await request.is_disconnected():
-            break
-
-        async with async_session_maker() as session:
-            rows = await _fetch_task_events(session, board_id, last_seen)
-            deps_map, dep_status, tag_state_by_task_id, custom_field_values_by_task_id = (
-                await _stream_task_state(
-                    session,
-                    board_id=board_id,
-                    rows=rows,
+    async with event_hub.subscribe([board_topic(board_id, "tasks")]) as subscription:
+        while await subscription.ready(request):
+            async with async_session_maker() as session:
+                rows = await _fetch_task_events(session, board_id, last_seen)
+                deps_map, dep_status, tag_state_by_task_id, custom_field_values_by_task_id = (
+                    await _stream_task_state(
+                        session,
+                        board_id=board_id,
+                        rows=rows,
+                    )
                 )
-            )
 
-        for event, task in rows:
-            if event.id in seen_ids:
-                continue
-            seen_ids.add(event.id)
-            seen_queue.append(event.id)
-            if len(seen_queue) > SSE_SEEN_MAX:
-                oldest = seen_queue.popleft()
-                seen_ids.discard(oldest)
-            last_seen = max(event.created_at, last_seen)
-
-            payload = _task_event_payload(
-                event,
-                task,
-                deps_map=deps_map,
-                dep_status=dep_status,
-                tag_state_by_task_id=tag_state_by_task_id,
-                custom_field_values_by_task_id=custom_field_values_by_task_id,
-            )
-            yield {"event": "task", "data": json.dumps(payload)}
-        await asyncio.sleep(2)
+            for event, task in rows:
+                if event.id in seen_ids:
+                    continue
+                seen_ids.add(event.id)
+                seen_queue.append(event.id)
+                if len(seen_queue) > SSE_SEEN_MAX:
+                    oldest = seen_queue.popleft()
+                    seen_ids.discard(oldest)
+                last_seen = max(event.created_at, last_seen)
+
+                payload = _task_event_payload(
+                    event,
+                    task,
+                    deps_map=deps_map,
+                    dep_status=dep_status,
+                    tag_state_by_task_id=tag_state_by_task_id,
+                    custom_field_values_by_task_id=custom_field_values_by_task_id,
+                )
+                yield {"event": "task", "data": json.dumps(payload)}
 
 
 @router.get("/stream")
@@ -1264,7 +1262,12 @@ async def list_tasks(
             tasks=tasks,
         )
 
-    return await paginate(session, statement, transformer=_transform)
+    return await paginate(
+        session,
+        statement,
+        transformer=_transform,
+        keyset=Keyset(col(Task.created_at), col(Task.id)),
+    )
 
 
 @router.post("", response_model=TaskRead, responses={409: {"model": BlockedTaskError}})
@@ -1465,6 +1468,15 @@ async def delete_task_and_related_records(
                 session.add(approval)
                 continue
             await session.delete(approval)
+    # Tasks that depended on this one lose a dependency without being flushed.
+    await bump_task_boards(
+        session,
+        col(Task.id).in_(
+            select(col(TaskDependency.task_id)).where(
+                col(TaskDependency.depends_on_task_id) == task.id,
+            ),
+        ),
+    )
     await crud.delete_where(
         session,
         TaskDependency,
@@ -1524,7 +1536,11 @@ async def list_task_comments(
         .where(col(ActivityEvent.event_type) == "task.comment")
         .order_by(asc(col(ActivityEvent.created_at)))
     )
-    return await paginate(session, statement)
+    return await paginate(
+        session,
+        statement,
+        keyset=Keyset(col(ActivityEvent.created_at), col(ActivityEvent.id), descending=False),
+    )
 
 
 async def _validate_task_comment_access(
@@ -32,6 +32,7 @@ from app.models.tasks import Task
 from app.models.users import User
 from app.schemas.common import OkResponse
 from app.schemas.users import UserRead, UserUpdate
+from app.services.board_versions import bump_task_boards
 
 if TYPE_CHECKING:
     from sqlmodel.ext.asyncio.session import AsyncSession
@@ -251,6 +252,7 @@ async def delete_me(
         accepted_by_user_id=None,
         commit=False,
     )
+    await bump_task_boards(session, col(Task.created_by_user_id) == user.id)
     await crud.update_where(
         session,
         Task,
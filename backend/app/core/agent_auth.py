@@ -6,6 +6,11 @@ Key ideas:
 - Agents authenticate with an opaque token presented as `X-Agent-Token: <token>`.
 - For convenience, some deployments may also allow `Authorization: Bearer <token>`
   for agents (controlled by caller/dependency).
+- Tokens are located via an indexed HMAC lookup digest (`Agent.agent_token_lookup`)
+  so authentication is one indexed query plus a single PBKDF2 verify. Agents minted
+  before the digest existed are found by a legacy scan and backfilled on first use.
+- Successful verifications are remembered in a short-lived in-process cache
+  (`verified_agent_tokens`) so polling agents skip PBKDF2 on repeat calls.
 - To reduce write-amplification, we only touch `Agent.last_seen_at` at a fixed
   interval and we avoid touching it for safe/read-only HTTP methods.
 
@@ -22,7 +27,9 @@ from typing import TYPE_CHECKING, Literal
 from fastapi import Depends, Header, HTTPException, Request, status
 from sqlmodel import col, select
 
-from app.core.agent_tokens import verify_agent_token
+from app.core.agent_token_cache import verified_agent_tokens
+from app.core.agent_tokens import agent_token_lookup, verify_agent_token
+from app.core.config import settings
 from app.core.logging import get_logger
 from app.core.time import utcnow
 from app.db.session import get_session
@@ -47,13 +54,53 @@ class AgentAuthContext:
 
 
 async def _find_agent_for_token(session: AsyncSession, token: str) -> Agent | None:
+    lookup = agent_token_lookup(token)
+    cached_agent_id = verified_agent_tokens.get(lookup)
+    if cached_agent_id is not None:
+        cached = await session.get(Agent, cached_agent_id)
+        if cached is not None and cached.agent_token_lookup == lookup:
+            return cached
+        verified_agent_tokens.discard(lookup)
+    agent = (
+        await session.exec(
+            select(Agent).where(col(Agent.agent_token_lookup) == lookup),
+        )
+    ).first()
+    if agent is not None:
+        if agent.agent_token_hash and verify_agent_token(token, agent.agent_token_hash):
+            verified_agent_tokens.put(lookup, agent.id)
+            return agent
+        return None
+    if not settings.agent_token_legacy_lookup:
+        return None
+    return await _find_legacy_agent_for_token(session, token, lookup=lookup)
+
+
+async def _find_legacy_agent_for_token(
+    session: AsyncSession,
+    token: str,
+    *,
+    lookup: str,
+) -> Agent | None:
+    """Scan agents whose token predates the lookup digest and backfill on match.
+
+    Only rows without `agent_token_lookup` are scanned, so the fallback shrinks to
+    nothing as agents authenticate or rotate their tokens.
+    """
     agents = list(
         await session.exec(
-            select(Agent).where(col(Agent.agent_token_hash).is_not(None)),
+            select(Agent)
+            .where(col(Agent.agent_token_hash).is_not(None))
+            .where(col(Agent.agent_token_lookup).is_(None)),
         ),
     )
     for agent in agents:
         if agent.agent_token_hash and verify_agent_token(token, agent.agent_token_hash):
+            agent.agent_token_lookup = lookup
+            session.add(agent)
+            await session.commit()
+            logger.info("agent auth backfilled token lookup agent_id=%s", agent.id)
+            verified_agent_tokens.put(lookup, agent.id)
             return agent
     return None
 
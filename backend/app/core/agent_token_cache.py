@@ -0,0 +1,83 @@
+"""In-process cache of verified agent tokens.
+
+Agents poll `/api/v1/agent/*` every few seconds, so nearly every authentication
+re-verifies a token that was already verified moments ago. This cache maps the
+token lookup digest to the authenticated agent id for a short TTL so repeat calls
+skip PBKDF2 entirely.
+
+Cache hits are still re-checked against the agent row (`agent_token_lookup` must
+match), so a token rotated or an agent deleted by another process can never be
+served from a stale entry; explicit invalidation just frees the slot early.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from uuid import UUID
+
+
+class VerifiedAgentTokenCache:
+    """Bounded LRU mapping token lookup digests to agent ids with a TTL."""
+
+    def __init__(self, *, max_size: int, ttl_seconds: float) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[UUID, float]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether caching is active for the configured size and TTL."""
+        return self.max_size > 0 and self.ttl_seconds > 0
+
+    def get(self, lookup: str) -> UUID | None:
+        """Return the cached agent id for a lookup digest, if fresh."""
+        entry = self._entries.get(lookup)
+        if entry is None:
+            return None
+        agent_id, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[lookup]
+            return None
+        self._entries.move_to_end(lookup)
+        return agent_id
+
+    def put(self, lookup: str, agent_id: UUID) -> None:
+        """Record a successful verification, evicting the oldest entries past capacity."""
+        if not self.enabled:
+            return
+        self._entries[lookup] = (agent_id, time.monotonic() + self.ttl_seconds)
+        self._entries.move_to_end(lookup)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def discard(self, lookup: str) -> None:
+        """Drop a single lookup digest."""
+        self._entries.pop(lookup, None)
+
+    def invalidate_agents(self, agent_ids: Iterable[UUID]) -> None:
+        """Drop every cached token belonging to the given agents."""
+        targets = set(agent_ids)
+        if not targets:
+            return
+        for lookup in [key for key, (agent_id, _) in self._entries.items() if agent_id in targets]:
+            del self._entries[lookup]
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+verified_agent_tokens = VerifiedAgentTokenCache(
+    max_size=settings.agent_auth_cache_size,
+    ttl_seconds=settings.agent_auth_cache_ttl_seconds,
+)
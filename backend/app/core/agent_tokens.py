@@ -9,6 +9,10 @@ import secrets
 
 ITERATIONS = 200_000
 SALT_BYTES = 16
+# Domain-separation key for the indexed lookup digest. Tokens carry 256 bits of
+# entropy, so the digest only needs to be deterministic, not secret; the PBKDF2
+# hash remains the authoritative verifier.
+_LOOKUP_KEY = b"openclaw-agent-token-lookup-v1"
 
 
 def generate_agent_token() -> str:
@@ -25,6 +29,11 @@ def _b64decode(value: str) -> bytes:
     return base64.urlsafe_b64decode(value + padding)
 
 
+def agent_token_lookup(token: str) -> str:
+    """Derive the deterministic, indexable lookup digest for an agent token."""
+    return hmac.new(_LOOKUP_KEY, token.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
 def hash_agent_token(token: str) -> str:
     """Hash an agent token using PBKDF2-HMAC-SHA256 with a random salt."""
     salt = secrets.token_bytes(SALT_BYTES)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Self
+from typing import Literal, Self
 
 from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -50,20 +50,109 @@ class Settings(BaseSettings):
     cors_origins: str = ""
     base_url: str = ""
 
+    # Agent auth: scan agents whose tokens predate the indexed lookup digest.
+    # Disable once every agent has re-authenticated or rotated its token.
+    agent_token_legacy_lookup: bool = True
+    # Verified-token cache (per process); set either value to 0 to disable.
+    agent_auth_cache_size: int = Field(default=4096, ge=0)
+    agent_auth_cache_ttl_seconds: float = Field(default=60.0, ge=0)
+
     # Database lifecycle
     db_auto_migrate: bool = False
 
+    # SSE streams are woken by in-process commit notifications. A positive value
+    # also re-queries idle streams at this interval as a safety net for writers
+    # outside this process; 0 keeps idle streams query-free.
+    stream_resync_seconds: float = Field(default=0.0, ge=0)
+    # Relay stream notifications across API replicas: "none", "postgres"
+    # (LISTEN/NOTIFY on DATABASE_URL) or "redis" (pub/sub on RQ_REDIS_URL).
+    stream_bridge_backend: Literal["none", "postgres", "redis"] = "none"
+    # Board snapshots run their independent reads on a dedicated pool of this many
+    # connections per process (on top of the request pool); 1 keeps every read on
+    # the request session (SQLite databases always do).
+    board_snapshot_read_concurrency: int = Field(default=1, ge=1)
+    # Built snapshots are cached per (board, version, task window); entries also
+    # expire after the TTL to cover writes that bypass the ORM (0 size disables).
+    board_snapshot_cache_size: int = Field(default=256, ge=0)
+    board_snapshot_cache_ttl_seconds: float = Field(default=60.0, gt=0)
+    # `approximate_total` list pages use the Postgres planner estimate; other
+    # databases (and failed estimates) reuse an exact count for the TTL.
+    pagination_count_cache_size: int = Field(default=1024, ge=0)
+    pagination_count_cache_ttl_seconds: float = Field(default=30.0, gt=0)
+
     # RQ queueing / dispatch
     rq_redis_url: str = "redis://localhost:6379/0"
     rq_queue_name: str = "default"
+    # Pause between items in the legacy single-item webhook flush entrypoint.
     rq_dispatch_throttle_seconds: float = 15.0
     rq_dispatch_max_retries: int = 3
     rq_dispatch_retry_base_seconds: float = 10.0
     rq_dispatch_retry_max_seconds: float = 120.0
+    # Pooled Redis clients ping idle connections after this many seconds (0 disables).
+    rq_redis_health_check_seconds: int = Field(default=30, ge=0)
+    # Queue worker: handlers run concurrently up to this many per process.
+    rq_worker_concurrency: int = Field(default=4, ge=1)
+    # On SIGTERM, wait this long for in-flight tasks before requeueing them and exiting.
+    rq_worker_drain_seconds: float = Field(default=30.0, ge=0)
+    # Reliable delivery keeps dequeued tasks on a processing list until acked; a
+    # task whose lease expires (worker crash or hang) is redelivered.
+    rq_reliable_delivery: bool = True
+    rq_lease_seconds: float = Field(default=300.0, gt=0)
+    # Tasks that exhaust their retries are kept in `<queue>:dead`, newest entries first.
+    rq_dead_letter_max_entries: int = Field(default=10_000, ge=1)
+    # Per-board (or per-gateway) token bucket for dispatch; a rate of 0 disables it.
+    rq_dispatch_rate_per_minute: float = Field(default=30.0, ge=0)
+    rq_dispatch_burst: int = Field(default=5, ge=1)
+    rq_dispatch_rate_scope: Literal["board", "gateway"] = "board"
+    # Gateway-scoped rate keys look up each board's gateway through a per-process
+    # LRU; entries expire after the TTL so boards moved between gateways re-route.
+    rq_dispatch_gateway_cache_size: int = Field(default=4096, ge=0)
+    rq_dispatch_gateway_cache_ttl_seconds: float = Field(default=60.0, gt=0)
+    # Webhook deliveries are coalesced into one digest per (board, target agent)
+    # over this window (keep it well below RQ_LEASE_SECONDS); 0 sends each alone.
+    rq_webhook_batch_window_seconds: float = Field(default=10.0, ge=0)
+    rq_webhook_batch_max_size: int = Field(default=200, ge=1)
 
     # OpenClaw gateway runtime compatibility
     gateway_min_version: str = "2026.02.9"
 
+    # Gateway RPC calls share one long-lived websocket per gateway config; pooled
+    # sockets close after the idle timeout and reconnect with capped backoff.
+    gateway_rpc_pool_enabled: bool = True
+    gateway_rpc_idle_timeout_seconds: float = Field(default=60.0, gt=0)
+    gateway_rpc_reconnect_max_seconds: float = Field(default=30.0, ge=0)
+    # Keepalive pings detect half-open pooled sockets; 0 disables them.
+    gateway_rpc_ping_interval_seconds: float = Field(default=20.0, ge=0)
+    # Requests written ahead of their replies by openclaw_call_many.
+    gateway_rpc_max_pipelined: int = Field(default=64, ge=1)
+    # Per-gateway circuit breaker: this many consecutive transport failures make
+    # calls fail fast until the reset window passes (0 disables the breaker).
+    gateway_circuit_failure_threshold: int = Field(default=5, ge=0)
+    gateway_circuit_reset_seconds: float = Field(default=30.0, gt=0)
+    # Lead broadcasts message boards concurrently; each board's send (including
+    # retries) is abandoned after the per-board timeout and reported as failed.
+    gateway_broadcast_concurrency: int = Field(default=10, ge=1)
+    gateway_broadcast_board_timeout_seconds: float = Field(default=30.0, gt=0)
+    # Queued template sync jobs: board agents synced at once, and how long job
+    # state and progress events are kept in Redis.
+    gateway_template_sync_concurrency: int = Field(default=4, ge=1)
+    gateway_template_sync_job_ttl_seconds: float = Field(default=7 * 24 * 3600, gt=0)
+    # Provisioning skips agent files whose rendered content hashes to what the
+    # gateway reports (or what this process last wrote); overwrite still writes all.
+    gateway_template_skip_unchanged: bool = True
+    gateway_template_hash_cache_size: int = Field(default=10_000, ge=0)
+    # Gateway status/session reads are served from a per-gateway cache for this
+    # long (0 disables it); a poller refreshes gateways read within the idle window.
+    gateway_status_cache_ttl_seconds: float = Field(default=10.0, ge=0)
+    gateway_status_poll_interval_seconds: float = Field(default=8.0, ge=0)
+    gateway_status_poll_idle_seconds: float = Field(default=300.0, gt=0)
+    # Subscribe to each gateway's event stream and batch agent presence updates.
+    # Off by default: every replica with it enabled subscribes to every gateway.
+    gateway_events_enabled: bool = False
+    gateway_events_flush_seconds: float = Field(default=2.0, gt=0)
+    gateway_events_presence_min_interval_seconds: float = Field(default=30.0, ge=0)
+    gateway_events_refresh_seconds: float = Field(default=60.0, gt=0)
+
     # OpenClaw config directory for Core Directory feature (~/.openclaw)
     openclaw_config_dir: str = "~/.openclaw"
 
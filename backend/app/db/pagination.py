@@ -2,32 +2,255 @@
 
 from __future__ import annotations
 
+import base64
+import json
+import time
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable, Sequence
-from typing import TYPE_CHECKING, Any, TypeVar
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+from uuid import UUID
 
+from fastapi import HTTPException, status
+from fastapi_pagination.api import apply_items_transformer, resolve_params
 from fastapi_pagination.ext.sqlalchemy import paginate as _paginate
+from sqlalchemy import Row, and_, asc, desc, func, inspect, or_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import select
 
+from app.core.config import settings
+from app.core.logging import get_logger
 from app.schemas.pagination import DefaultLimitOffsetPage
 
 if TYPE_CHECKING:
+    from fastapi_pagination.bases import AbstractParams
     from fastapi_pagination.limit_offset import LimitOffsetPage
+    from sqlalchemy.orm import Mapped, QueryableAttribute
+    from sqlalchemy.sql.elements import ColumnElement
     from sqlmodel.ext.asyncio.session import AsyncSession
     from sqlmodel.sql.expression import Select, SelectOfScalar
 
 T = TypeVar("T")
 
+logger = get_logger(__name__)
+
 Transformer = Callable[
     [Sequence[Any]],
     Sequence[Any] | Awaitable[Sequence[Any]],
 ]
 
 
+@dataclass(frozen=True, slots=True)
+class Keyset:
+    """Columns a list can seek by instead of counting and offsetting.
+
+    `sort` is the timestamp the list is ordered by and `id` breaks ties, so rows
+    sharing a timestamp are neither skipped nor repeated between pages.
+    """
+
+    sort: Mapped[datetime]
+    id: Mapped[UUID]
+    descending: bool = True
+
+
+def encode_cursor(sort_value: datetime, row_id: UUID) -> str:
+    """Return the opaque cursor that resumes a keyset list after this row."""
+    raw = json.dumps([sort_value.isoformat(), str(row_id)]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("utf-8").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_value, row_id = json.loads(raw)
+        return datetime.fromisoformat(sort_value), UUID(row_id)
+    except (TypeError, ValueError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="Invalid pagination cursor.",
+        ) from exc
+
+
+def _seek(keyset: Keyset, sort_value: datetime, row_id: UUID) -> ColumnElement[bool]:
+    # The plain range on `sort` lets the existing (..., created_at) indexes bound
+    # the scan; the second clause only filters rows that share the timestamp.
+    if keyset.descending:
+        return and_(
+            keyset.sort <= sort_value,
+            or_(keyset.sort < sort_value, keyset.id < row_id),
+        )
+    return and_(
+        keyset.sort >= sort_value,
+        or_(keyset.sort > sort_value, keyset.id > row_id),
+    )
+
+
+def _row_value(row: Any, attribute: Mapped[Any]) -> Any:
+    # Multi-entity selects yield rows; pick the entity whose mapper owns the column.
+    prop = cast("QueryableAttribute[Any]", inspect(attribute))
+    mapper = prop.parent.mapper
+    entities = row if isinstance(row, Row) else (row,)
+    entity = next(
+        value
+        for value in entities
+        if (state := inspect(value, raiseerr=False)) is not None and state.mapper.isa(mapper)
+    )
+    return getattr(entity, prop.key)
+
+
+async def _paginate_by_cursor(
+    session: AsyncSession,
+    statement: Select[Any] | SelectOfScalar[Any],
+    keyset: Keyset,
+    *,
+    cursor: str,
+    limit: int,
+    transformer: Transformer | None,
+) -> LimitOffsetPage[T]:
+    if cursor:
+        statement = statement.where(_seek(keyset, *_decode_cursor(cursor)))
+    direction = desc if keyset.descending else asc
+    statement = (
+        statement.order_by(None)
+        .order_by(direction(keyset.sort), direction(keyset.id))
+        .limit(limit + 1)
+    )
+    rows = list((await session.exec(statement)).all())
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(
+            _row_value(rows[-1], keyset.sort),
+            _row_value(rows[-1], keyset.id),
+        )
+    items = await apply_items_transformer(rows, transformer, async_=True)
+    return DefaultLimitOffsetPage[T](
+        items=items,
+        total=None,
+        limit=limit,
+        offset=0,
+        next_cursor=next_cursor,
+    )
+
+
+class _CountCache:
+    """Process-wide LRU of exact counts that stand in for estimates until the TTL."""
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[str, tuple[float, int]] = OrderedDict()
+
+    def get(self, key: str) -> int | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, total = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return total
+
+    def set(self, key: str, total: int) -> None:
+        max_entries = settings.pagination_count_cache_size
+        if max_entries <= 0:
+            return
+        expires_at = time.monotonic() + settings.pagination_count_cache_ttl_seconds
+        self._entries[key] = (expires_at, total)
+        self._entries.move_to_end(key)
+        while len(self._entries) > max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_count_cache = _CountCache()
+
+
+async def _planner_estimate(session: AsyncSession, statement: Any) -> int:
+    connection = await session.connection()
+    sql = statement.compile(
+        dialect=connection.dialect,
+        compile_kwargs={"literal_binds": True},
+    )
+    # A savepoint keeps a failed EXPLAIN from aborting the request transaction.
+    async with connection.begin_nested():
+        result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+        plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def estimate_total(
+    session: AsyncSession,
+    statement: Select[Any] | SelectOfScalar[Any],
+) -> int:
+    """Return an approximate row count for `statement` without always counting.
+
+    Postgres answers from the planner's row estimate; otherwise (or if the
+    statement cannot be explained) an exact count is cached for
+    `PAGINATION_COUNT_CACHE_TTL_SECONDS`.
+    """
+    statement = statement.order_by(None).limit(None).offset(None)
+    connection = await session.connection()
+    if connection.dialect.name == "postgresql":
+        try:
+            return await _planner_estimate(session, statement)
+        except (SQLAlchemyError, LookupError, TypeError, ValueError):
+            logger.warning("pagination.estimate_failed", exc_info=True)
+    count_statement = select(func.count()).select_from(statement.subquery())
+    compiled = count_statement.compile(dialect=connection.dialect)
+    key = f"{compiled}|{sorted(compiled.params.items())!r}"
+    cached = _count_cache.get(key)
+    if cached is not None:
+        return cached
+    total = int((await session.exec(count_statement)).one() or 0)
+    _count_cache.set(key, total)
+    return total
+
+
 async def paginate(
     session: AsyncSession,
     statement: Select[Any] | SelectOfScalar[Any],
     *,
     transformer: Transformer | None = None,
+    keyset: Keyset | None = None,
 ) -> LimitOffsetPage[T]:
-    """Execute a paginated query and cast to the project page type alias."""
-    page = await _paginate(session, statement, transformer=transformer)
-    return DefaultLimitOffsetPage[T].model_validate(page)
+    """Execute a paginated query and cast to the project page type alias.
+
+    Lists that pass `keyset` also accept `?cursor=`, which pages by seeking past
+    the previous page's last row and skips the `COUNT(*)`. Offset pages count
+    unless the request sends `include_total=false` (no total) or
+    `approximate_total=true` (see `estimate_total`).
+    """
+    params: AbstractParams = resolve_params()
+    cursor = getattr(params, "cursor", None)
+    if cursor is not None:
+        if keyset is None:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail="This list does not support cursor pagination.",
+            )
+        limit = params.to_raw_params().as_limit_offset().limit or 0
+        return await _paginate_by_cursor(
+            session,
+            statement,
+            keyset,
+            cursor=cursor,
+            limit=limit,
+            transformer=transformer,
+        )
+    page = DefaultLimitOffsetPage[T].model_validate(
+        await _paginate(session, statement, transformer=transformer),
+    )
+    if getattr(params, "include_total", True) and getattr(params, "approximate_total", False):
+        seen = page.offset + len(page.items)
+        if len(page.items) < page.limit and (page.items or not page.offset):
+            # A short page is the last one, so the total is known exactly.
+            return page.model_copy(update={"total": seen})
+        # An estimate must never claim fewer rows than this page has proven exist.
+        total = max(await estimate_total(session, statement), seen)
+        page = page.model_copy(update={"total": total, "total_is_estimate": True})
+    return page
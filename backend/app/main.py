@@ -26,6 +26,7 @@ from app.api.gateways import router as gateways_router
 from app.api.metrics import router as metrics_router
 from app.api.openclaw_config import router as openclaw_config_router
 from app.api.organizations import router as organizations_router
+from app.api.queue import router as queue_router
 from app.api.skills_marketplace import router as skills_marketplace_router
 from app.api.souls_directory import router as souls_directory_router
 from app.api.tags import router as tags_router
@@ -37,6 +38,18 @@ from app.core.error_handling import install_error_handling
 from app.core.logging import configure_logging, get_logger
 from app.db.session import init_db
 from app.schemas.health import HealthStatusResponse
+from app.services.event_bridge import start_event_bridge, stop_event_bridge
+from app.services.event_hub import event_hub
+from app.services.openclaw.gateway_events import (
+    start_gateway_event_subscribers,
+    stop_gateway_event_subscribers,
+)
+from app.services.openclaw.gateway_rpc import close_gateway_connections
+from app.services.openclaw.gateway_status_cache import (
+    start_gateway_status_poller,
+    stop_gateway_status_poller,
+)
+from app.services.queue import aclose_redis_clients
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
@@ -72,6 +85,10 @@ OPENAPI_TAGS = [
         "name": "metrics",
         "description": "Aggregated operational and board analytics metrics endpoints.",
     },
+    {
+        "name": "queue",
+        "description": "Background task queue health and dead-letter inspection, replay, and purge.",
+    },
     {
         "name": "organizations",
         "description": "Organization profile, membership, and governance management endpoints.",
@@ -442,10 +459,18 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
         settings.db_auto_migrate,
     )
     await init_db()
+    bridge_task = start_event_bridge(event_hub)
+    status_poller_task = start_gateway_status_poller()
+    gateway_events_task = start_gateway_event_subscribers()
     logger.info("app.lifecycle.started")
     try:
         yield
     finally:
+        await stop_gateway_event_subscribers(gateway_events_task)
+        await stop_gateway_status_poller(status_poller_task)
+        await stop_event_bridge(event_hub, bridge_task)
+        await close_gateway_connections()
+        await aclose_redis_clients()
         logger.info("app.lifecycle.stopped")
 
 
@@ -536,6 +561,7 @@ api_v1.include_router(gateway_router)
 api_v1.include_router(gateways_router)
 api_v1.include_router(metrics_router)
 api_v1.include_router(organizations_router)
+api_v1.include_router(queue_router)
 api_v1.include_router(openclaw_config_router)
 api_v1.include_router(souls_directory_router)
 api_v1.include_router(skills_marketplace_router)
@@ -5,6 +5,7 @@ from app.models.agent_channel_configs import AgentChannelConfig
 from app.models.agents import Agent
 from app.models.approval_task_links import ApprovalTaskLink
 from app.models.approvals import Approval
+from app.models.board_changes import BoardChange
 from app.models.board_group_memory import BoardGroupMemory
 from app.models.board_groups import BoardGroup
 from app.models.board_memory import BoardMemory
@@ -37,6 +38,7 @@ __all__ = [
     "AgentChannelConfig",
     "ApprovalTaskLink",
     "Approval",
+    "BoardChange",
     "BoardGroupMemory",
     "BoardWebhook",
     "BoardWebhookPayload",
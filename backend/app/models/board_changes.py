@@ -0,0 +1,28 @@
+"""Change log rows backing incremental board snapshot deltas."""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from sqlalchemy import BigInteger, Column, Index
+from sqlmodel import Field
+
+from app.models.base import QueryModel
+
+
+class BoardChange(QueryModel, table=True):
+    """Latest board version at which one snapshot entity changed or was deleted.
+
+    Rows are upserted by the session commit hooks (see
+    `app.services.board_versions`); an entity that no longer exists is a tombstone.
+    """
+
+    __tablename__ = "board_changes"  # pyright: ignore[reportAssignmentType]
+    __table_args__ = (Index("ix_board_changes_board_id_version", "board_id", "version"),)
+
+    # No foreign key: rows for deleted boards are removed with the board.
+    board_id: UUID = Field(primary_key=True)
+    # "task", "approval", "chat_message" or "agent" (agents are logged on delete only).
+    kind: str = Field(primary_key=True)
+    entity_id: UUID = Field(primary_key=True)
+    version: int = Field(sa_column=Column(BigInteger, nullable=False))
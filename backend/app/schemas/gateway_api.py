@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+from datetime import datetime
+from typing import Literal
+
 from sqlmodel import SQLModel
 
 from app.schemas.common import NonEmptyStr
 
-RUNTIME_ANNOTATION_TYPES = (NonEmptyStr,)
+RUNTIME_ANNOTATION_TYPES = (NonEmptyStr, datetime)
 
 
 class GatewaySessionMessageRequest(SQLModel):
@@ -24,6 +27,16 @@ class GatewayResolveQuery(SQLModel):
     gateway_password: str | None = None
 
 
+class GatewayCircuitRead(SQLModel):
+    """Circuit breaker state of the gateway RPC client for one gateway."""
+
+    state: Literal["closed", "open", "half_open"]
+    consecutive_failures: int = 0
+    opened_at: datetime | None = None
+    retry_in_seconds: float | None = None
+    last_error: str | None = None
+
+
 class GatewaysStatusResponse(SQLModel):
     """Aggregated gateway status response including session metadata."""
 
@@ -34,6 +47,11 @@ class GatewaysStatusResponse(SQLModel):
     main_session: object | None = None
     main_session_error: str | None = None
     error: str | None = None
+    # When the gateway was last asked, and how old that answer is.
+    cached_at: datetime | None = None
+    cache_age_seconds: float | None = None
+    # Live breaker state; an open circuit means calls to this gateway fail fast.
+    circuit: GatewayCircuitRead | None = None
 
 
 class GatewaySessionsResponse(SQLModel):
@@ -41,12 +59,16 @@ class GatewaySessionsResponse(SQLModel):
 
     sessions: list[object]
     main_session: object | None = None
+    cached_at: datetime | None = None
+    cache_age_seconds: float | None = None
 
 
 class GatewaySessionResponse(SQLModel):
     """Single gateway session response payload."""
 
     session: object
+    cached_at: datetime | None = None
+    cache_age_seconds: float | None = None
 
 
 class GatewaySessionHistoryResponse(SQLModel):
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
 from pydantic import field_validator
@@ -86,6 +87,16 @@ class GatewayTemplatesSyncError(SQLModel):
     message: str
 
 
+class GatewayTemplatesSyncAgentFiles(SQLModel):
+    """Workspace files a template sync wrote to, or left unchanged on, one agent."""
+
+    agent_id: UUID
+    agent_name: str
+    board_id: UUID | None = None
+    written: list[str] = Field(default_factory=list)
+    skipped: list[str] = Field(default_factory=list)
+
+
 class GatewayTemplatesSyncResult(SQLModel):
     """Summary payload returned by gateway template sync endpoints."""
 
@@ -95,9 +106,29 @@ class GatewayTemplatesSyncResult(SQLModel):
     agents_updated: int
     agents_skipped: int
     main_updated: bool
+    files_written: int = 0
+    files_skipped: int = 0
+    agent_files: list[GatewayTemplatesSyncAgentFiles] = Field(default_factory=list)
     errors: list[GatewayTemplatesSyncError] = Field(default_factory=list)
 
 
+class GatewayTemplatesSyncJobRead(SQLModel):
+    """Status and progress counters of a queued gateway template sync job."""
+
+    id: str
+    gateway_id: UUID
+    status: Literal["queued", "running", "retrying", "completed", "failed"]
+    total: int = 0
+    done: int = 0
+    skipped: int = 0
+    failed: int = 0
+    runs: int = 0
+    error: str | None = None
+    created_at: datetime
+    updated_at: datetime
+    result: GatewayTemplatesSyncResult | None = None
+
+
 class MainAgentRead(SQLModel):
     """Read-only view of a gateway's main agent config (agents.defaults from OpenClaw)."""
 
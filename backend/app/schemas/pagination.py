@@ -5,15 +5,50 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, TypeVar
 
 from fastapi import Query
-from fastapi_pagination.customization import CustomizedPage, UseParamsFields
-from fastapi_pagination.limit_offset import LimitOffsetPage
+from fastapi_pagination.bases import RawParams
+from fastapi_pagination.customization import (
+    CustomizedPage,
+    UseAdditionalFields,
+    UseOptionalFields,
+    UseParams,
+    UseParamsFields,
+)
+from fastapi_pagination.limit_offset import LimitOffsetPage, LimitOffsetParams
 
 T = TypeVar("T")
 
 
+class DefaultLimitOffsetParams(LimitOffsetParams):
+    """Limit/offset params plus an opt-in keyset cursor and total controls.
+
+    Sending `cursor` (empty for the first page, then the previous page's
+    `next_cursor`) switches supporting lists to keyset paging: `offset` is ignored
+    and `total` is not counted. `include_total=false` skips the count on offset
+    pages too, and `approximate_total=true` replaces it with an estimate.
+    """
+
+    cursor: str | None = Query(
+        None,
+        description="Keyset cursor; send it empty to start, then pass `next_cursor`.",
+    )
+    include_total: bool = Query(True, description="Count matching rows for `total`.")
+    approximate_total: bool = Query(
+        False,
+        description="Estimate `total` instead of counting every matching row.",
+    )
+
+    def to_raw_params(self) -> RawParams:
+        raw_params = super().to_raw_params()
+        # Estimated totals are filled in by `app.db.pagination.paginate`.
+        raw_params.include_total = self.include_total and not self.approximate_total
+        return raw_params
+
+
 # Project-wide default pagination response model.
 # - Keep `limit` / `offset` naming (matches existing API conventions).
 # - Cap list endpoints to 200 items per request (matches prior route-level constraints).
+# - `total` is null and `next_cursor` is set when the request paged by cursor.
+# - `total` is null when the count was skipped and flagged when it is an estimate.
 if TYPE_CHECKING:
     # Type checkers treat this as a normal generic page type.
     DefaultLimitOffsetPage = LimitOffsetPage
@@ -21,8 +56,14 @@ else:
     # Runtime uses project-default query param bounds for all list endpoints.
     DefaultLimitOffsetPage = CustomizedPage[
         LimitOffsetPage[T],
+        UseParams(DefaultLimitOffsetParams),
         UseParamsFields(
             limit=Query(200, ge=1, le=200),
             offset=Query(0, ge=0),
         ),
+        UseOptionalFields(fields=("total",)),
+        UseAdditionalFields(
+            next_cursor=(str | None, None),
+            total_is_estimate=(bool, False),
+        ),
     ]
@@ -0,0 +1,61 @@
+"""Schemas for background queue health and dead-letter management endpoints."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Self
+
+from pydantic import Field, model_validator
+from sqlmodel import SQLModel
+
+RUNTIME_ANNOTATION_TYPES = (datetime,)
+
+
+class QueueStatsRead(SQLModel):
+    """Current sizes of the background task queue."""
+
+    queue_name: str
+    queued: int
+    scheduled: int
+    processing: int
+    dead: int
+
+
+class DeadLetterSummary(SQLModel):
+    """Dead-lettered task as shown in list views."""
+
+    id: str
+    queue_name: str
+    task_type: str
+    board_id: str | None = None
+    gateway_id: str | None = None
+    attempts: int
+    last_error: str | None = None
+    dead_at: datetime
+
+
+class DeadLetterRead(DeadLetterSummary):
+    """Dead-lettered task with its payload and failure history."""
+
+    task: dict[str, Any]
+    history: list[dict[str, Any]] = Field(default_factory=list)
+
+
+class DeadLetterSelection(SQLModel):
+    """Dead letters to replay or purge: explicit ids, or every visible entry."""
+
+    ids: list[str] = Field(default_factory=list, max_length=1000)
+    all: bool = False
+
+    @model_validator(mode="after")
+    def require_target(self) -> Self:
+        """Reject selections that name no entries."""
+        if not self.ids and not self.all:
+            raise ValueError("Provide ids or set all=true.")
+        return self
+
+
+class DeadLetterActionResult(SQLModel):
+    """Number of dead letters affected by a replay or purge."""
+
+    count: int
@@ -44,6 +44,33 @@ class BoardSnapshot(SQLModel):
     approvals: list[ApprovalRead]
     chat_messages: list[BoardMemoryRead]
     pending_approvals_count: int = 0
+    # True when `task_limit` cut the task list short.
+    tasks_truncated: bool = False
+    # Board version the snapshot was read at; pass it back as `since_version`.
+    version: int = 0
+
+
+class BoardSnapshotDelta(SQLModel):
+    """Changes to a board snapshot since a previously read version.
+
+    Lists hold rows added or changed after `since_version`; `removed_*` ids were
+    deleted (or, for tasks, left the requested status window). `agents` is always
+    the full list. When `reset` is true the lists are a complete snapshot instead,
+    and the client should replace its state rather than patch it.
+    """
+
+    board: BoardRead
+    version: int
+    since_version: int
+    reset: bool = False
+    tasks: list[TaskCardRead]
+    agents: list[AgentRead]
+    approvals: list[ApprovalRead]
+    chat_messages: list[BoardMemoryRead]
+    pending_approvals_count: int = 0
+    removed_task_ids: list[UUID] = Field(default_factory=list)
+    removed_approval_ids: list[UUID] = Field(default_factory=list)
+    removed_chat_message_ids: list[UUID] = Field(default_factory=list)
 
 
 class BoardGroupTaskSummary(SQLModel):
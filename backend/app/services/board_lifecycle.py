@@ -11,11 +11,13 @@ from typing import TYPE_CHECKING
 from fastapi import HTTPException, status
 from sqlmodel import col, select
 
+from app.core.agent_token_cache import verified_agent_tokens
 from app.db import crud
 from app.models.activity_events import ActivityEvent
 from app.models.agents import Agent
 from app.models.approval_task_links import ApprovalTaskLink
 from app.models.approvals import Approval
+from app.models.board_changes import BoardChange
 from app.models.board_memory import BoardMemory
 from app.models.board_onboarding import BoardOnboardingSession
 from app.models.board_webhook_payloads import BoardWebhookPayload
@@ -155,6 +157,9 @@ async def delete_board(session: AsyncSession, *, board: Board) -> OkResponse:
             commit=False,
         )
         await crud.delete_where(session, Agent, col(Agent.id).in_(agent_ids))
+        verified_agent_tokens.invalidate_agents(agent_ids)
+
+    await crud.delete_where(session, BoardChange, col(BoardChange.board_id) == board.id)
 
     await session.delete(board)
     await session.commit()
@@ -2,20 +2,35 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import func
+from sqlalchemy import func, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.config import settings
+from app.core.time import utcnow
 from app.models.agents import Agent
 from app.models.approvals import Approval
 from app.models.board_memory import BoardMemory
+from app.models.task_dependencies import TaskDependency
 from app.models.tasks import Task
+from app.schemas.agents import AgentRead
 from app.schemas.approvals import ApprovalRead
 from app.schemas.board_memory import BoardMemoryRead
 from app.schemas.boards import BoardRead
-from app.schemas.view_models import BoardSnapshot, TaskCardRead
+from app.schemas.view_models import BoardSnapshot, BoardSnapshotDelta, TaskCardRead
 from app.services.approval_task_links import load_task_ids_by_approval, task_counts_for_board
+from app.services.board_versions import board_changes_since, board_version
+from app.services.openclaw.constants import OFFLINE_AFTER
 from app.services.openclaw.provisioning_db import AgentLifecycleService
 from app.services.tags import TagState, load_tag_state
 from app.services.task_dependencies import (
@@ -25,12 +40,13 @@ from app.services.task_dependencies import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
     from uuid import UUID
 
-    from sqlmodel.ext.asyncio.session import AsyncSession
-
     from app.models.boards import Board
 
+    _Read = Callable[[AsyncSession], Awaitable[Any]]
+
 
 def _memory_to_read(memory: BoardMemory) -> BoardMemoryRead:
     return BoardMemoryRead.model_validate(memory, from_attributes=True)
@@ -87,68 +103,226 @@ def _task_to_card(
     )
 
 
-async def build_board_snapshot(session: AsyncSession, board: Board) -> BoardSnapshot:
-    """Build a board snapshot with tasks, agents, approvals, and chat history."""
-    board_read = BoardRead.model_validate(board, from_attributes=True)
+@dataclass(slots=True)
+class _ReadPool:
+    """Dedicated engine for concurrent snapshot reads and the slots guarding it."""
 
-    tasks = list(
-        await Task.objects.filter_by(board_id=board.id)
-        .order_by(col(Task.created_at).desc())
-        .all(session),
-    )
-    task_ids = [task.id for task in tasks]
-    tag_state_by_task_id = await load_tag_state(
-        session,
-        task_ids=task_ids,
-    )
+    engine: AsyncEngine
+    slots: asyncio.Semaphore
 
-    deps_by_task_id = await dependency_ids_by_task_id(
-        session,
-        board_id=board.id,
-        task_ids=task_ids,
-    )
-    all_dependency_ids: list[UUID] = []
-    for values in deps_by_task_id.values():
-        all_dependency_ids.extend(values)
-    dependency_status_by_id_map = await dependency_status_by_id(
-        session,
-        board_id=board.id,
-        dependency_ids=list({*all_dependency_ids}),
-    )
 
-    agents = (
-        await Agent.objects.filter_by(board_id=board.id)
+# One bounded pool per database URL, separate from the request engine's pool.
+_read_pools: dict[str, _ReadPool] = {}
+_SNAPSHOT_ID_PATTERN = re.compile(r"[0-9A-Fa-f-]+")
+
+
+def _read_pool(session: AsyncSession) -> _ReadPool | None:
+    """Return the snapshot read pool for the session's database, if reads may fan out.
+
+    Concurrent reads never borrow connections from the request engine: each
+    snapshot request already holds one there, so fanning out on it could leave
+    every request waiting on the pool. The dedicated pool has exactly
+    `BOARD_SNAPSHOT_READ_CONCURRENCY` connections shared by all snapshots of the
+    process, and reads queue on its slots rather than on the pool timeout.
+    """
+    bind = session.bind
+    concurrency = settings.board_snapshot_read_concurrency
+    if concurrency <= 1 or not isinstance(bind, AsyncEngine):
+        return None
+    if bind.dialect.name == "sqlite":
+        return None
+    url = bind.url.render_as_string(hide_password=False)
+    pool = _read_pools.get(url)
+    if pool is None:
+        engine = create_async_engine(
+            bind.url,
+            pool_pre_ping=True,
+            pool_size=concurrency,
+            max_overflow=0,
+        )
+        pool = _read_pools[url] = _ReadPool(engine, asyncio.Semaphore(concurrency))
+    return pool
+
+
+class _SnapshotReads:
+    """Runs independent snapshot reads, on a dedicated read pool when enabled.
+
+    Each concurrent read gets its own session; on Postgres those sessions import
+    the request transaction's snapshot, so every round of one snapshot sees the
+    same point in time. SQLite engines (and a concurrency of 1) keep every read on
+    the request session, in order.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+        self._pool = _read_pool(session)
+        self._snapshot_id: str | None = None
+        self._exported = False
+
+    async def gather(self, *reads: _Read) -> list[Any]:
+        pool = self._pool
+        if pool is None:
+            return [await read(self._session) for read in reads]
+        if not self._exported:
+            self._snapshot_id = await _export_snapshot(self._session)
+            self._exported = True
+        return list(await asyncio.gather(*(self._run(pool, read) for read in reads)))
+
+    async def _run(self, pool: _ReadPool, read: _Read) -> Any:
+        async with pool.slots, AsyncSession(pool.engine, expire_on_commit=False) as session:
+            if self._snapshot_id is not None:
+                connection = await session.connection(
+                    execution_options={"isolation_level": "REPEATABLE READ"},
+                )
+                await connection.execute(
+                    text(f"SET TRANSACTION SNAPSHOT '{self._snapshot_id}'"),
+                )
+            return await read(session)
+
+
+async def _export_snapshot(session: AsyncSession) -> str | None:
+    """Export the request transaction's snapshot for the concurrent read sessions."""
+    connection = await session.connection()
+    if connection.dialect.name != "postgresql":
+        return None
+    snapshot_id = (await connection.execute(text("SELECT pg_export_snapshot()"))).scalar_one()
+    if not isinstance(snapshot_id, str) or not _SNAPSHOT_ID_PATTERN.fullmatch(snapshot_id):
+        return None
+    return snapshot_id
+
+
+async def _load_tasks(
+    session: AsyncSession,
+    *,
+    board_id: UUID,
+    statuses: Sequence[str],
+    limit: int | None,
+) -> list[Task]:
+    statement = Task.objects.filter_by(board_id=board_id)
+    if statuses:
+        statement = statement.filter(col(Task.status).in_(statuses))
+    statement = statement.order_by(col(Task.created_at).desc())
+    if limit is not None:
+        # One extra row tells the caller whether the window cut anything off.
+        statement = statement.limit(limit + 1)
+    return list(await statement.all(session))
+
+
+async def _load_agents(session: AsyncSession, *, board_id: UUID) -> list[Agent]:
+    return list(
+        await Agent.objects.filter_by(board_id=board_id)
         .order_by(col(Agent.created_at).desc())
-        .all(session)
+        .all(session),
     )
-    agent_reads = [
-        AgentLifecycleService.to_agent_read(AgentLifecycleService.with_computed_status(agent))
-        for agent in agents
-    ]
-    agent_name_by_id = {agent.id: agent.name for agent in agents}
 
-    pending_approvals_count = int(
+
+async def _pending_approvals_count(session: AsyncSession, *, board_id: UUID) -> int:
+    return int(
         (
             await session.exec(
                 select(func.count(col(Approval.id)))
-                .where(col(Approval.board_id) == board.id)
+                .where(col(Approval.board_id) == board_id)
                 .where(col(Approval.status) == "pending"),
             )
         ).one(),
     )
 
-    approvals = (
-        await Approval.objects.filter_by(board_id=board.id)
+
+async def _load_approvals(session: AsyncSession, *, board_id: UUID) -> list[Approval]:
+    return list(
+        await Approval.objects.filter_by(board_id=board_id)
         .order_by(col(Approval.created_at).desc())
         .limit(200)
-        .all(session)
+        .all(session),
     )
-    approval_ids = [approval.id for approval in approvals]
-    task_ids_by_approval = await load_task_ids_by_approval(
-        session,
-        approval_ids=approval_ids,
+
+
+async def _load_chat_messages(session: AsyncSession, *, board_id: UUID) -> list[BoardMemory]:
+    chat_messages = list(
+        await BoardMemory.objects.filter_by(board_id=board_id)
+        .filter(col(BoardMemory.is_chat).is_(True))
+        # Old/invalid rows (empty/whitespace-only content) can exist; exclude them to
+        # satisfy the NonEmptyStr response schema.
+        .filter(func.length(func.trim(col(BoardMemory.content))) > 0)
+        .order_by(col(BoardMemory.created_at).desc())
+        .limit(200)
+        .all(session),
+    )
+    chat_messages.sort(key=lambda item: item.created_at)
+    return chat_messages
+
+
+async def _task_titles_by_id(
+    session: AsyncSession,
+    *,
+    board_id: UUID,
+    task_ids: Sequence[UUID],
+) -> dict[UUID, str]:
+    if not task_ids:
+        return {}
+    rows = await session.exec(
+        select(col(Task.id), col(Task.title))
+        .where(col(Task.board_id) == board_id)
+        .where(col(Task.id).in_(task_ids)),
     )
+    return dict(rows.all())
+
+
+async def _hydrate(
+    reads: _SnapshotReads,
+    board_id: UUID,
+    *,
+    tasks: list[Task],
+    agents: list[Agent],
+    approvals: list[Approval],
+    scope_counts: bool,
+) -> tuple[list[TaskCardRead], list[AgentRead], list[ApprovalRead]]:
+    """Turn loaded rows into task cards, agent reads and approval cards.
+
+    `scope_counts` limits approval counts to the given tasks instead of the board.
+    """
+    task_ids = [task.id for task in tasks]
+
+    tag_state_by_task_id, deps_by_task_id, task_ids_by_approval, counts_by_task_id = (
+        await reads.gather(
+            partial(load_tag_state, task_ids=task_ids),
+            partial(dependency_ids_by_task_id, board_id=board_id, task_ids=task_ids),
+            partial(load_task_ids_by_approval, approval_ids=[item.id for item in approvals]),
+            partial(
+                task_counts_for_board,
+                board_id=board_id,
+                task_ids=set(task_ids) if scope_counts else None,
+            ),
+        )
+    )
+
+    all_dependency_ids: list[UUID] = []
+    for values in deps_by_task_id.values():
+        all_dependency_ids.extend(values)
     task_title_by_id = {task.id: task.title for task in tasks}
+    # Approvals can link tasks that were not loaded; look their titles up.
+    missing_title_ids = {
+        task_id
+        for approval in approvals
+        for task_id in task_ids_by_approval.get(approval.id, [approval.task_id])
+        if task_id is not None and task_id not in task_title_by_id
+    }
+    dependency_status_by_id_map, extra_titles = await reads.gather(
+        partial(
+            dependency_status_by_id,
+            board_id=board_id,
+            dependency_ids=list({*all_dependency_ids}),
+        ),
+        partial(_task_titles_by_id, board_id=board_id, task_ids=list(missing_title_ids)),
+    )
+    task_title_by_id.update(extra_titles)
+
+    agent_reads = [
+        AgentLifecycleService.to_agent_read(AgentLifecycleService.with_computed_status(agent))
+        for agent in agents
+    ]
+    agent_name_by_id = {agent.id: agent.name for agent in agents}
+
     # Hydrate each approval with linked task metadata, falling back to legacy
     # single-task fields so older rows still render complete approval cards.
     approval_reads = [
@@ -169,8 +343,6 @@ async def build_board_snapshot(session: AsyncSession, board: Board) -> BoardSnap
         for approval in approvals
     ]
 
-    counts_by_task_id = await task_counts_for_board(session, board_id=board.id)
-
     task_cards = [
         _task_to_card(
             task,
@@ -183,17 +355,45 @@ async def build_board_snapshot(session: AsyncSession, board: Board) -> BoardSnap
         for task in tasks
     ]
 
-    chat_messages = (
-        await BoardMemory.objects.filter_by(board_id=board.id)
-        .filter(col(BoardMemory.is_chat).is_(True))
-        # Old/invalid rows (empty/whitespace-only content) can exist; exclude them to
-        # satisfy the NonEmptyStr response schema.
-        .filter(func.length(func.trim(col(BoardMemory.content))) > 0)
-        .order_by(col(BoardMemory.created_at).desc())
-        .limit(200)
-        .all(session)
+    return task_cards, agent_reads, approval_reads
+
+
+async def build_board_snapshot(
+    session: AsyncSession,
+    board: Board,
+    *,
+    task_statuses: Sequence[str] = (),
+    task_limit: int | None = None,
+) -> BoardSnapshot:
+    """Build a board snapshot with tasks, agents, approvals, and chat history.
+
+    `task_statuses` and `task_limit` window the task list (newest first); the
+    other sections always cover the whole board. Reads that do not depend on
+    each other run in three rounds instead of one after another.
+    """
+    board_read = BoardRead.model_validate(board, from_attributes=True)
+    board_id = board.id
+    windowed = bool(task_statuses) or task_limit is not None
+    reads = _SnapshotReads(session)
+
+    tasks, agents, pending_approvals_count, approvals, chat_messages = await reads.gather(
+        partial(_load_tasks, board_id=board_id, statuses=task_statuses, limit=task_limit),
+        partial(_load_agents, board_id=board_id),
+        partial(_pending_approvals_count, board_id=board_id),
+        partial(_load_approvals, board_id=board_id),
+        partial(_load_chat_messages, board_id=board_id),
+    )
+    tasks_truncated = task_limit is not None and len(tasks) > task_limit
+    if tasks_truncated:
+        tasks = tasks[:task_limit]
+    task_cards, agent_reads, approval_reads = await _hydrate(
+        reads,
+        board_id,
+        tasks=tasks,
+        agents=agents,
+        approvals=approvals,
+        scope_counts=windowed,
     )
-    chat_messages.sort(key=lambda item: item.created_at)
     chat_reads = [_memory_to_read(memory) for memory in chat_messages]
 
     return BoardSnapshot(
@@ -203,4 +403,274 @@ async def build_board_snapshot(session: AsyncSession, board: Board) -> BoardSnap
         approvals=approval_reads,
         chat_messages=chat_reads,
         pending_approvals_count=pending_approvals_count,
+        tasks_truncated=tasks_truncated,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class VersionedBoardSnapshot:
+    """A built snapshot with the board version it was read at and its ETag."""
+
+    snapshot: BoardSnapshot
+    version: int
+    etag: str
+    # Monotonic deadline after which the entry must be rebuilt even if the board
+    # version has not moved (TTL, or an agent's computed status going offline).
+    stale_at: float = field(default=0.0, repr=False)
+
+
+_SnapshotKey = tuple["UUID", int, tuple[str, ...], int | None]
+
+
+class _SnapshotCache:
+    """Process-wide LRU of built snapshots keyed by board version and task window."""
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[_SnapshotKey, VersionedBoardSnapshot] = OrderedDict()
+
+    def get(self, key: _SnapshotKey) -> VersionedBoardSnapshot | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry.stale_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: _SnapshotKey, entry: VersionedBoardSnapshot) -> None:
+        max_entries = settings.board_snapshot_cache_size
+        if max_entries <= 0:
+            return
+        # Older versions of the same board can never be served again.
+        board_id = key[0]
+        for stale_key in [item for item in self._entries if item[0] == board_id]:
+            if stale_key[1] < key[1]:
+                del self._entries[stale_key]
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_snapshot_cache = _SnapshotCache()
+
+
+def _snapshot_etag(version: int, snapshot: BoardSnapshot) -> str:
+    # The content digest keeps ETags comparable across replicas and cache misses.
+    digest = hashlib.sha256(snapshot.model_dump_json().encode()).hexdigest()[:16]
+    return f'"{version}-{digest}"'
+
+
+def _stale_at(snapshot: BoardSnapshot) -> float:
+    ttl = settings.board_snapshot_cache_ttl_seconds
+    now = utcnow()
+    for agent in snapshot.agents:
+        if agent.status == "online" and agent.last_seen_at is not None:
+            ttl = min(ttl, (agent.last_seen_at + OFFLINE_AFTER - now).total_seconds())
+    return time.monotonic() + max(ttl, 0.0)
+
+
+async def versioned_board_snapshot(
+    session: AsyncSession,
+    board: Board,
+    *,
+    task_statuses: Sequence[str] = (),
+    task_limit: int | None = None,
+) -> VersionedBoardSnapshot:
+    """Return the board snapshot, reusing a cached build while the version holds."""
+    # Read the version before building: a write landing mid-build then only makes
+    # the entry look older than its data, never newer.
+    version = await board_version(session, board.id) or 0
+    key: _SnapshotKey = (board.id, version, tuple(task_statuses), task_limit)
+    cached = _snapshot_cache.get(key)
+    if cached is not None:
+        return cached
+    snapshot = await build_board_snapshot(
+        session,
+        board,
+        task_statuses=task_statuses,
+        task_limit=task_limit,
+    )
+    snapshot.version = version
+    entry = VersionedBoardSnapshot(
+        snapshot=snapshot,
+        version=version,
+        etag=_snapshot_etag(version, snapshot),
+        stale_at=_stale_at(snapshot),
+    )
+    _snapshot_cache.set(key, entry)
+    return entry
+
+
+async def _load_by_ids(
+    session: AsyncSession,
+    *,
+    model: type[Task] | type[Approval] | type[BoardMemory],
+    board_id: UUID,
+    ids: set[UUID],
+) -> list[Any]:
+    if not ids:
+        return []
+    return list(
+        await model.objects.filter_by(board_id=board_id)
+        .filter(col(model.id).in_(ids))
+        .order_by(col(model.created_at).desc())
+        .all(session),
+    )
+
+
+async def _dependent_task_ids(
+    session: AsyncSession,
+    *,
+    board_id: UUID,
+    task_ids: set[UUID],
+) -> set[UUID]:
+    if not task_ids:
+        return set()
+    rows = await session.exec(
+        select(col(TaskDependency.task_id))
+        .where(col(TaskDependency.board_id) == board_id)
+        .where(col(TaskDependency.depends_on_task_id).in_(task_ids)),
+    )
+    return set(rows.all())
+
+
+async def _existing_agent_ids(
+    session: AsyncSession,
+    *,
+    board_id: UUID,
+    agent_ids: set[UUID],
+) -> set[UUID]:
+    if not agent_ids:
+        return set()
+    rows = await session.exec(
+        select(col(Agent.id))
+        .where(col(Agent.board_id) == board_id)
+        .where(col(Agent.id).in_(agent_ids)),
+    )
+    return set(rows.all())
+
+
+async def _assigned_task_ids(
+    session: AsyncSession,
+    *,
+    board_id: UUID,
+    agent_ids: set[UUID],
+) -> set[UUID]:
+    if not agent_ids:
+        return set()
+    rows = await session.exec(
+        select(col(Task.id))
+        .where(col(Task.board_id) == board_id)
+        .where(col(Task.assigned_agent_id).in_(agent_ids)),
+    )
+    return set(rows.all())
+
+
+async def build_board_snapshot_delta(
+    session: AsyncSession,
+    board: Board,
+    *,
+    since_version: int,
+    task_statuses: Sequence[str] = (),
+) -> BoardSnapshotDelta:
+    """Return what changed on the board after `since_version`.
+
+    Besides logged task changes, the delta re-sends tasks linked to changed
+    approvals (their approval counts moved), tasks depending on changed tasks
+    (their blocked state may have moved) and tasks assigned to renamed agents
+    (their `assignee` moved). Falls back to a full snapshot with `reset=True` when
+    the log cannot answer: the version is from the future, or an agent was deleted
+    (which unassigns tasks without logging them).
+    """
+    board_read = BoardRead.model_validate(board, from_attributes=True)
+    board_id = board.id
+    version = await board_version(session, board_id) or 0
+    changed = await board_changes_since(session, board_id, since_version)
+    changed_agent_ids = changed.get("agent", set())
+    renamed_agent_ids = await _existing_agent_ids(
+        session,
+        board_id=board_id,
+        agent_ids=changed_agent_ids,
+    )
+    if since_version > version or renamed_agent_ids != changed_agent_ids:
+        snapshot = await build_board_snapshot(session, board, task_statuses=task_statuses)
+        return BoardSnapshotDelta(
+            board=board_read,
+            version=version,
+            since_version=since_version,
+            reset=True,
+            tasks=snapshot.tasks,
+            agents=snapshot.agents,
+            approvals=snapshot.approvals,
+            chat_messages=snapshot.chat_messages,
+            pending_approvals_count=snapshot.pending_approvals_count,
+        )
+
+    reads = _SnapshotReads(session)
+    changed_task_ids = changed.get("task", set())
+    changed_approval_ids = changed.get("approval", set())
+    changed_chat_ids = changed.get("chat_message", set())
+    (
+        agents,
+        pending_approvals_count,
+        approvals,
+        chat_messages,
+        task_ids_by_approval,
+        dependent_ids,
+        reassigned_ids,
+    ) = await reads.gather(
+        partial(_load_agents, board_id=board_id),
+        partial(_pending_approvals_count, board_id=board_id),
+        partial(_load_by_ids, model=Approval, board_id=board_id, ids=changed_approval_ids),
+        partial(_load_by_ids, model=BoardMemory, board_id=board_id, ids=changed_chat_ids),
+        partial(load_task_ids_by_approval, approval_ids=changed_approval_ids),
+        partial(_dependent_task_ids, board_id=board_id, task_ids=changed_task_ids),
+        partial(_assigned_task_ids, board_id=board_id, agent_ids=renamed_agent_ids),
+    )
+    related_task_ids = {
+        task_id for linked in task_ids_by_approval.values() for task_id in linked
+    } | {approval.task_id for approval in approvals if approval.task_id is not None}
+    [tasks] = await reads.gather(
+        partial(
+            _load_by_ids,
+            model=Task,
+            board_id=board_id,
+            ids=changed_task_ids | related_task_ids | dependent_ids | reassigned_ids,
+        ),
+    )
+    removed_task_ids = changed_task_ids - {task.id for task in tasks}
+    if task_statuses:
+        removed_task_ids |= {task.id for task in tasks if task.status not in task_statuses}
+        tasks = [task for task in tasks if task.status in task_statuses]
+
+    task_cards, agent_reads, approval_reads = await _hydrate(
+        reads,
+        board_id,
+        tasks=tasks,
+        agents=agents,
+        approvals=approvals,
+        scope_counts=True,
+    )
+    chat_messages.sort(key=lambda item: item.created_at)
+    return BoardSnapshotDelta(
+        board=board_read,
+        version=version,
+        since_version=since_version,
+        tasks=task_cards,
+        agents=agent_reads,
+        approvals=approval_reads,
+        chat_messages=[
+            _memory_to_read(memory) for memory in chat_messages if memory.content.strip()
+        ],
+        pending_approvals_count=pending_approvals_count,
+        removed_task_ids=sorted(removed_task_ids),
+        removed_approval_ids=sorted(changed_approval_ids - {item.id for item in approvals}),
+        removed_chat_message_ids=sorted(
+            changed_chat_ids - {memory.id for memory in chat_messages},
+        ),
     )
@@ -0,0 +1,173 @@
+"""Per-board change versions and the change log behind snapshot deltas.
+
+`boards.version` increases whenever a commit touches rows shown in the board
+snapshot: tasks, agents, approvals, board memory, task dependencies or the board
+itself. The event hub's session hooks collect those boards while flushing and call
+`record_board_changes` right before the transaction commits, so readers can tell
+whether anything changed with a single primary-key lookup.
+
+The same call upserts one `board_changes` row per changed task, approval and chat
+message (and per renamed or deleted agent) carrying the new version, which lets
+`?since_version=N` readers fetch only what moved after N.
+
+Bulk statements (`crud.delete_where`, `crud.update_where`) never reach the flush
+hooks, so their call sites record the affected boards with `bump_board_version`
+or `bump_task_boards`.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Literal, cast
+
+from sqlalchemy import delete, insert, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm.attributes import get_history
+from sqlmodel import col, select
+
+from app.models.agents import Agent
+from app.models.approvals import Approval
+from app.models.board_changes import BoardChange
+from app.models.board_memory import BoardMemory
+from app.models.boards import Board
+from app.models.task_dependencies import TaskDependency
+from app.models.tasks import Task
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from uuid import UUID
+
+    from sqlalchemy.engine import Connection
+    from sqlalchemy.orm import Session
+    from sqlalchemy.sql.elements import ColumnElement
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+BoardChangeKind = Literal["task", "approval", "chat_message", "agent"]
+# Changed entities per board; a board with an empty set still gets a new version.
+BoardChanges = dict["UUID", set[tuple[BoardChangeKind, "UUID"]]]
+# `Session.info` key holding a transaction's changes until `record_board_changes`.
+PENDING_BOARD_CHANGES_KEY = "board_versions_pending_changes"
+
+
+def changes_for_flush(session: Session) -> BoardChanges:
+    """Map pending rows in a flushing session to the board entities they change."""
+    changes: BoardChanges = {}
+    rows = [(obj, False) for obj in [*session.new, *session.dirty]]
+    rows.extend((obj, True) for obj in session.deleted)
+    for obj, deleted in rows:
+        if isinstance(obj, Task):
+            if obj.board_id is not None:
+                changes.setdefault(obj.board_id, set()).add(("task", obj.id))
+        elif isinstance(obj, Approval):
+            changes.setdefault(obj.board_id, set()).add(("approval", obj.id))
+        elif isinstance(obj, BoardMemory):
+            entities = changes.setdefault(obj.board_id, set())
+            if obj.is_chat:
+                entities.add(("chat_message", obj.id))
+        elif isinstance(obj, TaskDependency):
+            changes.setdefault(obj.board_id, set()).add(("task", obj.task_id))
+        elif isinstance(obj, Agent):
+            if obj.board_id is not None:
+                entities = changes.setdefault(obj.board_id, set())
+                # Snapshot deltas always carry the full agent list; only renames
+                # and removals need logging (they change or clear task card
+                # assignees without touching the tasks themselves).
+                if deleted or get_history(obj, "name").has_changes():
+                    entities.add(("agent", obj.id))
+        elif isinstance(obj, Board):
+            changes.setdefault(obj.id, set())
+    return changes
+
+
+def merge_board_changes(target: BoardChanges, changes: BoardChanges) -> None:
+    """Fold one flush's changes into the transaction's pending changes."""
+    for board_id, entities in changes.items():
+        target.setdefault(board_id, set()).update(entities)
+
+
+def bump_board_version(
+    session: AsyncSession,
+    board_id: UUID,
+    entities: Iterable[tuple[BoardChangeKind, UUID]] = (),
+) -> None:
+    """Bump `board_id`'s version (and log `entities`) when `session` commits."""
+    merge_board_changes(
+        session.info.setdefault(PENDING_BOARD_CHANGES_KEY, {}),
+        {board_id: set(entities)},
+    )
+
+
+async def bump_task_boards(session: AsyncSession, *criteria: ColumnElement[bool]) -> None:
+    """Bump the boards of tasks matching `criteria`, logging each task as changed.
+
+    Call before the bulk statement that changes the tasks or their card data, while
+    the criteria still match.
+    """
+    rows = await session.exec(select(col(Task.id), col(Task.board_id)).where(*criteria))
+    for task_id, board_id in rows:
+        if board_id is not None:
+            bump_board_version(session, board_id, [("task", task_id)])
+
+
+def record_board_changes(connection: Connection, changes: BoardChanges) -> None:
+    """Bump each board's version and log its changed entities at the new version."""
+    # One row at a time in a fixed order, so concurrent commits lock boards alike.
+    for board_id in sorted(changes):
+        version = connection.execute(
+            update(Board)
+            .where(col(Board.id) == board_id)
+            .values(version=col(Board.version) + 1)
+            .returning(col(Board.version)),
+        ).scalar_one_or_none()
+        entities = changes[board_id]
+        if version is None or not entities:
+            # The board is gone (or being deleted); nothing left to log against.
+            continue
+        rows = [
+            {"board_id": board_id, "kind": kind, "entity_id": entity_id, "version": version}
+            for kind, entity_id in sorted(entities)
+        ]
+        _upsert_changes(connection, rows)
+
+
+def _upsert_changes(connection: Connection, rows: list[dict[str, Any]]) -> None:
+    dialect = connection.dialect.name
+    if dialect in {"postgresql", "sqlite"}:
+        module = postgresql if dialect == "postgresql" else sqlite
+        statement = module.insert(BoardChange).values(rows)
+        connection.execute(
+            statement.on_conflict_do_update(
+                index_elements=["board_id", "kind", "entity_id"],
+                set_={"version": statement.excluded.version},
+            ),
+        )
+        return
+    for row in rows:
+        connection.execute(
+            delete(BoardChange)
+            .where(col(BoardChange.board_id) == row["board_id"])
+            .where(col(BoardChange.kind) == row["kind"])
+            .where(col(BoardChange.entity_id) == row["entity_id"]),
+        )
+    connection.execute(insert(BoardChange).values(rows))
+
+
+async def board_version(session: AsyncSession, board_id: UUID) -> int | None:
+    """Return the board's current version, or None when the board is gone."""
+    return (await session.exec(select(col(Board.version)).where(col(Board.id) == board_id))).first()
+
+
+async def board_changes_since(
+    session: AsyncSession,
+    board_id: UUID,
+    since_version: int,
+) -> dict[BoardChangeKind, set[UUID]]:
+    """Return entity ids per kind that changed after `since_version`."""
+    rows = await session.exec(
+        select(col(BoardChange.kind), col(BoardChange.entity_id))
+        .where(col(BoardChange.board_id) == board_id)
+        .where(col(BoardChange.version) > since_version),
+    )
+    changed: dict[BoardChangeKind, set[UUID]] = {}
+    for kind, entity_id in rows:
+        changed.setdefault(cast(BoardChangeKind, kind), set()).add(entity_id)
+    return changed
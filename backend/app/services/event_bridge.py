@@ -0,0 +1,268 @@
+"""Cross-replica transport for event hub notifications.
+
+The in-process `event_hub` only wakes streams on the replica that performed the
+write. When several API replicas run behind a load balancer, a bridge relays the
+committed topics to every replica, where a single listener connection republishes
+them into the local hub. The queue worker attaches the publishing side only, so
+its commits reach the API replicas as well.
+
+Backends (`STREAM_BRIDGE_BACKEND`):
+- `postgres`: `pg_notify` is issued inside the writing transaction (under a
+  savepoint, so a failed notify cannot abort the write), so notifications are
+  only delivered if the commit succeeds; each replica holds one `LISTEN`
+  connection.
+- `redis`: topics are published on `RQ_REDIS_URL` after commit and consumed through
+  a pub/sub subscription.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, cast
+from uuid import uuid4
+
+import psycopg
+import redis.asyncio as redis_async
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.services.queue import async_redis_client
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from sqlalchemy.orm import Session
+
+    from app.services.event_hub import EventHub
+
+logger = get_logger(__name__)
+
+EVENT_CHANNEL = "mission_control_events"
+# Postgres caps NOTIFY payloads at 8000 bytes; stay well below it per message.
+_MAX_PAYLOAD_BYTES = 7000
+_RECONNECT_INITIAL_SECONDS = 0.5
+_RECONNECT_MAX_SECONDS = 30.0
+
+
+def encode_topics(origin: str, topics: Iterable[str]) -> Iterator[str]:
+    """Serialize topics into one or more payloads under the NOTIFY size limit."""
+    batch: list[str] = []
+    size = 0
+    for topic in sorted(topics):
+        topic_size = len(topic.encode("utf-8")) + 4
+        if batch and size + topic_size > _MAX_PAYLOAD_BYTES:
+            yield json.dumps({"origin": origin, "topics": batch})
+            batch, size = [], 0
+        batch.append(topic)
+        size += topic_size
+    if batch:
+        yield json.dumps({"origin": origin, "topics": batch})
+
+
+def decode_topics(payload: str | bytes, *, origin: str) -> set[str]:
+    """Parse a bridge payload, ignoring malformed messages and our own echoes."""
+    if isinstance(payload, bytes):
+        payload = payload.decode("utf-8")
+    try:
+        data = json.loads(payload)
+    except ValueError:
+        logger.warning("event_bridge.payload_invalid")
+        return set()
+    if not isinstance(data, dict) or data.get("origin") == origin:
+        return set()
+    topics = data.get("topics")
+    if not isinstance(topics, list):
+        return set()
+    return {topic for topic in topics if isinstance(topic, str)}
+
+
+class EventBridge(ABC):
+    """Relay committed hub topics between replicas."""
+
+    def __init__(self) -> None:
+        # Identifies this process so listeners can skip notifications that the
+        # local hub already delivered at commit time.
+        self.origin = uuid4().hex
+
+    def on_flush(self, session: Session, topics: set[str]) -> None:
+        """Called inside the writing transaction after each flush."""
+        del session, topics
+
+    def on_commit(self, topics: set[str]) -> None:
+        """Called after the writing transaction commits."""
+        del topics
+
+    async def drain(self) -> None:
+        """Wait for notifications still being sent from `on_commit`."""
+
+    @abstractmethod
+    async def listen(self, handler: Callable[[set[str]], None]) -> None:
+        """Consume remote notifications until cancelled (one connection)."""
+        raise NotImplementedError
+
+    async def run(self, handler: Callable[[set[str]], None]) -> None:
+        """Run `listen` forever, reconnecting with capped exponential backoff."""
+        delay = _RECONNECT_INITIAL_SECONDS
+        while True:
+            try:
+                await self.listen(handler)
+                delay = _RECONNECT_INITIAL_SECONDS
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception(
+                    "event_bridge.listen_failed",
+                    extra={"backend": type(self).__name__, "retry_seconds": delay},
+                )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _RECONNECT_MAX_SECONDS)
+
+
+def _listener_database_url(database_url: str) -> str:
+    """Convert a SQLAlchemy URL into a libpq URL usable by psycopg directly."""
+    if "://" not in database_url:
+        return database_url
+    scheme, rest = database_url.split("://", 1)
+    return f"{scheme.split('+', 1)[0]}://{rest}"
+
+
+class PostgresEventBridge(EventBridge):
+    """Bridge over Postgres `LISTEN`/`NOTIFY`."""
+
+    def __init__(self, database_url: str) -> None:
+        super().__init__()
+        self.database_url = _listener_database_url(database_url)
+
+    def on_flush(self, session: Session, topics: set[str]) -> None:
+        connection = session.connection()
+        if connection.dialect.name != "postgresql":
+            return
+        # Postgres collapses identical notifications within a transaction, so
+        # repeated flushes touching the same topics do not multiply deliveries.
+        # The savepoint keeps a failed notify from aborting the writer's
+        # transaction; the error still propagates to event_hub, which logs it.
+        with connection.begin_nested():
+            for payload in encode_topics(self.origin, topics):
+                connection.execute(
+                    text("SELECT pg_notify(:channel, :payload)"),
+                    {"channel": EVENT_CHANNEL, "payload": payload},
+                )
+
+    async def listen(self, handler: Callable[[set[str]], None]) -> None:
+        async with await psycopg.AsyncConnection.connect(
+            self.database_url,
+            autocommit=True,
+        ) as conn:
+            await conn.execute(f"LISTEN {EVENT_CHANNEL}")
+            logger.info("event_bridge.postgres.listening", extra={"channel": EVENT_CHANNEL})
+            async for notify in conn.notifies():
+                topics = decode_topics(notify.payload, origin=self.origin)
+                if topics:
+                    handler(topics)
+
+
+class RedisEventBridge(EventBridge):
+    """Bridge over Redis pub/sub."""
+
+    def __init__(self, redis_url: str) -> None:
+        super().__init__()
+        self.redis_url = redis_url
+        self._pending: set[asyncio.Task[Any]] = set()
+
+    def _client(self) -> redis_async.Redis:
+        # The listener holds its connection indefinitely, so it gets its own client.
+        return cast("redis_async.Redis", redis_async.Redis.from_url(self.redis_url))
+
+    async def _publish(self, payloads: list[str]) -> None:
+        try:
+            publisher = async_redis_client(self.redis_url)
+            for payload in payloads:
+                await publisher.publish(EVENT_CHANNEL, payload)
+        except Exception:
+            logger.exception("event_bridge.redis.publish_failed")
+
+    def on_commit(self, topics: set[str]) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.warning("event_bridge.redis.no_running_loop")
+            return
+        task = loop.create_task(self._publish(list(encode_topics(self.origin, topics))))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def drain(self) -> None:
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+    async def listen(self, handler: Callable[[set[str]], None]) -> None:
+        client = self._client()
+        # `PubSub.aclose` is untyped in redis-py.
+        pubsub: Any = client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(EVENT_CHANNEL)
+            logger.info("event_bridge.redis.listening", extra={"channel": EVENT_CHANNEL})
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                topics = decode_topics(message["data"], origin=self.origin)
+                if topics:
+                    handler(topics)
+        finally:
+            await pubsub.aclose()
+            await client.aclose()
+
+
+def build_event_bridge() -> EventBridge | None:
+    """Construct the bridge selected by `STREAM_BRIDGE_BACKEND`, if any."""
+    backend = settings.stream_bridge_backend
+    if backend == "postgres":
+        return PostgresEventBridge(settings.database_url)
+    if backend == "redis":
+        return RedisEventBridge(settings.rq_redis_url)
+    return None
+
+
+def attach_event_bridge(hub: EventHub) -> EventBridge | None:
+    """Attach the configured bridge to `hub` for publishing only.
+
+    Processes that write but serve no streams (the queue worker) use this so their
+    commits still reach the API replicas' listeners.
+    """
+    bridge = build_event_bridge()
+    if bridge is None:
+        return None
+    hub.bridge = bridge
+    logger.info("event_bridge.attached", extra={"backend": settings.stream_bridge_backend})
+    return bridge
+
+
+async def detach_event_bridge(hub: EventHub) -> None:
+    """Detach the bridge from `hub`, letting in-flight publishes finish."""
+    bridge = hub.bridge
+    hub.bridge = None
+    if bridge is not None:
+        await bridge.drain()
+
+
+def start_event_bridge(hub: EventHub) -> asyncio.Task[None] | None:
+    """Attach the configured bridge to `hub` and start its listener task."""
+    bridge = attach_event_bridge(hub)
+    if bridge is None:
+        return None
+    return asyncio.create_task(bridge.run(hub.publish), name="event-bridge-listener")
+
+
+async def stop_event_bridge(hub: EventHub, task: asyncio.Task[None] | None) -> None:
+    """Detach the bridge from `hub` and cancel its listener task."""
+    await detach_event_bridge(hub)
+    if task is None:
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
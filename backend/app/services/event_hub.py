@@ -0,0 +1,306 @@
+"""In-process pub/sub hub that wakes SSE streams when relevant rows commit.
+
+SSE endpoints used to poll Postgres every couple of seconds per connected client.
+Instead, each stream subscribes to per-board topics and only re-queries after a
+commit that touched rows it cares about, so idle dashboard tabs cost no queries.
+
+Write paths do not publish explicitly: an ORM session hook inspects flushed
+`ActivityEvent`, `Task`, `BoardMemory`, `Approval`, `Agent` and `BoardGroupMemory`
+rows, maps them to topics, and publishes once the transaction commits. When an
+`EventBridge` is attached (see `app.services.event_bridge`), the same topics are
+relayed to the other API replicas.
+
+The same hooks bump `boards.version` for every board a transaction touched and log
+the changed entities (see `app.services.board_versions`); cached board snapshots
+validate against the version and snapshot deltas read the log. Bulk statements
+that bypass the flush record their changes with `bump_board_version` or
+`bump_task_boards`, and the matching topics are published from those changes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, Literal
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
+from sqlmodel import col, select
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.models.activity_events import ActivityEvent
+from app.models.agents import Agent
+from app.models.approvals import Approval
+from app.models.board_group_memory import BoardGroupMemory
+from app.models.board_memory import BoardMemory
+from app.models.tasks import Task
+from app.services.board_versions import (
+    PENDING_BOARD_CHANGES_KEY,
+    BoardChangeKind,
+    BoardChanges,
+    changes_for_flush,
+    merge_board_changes,
+    record_board_changes,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
+
+    from fastapi import Request
+
+    from app.services.event_bridge import EventBridge
+
+logger = get_logger(__name__)
+
+BoardTopicKind = Literal["tasks", "memory", "approvals", "agents"]
+_TOPIC_KIND_BY_CHANGE: dict[BoardChangeKind, BoardTopicKind] = {
+    "task": "tasks",
+    "approval": "approvals",
+    "chat_message": "memory",
+    "agent": "agents",
+}
+_PENDING_TOPICS_KEY = "event_hub_pending_topics"
+# How often an idle stream wakes (without querying) to notice client disconnects.
+_IDLE_CHECK_SECONDS = 5.0
+
+
+def board_topic(board_id: UUID, kind: BoardTopicKind) -> str:
+    """Topic name for one category of board-scoped changes."""
+    return f"board:{board_id}:{kind}"
+
+
+def board_group_memory_topic(group_id: UUID) -> str:
+    """Topic name for board-group memory changes."""
+    return f"board_group:{group_id}:memory"
+
+
+class Subscription:
+    """A stream's registration on one or more hub topics."""
+
+    def __init__(self, topics: frozenset[str]) -> None:
+        self.topics = topics
+        self._loop = asyncio.get_running_loop()
+        self._event = asyncio.Event()
+        # Start signalled so the first `ready()` runs the initial catch-up query.
+        self._event.set()
+
+    def notify(self) -> None:
+        """Wake the subscriber; safe to call from any thread."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._event.set()
+        else:
+            self._loop.call_soon_threadsafe(self._event.set)
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait up to `timeout` seconds for a notification; return whether one arrived."""
+        if not self._event.is_set():
+            try:
+                await asyncio.wait_for(self._event.wait(), timeout)
+            except TimeoutError:
+                return False
+        self._event.clear()
+        return True
+
+    async def ready(self, request: Request) -> bool:
+        """Block until the stream should re-query; return False once the client is gone.
+
+        Returns immediately on first use. When `STREAM_RESYNC_SECONDS` is positive the
+        stream also re-queries after that long without a notification, as a safety
+        net for writers that bypass this process.
+        """
+        resync = float(settings.stream_resync_seconds)
+        idle = 0.0
+        while True:
+            if await request.is_disconnected():
+                return False
+            timeout = _IDLE_CHECK_SECONDS
+            if resync > 0:
+                timeout = max(0.0, min(timeout, resync - idle))
+            if await self.wait(timeout):
+                return True
+            idle += timeout
+            if resync > 0 and idle >= resync:
+                return True
+
+
+class EventHub:
+    """Topic registry fanning commit notifications out to subscribed streams."""
+
+    def __init__(self) -> None:
+        self._subscriptions: dict[str, set[Subscription]] = {}
+        self.bridge: EventBridge | None = None
+
+    @asynccontextmanager
+    async def subscribe(self, topics: Iterable[str]) -> AsyncIterator[Subscription]:
+        """Register a subscription for the lifetime of the context."""
+        subscription = Subscription(frozenset(topics))
+        for topic in subscription.topics:
+            self._subscriptions.setdefault(topic, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            for topic in subscription.topics:
+                subscribers = self._subscriptions.get(topic)
+                if subscribers is None:
+                    continue
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscriptions[topic]
+
+    def publish(self, topics: Iterable[str]) -> None:
+        """Wake every subscription registered on any of the given topics."""
+        woken: set[Subscription] = set()
+        for topic in topics:
+            woken.update(self._subscriptions.get(topic, ()))
+        for subscription in woken:
+            subscription.notify()
+
+    def subscriber_count(self, topic: str | None = None) -> int:
+        """Number of live subscriptions, optionally for one topic."""
+        if topic is not None:
+            return len(self._subscriptions.get(topic, ()))
+        return len({sub for subs in self._subscriptions.values() for sub in subs})
+
+
+event_hub = EventHub()
+
+
+def _task_board_ids(session: Session, task_ids: set[UUID]) -> dict[UUID, UUID | None]:
+    resolved: dict[UUID, UUID | None] = {}
+    for obj in [*session.new, *session.dirty, *session.deleted]:
+        if isinstance(obj, Task) and obj.id in task_ids:
+            resolved[obj.id] = obj.board_id
+    for task_id in task_ids - resolved.keys():
+        cached = session.identity_map.get(identity_key(Task, task_id))
+        if isinstance(cached, Task):
+            resolved[task_id] = cached.board_id
+    missing = task_ids - resolved.keys()
+    if missing:
+        rows = session.connection().execute(
+            select(col(Task.id), col(Task.board_id)).where(col(Task.id).in_(missing)),
+        )
+        for task_id, board_id in rows:
+            resolved[task_id] = board_id
+    return resolved
+
+
+def topics_for_flush(session: Session) -> set[str]:
+    """Map pending rows in a flushing session to the hub topics they affect."""
+    topics: set[str] = set()
+    activity_task_ids: set[UUID] = set()
+    for obj in [*session.new, *session.dirty, *session.deleted]:
+        if isinstance(obj, ActivityEvent):
+            if obj.task_id is not None:
+                activity_task_ids.add(obj.task_id)
+        elif isinstance(obj, Task):
+            if obj.board_id is not None:
+                topics.add(board_topic(obj.board_id, "tasks"))
+        elif isinstance(obj, BoardMemory):
+            topics.add(board_topic(obj.board_id, "memory"))
+        elif isinstance(obj, Approval):
+            topics.add(board_topic(obj.board_id, "approvals"))
+        elif isinstance(obj, Agent):
+            if obj.board_id is not None:
+                topics.add(board_topic(obj.board_id, "agents"))
+        elif isinstance(obj, BoardGroupMemory):
+            topics.add(board_group_memory_topic(obj.board_group_id))
+    if activity_task_ids:
+        for board_id in _task_board_ids(session, activity_task_ids).values():
+            if board_id is not None:
+                topics.add(board_topic(board_id, "tasks"))
+    return topics
+
+
+def _board_changes(session: Session, topics: set[str]) -> BoardChanges:
+    changes = changes_for_flush(session)
+    # Every board with a published topic gets a new version, even when no logged
+    # entity changed (e.g. agent presence or non-chat memory).
+    for topic in topics:
+        if topic.startswith("board:"):
+            changes.setdefault(UUID(topic.split(":", 2)[1]), set())
+    return changes
+
+
+def _change_topics(changes: BoardChanges) -> set[str]:
+    """Topics for logged board changes, including ones recorded without a flush."""
+    return {
+        board_topic(board_id, _TOPIC_KIND_BY_CHANGE[kind])
+        for board_id, entities in changes.items()
+        for kind, _entity_id in entities
+    }
+
+
+def _after_flush(session: Session, _flush_context: Any) -> None:
+    try:
+        topics = topics_for_flush(session)
+        changes = _board_changes(session, topics)
+    except Exception:
+        # Notifications are best-effort; never fail the caller's transaction.
+        logger.exception("event_hub.collect_failed")
+        return
+    if changes:
+        merge_board_changes(session.info.setdefault(PENDING_BOARD_CHANGES_KEY, {}), changes)
+    _queue_topics(session, topics)
+
+
+def _queue_topics(session: Session, topics: set[str]) -> None:
+    if not topics:
+        return
+    session.info.setdefault(_PENDING_TOPICS_KEY, set()).update(topics)
+    bridge = event_hub.bridge
+    if bridge is not None:
+        try:
+            bridge.on_flush(session, topics)
+        except Exception:
+            logger.exception("event_hub.bridge_flush_failed")
+
+
+def _before_commit(session: Session) -> None:
+    # Flush first so the final flush's boards are known, then bump their versions
+    # as the transaction's last statements to keep the board row locks short.
+    session.flush()
+    changes = session.info.pop(PENDING_BOARD_CHANGES_KEY, None)
+    if changes:
+        # Bulk deletes and updates record their changes without flushing rows, so
+        # their topics are only known here.
+        pending = session.info.get(_PENDING_TOPICS_KEY, set())
+        _queue_topics(session, _change_topics(changes) - pending)
+        record_board_changes(session.connection(), changes)
+
+
+def _after_commit(session: Session) -> None:
+    topics = session.info.pop(_PENDING_TOPICS_KEY, None)
+    if not topics:
+        return
+    event_hub.publish(topics)
+    bridge = event_hub.bridge
+    if bridge is not None:
+        try:
+            bridge.on_commit(topics)
+        except Exception:
+            logger.exception("event_hub.bridge_commit_failed")
+
+
+def _after_soft_rollback(session: Session, _previous_transaction: Any) -> None:
+    session.info.pop(_PENDING_TOPICS_KEY, None)
+    session.info.pop(PENDING_BOARD_CHANGES_KEY, None)
+
+
+def install_session_hooks() -> None:
+    """Attach the commit hooks that feed the hub (idempotent)."""
+    if event.contains(Session, "after_flush", _after_flush):
+        return
+    event.listen(Session, "after_flush", _after_flush)
+    event.listen(Session, "before_commit", _before_commit)
+    event.listen(Session, "after_commit", _after_commit)
+    event.listen(Session, "after_soft_rollback", _after_soft_rollback)
+
+
+install_session_hooks()
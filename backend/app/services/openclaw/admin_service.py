@@ -19,7 +19,7 @@ from app.models.approvals import Approval
 from app.models.board_webhooks import BoardWebhook
 from app.models.gateways import Gateway
 from app.models.tasks import Task
-from app.schemas.gateways import GatewayTemplatesSyncResult
+from app.services.board_versions import bump_task_boards
 from app.services.openclaw.constants import DEFAULT_HEARTBEAT_CONFIG
 from app.services.openclaw.db_agent_state import (
     mark_provision_complete,
@@ -32,12 +32,9 @@ from app.services.openclaw.gateway_resolver import gateway_client_config
 from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
 from app.services.openclaw.gateway_rpc import OpenClawGatewayError, openclaw_call
 from app.services.openclaw.provisioning import OpenClawGatewayProvisioner
-from app.services.openclaw.provisioning_db import (
-    GatewayTemplateSyncOptions,
-    OpenClawProvisioningService,
-)
 from app.services.openclaw.session_service import GatewayTemplateSyncQuery
 from app.services.openclaw.shared import GatewayAgentIdentity
+from app.services.openclaw.template_sync_jobs import TemplateSyncJob, create_template_sync_job
 from app.services.organizations import get_org_owner_user
 
 if TYPE_CHECKING:
@@ -314,6 +311,7 @@ class GatewayAdminLifecycleService(OpenClawDBService):
 
     async def clear_agent_foreign_keys(self, *, agent_id: UUID) -> None:
         now = utcnow()
+        await bump_task_boards(self.session, col(Task.assigned_agent_id) == agent_id)
         await crud.update_where(
             self.session,
             Task,
@@ -357,32 +355,25 @@ class GatewayAdminLifecycleService(OpenClawDBService):
             commit=False,
         )
 
-    async def sync_templates(
+    async def enqueue_template_sync(
         self,
         gateway: Gateway,
         *,
         query: GatewayTemplateSyncQuery,
         auth: AuthContext,
-    ) -> GatewayTemplatesSyncResult:
+    ) -> TemplateSyncJob:
         self.logger.log(
             TRACE_LEVEL,
-            "gateway.templates.sync.start gateway_id=%s include_main=%s",
+            "gateway.templates.sync.enqueue gateway_id=%s include_main=%s",
             gateway.id,
             query.include_main,
         )
         await self.ensure_gateway_agents_exist([gateway])
-        result = await OpenClawProvisioningService(self.session).sync_gateway_templates(
-            gateway,
-            GatewayTemplateSyncOptions(
-                user=auth.user,
-                include_main=query.include_main,
-                lead_only=query.lead_only,
-                reset_sessions=query.reset_sessions,
-                rotate_tokens=query.rotate_tokens,
-                force_bootstrap=query.force_bootstrap,
-                overwrite=query.overwrite,
-                board_id=query.board_id,
-            ),
+        job = await create_template_sync_job(gateway=gateway, query=query, user=auth.user)
+        self.logger.info(
+            "gateway.templates.sync.enqueued gateway_id=%s job_id=%s status=%s",
+            gateway.id,
+            job.id,
+            job.status,
         )
-        self.logger.info("gateway.templates.sync.success gateway_id=%s", gateway.id)
-        return result
+        return job
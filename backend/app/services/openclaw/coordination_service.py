@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from abc import ABC
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
 from typing import TypeVar
 from uuid import UUID
 
@@ -50,6 +52,38 @@ from app.services.openclaw.shared import GatewayAgentIdentity
 _T = TypeVar("_T")
 
 
+@dataclass(frozen=True, slots=True)
+class LeadBroadcastDelivery:
+    """One resolved lead and the message it should receive."""
+
+    board_id: UUID
+    lead_agent_id: UUID
+    lead_agent_name: str
+    session_key: str
+    message: str
+
+
+@dataclass(frozen=True, slots=True)
+class LeadBroadcastPlan:
+    """Session-free snapshot of a lead broadcast, ready for concurrent sends."""
+
+    trace_id: str
+    actor_agent_id: UUID
+    kind: str
+    config: GatewayClientConfig
+    board_ids: tuple[UUID, ...]
+    deliveries: tuple[LeadBroadcastDelivery, ...]
+    failures: tuple[GatewayLeadBroadcastBoardResult, ...]
+
+
+def _lead_broadcast_failure(board_id: UUID, exc: Exception) -> GatewayLeadBroadcastBoardResult:
+    return GatewayLeadBroadcastBoardResult(
+        board_id=board_id,
+        ok=False,
+        error=map_gateway_error_message(GatewayOperation.LEAD_BROADCAST_DISPATCH, exc),
+    )
+
+
 class AbstractGatewayMessagingService(OpenClawDBService, ABC):
     """Shared gateway messaging primitives with retry semantics."""
 
@@ -520,13 +554,12 @@ class GatewayCoordinationService(AbstractGatewayMessagingService):
             main_agent_name=main_agent.name if main_agent else None,
         )
 
-    async def _ensure_and_message_board_lead(
+    async def _ensure_board_lead(
         self,
         *,
         gateway: Gateway,
         config: GatewayClientConfig,
         board: Board,
-        message: str,
     ) -> tuple[Agent, bool]:
         lead, lead_created = await OpenClawProvisioningService(
             self.session
@@ -544,6 +577,21 @@ class GatewayCoordinationService(AbstractGatewayMessagingService):
                 status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
                 detail="Lead agent has no session key",
             )
+        return lead, lead_created
+
+    async def _ensure_and_message_board_lead(
+        self,
+        *,
+        gateway: Gateway,
+        config: GatewayClientConfig,
+        board: Board,
+        message: str,
+    ) -> tuple[Agent, bool]:
+        lead, lead_created = await self._ensure_board_lead(
+            gateway=gateway,
+            config=config,
+            board=board,
+        )
         await self._dispatch_gateway_message(
             session_key=lead.openclaw_session_id or "",
             config=config,
@@ -643,12 +691,17 @@ class GatewayCoordinationService(AbstractGatewayMessagingService):
             lead_created=lead_created,
         )
 
-    async def broadcast_gateway_lead_message(
+    async def prepare_gateway_lead_broadcast(
         self,
         *,
         actor_agent: Agent,
         payload: GatewayLeadBroadcastRequest,
-    ) -> GatewayLeadBroadcastResponse:
+    ) -> LeadBroadcastPlan:
+        """Resolve (and provision if missing) every target lead before any send.
+
+        All database work happens here so the gateway fan-out can run concurrently
+        without sharing the session.
+        """
         trace_id = GatewayDispatchService.resolve_trace_id(
             payload.correlation_id, prefix="coord.lead_broadcast"
         )
@@ -668,58 +721,123 @@ class GatewayCoordinationService(AbstractGatewayMessagingService):
             statement = statement.where(col(Board.id).in_(payload.board_ids))
         boards = list(await self.session.exec(statement))
 
-        results: list[GatewayLeadBroadcastBoardResult] = []
-        sent = 0
-        failed = 0
-
+        deliveries: list[LeadBroadcastDelivery] = []
+        failures: list[GatewayLeadBroadcastBoardResult] = []
         for board in boards:
-            message = self._build_gateway_lead_message(
-                board=board,
-                actor_agent_name=actor_agent.name,
-                kind=payload.kind,
-                content=payload.content,
-                correlation_id=payload.correlation_id,
-                reply_tags=payload.reply_tags,
-                reply_source=payload.reply_source,
-            )
             try:
-                lead, _lead_created = await self._ensure_and_message_board_lead(
+                lead, _lead_created = await self._ensure_board_lead(
                     gateway=gateway,
                     config=config,
                     board=board,
-                    message=message,
                 )
-                board_result = GatewayLeadBroadcastBoardResult(
+            except (HTTPException, OpenClawGatewayError, TimeoutError, ValueError) as exc:
+                failures.append(_lead_broadcast_failure(board.id, exc))
+                continue
+            deliveries.append(
+                LeadBroadcastDelivery(
                     board_id=board.id,
                     lead_agent_id=lead.id,
                     lead_agent_name=lead.name,
-                    ok=True,
-                )
-                sent += 1
-            except (HTTPException, OpenClawGatewayError, TimeoutError, ValueError) as exc:
-                board_result = GatewayLeadBroadcastBoardResult(
-                    board_id=board.id,
-                    ok=False,
-                    error=map_gateway_error_message(
-                        GatewayOperation.LEAD_BROADCAST_DISPATCH,
-                        exc,
+                    session_key=lead.openclaw_session_id or "",
+                    message=self._build_gateway_lead_message(
+                        board=board,
+                        actor_agent_name=actor_agent.name,
+                        kind=payload.kind,
+                        content=payload.content,
+                        correlation_id=payload.correlation_id,
+                        reply_tags=payload.reply_tags,
+                        reply_source=payload.reply_source,
                     ),
-                )
-                failed += 1
-            results.append(board_result)
+                ),
+            )
+        return LeadBroadcastPlan(
+            trace_id=trace_id,
+            actor_agent_id=actor_agent.id,
+            kind=payload.kind,
+            config=config,
+            board_ids=tuple(board.id for board in boards),
+            deliveries=tuple(deliveries),
+            failures=tuple(failures),
+        )
+
+    async def _send_lead_broadcast_delivery(
+        self,
+        config: GatewayClientConfig,
+        delivery: LeadBroadcastDelivery,
+    ) -> GatewayLeadBroadcastBoardResult:
+        timeout = settings.gateway_broadcast_board_timeout_seconds
+        try:
+            await asyncio.wait_for(
+                self._dispatch_gateway_message(
+                    session_key=delivery.session_key,
+                    config=config,
+                    agent_name=delivery.lead_agent_name,
+                    message=delivery.message,
+                    deliver=False,
+                ),
+                timeout=timeout,
+            )
+        except TimeoutError:
+            return _lead_broadcast_failure(
+                delivery.board_id,
+                TimeoutError(f"no response within {timeout:g}s"),
+            )
+        except (HTTPException, OpenClawGatewayError, ValueError) as exc:
+            return _lead_broadcast_failure(delivery.board_id, exc)
+        return GatewayLeadBroadcastBoardResult(
+            board_id=delivery.board_id,
+            lead_agent_id=delivery.lead_agent_id,
+            lead_agent_name=delivery.lead_agent_name,
+            ok=True,
+        )
+
+    async def iter_gateway_lead_broadcast(
+        self,
+        plan: LeadBroadcastPlan,
+    ) -> AsyncIterator[GatewayLeadBroadcastBoardResult]:
+        """Send a prepared broadcast, yielding per-board results as they complete.
+
+        Sends run with bounded concurrency and never touch the database session.
+        Closing the iterator early cancels the sends still in flight.
+        """
+        for failure in plan.failures:
+            yield failure
+        semaphore = asyncio.Semaphore(settings.gateway_broadcast_concurrency)
+
+        async def _bounded(delivery: LeadBroadcastDelivery) -> GatewayLeadBroadcastBoardResult:
+            async with semaphore:
+                return await self._send_lead_broadcast_delivery(plan.config, delivery)
+
+        tasks = [asyncio.create_task(_bounded(delivery)) for delivery in plan.deliveries]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            for task in tasks:
+                task.cancel()
 
+    async def finish_gateway_lead_broadcast(
+        self,
+        plan: LeadBroadcastPlan,
+        results: list[GatewayLeadBroadcastBoardResult],
+    ) -> GatewayLeadBroadcastResponse:
+        """Record the broadcast outcome and build the summary response."""
+        order = {board_id: index for index, board_id in enumerate(plan.board_ids)}
+        results = sorted(results, key=lambda result: order.get(result.board_id, len(order)))
+        sent = sum(1 for result in results if result.ok)
+        failed = len(results) - sent
         record_activity(
             self.session,
             event_type="gateway.main.lead_broadcast.sent",
-            message=f"Broadcast {payload.kind} to {sent} board leads (failed: {failed}).",
-            agent_id=actor_agent.id,
+            message=f"Broadcast {plan.kind} to {sent} board leads (failed: {failed}).",
+            agent_id=plan.actor_agent_id,
         )
         await self.session.commit()
         self.logger.info(
             "gateway.coordination.lead_broadcast.success trace_id=%s actor_agent_id=%s sent=%s "
             "failed=%s",
-            trace_id,
-            actor_agent.id,
+            plan.trace_id,
+            plan.actor_agent_id,
             sent,
             failed,
         )
@@ -729,3 +847,16 @@ class GatewayCoordinationService(AbstractGatewayMessagingService):
             failed=failed,
             results=results,
         )
+
+    async def broadcast_gateway_lead_message(
+        self,
+        *,
+        actor_agent: Agent,
+        payload: GatewayLeadBroadcastRequest,
+    ) -> GatewayLeadBroadcastResponse:
+        plan = await self.prepare_gateway_lead_broadcast(
+            actor_agent=actor_agent,
+            payload=payload,
+        )
+        results = [result async for result in self.iter_gateway_lead_broadcast(plan)]
+        return await self.finish_gateway_lead_broadcast(plan, results)
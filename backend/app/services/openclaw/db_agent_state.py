@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from typing import Literal
 
-from app.core.agent_tokens import generate_agent_token, hash_agent_token
+from app.core.agent_token_cache import verified_agent_tokens
+from app.core.agent_tokens import agent_token_lookup, generate_agent_token, hash_agent_token
 from app.core.time import utcnow
 from app.models.agents import Agent
 from app.services.openclaw.constants import DEFAULT_HEARTBEAT_CONFIG
@@ -21,7 +22,9 @@ def mint_agent_token(agent: Agent) -> str:
     """Generate a new raw token and update the agent's token hash."""
 
     raw_token = generate_agent_token()
+    verified_agent_tokens.invalidate_agents([agent.id])
     agent.agent_token_hash = hash_agent_token(raw_token)
+    agent.agent_token_lookup = agent_token_lookup(raw_token)
     return raw_token
 
 
@@ -6,7 +6,10 @@ directly orchestrate gateway RPC calls.
 
 from __future__ import annotations
 
-from uuid import uuid4
+from collections.abc import Iterable
+from uuid import UUID, uuid4
+
+from sqlmodel import col, select
 
 from app.models.boards import Board
 from app.models.gateways import Gateway
@@ -31,6 +34,28 @@ class GatewayDispatchService(OpenClawDBService):
         gateway = await get_gateway_for_board(self.session, board)
         return optional_gateway_client_config(gateway)
 
+    async def optional_gateway_configs_for_boards(
+        self,
+        boards: Iterable[Board],
+    ) -> dict[UUID, GatewayClientConfig | None]:
+        """Resolve gateway configs for many boards with a single gateway query."""
+        board_list = list(boards)
+        gateway_ids = {board.gateway_id for board in board_list if board.gateway_id is not None}
+        gateways: dict[UUID, Gateway] = {}
+        if gateway_ids:
+            rows = await self.session.exec(
+                select(Gateway).where(col(Gateway.id).in_(gateway_ids)),
+            )
+            gateways = {gateway.id: gateway for gateway in rows}
+        configs: dict[UUID, GatewayClientConfig | None] = {}
+        for board in board_list:
+            gateway = gateways.get(board.gateway_id) if board.gateway_id is not None else None
+            # Same tenant guard as `get_gateway_for_board`.
+            if gateway is not None and gateway.organization_id != board.organization_id:
+                gateway = None
+            configs[board.id] = optional_gateway_client_config(gateway)
+        return configs
+
     async def require_gateway_config_for_board(
         self,
         board: Board,
@@ -0,0 +1,269 @@
+"""Gateway event subscribers that keep agent presence current.
+
+Each gateway pushes `agent`, `chat` and `heartbeat` events for the sessions it runs
+(see `GATEWAY_EVENTS`). One subscriber per gateway consumes them over a dedicated
+socket and marks the matching agents as seen. Sightings are buffered and written
+in one transaction per flush window. The commit goes through the ORM, so the event
+hub's session hooks wake the affected board streams like any other agent write.
+
+Every API replica that enables `GATEWAY_EVENTS_ENABLED` subscribes to every
+gateway, so enable it on one replica only (or accept the repeated, idempotent
+presence writes).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from sqlmodel import col
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.time import utcnow
+from app.db.session import async_session_maker
+from app.models.agents import Agent
+from app.models.gateways import Gateway
+from app.services.openclaw.constants import AGENT_SESSION_PREFIX
+from app.services.openclaw.gateway_resolver import gateway_client_config
+from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
+from app.services.openclaw.gateway_rpc import GatewayEvent, stream_gateway_events
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+logger = get_logger(__name__)
+
+# Events that prove the session they name is alive.
+PRESENCE_EVENTS = frozenset({"agent", "chat", "heartbeat"})
+# Agents in these states are being changed by Mission Control; leave them alone.
+_LOCKED_STATUSES = frozenset({"updating", "deleting"})
+_RECONNECT_INITIAL_SECONDS = 1.0
+_RECONNECT_MAX_SECONDS = 60.0
+
+
+def event_session_key(event: GatewayEvent) -> str | None:
+    """Return the agent's main session key for an event, if it names one."""
+    payload = event.payload
+    raw = payload.get("sessionKey")
+    if not isinstance(raw, str) or not raw:
+        agent_id = payload.get("agentId")
+        if isinstance(agent_id, str) and agent_id:
+            return f"{AGENT_SESSION_PREFIX}:{agent_id}:main"
+        return None
+    # Sub-sessions (threads, sub-agents) belong to the agent of their main session.
+    parts = raw.split(":")
+    if len(parts) >= 2 and parts[0] == AGENT_SESSION_PREFIX and parts[1]:
+        return f"{AGENT_SESSION_PREFIX}:{parts[1]}:main"
+    return raw
+
+
+@dataclass
+class PresenceBuffer:
+    """Latest sighting per session key since the last flush."""
+
+    seen: dict[str, datetime] = field(default_factory=dict)
+
+    def add(self, session_key: str, at: datetime) -> None:
+        previous = self.seen.get(session_key)
+        if previous is None or at > previous:
+            self.seen[session_key] = at
+
+    def drain(self) -> dict[str, datetime]:
+        seen, self.seen = self.seen, {}
+        return seen
+
+
+async def apply_presence(gateway_id: UUID, seen: dict[str, datetime]) -> int:
+    """Mark agents of `gateway_id` as seen; return how many rows were written.
+
+    Agents whose stored presence is already fresher than
+    `GATEWAY_EVENTS_PRESENCE_MIN_INTERVAL_SECONDS` are skipped, so a chatty
+    session costs at most one write per interval.
+    """
+    if not seen:
+        return 0
+    min_interval = timedelta(seconds=settings.gateway_events_presence_min_interval_seconds)
+    async with async_session_maker() as session:
+        agents = (
+            await Agent.objects.filter_by(gateway_id=gateway_id)
+            .filter(col(Agent.openclaw_session_id).in_(list(seen)))
+            .all(session)
+        )
+        written = 0
+        for agent in agents:
+            at = seen[agent.openclaw_session_id or ""]
+            stale = agent.last_seen_at is None or at - agent.last_seen_at >= min_interval
+            revive = agent.status not in _LOCKED_STATUSES and agent.status != "online"
+            if not stale and not revive:
+                continue
+            agent.last_seen_at = max(at, agent.last_seen_at or at)
+            agent.updated_at = utcnow()
+            if revive:
+                agent.status = "online"
+            session.add(agent)
+            written += 1
+        if written:
+            await session.commit()
+    return written
+
+
+class GatewayEventSubscriber:
+    """Consumes one gateway's events and flushes agent presence in batches."""
+
+    def __init__(
+        self,
+        gateway_id: UUID,
+        config: GatewayClientConfig,
+        *,
+        stream: Callable[[GatewayClientConfig], AsyncIterator[GatewayEvent]] = (
+            stream_gateway_events
+        ),
+    ) -> None:
+        self.gateway_id = gateway_id
+        self.config = config
+        self.buffer = PresenceBuffer()
+        self.events_seen = 0
+        self._stream = stream
+
+    def handle(self, event: GatewayEvent) -> None:
+        self.events_seen += 1
+        if event.event not in PRESENCE_EVENTS:
+            return
+        session_key = event_session_key(event)
+        if session_key is not None:
+            self.buffer.add(session_key, utcnow())
+
+    async def flush(self) -> int:
+        seen = self.buffer.drain()
+        try:
+            return await apply_presence(self.gateway_id, seen)
+        except Exception:
+            # Keep the sightings for the next window rather than losing them.
+            for session_key, at in seen.items():
+                self.buffer.add(session_key, at)
+            raise
+
+    async def consume(self) -> None:
+        """Read events until the stream ends (one connection)."""
+        async for event in self._stream(self.config):
+            self.handle(event)
+
+    async def _flush_forever(self) -> None:
+        while True:
+            await asyncio.sleep(settings.gateway_events_flush_seconds)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception(
+                    "gateway.events.flush_failed",
+                    extra={"gateway_id": str(self.gateway_id)},
+                )
+
+    async def run(self) -> None:
+        """Consume forever, reconnecting with capped backoff, until cancelled."""
+        flusher = asyncio.create_task(self._flush_forever())
+        delay = _RECONNECT_INITIAL_SECONDS
+        try:
+            while True:
+                try:
+                    await self.consume()
+                    delay = _RECONNECT_INITIAL_SECONDS
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:
+                    logger.warning(
+                        "gateway.events.stream_failed",
+                        extra={
+                            "gateway_id": str(self.gateway_id),
+                            "error": f"{type(exc).__name__}: {exc}",
+                            "retry_seconds": delay,
+                        },
+                    )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _RECONNECT_MAX_SECONDS)
+        finally:
+            flusher.cancel()
+            await asyncio.gather(flusher, return_exceptions=True)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception(
+                    "gateway.events.flush_failed",
+                    extra={"gateway_id": str(self.gateway_id)},
+                )
+
+
+class GatewayEventSubscriptions:
+    """Keeps one running subscriber per configured gateway."""
+
+    def __init__(self) -> None:
+        self._running: dict[UUID, tuple[GatewayClientConfig, asyncio.Task[None]]] = {}
+
+    def sync(self, gateways: dict[UUID, GatewayClientConfig]) -> None:
+        """Start subscribers for new gateways, restart changed ones, stop removed ones."""
+        for gateway_id, (config, task) in list(self._running.items()):
+            if gateways.get(gateway_id) != config or task.done():
+                task.cancel()
+                del self._running[gateway_id]
+        for gateway_id, config in gateways.items():
+            if gateway_id in self._running:
+                continue
+            subscriber = GatewayEventSubscriber(gateway_id, config)
+            task = asyncio.create_task(
+                subscriber.run(),
+                name=f"gateway-events-{gateway_id}",
+            )
+            self._running[gateway_id] = (config, task)
+
+    async def refresh(self) -> None:
+        async with async_session_maker() as session:
+            gateways = await Gateway.objects.all().all(session)
+        self.sync(
+            {
+                gateway.id: gateway_client_config(gateway)
+                for gateway in gateways
+                if (gateway.url or "").strip()
+            },
+        )
+
+    async def run(self) -> None:
+        """Track the gateway table until cancelled, then stop every subscriber."""
+        try:
+            while True:
+                try:
+                    await self.refresh()
+                except Exception:
+                    logger.exception("gateway.events.refresh_failed")
+                await asyncio.sleep(settings.gateway_events_refresh_seconds)
+        finally:
+            tasks = [task for _, task in self._running.values()]
+            self._running.clear()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def start_gateway_event_subscribers() -> asyncio.Task[None] | None:
+    """Start the subscriber supervisor when `GATEWAY_EVENTS_ENABLED` is set."""
+    if not settings.gateway_events_enabled:
+        return None
+    logger.info("gateway.events.started")
+    return asyncio.create_task(
+        GatewayEventSubscriptions().run(),
+        name="gateway-event-subscriptions",
+    )
+
+
+async def stop_gateway_event_subscribers(task: asyncio.Task[None] | None) -> None:
+    """Cancel the supervisor started by `start_gateway_event_subscribers`."""
+    if task is None:
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
@@ -9,13 +9,18 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import copy
 import hashlib
 import json
+import os
+import threading
 import time
-from dataclasses import dataclass
+import weakref
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from time import perf_counter
-from typing import Any
+from typing import TYPE_CHECKING, Any, Literal
 from urllib.parse import urlencode, urlparse, urlunparse
 from uuid import uuid4
 
@@ -31,7 +36,13 @@ from cryptography.hazmat.primitives.serialization import (
 )
 from websockets.exceptions import WebSocketException
 
+from app.core.config import settings
 from app.core.logging import TRACE_LEVEL, get_logger
+from app.core.time import utcnow
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+    from datetime import datetime
 
 PROTOCOL_VERSION = 3
 logger = get_logger(__name__)
@@ -52,27 +63,70 @@ def _b64url(data: bytes) -> str:
     return base64.urlsafe_b64encode(data).decode().rstrip("=")
 
 
-def _get_or_create_device_keypair() -> tuple[Ed25519PrivateKey, bytes, str]:
-    """Return (private_key, raw_public_bytes, device_id).
-
-    Keys are persisted to ``_DEVICE_KEY_DIR`` so the device identity remains
-    stable across restarts (avoiding repeated pairing prompts).
-    """
+def _load_or_create_device_keypair() -> tuple[Ed25519PrivateKey, bytes, str]:
     _DEVICE_KEY_DIR.mkdir(parents=True, exist_ok=True)
     key_path = _DEVICE_KEY_DIR / "device.key"
-    if key_path.exists():
-        raw = key_path.read_bytes()
-        private_key = Ed25519PrivateKey.from_private_bytes(raw[:32])
-    else:
+    if not key_path.exists():
         private_key = Ed25519PrivateKey.generate()
         raw = private_key.private_bytes(Encoding.Raw, PrivateFormat.Raw, NoEncryption())
-        key_path.write_bytes(raw)
-        key_path.chmod(0o600)
+        # Write a temp file and hard-link it into place so concurrent processes
+        # never read a partial key and exactly one generated key wins.
+        tmp_path = key_path.with_name(f".device.key.{os.getpid()}.{uuid4().hex}")
+        tmp_path.write_bytes(raw)
+        tmp_path.chmod(0o600)
+        try:
+            os.link(tmp_path, key_path)
+        except FileExistsError:
+            pass
+        finally:
+            tmp_path.unlink(missing_ok=True)
+    raw = key_path.read_bytes()
+    private_key = Ed25519PrivateKey.from_private_bytes(raw[:32])
     pub_bytes = private_key.public_key().public_bytes(Encoding.Raw, PublicFormat.Raw)
     device_id = hashlib.sha256(pub_bytes).hexdigest()
     return private_key, pub_bytes, device_id
 
 
+class _DeviceKeyCache:
+    """Process-wide device keypair, loaded (or created) once under a lock."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._keypair: tuple[Ed25519PrivateKey, bytes, str] | None = None
+
+    def get(self) -> tuple[Ed25519PrivateKey, bytes, str]:
+        keypair = self._keypair
+        if keypair is None:
+            with self._lock:
+                keypair = self._keypair
+                if keypair is None:
+                    keypair = _load_or_create_device_keypair()
+                    self._keypair = keypair
+        return keypair
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keypair = None
+
+
+_device_keys = _DeviceKeyCache()
+
+
+def _get_or_create_device_keypair() -> tuple[Ed25519PrivateKey, bytes, str]:
+    """Return (private_key, raw_public_bytes, device_id).
+
+    Keys are persisted to ``_DEVICE_KEY_DIR`` so the device identity remains
+    stable across restarts (avoiding repeated pairing prompts). The keypair is
+    read once per process; call `reload_device_keypair` after replacing the file.
+    """
+    return _device_keys.get()
+
+
+def reload_device_keypair() -> None:
+    """Forget the cached device keypair so the next handshake re-reads it from disk."""
+    _device_keys.clear()
+
+
 def _build_device_auth(
     *,
     token: str,
@@ -224,6 +278,14 @@ class OpenClawGatewayError(RuntimeError):
     """Raised when OpenClaw gateway calls fail."""
 
 
+class GatewayCircuitOpenError(OpenClawGatewayError):
+    """Raised without contacting a gateway whose circuit breaker is open."""
+
+
+class _GatewayConnectionLostError(OpenClawGatewayError):
+    """A pooled socket dropped while requests were waiting on it."""
+
+
 @dataclass(frozen=True)
 class GatewayConfig:
     """Connection configuration for the OpenClaw gateway."""
@@ -246,11 +308,37 @@ def _build_gateway_url(config: GatewayConfig) -> str:
     return str(urlunparse(parsed._replace(query=query)))
 
 
+@dataclass(frozen=True)
+class GatewayRequest:
+    """One RPC in a pipelined `openclaw_call_many` batch."""
+
+    method: str
+    params: dict[str, Any] | None = None
+
+
+# Per-item outcome of a batch: the result payload, or the gateway's error.
+GatewayResult = object | OpenClawGatewayError
+
+
 def _redacted_url_for_log(raw_url: str) -> str:
     parsed = urlparse(raw_url)
     return str(urlunparse(parsed._replace(query="", fragment="")))
 
 
+def _response_result(data: dict[str, Any]) -> object:
+    """Return the result of a response frame, raising on gateway errors."""
+    if data.get("type") == "res":
+        ok = data.get("ok")
+        if ok is not None and not ok:
+            error = data.get("error", {}).get("message", "Gateway error")
+            raise OpenClawGatewayError(error)
+        return data.get("payload")
+    if data.get("error"):
+        message = data["error"].get("message", "Gateway error")
+        raise OpenClawGatewayError(message)
+    return data.get("result")
+
+
 async def _await_response(
     ws: websockets.ClientConnection,
     request_id: str,
@@ -264,26 +352,11 @@ async def _await_response(
             request_id,
             data.get("type"),
         )
-
-        if data.get("type") == "res" and data.get("id") == request_id:
-            ok = data.get("ok")
-            if ok is not None and not ok:
-                error = data.get("error", {}).get("message", "Gateway error")
-                raise OpenClawGatewayError(error)
-            return data.get("payload")
-
         if data.get("id") == request_id:
-            if data.get("error"):
-                message = data["error"].get("message", "Gateway error")
-                raise OpenClawGatewayError(message)
-            return data.get("result")
+            return _response_result(data)
 
 
-async def _send_request(
-    ws: websockets.ClientConnection,
-    method: str,
-    params: dict[str, Any] | None,
-) -> object:
+def _request_frame(method: str, params: dict[str, Any] | None) -> tuple[str, str]:
     request_id = str(uuid4())
     message = {
         "type": "req",
@@ -298,21 +371,27 @@ async def _send_request(
         request_id,
         sorted((params or {}).keys()),
     )
-    await ws.send(json.dumps(message))
+    return request_id, json.dumps(message)
+
+
+async def _send_request(
+    ws: websockets.ClientConnection,
+    method: str,
+    params: dict[str, Any] | None,
+) -> object:
+    request_id, frame = _request_frame(method, params)
+    await ws.send(frame)
     return await _await_response(ws, request_id)
 
 
-def _build_connect_params(
-    config: GatewayConfig,
-    *,
-    nonce: str = "",
-) -> dict[str, Any]:
-    scopes = list(GATEWAY_OPERATOR_SCOPES)
+@lru_cache(maxsize=256)
+def _static_connect_params(config: GatewayConfig) -> dict[str, Any]:
+    """Connect params that do not depend on the challenge nonce (never mutate)."""
     params: dict[str, Any] = {
         "minProtocol": PROTOCOL_VERSION,
         "maxProtocol": PROTOCOL_VERSION,
         "role": "operator",
-        "scopes": scopes,
+        "scopes": list(GATEWAY_OPERATOR_SCOPES),
         "client": {
             "id": "gateway-client",
             "version": "1.0.0",
@@ -324,30 +403,26 @@ def _build_connect_params(
         params["auth"] = {"password": config.password}
         if config.token:
             params["auth"]["token"] = config.token
-        # When token is present, add device auth so the gateway grants operator scopes.
-        if config.token:
-            try:
-                private_key, pub_bytes, device_id = _get_or_create_device_keypair()
-                params["device"] = _build_device_auth(
-                    token=config.token,
-                    nonce=nonce,
-                    scopes=scopes,
-                    device_id=device_id,
-                    private_key=private_key,
-                    pub_bytes=pub_bytes,
-                )
-            except Exception:
-                logger.warning("gateway.rpc.device_auth_failed", exc_info=True)
     elif config.token:
         params["auth"] = {"token": config.token}
-        # Device-key auth: sign the challenge nonce so the gateway preserves
-        # the requested scopes (without this, scopes are stripped).
+    return params
+
+
+def _build_connect_params(
+    config: GatewayConfig,
+    *,
+    nonce: str = "",
+) -> dict[str, Any]:
+    params = copy.deepcopy(_static_connect_params(config))
+    # Device-key auth: sign the challenge nonce so the gateway preserves (and,
+    # alongside a password, grants) the requested operator scopes.
+    if config.token:
         try:
             private_key, pub_bytes, device_id = _get_or_create_device_keypair()
             params["device"] = _build_device_auth(
                 token=config.token,
                 nonce=nonce,
-                scopes=scopes,
+                scopes=params["scopes"],
                 device_id=device_id,
                 private_key=private_key,
                 pub_bytes=pub_bytes,
@@ -386,14 +461,572 @@ async def _ensure_connected(
     await _await_response(ws, connect_id)
 
 
+async def _handshake(ws: websockets.ClientConnection, config: GatewayConfig) -> None:
+    first_message = None
+    try:
+        first_message = await asyncio.wait_for(ws.recv(), timeout=2)
+    except TimeoutError:
+        first_message = None
+    await _ensure_connected(ws, first_message, config)
+
+
+# ---------------------------------------------------------------------------
+# Pooled connections
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class GatewayPoolStats:
+    """Counters for the pooled gateway connections of the current event loop."""
+
+    open_connections: int = 0
+    in_flight: int = 0
+    calls: int = 0
+    handshakes: int = 0
+    connect_failures: int = 0
+    idle_closes: int = 0
+    dropped: int = 0
+
+
+class _GatewayConnection:
+    """One long-lived, authenticated websocket shared by concurrent calls.
+
+    Requests are written directly to the socket; a single reader task resolves
+    the pending future matching each response id. The socket is closed after
+    `GATEWAY_RPC_IDLE_TIMEOUT_SECONDS` without traffic, and reopened lazily with
+    exponential backoff after failures.
+    """
+
+    def __init__(self, config: GatewayConfig, stats: GatewayPoolStats) -> None:
+        self.config = config
+        self._stats = stats
+        self._ws: websockets.ClientConnection | None = None
+        self._reader: asyncio.Task[None] | None = None
+        self._pending: dict[str, asyncio.Future[object]] = {}
+        self._connect_lock = asyncio.Lock()
+        self._failures = 0
+        self._last_used = time.monotonic()
+
+    async def call(self, method: str, params: dict[str, Any] | None) -> object:
+        ws = await self._ensure_open()
+        request_id, frame = _request_frame(method, params)
+        future: asyncio.Future[object] = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self._stats.calls += 1
+        self._stats.in_flight += 1
+        try:
+            await ws.send(frame)
+            return await future
+        finally:
+            self._stats.in_flight -= 1
+            self._pending.pop(request_id, None)
+            self._last_used = time.monotonic()
+
+    async def call_many(self, requests: Sequence[GatewayRequest]) -> list[GatewayResult]:
+        """Send every request before awaiting any reply; gateway errors are per item."""
+        ws = await self._ensure_open()
+        loop = asyncio.get_running_loop()
+        pending: list[tuple[str, asyncio.Future[object]]] = []
+        self._stats.calls += len(requests)
+        self._stats.in_flight += len(requests)
+        try:
+            for request in requests:
+                request_id, frame = _request_frame(request.method, request.params)
+                future: asyncio.Future[object] = loop.create_future()
+                self._pending[request_id] = future
+                pending.append((request_id, future))
+                await ws.send(frame)
+            outcomes = await asyncio.gather(
+                *(future for _, future in pending),
+                return_exceptions=True,
+            )
+        finally:
+            self._stats.in_flight -= len(requests)
+            for request_id, future in pending:
+                self._pending.pop(request_id, None)
+                future.cancel()
+            self._last_used = time.monotonic()
+        results: list[GatewayResult] = []
+        for outcome in outcomes:
+            if isinstance(outcome, OpenClawGatewayError) or not isinstance(
+                outcome,
+                BaseException,
+            ):
+                results.append(outcome)
+            else:
+                raise outcome
+        return results
+
+    async def _ensure_open(self) -> websockets.ClientConnection:
+        if self._ws is not None:
+            return self._ws
+        async with self._connect_lock:
+            if self._ws is not None:
+                return self._ws
+            if self._failures:
+                delay = min(
+                    settings.gateway_rpc_reconnect_max_seconds,
+                    0.25 * 2 ** (self._failures - 1),
+                )
+                await asyncio.sleep(delay)
+            ws = await self._connect()
+            self._ws = ws
+            self._last_used = time.monotonic()
+            self._reader = asyncio.create_task(self._read_forever(ws))
+            self._stats.open_connections += 1
+            return ws
+
+    async def _connect(self) -> websockets.ClientConnection:
+        gateway_url = _build_gateway_url(self.config)
+        try:
+            ws = await websockets.connect(
+                gateway_url,
+                ping_interval=settings.gateway_rpc_ping_interval_seconds or None,
+            )
+        except BaseException:
+            self._failures += 1
+            self._stats.connect_failures += 1
+            raise
+        try:
+            await _handshake(ws, self.config)
+        except BaseException:
+            self._failures += 1
+            self._stats.connect_failures += 1
+            await ws.close()
+            raise
+        self._failures = 0
+        self._stats.handshakes += 1
+        logger.debug(
+            "gateway.rpc.pool.connected gateway_url=%s",
+            _redacted_url_for_log(gateway_url),
+        )
+        return ws
+
+    def _idle_for(self) -> float:
+        return time.monotonic() - self._last_used
+
+    async def _read_forever(self, ws: websockets.ClientConnection) -> None:
+        error: BaseException | None = None
+        idle_timeout = settings.gateway_rpc_idle_timeout_seconds
+        try:
+            while True:
+                try:
+                    raw = await asyncio.wait_for(ws.recv(), timeout=idle_timeout)
+                except TimeoutError:
+                    if not self._pending and self._idle_for() >= idle_timeout:
+                        self._stats.idle_closes += 1
+                        break
+                    continue
+                self._dispatch(json.loads(raw))
+        except asyncio.CancelledError:
+            error = OpenClawGatewayError("Gateway connection closed.")
+            raise
+        except Exception as exc:
+            error = exc
+            self._stats.dropped += 1
+            logger.warning(
+                "gateway.rpc.pool.connection_lost error_type=%s",
+                exc.__class__.__name__,
+            )
+        finally:
+            self._detach(ws, error)
+            await ws.close()
+
+    def _dispatch(self, data: dict[str, Any]) -> None:
+        future = self._pending.get(str(data.get("id")))
+        if future is None:
+            logger.log(
+                TRACE_LEVEL,
+                "gateway.rpc.pool.unsolicited type=%s event=%s",
+                data.get("type"),
+                data.get("event"),
+            )
+            return
+        if future.done():
+            return
+        try:
+            future.set_result(_response_result(data))
+        except OpenClawGatewayError as exc:
+            future.set_exception(exc)
+
+    def _detach(self, ws: websockets.ClientConnection, error: BaseException | None) -> None:
+        if self._ws is ws:
+            self._ws = None
+            self._reader = None
+            self._stats.open_connections -= 1
+        if not self._pending:
+            return
+        failure = _GatewayConnectionLostError(
+            str(error) if error else "Gateway connection closed.",
+        )
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(failure)
+
+    async def close(self) -> None:
+        reader = self._reader
+        if reader is not None:
+            reader.cancel()
+            try:
+                await reader
+            except asyncio.CancelledError:
+                pass
+
+
+@dataclass
+class _GatewayPool:
+    connections: dict[GatewayConfig, _GatewayConnection] = field(default_factory=dict)
+    stats: GatewayPoolStats = field(default_factory=GatewayPoolStats)
+
+    def connection(self, config: GatewayConfig) -> _GatewayConnection:
+        conn = self.connections.get(config)
+        if conn is None:
+            conn = _GatewayConnection(config, self.stats)
+            self.connections[config] = conn
+        return conn
+
+
+# Websockets are bound to the loop that opened them, so pools are per event loop.
+_POOLS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _GatewayPool] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _gateway_pool() -> _GatewayPool:
+    loop = asyncio.get_running_loop()
+    pool = _POOLS.get(loop)
+    if pool is None:
+        pool = _GatewayPool()
+        _POOLS[loop] = pool
+    return pool
+
+
+def gateway_pool_stats() -> GatewayPoolStats:
+    """Return a snapshot of the connection pool counters for the running loop."""
+    pool = _POOLS.get(asyncio.get_running_loop())
+    if pool is None:
+        return GatewayPoolStats()
+    return GatewayPoolStats(**vars(pool.stats))
+
+
+async def close_gateway_connections() -> None:
+    """Close every pooled gateway connection owned by the running loop."""
+    pool = _POOLS.pop(asyncio.get_running_loop(), None)
+    if pool is None:
+        return
+    await asyncio.gather(*(conn.close() for conn in pool.connections.values()))
+
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+@dataclass(frozen=True, slots=True)
+class GatewayCircuitStatus:
+    """Point-in-time view of one gateway's circuit breaker."""
+
+    state: CircuitState
+    consecutive_failures: int
+    opened_at: datetime | None = None
+    retry_in_seconds: float | None = None
+    last_error: str | None = None
+
+
+@dataclass
+class GatewayCircuitBreaker:
+    """Fails calls fast while a gateway keeps failing at the transport level.
+
+    closed: calls go through; `GATEWAY_CIRCUIT_FAILURE_THRESHOLD` consecutive
+    transport failures (connect errors, timeouts, dropped sockets) open the circuit.
+    open: calls raise `GatewayCircuitOpenError` without touching the network until
+    `GATEWAY_CIRCUIT_RESET_SECONDS` have passed.
+    half_open: a single probe call goes through; success closes the circuit and
+    failure opens it again. Error replies from a reachable gateway count as success.
+    """
+
+    gateway_url: str
+    state: CircuitState = "closed"
+    consecutive_failures: int = 0
+    opened_at: datetime | None = None
+    last_error: str | None = None
+    _opened_monotonic: float = 0.0
+    _probe_in_flight: bool = False
+
+    def _retry_in(self) -> float:
+        elapsed = time.monotonic() - self._opened_monotonic
+        return max(0.0, settings.gateway_circuit_reset_seconds - elapsed)
+
+    def before_call(self) -> bool:
+        """Admit a call or raise; returns True when the call is the half-open probe."""
+        if self.state == "open" and self._retry_in() <= 0:
+            self.state = "half_open"
+        if self.state == "closed":
+            return False
+        if self.state == "half_open" and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        retry_in = self._retry_in() if self.state == "open" else 0.0
+        message = (
+            f"Gateway {_redacted_url_for_log(self.gateway_url)} is unavailable "
+            f"(circuit open after {self.consecutive_failures} consecutive failures; "
+            f"next attempt in {retry_in:.0f}s). Last error: {self.last_error}"
+        )
+        raise GatewayCircuitOpenError(message)
+
+    def record_success(self, *, probe: bool) -> None:
+        if probe:
+            self._probe_in_flight = False
+        if self.state != "closed":
+            logger.info(
+                "gateway.rpc.circuit.closed gateway_url=%s",
+                _redacted_url_for_log(self.gateway_url),
+            )
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.last_error = None
+
+    def record_failure(self, exc: BaseException, *, probe: bool) -> None:
+        if probe:
+            self._probe_in_flight = False
+        self.consecutive_failures += 1
+        self.last_error = str(exc) or type(exc).__name__
+        threshold = settings.gateway_circuit_failure_threshold
+        if probe or (threshold and self.consecutive_failures >= threshold):
+            if self.state != "open":
+                logger.warning(
+                    "gateway.rpc.circuit.opened gateway_url=%s failures=%s",
+                    _redacted_url_for_log(self.gateway_url),
+                    self.consecutive_failures,
+                )
+            self.state = "open"
+            self.opened_at = utcnow()
+            self._opened_monotonic = time.monotonic()
+
+    def release(self, *, probe: bool) -> None:
+        """Forget an admitted call that ended without a verdict (e.g. cancelled)."""
+        if probe:
+            self._probe_in_flight = False
+
+    def status(self) -> GatewayCircuitStatus:
+        if self.state == "open" and self._retry_in() <= 0:
+            self.state = "half_open"
+        return GatewayCircuitStatus(
+            state=self.state,
+            consecutive_failures=self.consecutive_failures,
+            opened_at=self.opened_at,
+            retry_in_seconds=round(self._retry_in(), 3) if self.state == "open" else None,
+            last_error=self.last_error,
+        )
+
+
+class _GatewayCircuits:
+    """Process-wide circuit breakers, one per gateway URL."""
+
+    def __init__(self) -> None:
+        self._breakers: dict[str, GatewayCircuitBreaker] = {}
+
+    def get(self, config: GatewayConfig) -> GatewayCircuitBreaker:
+        key = (config.url or "").strip().rstrip("/")
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = GatewayCircuitBreaker(gateway_url=key)
+            self._breakers[key] = breaker
+        return breaker
+
+    def clear(self) -> None:
+        self._breakers.clear()
+
+
+_circuits = _GatewayCircuits()
+
+
+def gateway_circuit_status(config: GatewayConfig) -> GatewayCircuitStatus:
+    """Return the circuit breaker state for the gateway `config` points at."""
+    return _circuits.get(config).status()
+
+
+def _circuit_breaker_enabled() -> bool:
+    return settings.gateway_circuit_failure_threshold > 0
+
+
+def _record_gateway_error(
+    breaker: GatewayCircuitBreaker,
+    exc: OpenClawGatewayError,
+    *,
+    probe: bool,
+) -> None:
+    # An error reply proves the gateway is reachable; a dropped socket does not.
+    if isinstance(exc, _GatewayConnectionLostError):
+        breaker.record_failure(exc, probe=probe)
+    else:
+        breaker.record_success(probe=probe)
+
+
+async def _call_once(
+    method: str,
+    params: dict[str, Any] | None,
+    config: GatewayConfig,
+) -> object:
+    async with websockets.connect(_build_gateway_url(config), ping_interval=None) as ws:
+        await _handshake(ws, config)
+        return await _send_request(ws, method, params)
+
+
+async def _call_many_once(
+    requests: Sequence[GatewayRequest],
+    config: GatewayConfig,
+) -> list[GatewayResult]:
+    async with websockets.connect(_build_gateway_url(config), ping_interval=None) as ws:
+        await _handshake(ws, config)
+        request_ids: list[str] = []
+        for request in requests:
+            request_id, frame = _request_frame(request.method, request.params)
+            request_ids.append(request_id)
+            await ws.send(frame)
+        wanted = set(request_ids)
+        results: dict[str, GatewayResult] = {}
+        while len(results) < len(wanted):
+            data = json.loads(await ws.recv())
+            request_id = data.get("id")
+            if request_id not in wanted or request_id in results:
+                continue
+            try:
+                results[request_id] = _response_result(data)
+            except OpenClawGatewayError as exc:
+                results[request_id] = exc
+        return [results[request_id] for request_id in request_ids]
+
+
+@dataclass(frozen=True, slots=True)
+class GatewayEvent:
+    """One server-pushed event frame (see `GATEWAY_EVENTS`)."""
+
+    event: str
+    payload: dict[str, Any]
+    seq: int | None = None
+
+
+async def stream_gateway_events(config: GatewayConfig) -> AsyncIterator[GatewayEvent]:
+    """Yield the gateway's event frames over a dedicated socket until it closes.
+
+    Request/response calls stay on the pooled connection; subscribers own this
+    socket for as long as they iterate. Transport failures raise
+    `OpenClawGatewayError`, and the caller decides when to reconnect.
+    """
+    gateway_url = _build_gateway_url(config)
+    try:
+        async with websockets.connect(
+            gateway_url,
+            ping_interval=settings.gateway_rpc_ping_interval_seconds or None,
+        ) as ws:
+            await _handshake(ws, config)
+            logger.info(
+                "gateway.rpc.events.subscribed gateway_url=%s",
+                _redacted_url_for_log(gateway_url),
+            )
+            async for raw in ws:
+                data = json.loads(raw)
+                if not isinstance(data, dict) or data.get("type") != "event":
+                    continue
+                name = data.get("event")
+                payload = data.get("payload")
+                seq = data.get("seq")
+                if not isinstance(name, str) or name == "connect.challenge":
+                    continue
+                yield GatewayEvent(
+                    event=name,
+                    payload=payload if isinstance(payload, dict) else {},
+                    seq=seq if isinstance(seq, int) else None,
+                )
+    except (
+        TimeoutError,
+        ConnectionError,
+        OSError,
+        ValueError,
+        WebSocketException,
+    ) as exc:  # pragma: no cover - network/protocol errors
+        raise OpenClawGatewayError(str(exc)) from exc
+
+
+async def openclaw_call_many(
+    requests: Sequence[GatewayRequest],
+    *,
+    config: GatewayConfig,
+) -> list[GatewayResult]:
+    """Pipeline several RPCs on one connection and return their results in order.
+
+    Up to `GATEWAY_RPC_MAX_PIPELINED` requests are written before the first reply is
+    awaited. A gateway error for one request is returned in its slot (as an
+    `OpenClawGatewayError`) without affecting the others; transport failures raise.
+    """
+    gateway_url = _build_gateway_url(config)
+    breaker = _circuits.get(config) if _circuit_breaker_enabled() else None
+    probe = breaker.before_call() if breaker is not None else False
+    started_at = perf_counter()
+    window = settings.gateway_rpc_max_pipelined
+    results: list[GatewayResult] = []
+    try:
+        for start in range(0, len(requests), window):
+            chunk = requests[start : start + window]
+            if settings.gateway_rpc_pool_enabled:
+                results.extend(await _gateway_pool().connection(config).call_many(chunk))
+            else:
+                results.extend(await _call_many_once(chunk, config))
+    except OpenClawGatewayError as exc:
+        if breaker is not None:
+            _record_gateway_error(breaker, exc, probe=probe)
+        logger.warning(
+            "gateway.rpc.call_many.gateway_error count=%s duration_ms=%s",
+            len(requests),
+            int((perf_counter() - started_at) * 1000),
+        )
+        raise
+    except (
+        TimeoutError,
+        ConnectionError,
+        OSError,
+        ValueError,
+        WebSocketException,
+    ) as exc:  # pragma: no cover - network/protocol errors
+        if breaker is not None:
+            breaker.record_failure(exc, probe=probe)
+        logger.error(
+            "gateway.rpc.call_many.transport_error count=%s duration_ms=%s error_type=%s",
+            len(requests),
+            int((perf_counter() - started_at) * 1000),
+            exc.__class__.__name__,
+        )
+        raise OpenClawGatewayError(str(exc)) from exc
+    except BaseException:
+        if breaker is not None:
+            breaker.release(probe=probe)
+        raise
+    if breaker is not None:
+        breaker.record_success(probe=probe)
+    logger.debug(
+        "gateway.rpc.call_many.success gateway_url=%s count=%s failed=%s duration_ms=%s",
+        _redacted_url_for_log(gateway_url),
+        len(requests),
+        sum(isinstance(result, OpenClawGatewayError) for result in results),
+        int((perf_counter() - started_at) * 1000),
+    )
+    return results
+
+
 async def openclaw_call(
     method: str,
     params: dict[str, Any] | None = None,
     *,
     config: GatewayConfig,
 ) -> object:
-    """Call a gateway RPC method and return the result payload."""
+    """Call a gateway RPC method and return the result payload.
+
+    Calls share a pooled connection per gateway config unless
+    `GATEWAY_RPC_POOL_ENABLED` is off, in which case each call opens its own socket.
+    """
     gateway_url = _build_gateway_url(config)
+    breaker = _circuits.get(config) if _circuit_breaker_enabled() else None
+    probe = breaker.before_call() if breaker is not None else False
     started_at = perf_counter()
     logger.debug(
         "gateway.rpc.call.start method=%s gateway_url=%s",
@@ -401,21 +1034,13 @@ async def openclaw_call(
         _redacted_url_for_log(gateway_url),
     )
     try:
-        async with websockets.connect(gateway_url, ping_interval=None) as ws:
-            first_message = None
-            try:
-                first_message = await asyncio.wait_for(ws.recv(), timeout=2)
-            except TimeoutError:
-                first_message = None
-            await _ensure_connected(ws, first_message, config)
-            payload = await _send_request(ws, method, params)
-            logger.debug(
-                "gateway.rpc.call.success method=%s duration_ms=%s",
-                method,
-                int((perf_counter() - started_at) * 1000),
-            )
-            return payload
-    except OpenClawGatewayError:
+        if settings.gateway_rpc_pool_enabled:
+            payload = await _gateway_pool().connection(config).call(method, params)
+        else:
+            payload = await _call_once(method, params, config)
+    except OpenClawGatewayError as exc:
+        if breaker is not None:
+            _record_gateway_error(breaker, exc, probe=probe)
         logger.warning(
             "gateway.rpc.call.gateway_error method=%s duration_ms=%s",
             method,
@@ -429,6 +1054,8 @@ async def openclaw_call(
         ValueError,
         WebSocketException,
     ) as exc:  # pragma: no cover - network/protocol errors
+        if breaker is not None:
+            breaker.record_failure(exc, probe=probe)
         logger.error(
             "gateway.rpc.call.transport_error method=%s duration_ms=%s error_type=%s",
             method,
@@ -436,6 +1063,18 @@ async def openclaw_call(
             exc.__class__.__name__,
         )
         raise OpenClawGatewayError(str(exc)) from exc
+    except BaseException:
+        if breaker is not None:
+            breaker.release(probe=probe)
+        raise
+    if breaker is not None:
+        breaker.record_success(probe=probe)
+    logger.debug(
+        "gateway.rpc.call.success method=%s duration_ms=%s",
+        method,
+        int((perf_counter() - started_at) * 1000),
+    )
+    return payload
 
 
 async def send_message(
@@ -0,0 +1,175 @@
+"""Per-gateway cache of runtime status shared by the gateway session APIs.
+
+Dashboard pages read gateway status and sessions on every load, and each read costs
+a version check, `sessions.list` and `ensure_session` against the gateway. Results
+are kept per gateway config for `GATEWAY_STATUS_CACHE_TTL_SECONDS`; concurrent
+readers of a stale entry share one in-flight refresh, and a background poller keeps
+recently read gateways warm so requests rarely wait on the gateway. Failed
+snapshots are never served from the cache, so a recovered gateway shows up on the
+next read.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.time import utcnow
+from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
+
+logger = get_logger(__name__)
+
+# A gateway config plus the main session key ensured while fetching.
+GatewayStatusKey = tuple[GatewayClientConfig, str | None]
+
+
+@dataclass(frozen=True, slots=True)
+class GatewayStatusSnapshot:
+    """What one round of status calls returned for a gateway."""
+
+    # Set when the gateway could not be reached or `sessions.list` failed.
+    error: str | None = None
+    # Set when the gateway answered but runs an unsupported version.
+    compatibility_error: str | None = None
+    sessions: list[object] | None = None
+    main_session: object | None = None
+    main_session_error: str | None = None
+    fetched_at: datetime = field(default_factory=utcnow)
+    fetched_monotonic: float = field(default_factory=time.monotonic, repr=False)
+
+    def age_seconds(self) -> float:
+        return max(0.0, time.monotonic() - self.fetched_monotonic)
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None or self.compatibility_error is not None
+
+
+StatusFetcher = Callable[[GatewayClientConfig, str | None], Awaitable[GatewayStatusSnapshot]]
+
+
+@dataclass
+class _Entry:
+    fetch: StatusFetcher
+    snapshot: GatewayStatusSnapshot | None = None
+    refreshing: asyncio.Task[GatewayStatusSnapshot] | None = None
+    # Last time an API request read this entry; the poller drops idle entries.
+    last_read: float = field(default_factory=time.monotonic)
+
+
+class GatewayStatusCache:
+    """TTL cache of gateway status snapshots with single-flight refreshes."""
+
+    def __init__(self) -> None:
+        self._entries: dict[GatewayStatusKey, _Entry] = {}
+
+    async def get(
+        self,
+        key: GatewayStatusKey,
+        fetch: StatusFetcher,
+        *,
+        max_age: float | None = None,
+    ) -> GatewayStatusSnapshot:
+        """Return a snapshot no older than `max_age` (default: the configured TTL).
+
+        Failed snapshots are always refetched; concurrent readers still share one
+        refresh.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = _Entry(fetch=fetch)
+            self._entries[key] = entry
+        else:
+            entry.fetch = fetch
+        entry.last_read = time.monotonic()
+        ttl = settings.gateway_status_cache_ttl_seconds if max_age is None else max_age
+        snapshot = entry.snapshot
+        if snapshot is not None and not snapshot.failed and snapshot.age_seconds() < ttl:
+            return snapshot
+        return await self._refresh(key, entry)
+
+    async def _refresh(self, key: GatewayStatusKey, entry: _Entry) -> GatewayStatusSnapshot:
+        task = entry.refreshing
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._fetch(key, entry))
+            task.add_done_callback(_consume_task_error)
+            entry.refreshing = task
+        # A reader that goes away must not cancel the refresh other readers await.
+        return await asyncio.shield(task)
+
+    @staticmethod
+    async def _fetch(key: GatewayStatusKey, entry: _Entry) -> GatewayStatusSnapshot:
+        config, main_session = key
+        snapshot = await entry.fetch(config, main_session)
+        entry.snapshot = snapshot
+        return snapshot
+
+    async def poll_once(self) -> None:
+        """Refresh every recently read gateway and forget the idle ones."""
+        now = time.monotonic()
+        idle_seconds = settings.gateway_status_poll_idle_seconds
+        for key, entry in list(self._entries.items()):
+            if now - entry.last_read > idle_seconds:
+                del self._entries[key]
+        results = await asyncio.gather(
+            *(self._refresh(key, entry) for key, entry in list(self._entries.items())),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(
+                    "gateway.status_cache.refresh_failed",
+                    extra={"error": f"{type(result).__name__}: {result}"},
+                )
+
+    async def run_poller(self) -> None:
+        """Poll forever at `GATEWAY_STATUS_POLL_INTERVAL_SECONDS` until cancelled."""
+        interval = settings.gateway_status_poll_interval_seconds
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.poll_once()
+            except Exception:
+                logger.exception("gateway.status_cache.poll_failed")
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def _consume_task_error(task: asyncio.Task[GatewayStatusSnapshot]) -> None:
+    # Readers re-raise the error themselves; this only keeps asyncio from logging
+    # "exception was never retrieved" when every reader has gone away.
+    if not task.cancelled():
+        task.exception()
+
+
+gateway_status_cache = GatewayStatusCache()
+
+
+def start_gateway_status_poller() -> asyncio.Task[None] | None:
+    """Start the background refresh task, unless caching or polling is disabled."""
+    if (
+        settings.gateway_status_cache_ttl_seconds <= 0
+        or settings.gateway_status_poll_interval_seconds <= 0
+    ):
+        return None
+    return asyncio.create_task(
+        gateway_status_cache.run_poller(),
+        name="gateway-status-poller",
+    )
+
+
+async def stop_gateway_status_poller(task: asyncio.Task[None] | None) -> None:
+    """Cancel the background refresh task started by `start_gateway_status_poller`."""
+    if task is None:
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
@@ -14,7 +14,7 @@ from app.services.openclaw.constants import (
     _SECURE_RANDOM,
     _TRANSIENT_GATEWAY_ERROR_MARKERS,
 )
-from app.services.openclaw.gateway_rpc import OpenClawGatewayError
+from app.services.openclaw.gateway_rpc import GatewayCircuitOpenError, OpenClawGatewayError
 
 _T = TypeVar("_T")
 
@@ -82,6 +82,10 @@ class GatewayBackoff:
             value, error = await self._attempt(fn)
             if error is not None:
                 exc = error
+                if isinstance(exc, GatewayCircuitOpenError):
+                    # The breaker already found the gateway down; fail like an
+                    # exhausted backoff instead of holding the caller until then.
+                    raise TimeoutError(str(exc)) from exc
                 if not _is_transient_gateway_error(exc):
                     raise exc
                 now = asyncio.get_running_loop().time()
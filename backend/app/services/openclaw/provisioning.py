@@ -7,14 +7,22 @@ DB-backed workflows (template sync, lead-agent record creation) live in
 
 from __future__ import annotations
 
+import hashlib
 import json
 import re
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from jinja2 import Environment, FileSystemLoader, StrictUndefined, select_autoescape
+from jinja2 import (
+    Environment,
+    FileSystemLoader,
+    StrictUndefined,
+    Template,
+    select_autoescape,
+)
 
 from app.core.config import settings
 from app.models.agents import Agent
@@ -39,9 +47,11 @@ from app.services.openclaw.constants import (
 from app.services.openclaw.gateway_resolver import gateway_client_config
 from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
 from app.services.openclaw.gateway_rpc import (
+    GatewayRequest,
     OpenClawGatewayError,
     ensure_session,
     openclaw_call,
+    openclaw_call_many,
     send_message,
 )
 from app.services.openclaw.internal.agent_key import agent_key as _agent_key
@@ -65,6 +75,14 @@ class ProvisionOptions:
     overwrite: bool = False
 
 
+@dataclass(frozen=True, slots=True)
+class AgentFileSyncReport:
+    """Workspace files one provisioning run wrote, and those it left untouched."""
+
+    written: tuple[str, ...] = ()
+    skipped: tuple[str, ...] = ()
+
+
 _ROLE_SOUL_MAX_CHARS = 24_000
 _ROLE_SOUL_WORD_RE = re.compile(r"[a-z0-9]+")
 
@@ -138,9 +156,65 @@ def _template_env() -> Environment:
         autoescape=select_autoescape(default=False),
         undefined=StrictUndefined,
         keep_trailing_newline=True,
+        # Templates ship with the app; compiled ones are reused without re-checking
+        # mtimes. Call `reload_templates` after changing files under `templates/`.
+        auto_reload=False,
     )
 
 
+# Compiled `identity_template`/`soul_template` overrides kept per process.
+_OVERRIDE_TEMPLATE_CACHE_SIZE = 256
+
+
+class _TemplateCache:
+    """Process-wide Jinja environment, template index and compiled overrides."""
+
+    def __init__(self) -> None:
+        self._env: Environment | None = None
+        self._names: frozenset[str] = frozenset()
+        # Keyed by the sha256 of the override source, least recently used first.
+        self._overrides: OrderedDict[str, Template] = OrderedDict()
+
+    def _environment(self) -> Environment:
+        if self._env is None:
+            env = _template_env()
+            self._names = frozenset(env.list_templates())
+            self._env = env
+        return self._env
+
+    def get(self, name: str) -> Template:
+        env = self._environment()
+        if name not in self._names:
+            msg = f"Missing template file: {name}"
+            raise FileNotFoundError(msg)
+        return env.get_template(name)
+
+    def from_string(self, source: str) -> Template:
+        key = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        template = self._overrides.get(key)
+        if template is not None:
+            self._overrides.move_to_end(key)
+            return template
+        template = self._environment().from_string(source)
+        self._overrides[key] = template
+        while len(self._overrides) > _OVERRIDE_TEMPLATE_CACHE_SIZE:
+            self._overrides.popitem(last=False)
+        return template
+
+    def clear(self) -> None:
+        self._env = None
+        self._names = frozenset()
+        self._overrides.clear()
+
+
+_templates = _TemplateCache()
+
+
+def reload_templates() -> None:
+    """Drop compiled templates so the next render reads `templates/` again."""
+    _templates.clear()
+
+
 def _heartbeat_template_name(agent: Agent) -> str:
     return HEARTBEAT_LEAD_TEMPLATE if agent.is_board_lead else HEARTBEAT_AGENT_TEMPLATE
 
@@ -394,7 +468,6 @@ def _render_agent_files(
     include_bootstrap: bool,
     template_overrides: dict[str, str] | None = None,
 ) -> dict[str, str]:
-    env = _template_env()
     overrides: dict[str, str] = {}
     if agent.identity_template:
         overrides["IDENTITY.md"] = agent.identity_template
@@ -411,15 +484,11 @@ def _render_agent_files(
                 if template_overrides and name in template_overrides
                 else _heartbeat_template_name(agent)
             )
-            heartbeat_path = _templates_root() / heartbeat_template
-            if not heartbeat_path.exists():
-                msg = f"Missing template file: {heartbeat_template}"
-                raise FileNotFoundError(msg)
-            rendered[name] = env.get_template(heartbeat_template).render(**context).strip()
+            rendered[name] = _templates.get(heartbeat_template).render(**context).strip()
             continue
         override = overrides.get(name)
         if override:
-            rendered[name] = env.from_string(override).render(**context).strip()
+            rendered[name] = _templates.from_string(override).render(**context).strip()
             continue
         template_name = (
             template_overrides[name] if template_overrides and name in template_overrides else name
@@ -427,11 +496,7 @@ def _render_agent_files(
         if template_name == "SOUL.md":
             # Use shared Jinja soul template as the default implementation.
             template_name = "BOARD_SOUL.md.j2"
-        path = _templates_root() / template_name
-        if not path.exists():
-            msg = f"Missing template file: {template_name}"
-            raise FileNotFoundError(msg)
-        rendered[name] = env.get_template(template_name).render(**context).strip()
+        rendered[name] = _templates.get(template_name).render(**context).strip()
     return rendered
 
 
@@ -488,6 +553,49 @@ class GatewayControlPlane(ABC):
     async def delete_agent_file(self, *, agent_id: str, name: str) -> None:
         raise NotImplementedError
 
+    async def get_agent_file_payloads(
+        self,
+        files: list[tuple[str, str]],
+    ) -> list[object | OpenClawGatewayError]:
+        """Fetch `(agent_id, name)` files; each slot holds a payload or its error."""
+        payloads: list[object | OpenClawGatewayError] = []
+        for agent_id, name in files:
+            try:
+                payloads.append(await self.get_agent_file_payload(agent_id=agent_id, name=name))
+            except OpenClawGatewayError as exc:
+                payloads.append(exc)
+        return payloads
+
+    async def set_agent_files(
+        self,
+        *,
+        agent_id: str,
+        files: dict[str, str],
+    ) -> dict[str, OpenClawGatewayError]:
+        """Write several files; return the errors of those that failed, by name."""
+        errors: dict[str, OpenClawGatewayError] = {}
+        for name, content in files.items():
+            try:
+                await self.set_agent_file(agent_id=agent_id, name=name, content=content)
+            except OpenClawGatewayError as exc:
+                errors[name] = exc
+        return errors
+
+    async def delete_agent_files(
+        self,
+        *,
+        agent_id: str,
+        names: list[str],
+    ) -> dict[str, OpenClawGatewayError]:
+        """Delete several files; return the errors of those that failed, by name."""
+        errors: dict[str, OpenClawGatewayError] = {}
+        for name in names:
+            try:
+                await self.delete_agent_file(agent_id=agent_id, name=name)
+            except OpenClawGatewayError as exc:
+                errors[name] = exc
+        return errors
+
     @abstractmethod
     async def patch_agent_heartbeats(
         self,
@@ -602,6 +710,52 @@ class OpenClawGatewayControlPlane(GatewayControlPlane):
             config=self._config,
         )
 
+    async def get_agent_file_payloads(
+        self,
+        files: list[tuple[str, str]],
+    ) -> list[object | OpenClawGatewayError]:
+        return await openclaw_call_many(
+            [
+                GatewayRequest("agents.files.get", {"agentId": agent_id, "name": name})
+                for agent_id, name in files
+            ],
+            config=self._config,
+        )
+
+    async def set_agent_files(
+        self,
+        *,
+        agent_id: str,
+        files: dict[str, str],
+    ) -> dict[str, OpenClawGatewayError]:
+        names = list(files)
+        results = await openclaw_call_many(
+            [
+                GatewayRequest(
+                    "agents.files.set",
+                    {"agentId": agent_id, "name": name, "content": files[name]},
+                )
+                for name in names
+            ],
+            config=self._config,
+        )
+        return _errors_by_name(names, results)
+
+    async def delete_agent_files(
+        self,
+        *,
+        agent_id: str,
+        names: list[str],
+    ) -> dict[str, OpenClawGatewayError]:
+        results = await openclaw_call_many(
+            [
+                GatewayRequest("agents.files.delete", {"agentId": agent_id, "name": name})
+                for name in names
+            ],
+            config=self._config,
+        )
+        return _errors_by_name(names, results)
+
     async def patch_agent_heartbeats(
         self,
         entries: list[tuple[str, str, dict[str, Any]]],
@@ -620,6 +774,17 @@ class OpenClawGatewayControlPlane(GatewayControlPlane):
         await openclaw_call("config.patch", params, config=self._config)
 
 
+def _errors_by_name(
+    names: list[str],
+    results: list[object | OpenClawGatewayError],
+) -> dict[str, OpenClawGatewayError]:
+    return {
+        name: result
+        for name, result in zip(names, results, strict=True)
+        if isinstance(result, OpenClawGatewayError)
+    }
+
+
 async def _gateway_config_agent_list(
     config: GatewayClientConfig,
 ) -> tuple[str | None, list[object], dict[str, Any]]:
@@ -743,34 +908,55 @@ class BaseAgentLifecycleManager(ABC):
         existing_files: dict[str, dict[str, Any]],
         action: str,
         overwrite: bool = False,
-    ) -> None:
+    ) -> AgentFileSyncReport:
         preserve_files = (
             self._preserve_files(agent) if agent is not None else set(PRESERVE_AGENT_EDITABLE_FILES)
         )
         target_file_names = desired_file_names or set(rendered.keys())
         unsupported_names: list[str] = []
+        gateway_key = str(self._gateway.id)
+        skip_unchanged = settings.gateway_template_skip_unchanged and not overwrite
 
+        writes: dict[str, str] = {}
+        digests: dict[str, str] = {}
+        skipped: list[str] = []
         for name, content in rendered.items():
             if content == "":
                 continue
+            entry = existing_files.get(name)
             # Preserve "editable" files only during updates. During first-time provisioning,
             # the gateway may pre-create defaults for USER/MEMORY/etc, and we still want to
             # apply Mission Control's templates.
             if action == "update" and not overwrite and name in preserve_files:
-                entry = existing_files.get(name)
                 if entry and not bool(entry.get("missing")):
+                    skipped.append(name)
                     continue
-            try:
-                await self._control_plane.set_agent_file(
-                    agent_id=agent_id,
-                    name=name,
-                    content=content,
-                )
-            except OpenClawGatewayError as exc:
-                if "unsupported file" in str(exc).lower():
-                    unsupported_names.append(name)
-                    continue
-                raise
+            digest = _content_sha256(content)
+            if skip_unchanged and _file_unchanged(
+                entry,
+                content=content,
+                digest=digest,
+                pushed_digest=_pushed_file_hashes.get((gateway_key, agent_id, name)),
+            ):
+                skipped.append(name)
+                continue
+            writes[name] = content
+            digests[name] = digest
+        # All writes are pipelined; failures are inspected once every reply is in.
+        errors = (
+            await self._control_plane.set_agent_files(agent_id=agent_id, files=writes)
+            if writes
+            else {}
+        )
+        written = [name for name in writes if name not in errors]
+        for name in written:
+            _pushed_file_hashes.set((gateway_key, agent_id, name), digests[name])
+        for name, exc in errors.items():
+            if "unsupported file" in str(exc).lower():
+                unsupported_names.append(name)
+                continue
+            raise exc
+        report = AgentFileSyncReport(written=tuple(written), skipped=tuple(skipped))
 
         if agent is not None and agent.is_board_lead and unsupported_names:
             unsupported_sorted = ", ".join(sorted(set(unsupported_names)))
@@ -781,27 +967,31 @@ class BaseAgentLifecycleManager(ABC):
             raise RuntimeError(msg)
 
         if agent is None or not self._allow_stale_file_deletion(agent):
-            return
+            return report
 
         stale_names = (
             set(existing_files.keys()) & self._stale_file_candidates(agent)
         ) - target_file_names
-        for name in sorted(stale_names):
-            try:
-                await self._control_plane.delete_agent_file(agent_id=agent_id, name=name)
-            except OpenClawGatewayError as exc:
-                message = str(exc).lower()
-                if any(
-                    marker in message
-                    for marker in (
-                        "unsupported",
-                        "unknown method",
-                        "not found",
-                        "no such file",
-                    )
-                ):
-                    continue
-                raise
+        if not stale_names:
+            return report
+        delete_errors = await self._control_plane.delete_agent_files(
+            agent_id=agent_id,
+            names=sorted(stale_names),
+        )
+        for exc in delete_errors.values():
+            message = str(exc).lower()
+            if any(
+                marker in message
+                for marker in (
+                    "unsupported",
+                    "unknown method",
+                    "not found",
+                    "no such file",
+                )
+            ):
+                continue
+            raise exc
+        return report
 
     async def provision(
         self,
@@ -813,7 +1003,7 @@ class BaseAgentLifecycleManager(ABC):
         options: ProvisionOptions,
         board: Board | None = None,
         session_label: str | None = None,
-    ) -> None:
+    ) -> AgentFileSyncReport:
         if not self._gateway.workspace_root:
             msg = "gateway_workspace_root is required"
             raise ValueError(msg)
@@ -856,7 +1046,7 @@ class BaseAgentLifecycleManager(ABC):
             template_overrides=self._template_overrides(agent),
         )
 
-        await self._set_agent_files(
+        return await self._set_agent_files(
             agent=agent,
             agent_id=agent_id,
             rendered=rendered,
@@ -986,6 +1176,71 @@ async def _patch_gateway_agent_heartbeats(
     await control_plane.patch_agent_heartbeats(entries)
 
 
+class _PushedFileHashes:
+    """Process-wide LRU of the content hash last written to each gateway agent file."""
+
+    def __init__(self) -> None:
+        self._hashes: OrderedDict[tuple[str, str, str], str] = OrderedDict()
+
+    def get(self, key: tuple[str, str, str]) -> str | None:
+        digest = self._hashes.get(key)
+        if digest is not None:
+            self._hashes.move_to_end(key)
+        return digest
+
+    def set(self, key: tuple[str, str, str], digest: str) -> None:
+        max_entries = settings.gateway_template_hash_cache_size
+        if max_entries <= 0:
+            return
+        self._hashes[key] = digest
+        self._hashes.move_to_end(key)
+        while len(self._hashes) > max_entries:
+            self._hashes.popitem(last=False)
+
+    def forget_agent(self, gateway_key: str, agent_id: str) -> None:
+        for key in [key for key in self._hashes if key[:2] == (gateway_key, agent_id)]:
+            del self._hashes[key]
+
+    def clear(self) -> None:
+        self._hashes.clear()
+
+
+_pushed_file_hashes = _PushedFileHashes()
+
+# Metadata keys a gateway may use to report a file's sha256 in `agents.files.list`.
+_GATEWAY_FILE_HASH_KEYS = ("sha256", "hash", "contentHash")
+
+
+def _content_sha256(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _file_unchanged(
+    entry: dict[str, Any] | None,
+    *,
+    content: str,
+    digest: str,
+    pushed_digest: str | None,
+) -> bool:
+    """Whether the gateway already holds `content`, judged without reading it back.
+
+    A hash reported by the gateway is authoritative. Otherwise fall back to the hash
+    this process last wrote, as long as the reported size still agrees with it (a
+    size change means the file was edited on the gateway since).
+    """
+    if not entry or bool(entry.get("missing")):
+        return False
+    for key in _GATEWAY_FILE_HASH_KEYS:
+        reported = entry.get(key)
+        if isinstance(reported, str) and reported:
+            return reported.lower().removeprefix("sha256:") == digest
+    size = entry.get("size")
+    if isinstance(size, int) and not isinstance(size, bool):
+        if size != len(content.encode("utf-8")):
+            return False
+    return pushed_digest == digest
+
+
 def _should_include_bootstrap(
     *,
     action: str,
@@ -1041,13 +1296,15 @@ class OpenClawGatewayProvisioner:
         wake: bool = True,
         deliver_wakeup: bool = True,
         wakeup_verb: str | None = None,
-    ) -> None:
+    ) -> AgentFileSyncReport:
         """Create/update an agent, sync all template files, and optionally wake the agent.
 
         Lifecycle steps (same for all agent types):
         1) create agent (idempotent)
-        2) set/update all template files
+        2) set/update template files whose content changed
         3) wake the agent session (chat.send)
+
+        Returns which workspace files were written and which were left as they were.
         """
 
         if not gateway.url:
@@ -1074,7 +1331,7 @@ class OpenClawGatewayProvisioner:
 
         control_plane = _control_plane_for_gateway(gateway)
         manager = manager_type(gateway, control_plane)
-        await manager.provision(
+        report = await manager.provision(
             agent=agent,
             board=board,
             session_key=session_key,
@@ -1096,7 +1353,7 @@ class OpenClawGatewayProvisioner:
                     raise
 
         if not wake:
-            return
+            return report
 
         client_config = gateway_client_config(gateway)
         await ensure_session(session_key, config=client_config, label=agent.name)
@@ -1107,6 +1364,7 @@ class OpenClawGatewayProvisioner:
             config=client_config,
             deliver=deliver_wakeup,
         )
+        return report
 
     async def delete_agent_lifecycle(
         self,
@@ -1137,6 +1395,7 @@ class OpenClawGatewayProvisioner:
         except OpenClawGatewayError as exc:
             if not _is_missing_agent_error(exc):
                 raise
+        _pushed_file_hashes.forget_agent(str(gateway.id), agent_gateway_id)
 
         if delete_session:
             if agent.board_id is None:
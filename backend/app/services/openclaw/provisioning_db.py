@@ -11,7 +11,8 @@ from __future__ import annotations
 import asyncio
 import json
 import re
-from dataclasses import dataclass, field
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypeVar
 from uuid import UUID, uuid4
@@ -21,11 +22,13 @@ from sqlalchemy import asc, func, or_
 from sqlmodel import col, select
 from sse_starlette.sse import EventSourceResponse
 
-from app.core.agent_tokens import verify_agent_token
+from app.core.agent_token_cache import verified_agent_tokens
+from app.core.agent_tokens import agent_token_lookup, verify_agent_token
+from app.core.config import settings
 from app.core.logging import TRACE_LEVEL
 from app.core.time import utcnow
 from app.db import crud
-from app.db.pagination import paginate
+from app.db.pagination import Keyset, paginate
 from app.db.session import async_session_maker
 from app.models.activity_events import ActivityEvent
 from app.models.agents import Agent
@@ -44,8 +47,14 @@ from app.schemas.agents import (
     AgentUpdate,
 )
 from app.schemas.common import OkResponse
-from app.schemas.gateways import GatewayTemplatesSyncError, GatewayTemplatesSyncResult
+from app.schemas.gateways import (
+    GatewayTemplatesSyncAgentFiles,
+    GatewayTemplatesSyncError,
+    GatewayTemplatesSyncResult,
+)
 from app.services.activity_log import record_activity
+from app.services.board_versions import bump_task_boards
+from app.services.event_hub import board_topic, event_hub
 from app.services.openclaw.constants import (
     _TOOLS_KV_RE,
     DEFAULT_HEARTBEAT_CONFIG,
@@ -76,6 +85,7 @@ from app.services.openclaw.internal.session_keys import (
 )
 from app.services.openclaw.policies import OpenClawAuthorizationPolicy
 from app.services.openclaw.provisioning import (
+    AgentFileSyncReport,
     OpenClawGatewayControlPlane,
     OpenClawGatewayProvisioner,
 )
@@ -91,7 +101,7 @@ from app.services.organizations import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Sequence
+    from collections.abc import AsyncIterator, Awaitable, Sequence
 
     from fastapi_pagination.limit_offset import LimitOffsetPage
     from sqlalchemy.sql.elements import ColumnElement
@@ -116,6 +126,53 @@ class GatewayTemplateSyncOptions:
     force_bootstrap: bool = False
     overwrite: bool = False
     board_id: UUID | None = None
+    # Agents already handled by an earlier, interrupted run of the same sync job.
+    completed_agent_ids: frozenset[UUID] = frozenset()
+    # Board agents synced at once; None uses GATEWAY_TEMPLATE_SYNC_CONCURRENCY.
+    concurrency: int | None = None
+
+
+TemplateSyncAgentStatus = Literal["updated", "skipped", "failed"]
+
+
+class TemplateSyncProgress(ABC):
+    """Observer notified as a template sync works through gateway agents."""
+
+    @abstractmethod
+    async def started(self, total: int) -> None:
+        """Called once with the number of agents this run will visit."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def agent_finished(
+        self,
+        agent: Agent,
+        status: TemplateSyncAgentStatus,
+        message: str | None,
+    ) -> None:
+        """Called as each agent is updated, skipped or fails."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def interrupted(self, message: str) -> None:
+        """Called when the gateway stays unreachable and the run stops early."""
+        raise NotImplementedError
+
+
+class _SilentTemplateSyncProgress(TemplateSyncProgress):
+    async def started(self, total: int) -> None:
+        del total
+
+    async def agent_finished(
+        self,
+        agent: Agent,
+        status: TemplateSyncAgentStatus,
+        message: str | None,
+    ) -> None:
+        del agent, status, message
+
+    async def interrupted(self, message: str) -> None:
+        del message
 
 
 @dataclass(frozen=True, slots=True)
@@ -238,24 +295,22 @@ class OpenClawProvisioningService(OpenClawDBService):
         self,
         gateway: Gateway,
         options: GatewayTemplateSyncOptions,
+        *,
+        progress: TemplateSyncProgress | None = None,
     ) -> GatewayTemplatesSyncResult:
-        """Synchronize AGENTS/TOOLS/etc templates to gateway-connected agents."""
+        """Synchronize AGENTS/TOOLS/etc templates to gateway-connected agents.
+
+        Board agents are synced concurrently (`options.concurrency`, defaulting to
+        `GATEWAY_TEMPLATE_SYNC_CONCURRENCY`); database writes stay serialized.
+        """
+        progress = progress or _SilentTemplateSyncProgress()
         template_user = options.user
         if template_user is None:
             template_user = await get_org_owner_user(
                 self.session,
                 organization_id=gateway.organization_id,
             )
-            options = GatewayTemplateSyncOptions(
-                user=template_user,
-                include_main=options.include_main,
-                lead_only=options.lead_only,
-                reset_sessions=options.reset_sessions,
-                rotate_tokens=options.rotate_tokens,
-                force_bootstrap=options.force_bootstrap,
-                overwrite=options.overwrite,
-                board_id=options.board_id,
-            )
+            options = replace(options, user=template_user)
 
         if template_user is None:
             result = _base_result(
@@ -289,11 +344,12 @@ class OpenClawProvisioningService(OpenClawDBService):
             session=self.session,
             gateway=gateway,
             control_plane=control_plane,
-            backoff=GatewayBackoff(timeout_s=10 * 60, timeout_context="template sync"),
+            backoff=_template_sync_backoff(),
             options=options,
             provisioner=self._gateway,
         )
         if not await _ping_gateway(ctx, result):
+            await progress.interrupted(result.errors[-1].message)
             return result
 
         boards = await Board.objects.filter_by(gateway_id=gateway.id).all(self.session)
@@ -314,27 +370,44 @@ class OpenClawProvisioningService(OpenClawDBService):
             agents = await query.all(self.session)
         else:
             agents = []
+        agents = [agent for agent in agents if agent.id not in options.completed_agent_ids]
+        main_agent = await _find_main_agent(ctx) if options.include_main else None
+        sync_main = main_agent is not None and main_agent.id not in options.completed_agent_ids
+        await progress.started(len(agents) + int(sync_main))
+
+        await _prefetch_agent_tools(
+            ctx,
+            [
+                agent
+                for agent in agents
+                if agent.board_id in boards_by_id and agent.board_id not in paused_board_ids
+            ],
+        )
+        if not await _sync_board_agents(
+            ctx,
+            result,
+            progress,
+            agents=agents,
+            boards_by_id=boards_by_id,
+            paused_board_ids=paused_board_ids,
+        ):
+            return result
 
-        stop_sync = False
-        for agent in agents:
-            board = boards_by_id.get(agent.board_id) if agent.board_id is not None else None
-            if board is None:
-                result.agents_skipped += 1
-                _append_sync_error(
-                    result,
-                    agent=agent,
-                    message="Skipping agent: board not found for agent.",
+        if options.include_main and main_agent is None:
+            _append_sync_error(
+                result,
+                message="Gateway agent record not found; skipping gateway agent template sync.",
+            )
+        elif sync_main and main_agent is not None:
+            outcome = await _sync_main_agent(ctx, result, main_agent)
+            if outcome == "interrupted":
+                await progress.interrupted(_agent_error(result, main_agent) or "")
+            else:
+                await progress.agent_finished(
+                    main_agent,
+                    outcome,
+                    _agent_error(result, main_agent),
                 )
-                continue
-            if board.id in paused_board_ids:
-                result.agents_skipped += 1
-                continue
-            stop_sync = await _sync_one_agent(ctx, result, agent, board)
-            if stop_sync:
-                break
-
-        if not stop_sync and options.include_main:
-            await _sync_main_agent(ctx, result)
         return result
 
 
@@ -346,6 +419,14 @@ class _SyncContext:
     backoff: GatewayBackoff
     options: GatewayTemplateSyncOptions
     provisioner: OpenClawGatewayProvisioner
+    # TOOLS.md contents fetched in one pipelined batch, keyed by gateway agent id.
+    prefetched_tools: dict[str, str | None] = field(default_factory=dict)
+    # Agents sync concurrently but share one AsyncSession; DB work holds this lock.
+    db_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+def _template_sync_backoff() -> GatewayBackoff:
+    return GatewayBackoff(timeout_s=10 * 60, timeout_context="template sync")
 
 
 def _parse_tools_md(content: str) -> dict[str, str]:
@@ -376,6 +457,10 @@ async def _get_agent_file(
         payload = await (backoff.run(_do_get) if backoff else _do_get())
     except OpenClawGatewayError:
         return None
+    return _file_content(payload)
+
+
+def _file_content(payload: object) -> str | None:
     if isinstance(payload, str):
         return payload
     if isinstance(payload, dict):
@@ -402,6 +487,10 @@ async def _get_existing_auth_token(
         control_plane=control_plane,
         backoff=backoff,
     )
+    return _auth_token_from_tools(tools)
+
+
+def _auth_token_from_tools(tools: str | None) -> str | None:
     if not tools:
         return None
     values = _parse_tools_md(tools)
@@ -412,6 +501,26 @@ async def _get_existing_auth_token(
     return token or None
 
 
+async def _prefetch_agent_tools(ctx: _SyncContext, agents: list[Agent]) -> None:
+    """Fetch every agent's TOOLS.md in one pipelined batch.
+
+    Agents whose file could not be fetched are left out, so they fall back to the
+    per-agent read (with backoff) in `_resolve_agent_auth_token`.
+    """
+    agent_ids = [_agent_key(agent) for agent in agents]
+    if not agent_ids:
+        return
+    try:
+        payloads = await ctx.control_plane.get_agent_file_payloads(
+            [(agent_id, "TOOLS.md") for agent_id in agent_ids],
+        )
+    except OpenClawGatewayError:
+        return
+    for agent_id, payload in zip(agent_ids, payloads, strict=True):
+        if not isinstance(payload, OpenClawGatewayError):
+            ctx.prefetched_tools[agent_id] = _file_content(payload)
+
+
 async def _paused_board_ids(session: AsyncSession, board_ids: list[UUID]) -> set[UUID]:
     if not board_ids:
         return set()
@@ -452,6 +561,25 @@ def _append_sync_error(
     )
 
 
+def _record_file_report(
+    result: GatewayTemplatesSyncResult,
+    *,
+    agent: Agent,
+    report: AgentFileSyncReport,
+) -> None:
+    result.files_written += len(report.written)
+    result.files_skipped += len(report.skipped)
+    result.agent_files.append(
+        GatewayTemplatesSyncAgentFiles(
+            agent_id=agent.id,
+            agent_name=agent.name,
+            board_id=agent.board_id,
+            written=list(report.written),
+            skipped=list(report.skipped),
+        ),
+    )
+
+
 async def _rotate_agent_token(session: AsyncSession, agent: Agent) -> str:
     token = mint_agent_token(agent)
     agent.updated_at = utcnow()
@@ -514,11 +642,14 @@ async def _resolve_agent_auth_token(
     agent_gateway_id: str,
 ) -> tuple[str | None, bool]:
     try:
-        auth_token = await _get_existing_auth_token(
-            agent_gateway_id=agent_gateway_id,
-            control_plane=ctx.control_plane,
-            backoff=ctx.backoff,
-        )
+        if agent_gateway_id in ctx.prefetched_tools:
+            auth_token = _auth_token_from_tools(ctx.prefetched_tools[agent_gateway_id])
+        else:
+            auth_token = await _get_existing_auth_token(
+                agent_gateway_id=agent_gateway_id,
+                control_plane=ctx.control_plane,
+                backoff=ctx.backoff,
+            )
     except TimeoutError as exc:
         _append_sync_error(result, agent=agent, board=board, message=str(exc))
         return None, True
@@ -554,30 +685,101 @@ async def _resolve_agent_auth_token(
                     "token hash (agent auth may be broken)."
                 ),
             )
+    elif agent.agent_token_hash and agent.agent_token_lookup is None:
+        # Backfill the indexed lookup digest for tokens minted before it existed.
+        agent.agent_token_lookup = agent_token_lookup(auth_token)
+        ctx.session.add(agent)
+        await ctx.session.commit()
     return auth_token, False
 
 
+_AgentSyncOutcome = Literal["updated", "skipped", "failed", "interrupted"]
+
+
+def _agent_error(result: GatewayTemplatesSyncResult, agent: Agent) -> str | None:
+    for error in reversed(result.errors):
+        if error.agent_id == agent.id:
+            return error.message
+    return None
+
+
+async def _sync_board_agents(
+    ctx: _SyncContext,
+    result: GatewayTemplatesSyncResult,
+    progress: TemplateSyncProgress,
+    *,
+    agents: list[Agent],
+    boards_by_id: dict[UUID, Board],
+    paused_board_ids: set[UUID],
+) -> bool:
+    """Sync board agents with bounded concurrency; return False if interrupted."""
+    semaphore = asyncio.Semaphore(
+        ctx.options.concurrency or settings.gateway_template_sync_concurrency
+    )
+    interrupted = asyncio.Event()
+
+    async def _sync(agent: Agent, board: Board) -> None:
+        async with semaphore:
+            if interrupted.is_set():
+                return
+            # Each worker gets its own backoff so one agent's retries do not
+            # stretch another's delays.
+            outcome = await _sync_one_agent(
+                replace(ctx, backoff=_template_sync_backoff()),
+                result,
+                agent,
+                board,
+            )
+        if outcome == "interrupted":
+            if not interrupted.is_set():
+                interrupted.set()
+                await progress.interrupted(_agent_error(result, agent) or "")
+            return
+        await progress.agent_finished(agent, outcome, _agent_error(result, agent))
+
+    runs: list[Awaitable[None]] = []
+    for agent in agents:
+        board = boards_by_id.get(agent.board_id) if agent.board_id is not None else None
+        if board is None:
+            result.agents_skipped += 1
+            _append_sync_error(
+                result,
+                agent=agent,
+                message="Skipping agent: board not found for agent.",
+            )
+            await progress.agent_finished(agent, "skipped", _agent_error(result, agent))
+            continue
+        if board.id in paused_board_ids:
+            result.agents_skipped += 1
+            await progress.agent_finished(agent, "skipped", "Board is paused.")
+            continue
+        runs.append(_sync(agent, board))
+    await asyncio.gather(*runs)
+    return not interrupted.is_set()
+
+
 async def _sync_one_agent(
     ctx: _SyncContext,
     result: GatewayTemplatesSyncResult,
     agent: Agent,
     board: Board,
-) -> bool:
-    auth_token, fatal = await _resolve_agent_auth_token(
-        ctx,
-        result,
-        agent,
-        board,
-        agent_gateway_id=_agent_key(agent),
-    )
+) -> _AgentSyncOutcome:
+    async with ctx.db_lock:
+        auth_token, fatal = await _resolve_agent_auth_token(
+            ctx,
+            result,
+            agent,
+            board,
+            agent_gateway_id=_agent_key(agent),
+        )
     if fatal:
-        return True
+        return "interrupted"
     if not auth_token:
-        return False
+        return "skipped"
     try:
 
-        async def _do_provision() -> bool:
-            await ctx.provisioner.apply_agent_lifecycle(
+        async def _do_provision() -> AgentFileSyncReport:
+            return await ctx.provisioner.apply_agent_lifecycle(
                 agent=agent,
                 gateway=ctx.gateway,
                 board=board,
@@ -589,14 +791,14 @@ async def _sync_one_agent(
                 reset_session=ctx.options.reset_sessions,
                 wake=False,
             )
-            return True
 
-        await ctx.backoff.run(_do_provision)
+        report = await ctx.backoff.run(_do_provision)
         result.agents_updated += 1
+        _record_file_report(result, agent=agent, report=report)
     except TimeoutError as exc:  # pragma: no cover - gateway/network dependent
         result.agents_skipped += 1
         _append_sync_error(result, agent=agent, board=board, message=str(exc))
-        return True
+        return "interrupted"
     except (OSError, RuntimeError, ValueError) as exc:  # pragma: no cover
         result.agents_skipped += 1
         _append_sync_error(
@@ -605,28 +807,25 @@ async def _sync_one_agent(
             board=board,
             message=f"Failed to sync templates: {exc}",
         )
-        return False
+        return "failed"
     else:
-        return False
+        return "updated"
 
 
-async def _sync_main_agent(
-    ctx: _SyncContext,
-    result: GatewayTemplatesSyncResult,
-) -> bool:
-    main_agent = (
+async def _find_main_agent(ctx: _SyncContext) -> Agent | None:
+    return (
         await Agent.objects.all()
         .filter(col(Agent.gateway_id) == ctx.gateway.id)
         .filter(col(Agent.board_id).is_(None))
         .first(ctx.session)
     )
-    if main_agent is None:
-        _append_sync_error(
-            result,
-            message="Gateway agent record not found; skipping gateway agent template sync.",
-        )
-        return True
 
+
+async def _sync_main_agent(
+    ctx: _SyncContext,
+    result: GatewayTemplatesSyncResult,
+    main_agent: Agent,
+) -> _AgentSyncOutcome:
     main_gateway_agent_id = GatewayAgentIdentity.openclaw_agent_id(ctx.gateway)
     token, fatal = await _resolve_agent_auth_token(
         ctx,
@@ -636,19 +835,18 @@ async def _sync_main_agent(
         agent_gateway_id=main_gateway_agent_id,
     )
     if fatal:
-        return True
+        return "interrupted"
     if not token:
         _append_sync_error(
             result,
             agent=main_agent,
             message="Skipping gateway agent: unable to read AUTH_TOKEN from TOOLS.md.",
         )
-        return True
-    stop_sync = False
+        return "skipped"
     try:
 
-        async def _do_provision_main() -> bool:
-            await ctx.provisioner.apply_agent_lifecycle(
+        async def _do_provision_main() -> AgentFileSyncReport:
+            return await ctx.provisioner.apply_agent_lifecycle(
                 agent=main_agent,
                 gateway=ctx.gateway,
                 board=None,
@@ -660,21 +858,21 @@ async def _sync_main_agent(
                 reset_session=ctx.options.reset_sessions,
                 wake=False,
             )
-            return True
 
-        await ctx.backoff.run(_do_provision_main)
+        report = await ctx.backoff.run(_do_provision_main)
     except TimeoutError as exc:  # pragma: no cover - gateway/network dependent
         _append_sync_error(result, agent=main_agent, message=str(exc))
-        stop_sync = True
+        return "interrupted"
     except (OSError, RuntimeError, ValueError) as exc:  # pragma: no cover
         _append_sync_error(
             result,
             agent=main_agent,
             message=f"Failed to sync gateway agent templates: {exc}",
         )
-    else:
-        result.main_updated = True
-    return stop_sync
+        return "failed"
+    result.main_updated = True
+    _record_file_report(result, agent=main_agent, report=report)
+    return "updated"
 
 
 class ActorContextLike(Protocol):
@@ -1486,7 +1684,12 @@ class AgentLifecycleService(OpenClawDBService):
             agents = self.coerce_agent_items(items)
             return [self.to_agent_read(self.with_computed_status(agent)) for agent in agents]
 
-        return await paginate(self.session, statement, transformer=_transform)
+        return await paginate(
+            self.session,
+            statement,
+            transformer=_transform,
+            keyset=Keyset(col(Agent.created_at), col(Agent.id)),
+        )
 
     async def stream_agents(
         self,
@@ -1503,30 +1706,31 @@ class AgentLifecycleService(OpenClawDBService):
         if board_id is not None:
             OpenClawAuthorizationPolicy.require_board_write_access(allowed=board_id in allowed_ids)
 
+        watched_ids = [board_id] if board_id is not None else board_ids
+        topics = [board_topic(watched_id, "agents") for watched_id in watched_ids]
+
         async def event_generator() -> AsyncIterator[dict[str, str]]:
             nonlocal last_seen
-            while True:
-                if await request.is_disconnected():
-                    break
-                async with async_session_maker() as stream_session:
-                    stream_service = AgentLifecycleService(stream_session)
-                    stream_service.logger = self.logger
-                    if board_id is not None:
-                        agents = await stream_service.fetch_agent_events(
-                            board_id,
-                            last_seen,
-                        )
-                    elif allowed_ids:
-                        agents = await stream_service.fetch_agent_events(None, last_seen)
-                        agents = [agent for agent in agents if agent.board_id in allowed_ids]
-                    else:
-                        agents = []
-                for agent in agents:
-                    updated_at = agent.updated_at or agent.last_seen_at or utcnow()
-                    last_seen = max(updated_at, last_seen)
-                    payload = {"agent": self.serialize_agent(agent)}
-                    yield {"event": "agent", "data": json.dumps(payload)}
-                await asyncio.sleep(2)
+            async with event_hub.subscribe(topics) as subscription:
+                while await subscription.ready(request):
+                    async with async_session_maker() as stream_session:
+                        stream_service = AgentLifecycleService(stream_session)
+                        stream_service.logger = self.logger
+                        if board_id is not None:
+                            agents = await stream_service.fetch_agent_events(
+                                board_id,
+                                last_seen,
+                            )
+                        elif allowed_ids:
+                            agents = await stream_service.fetch_agent_events(None, last_seen)
+                            agents = [agent for agent in agents if agent.board_id in allowed_ids]
+                        else:
+                            agents = []
+                    for agent in agents:
+                        updated_at = agent.updated_at or agent.last_seen_at or utcnow()
+                        last_seen = max(updated_at, last_seen)
+                        payload = {"agent": self.serialize_agent(agent)}
+                        yield {"event": "agent", "data": json.dumps(payload)}
 
         return EventSourceResponse(event_generator(), ping=15)
 
@@ -1814,6 +2018,7 @@ class AgentLifecycleService(OpenClawDBService):
             agent_id=None,
         )
         now = utcnow()
+        await bump_task_boards(self.session, col(Task.assigned_agent_id) == agent.id)
         await crud.update_where(
             self.session,
             Task,
@@ -1858,6 +2063,7 @@ class AgentLifecycleService(OpenClawDBService):
         )
         await self.session.delete(agent)
         await self.session.commit()
+        verified_agent_tokens.invalidate_agents([agent.id])
 
         try:
             # Notify the gateway-main agent about cleanup for board-scoped deletes.
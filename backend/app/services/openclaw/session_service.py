@@ -9,9 +9,11 @@ from uuid import UUID
 
 from fastapi import HTTPException, status
 
+from app.core.config import settings
 from app.core.logging import TRACE_LEVEL
 from app.models.boards import Board
 from app.schemas.gateway_api import (
+    GatewayCircuitRead,
     GatewayResolveQuery,
     GatewaySessionHistoryResponse,
     GatewaySessionMessageRequest,
@@ -26,10 +28,15 @@ from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConf
 from app.services.openclaw.gateway_rpc import (
     OpenClawGatewayError,
     ensure_session,
+    gateway_circuit_status,
     get_chat_history,
     openclaw_call,
     send_message,
 )
+from app.services.openclaw.gateway_status_cache import (
+    GatewayStatusSnapshot,
+    gateway_status_cache,
+)
 from app.services.openclaw.policies import OpenClawAuthorizationPolicy
 from app.services.openclaw.shared import GatewayAgentIdentity
 from app.services.organizations import require_board_access
@@ -39,6 +46,11 @@ if TYPE_CHECKING:
 
     from app.models.users import User
 
+# A session missing from a cached listing triggers one refetch, but only once the
+# listing is at least this fraction of the cache TTL old; repeated lookups of an
+# unknown session would otherwise reach the gateway on every request.
+_MISS_REFRESH_MIN_AGE_FRACTION = 0.2
+
 
 @dataclass(frozen=True, slots=True)
 class GatewayTemplateSyncQuery:
@@ -152,29 +164,6 @@ class GatewaySessionService(OpenClawDBService):
             )
         return board, config, main_session
 
-    async def list_sessions(self, config: GatewayClientConfig) -> list[dict[str, object]]:
-        sessions = await openclaw_call("sessions.list", config=config)
-        if isinstance(sessions, dict):
-            raw_items = self.as_object_list(sessions.get("sessions"))
-        else:
-            raw_items = self.as_object_list(sessions)
-        return [item for item in raw_items if isinstance(item, dict)]
-
-    async def with_main_session(
-        self,
-        sessions_list: list[dict[str, object]],
-        *,
-        config: GatewayClientConfig,
-        main_session: str | None,
-    ) -> list[dict[str, object]]:
-        if not main_session or any(item.get("key") == main_session for item in sessions_list):
-            return sessions_list
-        try:
-            await ensure_session(main_session, config=config, label="Gateway Agent")
-            return await self.list_sessions(config)
-        except OpenClawGatewayError:
-            return sessions_list
-
     @staticmethod
     def _require_same_org(board: Board | None, organization_id: UUID) -> None:
         if board is None:
@@ -183,62 +172,55 @@ class GatewaySessionService(OpenClawDBService):
             allowed=board.organization_id == organization_id,
         )
 
+    async def _status_snapshot(
+        self,
+        config: GatewayClientConfig,
+        main_session: str | None,
+        *,
+        refresh: bool = False,
+    ) -> GatewayStatusSnapshot:
+        return await gateway_status_cache.get(
+            (config, main_session),
+            fetch_gateway_status,
+            max_age=0 if refresh else None,
+        )
+
     async def get_status(
         self,
         *,
         params: GatewayResolveQuery,
         organization_id: UUID,
         user: User | None,
+        refresh: bool = False,
     ) -> GatewaysStatusResponse:
         board, config, main_session = await self.resolve_gateway(params, user=user)
         self._require_same_org(board, organization_id)
-        try:
-            compatibility = await check_gateway_runtime_compatibility(config)
-        except OpenClawGatewayError as exc:
-            return GatewaysStatusResponse(
-                connected=False,
-                gateway_url=config.url,
-                error=str(exc),
-            )
-        if not compatibility.compatible:
-            return GatewaysStatusResponse(
-                connected=False,
-                gateway_url=config.url,
-                error=compatibility.message,
-            )
-        try:
-            sessions = await openclaw_call("sessions.list", config=config)
-            if isinstance(sessions, dict):
-                sessions_list = self.as_object_list(sessions.get("sessions"))
-            else:
-                sessions_list = self.as_object_list(sessions)
-            main_session_entry: object | None = None
-            main_session_error: str | None = None
-            if main_session:
-                try:
-                    ensured = await ensure_session(
-                        main_session,
-                        config=config,
-                        label="Gateway Agent",
-                    )
-                    if isinstance(ensured, dict):
-                        main_session_entry = ensured.get("entry") or ensured
-                except OpenClawGatewayError as exc:
-                    main_session_error = str(exc)
-            return GatewaysStatusResponse(
-                connected=True,
-                gateway_url=config.url,
-                sessions_count=len(sessions_list),
-                sessions=sessions_list,
-                main_session=main_session_entry,
-                main_session_error=main_session_error,
-            )
-        except OpenClawGatewayError as exc:
+        snapshot = await self._status_snapshot(config, main_session, refresh=refresh)
+        extra = {
+            "cached_at": snapshot.fetched_at,
+            "cache_age_seconds": round(snapshot.age_seconds(), 3),
+            "circuit": GatewayCircuitRead.model_validate(
+                gateway_circuit_status(config),
+                from_attributes=True,
+            ),
+        }
+        error = snapshot.error or snapshot.compatibility_error
+        if error is not None or snapshot.sessions is None:
             return GatewaysStatusResponse(
                 connected=False,
                 gateway_url=config.url,
-                error=str(exc),
+                error=error,
+                **extra,
             )
+        return GatewaysStatusResponse(
+            connected=True,
+            gateway_url=config.url,
+            sessions_count=len(snapshot.sessions),
+            sessions=snapshot.sessions,
+            main_session=snapshot.main_session,
+            main_session_error=snapshot.main_session_error,
+            **extra,
+        )
 
     async def get_sessions(
         self,
@@ -250,31 +232,32 @@ class GatewaySessionService(OpenClawDBService):
         params = GatewayResolveQuery(board_id=board_id)
         board, config, main_session = await self.resolve_gateway(params, user=user)
         self._require_same_org(board, organization_id)
-        try:
-            sessions = await openclaw_call("sessions.list", config=config)
-        except OpenClawGatewayError as exc:
+        snapshot = await self._status_snapshot(config, main_session)
+        if snapshot.sessions is None:
             raise HTTPException(
                 status_code=status.HTTP_502_BAD_GATEWAY,
-                detail=str(exc),
-            ) from exc
-        if isinstance(sessions, dict):
-            sessions_list = self.as_object_list(sessions.get("sessions"))
-        else:
-            sessions_list = self.as_object_list(sessions)
+                detail=snapshot.error or snapshot.compatibility_error,
+            )
+        return GatewaySessionsResponse(
+            sessions=snapshot.sessions,
+            main_session=snapshot.main_session,
+            cached_at=snapshot.fetched_at,
+            cache_age_seconds=round(snapshot.age_seconds(), 3),
+        )
 
-        main_session_entry: object | None = None
-        if main_session:
-            try:
-                ensured = await ensure_session(
-                    main_session,
-                    config=config,
-                    label="Gateway Agent",
-                )
-                if isinstance(ensured, dict):
-                    main_session_entry = ensured.get("entry") or ensured
-            except OpenClawGatewayError:
-                main_session_entry = None
-        return GatewaySessionsResponse(sessions=sessions_list, main_session=main_session_entry)
+    @staticmethod
+    def _find_session(
+        snapshot: GatewayStatusSnapshot,
+        *,
+        session_id: str,
+        main_session: str | None,
+    ) -> object | None:
+        for item in snapshot.sessions or []:
+            if isinstance(item, dict) and item.get("key") == session_id:
+                return item
+        if main_session and session_id == main_session:
+            return snapshot.main_session
+        return None
 
     async def get_session(
         self,
@@ -287,38 +270,36 @@ class GatewaySessionService(OpenClawDBService):
         params = GatewayResolveQuery(board_id=board_id)
         board, config, main_session = await self.resolve_gateway(params, user=user)
         self._require_same_org(board, organization_id)
-        try:
-            sessions_list = await self.list_sessions(config)
-        except OpenClawGatewayError as exc:
-            raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                detail=str(exc),
-            ) from exc
-        sessions_list = await self.with_main_session(
-            sessions_list,
-            config=config,
+        snapshot = await self._status_snapshot(config, main_session)
+        session_entry = self._find_session(
+            snapshot,
+            session_id=session_id,
             main_session=main_session,
         )
-        session_entry = next(
-            (item for item in sessions_list if item.get("key") == session_id), None
-        )
-        if session_entry is None and main_session and session_id == main_session:
-            try:
-                ensured = await ensure_session(
-                    main_session,
-                    config=config,
-                    label="Gateway Agent",
-                )
-                if isinstance(ensured, dict):
-                    session_entry = ensured.get("entry") or ensured
-            except OpenClawGatewayError:
-                session_entry = None
+        min_age = settings.gateway_status_cache_ttl_seconds * _MISS_REFRESH_MIN_AGE_FRACTION
+        if session_entry is None and min_age > 0 and snapshot.age_seconds() >= min_age:
+            # The session may have been created since the cached listing.
+            snapshot = await self._status_snapshot(config, main_session, refresh=True)
+            session_entry = self._find_session(
+                snapshot,
+                session_id=session_id,
+                main_session=main_session,
+            )
+        if snapshot.sessions is None:
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail=snapshot.error or snapshot.compatibility_error,
+            )
         if session_entry is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Session not found",
             )
-        return GatewaySessionResponse(session=session_entry)
+        return GatewaySessionResponse(
+            session=session_entry,
+            cached_at=snapshot.fetched_at,
+            cache_age_seconds=round(snapshot.age_seconds(), 3),
+        )
 
     async def get_session_history(
         self,
@@ -362,3 +343,37 @@ class GatewaySessionService(OpenClawDBService):
                 status_code=status.HTTP_502_BAD_GATEWAY,
                 detail=str(exc),
             ) from exc
+
+
+def _session_items(sessions: object) -> list[object]:
+    if isinstance(sessions, dict):
+        return GatewaySessionService.as_object_list(sessions.get("sessions"))
+    return GatewaySessionService.as_object_list(sessions)
+
+
+async def fetch_gateway_status(
+    config: GatewayClientConfig,
+    main_session: str | None,
+) -> GatewayStatusSnapshot:
+    """Ask the gateway for its version, sessions and main session in one round."""
+    try:
+        compatibility = await check_gateway_runtime_compatibility(config)
+        if not compatibility.compatible:
+            return GatewayStatusSnapshot(compatibility_error=compatibility.message)
+        sessions = _session_items(await openclaw_call("sessions.list", config=config))
+    except OpenClawGatewayError as exc:
+        return GatewayStatusSnapshot(error=str(exc))
+    main_session_entry: object | None = None
+    main_session_error: str | None = None
+    if main_session:
+        try:
+            ensured = await ensure_session(main_session, config=config, label="Gateway Agent")
+            if isinstance(ensured, dict):
+                main_session_entry = ensured.get("entry") or ensured
+        except OpenClawGatewayError as exc:
+            main_session_error = str(exc)
+    return GatewayStatusSnapshot(
+        sessions=sessions,
+        main_session=main_session_entry,
+        main_session_error=main_session_error,
+    )
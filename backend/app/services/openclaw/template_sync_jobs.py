@@ -0,0 +1,395 @@
+"""Queued gateway template sync jobs with persisted progress.
+
+`POST /gateways/{id}/templates/sync` records a job in Redis and enqueues a
+`gateway_template_sync` task; the queue worker runs the sync and appends one
+progress event per agent to the job's event list, which the API streams back.
+Jobs remember which agents were updated or skipped, so a retried (or resumed)
+job continues with the agents that are left instead of starting over.
+
+A run that raises is marked `retrying` while the worker's retry is pending and
+only becomes `failed` once retries are exhausted, which is when the API lets a
+user resume it. Runs hold a per-job Redis lock, so a duplicate delivery of the
+same job is skipped rather than syncing the same agents in parallel.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Literal, cast
+from uuid import UUID, uuid4
+
+from redis.exceptions import LockError
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.time import utcnow
+from app.db.session import async_session_maker
+from app.models.gateways import Gateway
+from app.models.users import User
+from app.services.openclaw.provisioning_db import (
+    GatewayTemplateSyncOptions,
+    OpenClawProvisioningService,
+    TemplateSyncAgentStatus,
+    TemplateSyncProgress,
+)
+from app.services.queue import QueuedTask, async_redis_client, enqueue_task_async
+from app.services.queue import requeue_if_failed as generic_requeue_if_failed
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+
+    from redis.asyncio.lock import Lock
+
+    from app.models.agents import Agent
+    from app.services.openclaw.session_service import GatewayTemplateSyncQuery
+
+logger = get_logger(__name__)
+TASK_TYPE = "gateway_template_sync"
+
+TemplateSyncJobStatus = Literal["queued", "running", "retrying", "completed", "failed"]
+TERMINAL_JOB_STATUSES: frozenset[str] = frozenset({"completed", "failed"})
+
+
+class TemplateSyncInterruptedError(RuntimeError):
+    """Raised when the gateway went away mid-sync so the worker retries the job."""
+
+
+@dataclass
+class TemplateSyncJob:
+    """Persisted state of one queued template sync."""
+
+    id: str
+    gateway_id: UUID
+    organization_id: UUID
+    options: dict[str, Any]
+    status: TemplateSyncJobStatus = "queued"
+    created_at: datetime = field(default_factory=utcnow)
+    updated_at: datetime = field(default_factory=utcnow)
+    # Agents this job visits across all runs; per-agent outcome keyed by agent id.
+    total: int = 0
+    agents: dict[str, TemplateSyncAgentStatus] = field(default_factory=dict)
+    runs: int = 0
+    error: str | None = None
+    result: dict[str, Any] | None = None
+    # Number of progress events appended so far (the next event's index).
+    events: int = 0
+
+    def count(self, status: TemplateSyncAgentStatus) -> int:
+        return sum(1 for value in self.agents.values() if value == status)
+
+    def counters(self) -> dict[str, int]:
+        return {
+            "total": self.total,
+            "done": self.count("updated"),
+            "skipped": self.count("skipped"),
+            "failed": self.count("failed"),
+        }
+
+    def completed_agent_ids(self) -> frozenset[UUID]:
+        """Agents a resumed run can skip: failed agents are tried again."""
+        return frozenset(
+            UUID(agent_id) for agent_id, status in self.agents.items() if status != "failed"
+        )
+
+    def sync_options(self, user: User | None) -> GatewayTemplateSyncOptions:
+        board_id = self.options.get("board_id")
+        return GatewayTemplateSyncOptions(
+            user=user,
+            include_main=bool(self.options.get("include_main", True)),
+            lead_only=bool(self.options.get("lead_only", False)),
+            reset_sessions=bool(self.options.get("reset_sessions", False)),
+            rotate_tokens=bool(self.options.get("rotate_tokens", False)),
+            force_bootstrap=bool(self.options.get("force_bootstrap", False)),
+            overwrite=bool(self.options.get("overwrite", False)),
+            board_id=UUID(board_id) if board_id else None,
+            completed_agent_ids=self.completed_agent_ids(),
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "id": self.id,
+                "gateway_id": str(self.gateway_id),
+                "organization_id": str(self.organization_id),
+                "options": self.options,
+                "status": self.status,
+                "created_at": self.created_at.isoformat(),
+                "updated_at": self.updated_at.isoformat(),
+                "total": self.total,
+                "agents": self.agents,
+                "runs": self.runs,
+                "error": self.error,
+                "result": self.result,
+                "events": self.events,
+            },
+        )
+
+    @classmethod
+    def from_json(cls, raw: str | bytes) -> TemplateSyncJob:
+        data = json.loads(raw)
+        return cls(
+            id=data["id"],
+            gateway_id=UUID(data["gateway_id"]),
+            organization_id=UUID(data["organization_id"]),
+            options=data.get("options") or {},
+            status=data["status"],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+            total=int(data.get("total", 0)),
+            agents=data.get("agents") or {},
+            runs=int(data.get("runs", 0)),
+            error=data.get("error"),
+            result=data.get("result"),
+            events=int(data.get("events", 0)),
+        )
+
+
+def _job_key(job_id: str) -> str:
+    return f"{settings.rq_queue_name}:template_sync:{job_id}"
+
+
+def _events_key(job_id: str) -> str:
+    return f"{_job_key(job_id)}:events"
+
+
+def _lock_key(job_id: str) -> str:
+    return f"{_job_key(job_id)}:lock"
+
+
+async def _save_job(job: TemplateSyncJob, event: dict[str, Any] | None = None) -> None:
+    """Persist `job` and append `event` (stamped with the job's counters) atomically."""
+    job.updated_at = utcnow()
+    ttl = int(settings.gateway_template_sync_job_ttl_seconds)
+    client = async_redis_client(settings.rq_redis_url)
+    pipe = client.pipeline(transaction=True)
+    if event is not None:
+        payload = {
+            **event,
+            **job.counters(),
+            "index": job.events,
+            "at": job.updated_at.isoformat(),
+        }
+        job.events += 1
+        pipe.rpush(_events_key(job.id), json.dumps(payload))
+        pipe.expire(_events_key(job.id), ttl)
+    pipe.set(_job_key(job.id), job.to_json(), ex=ttl)
+    await pipe.execute()
+
+
+def _status_event(job: TemplateSyncJob, message: str | None = None) -> dict[str, Any]:
+    return {"type": "status", "status": job.status, "message": message}
+
+
+async def get_template_sync_job(job_id: str) -> TemplateSyncJob | None:
+    """Load a job, or None if it never existed or has expired."""
+    raw = await async_redis_client(settings.rq_redis_url).get(_job_key(job_id))
+    return TemplateSyncJob.from_json(raw) if raw else None
+
+
+async def list_template_sync_events(job_id: str, *, start: int = 0) -> list[dict[str, Any]]:
+    """Return the job's progress events from index `start` onward."""
+    client = async_redis_client(settings.rq_redis_url)
+    raw_events = await cast(
+        "Awaitable[list[bytes]]",
+        client.lrange(_events_key(job_id), start, -1),
+    )
+    return [json.loads(raw) for raw in raw_events]
+
+
+async def _enqueue_job(job: TemplateSyncJob) -> bool:
+    task = QueuedTask(
+        task_type=TASK_TYPE,
+        payload={"job_id": job.id, "gateway_id": str(job.gateway_id)},
+        created_at=utcnow(),
+    )
+    return await enqueue_task_async(task, settings.rq_queue_name, redis_url=settings.rq_redis_url)
+
+
+async def _enqueue_or_fail(job: TemplateSyncJob) -> TemplateSyncJob:
+    if not await _enqueue_job(job):
+        job.status = "failed"
+        job.error = "Unable to enqueue template sync job."
+        await _save_job(job, _status_event(job, job.error))
+    return job
+
+
+async def create_template_sync_job(
+    *,
+    gateway: Gateway,
+    query: GatewayTemplateSyncQuery,
+    user: User | None,
+) -> TemplateSyncJob:
+    """Record a new job and queue it; a failed enqueue leaves the job `failed`."""
+    job = TemplateSyncJob(
+        id=uuid4().hex,
+        gateway_id=gateway.id,
+        organization_id=gateway.organization_id,
+        options={
+            "include_main": query.include_main,
+            "lead_only": query.lead_only,
+            "reset_sessions": query.reset_sessions,
+            "rotate_tokens": query.rotate_tokens,
+            "force_bootstrap": query.force_bootstrap,
+            "overwrite": query.overwrite,
+            "board_id": str(query.board_id) if query.board_id else None,
+            "user_id": str(user.id) if user is not None else None,
+        },
+    )
+    await _save_job(job, _status_event(job))
+    return await _enqueue_or_fail(job)
+
+
+async def resume_template_sync_job(job: TemplateSyncJob) -> TemplateSyncJob:
+    """Queue a failed job again; agents it already handled are not synced twice."""
+    job.status = "queued"
+    job.error = None
+    await _save_job(job, _status_event(job, "Resuming from the last completed agent."))
+    return await _enqueue_or_fail(job)
+
+
+class _JobProgress(TemplateSyncProgress):
+    """Writes sync progress into the job record and its event list."""
+
+    def __init__(self, job: TemplateSyncJob) -> None:
+        self.job = job
+        self.interruption: str | None = None
+        # Agents finish concurrently; serialize writes so the stored record never
+        # goes backwards.
+        self._lock = asyncio.Lock()
+
+    async def started(self, total: int) -> None:
+        async with self._lock:
+            # Agents that failed in an earlier run are visited again; the rest were
+            # left out of this run's `total`.
+            self.job.agents = {
+                agent_id: status
+                for agent_id, status in self.job.agents.items()
+                if status != "failed"
+            }
+            self.job.total = total + len(self.job.agents)
+            await _save_job(self.job, _status_event(self.job))
+
+    async def agent_finished(
+        self,
+        agent: Agent,
+        status: TemplateSyncAgentStatus,
+        message: str | None,
+    ) -> None:
+        async with self._lock:
+            self.job.agents[str(agent.id)] = status
+            await _save_job(
+                self.job,
+                {
+                    "type": "agent",
+                    "agent_id": str(agent.id),
+                    "agent_name": agent.name,
+                    "board_id": str(agent.board_id) if agent.board_id else None,
+                    "status": status,
+                    "message": message,
+                },
+            )
+
+    async def interrupted(self, message: str) -> None:
+        self.interruption = message
+
+
+async def _fail_job(job: TemplateSyncJob, error: str, *, retrying: bool = False) -> None:
+    job.status = "retrying" if retrying else "failed"
+    job.error = error
+    await _save_job(job, _status_event(job, error))
+
+
+def _will_retry(task: QueuedTask) -> bool:
+    """Whether `requeue_template_sync_task` will requeue (not dead-letter) `task`."""
+    return task.attempts < settings.rq_dispatch_max_retries
+
+
+async def _keep_job_lock(lock: Lock) -> None:
+    interval = settings.rq_lease_seconds / 3
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await lock.reacquire()
+        except LockError:
+            logger.warning("gateway.templates.sync_job.lock_lost", extra={"key": lock.name})
+            return
+        except Exception:
+            logger.exception("gateway.templates.sync_job.lock_extend_failed")
+
+
+async def process_template_sync_task(task: QueuedTask) -> None:
+    """Queue worker handler: run (or resume) one template sync job."""
+    job_id = str(task.payload["job_id"])
+    lock = async_redis_client(settings.rq_redis_url).lock(
+        _lock_key(job_id),
+        timeout=settings.rq_lease_seconds,
+        blocking=False,
+    )
+    if not await lock.acquire():
+        logger.info("gateway.templates.sync_job.already_running", extra={"job_id": job_id})
+        return
+    heartbeat = asyncio.create_task(_keep_job_lock(lock))
+    try:
+        await _run_template_sync_job(task, job_id)
+    finally:
+        heartbeat.cancel()
+        try:
+            await lock.release()
+        except LockError:
+            logger.warning("gateway.templates.sync_job.lock_lost", extra={"job_id": job_id})
+
+
+async def _run_template_sync_job(task: QueuedTask, job_id: str) -> None:
+    job = await get_template_sync_job(job_id)
+    if job is None:
+        logger.warning("gateway.templates.sync_job.expired", extra={"payload": task.payload})
+        return
+    if job.status == "completed":
+        return
+    job.status = "running"
+    job.error = None
+    job.runs += 1
+    await _save_job(job, _status_event(job))
+
+    progress = _JobProgress(job)
+    try:
+        async with async_session_maker() as session:
+            gateway = await Gateway.objects.by_id(job.gateway_id).first(session)
+            if gateway is None:
+                await _fail_job(job, "Gateway not found.")
+                return
+            user_id = job.options.get("user_id")
+            user = await session.get(User, UUID(user_id)) if user_id else None
+            result = await OpenClawProvisioningService(session).sync_gateway_templates(
+                gateway,
+                job.sync_options(user),
+                progress=progress,
+            )
+    except Exception as exc:
+        await _fail_job(job, f"{type(exc).__name__}: {exc}", retrying=_will_retry(task))
+        raise
+
+    job.result = result.model_dump(mode="json")
+    if progress.interruption is not None:
+        await _fail_job(job, progress.interruption, retrying=_will_retry(task))
+        raise TemplateSyncInterruptedError(progress.interruption)
+    job.status = "completed"
+    await _save_job(job, _status_event(job))
+    logger.info(
+        "gateway.templates.sync_job.completed",
+        extra={"job_id": job.id, "gateway_id": str(job.gateway_id), **job.counters()},
+    )
+
+
+def requeue_template_sync_task(task: QueuedTask, *, delay_seconds: float = 0) -> bool:
+    """Retry a failed job run with capped retries; it resumes where it stopped."""
+    return generic_requeue_if_failed(
+        task,
+        settings.rq_queue_name,
+        max_retries=settings.rq_dispatch_max_retries,
+        redis_url=settings.rq_redis_url,
+        delay_seconds=delay_seconds,
+    )
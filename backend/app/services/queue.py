@@ -1,22 +1,53 @@
-"""Generic Redis-backed queue helpers for RQ-backed background workloads."""
+"""Generic Redis-backed queue helpers for RQ-backed background workloads.
+
+Redis clients are pooled per process and keyed by URL, so enqueue/dequeue calls
+reuse connections instead of opening a new pool each time. Async callers (request
+handlers) use `enqueue_task_async`, backed by a `redis.asyncio` client per event
+loop, so queueing never blocks the loop.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import json
+import threading
 import time
-from dataclasses import dataclass
+import weakref
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
+from uuid import uuid4
 
 import redis
+import redis.asyncio as redis_async
+from redis.asyncio.retry import Retry as AsyncRetry
+from redis.backoff import ExponentialWithJitterBackoff
+from redis.retry import Retry
 
 from app.core.config import settings
 from app.core.logging import get_logger
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
 logger = get_logger(__name__)
 
 _SCHEDULED_SUFFIX = ":scheduled"
+_HISTORY_MAX_ENTRIES = 10
+_HISTORY_ERROR_CHARS = 2000
 _DRY_RUN_BATCH_SIZE = 100
+# KEYS[1]=scheduled zset, KEYS[2]=ready list; ARGV[1]=now, ARGV[2]=max items.
+# Moves due members to the ready list (earliest first out of RPOP) and returns
+# {promoted_count, next_due_score_or_nil}.
+_PROMOTE_SCHEDULED_LUA = """
+local ready = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+if #ready > 0 then
+  redis.call('LPUSH', KEYS[2], unpack(ready))
+  redis.call('ZREM', KEYS[1], unpack(ready))
+end
+local next_item = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+return {#ready, next_item[2] or false}
+"""
 
 
 @dataclass(frozen=True)
@@ -27,21 +58,101 @@ class QueuedTask:
     payload: dict[str, Any]
     created_at: datetime
     attempts: int = 0
+    # Most recent failures, oldest first: {"attempt", "error", "failed_at"}.
+    history: tuple[dict[str, Any], ...] = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            "task_type": self.task_type,
+            "payload": self.payload,
+            "created_at": self.created_at.isoformat(),
+            "attempts": self.attempts,
+        }
+        if self.history:
+            data["history"] = list(self.history)
+        return data
 
     def to_json(self) -> str:
-        return json.dumps(
-            {
-                "task_type": self.task_type,
-                "payload": self.payload,
-                "created_at": self.created_at.isoformat(),
-                "attempts": self.attempts,
-            },
-            sort_keys=True,
-        )
+        return json.dumps(self.to_dict(), sort_keys=True)
+
+    def with_failure(self, error: str) -> QueuedTask:
+        """Return a copy recording a failed attempt in `history`."""
+        entry = {
+            "attempt": self.attempts,
+            "error": error[:_HISTORY_ERROR_CHARS],
+            "failed_at": datetime.now(UTC).isoformat(),
+        }
+        return replace(self, history=(*self.history, entry)[-_HISTORY_MAX_ENTRIES:])
+
+
+_RETRY_ATTEMPTS = 3
+_RETRY_ON_ERROR: list[type[Exception]] = [redis.ConnectionError, redis.TimeoutError]
+
+_clients_lock = threading.Lock()
+_sync_clients: dict[str, redis.Redis] = {}
+# redis.asyncio connections are bound to the loop that opened them.
+_async_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop,
+    dict[str, redis_async.Redis],
+] = weakref.WeakKeyDictionary()
+
+
+def _backoff() -> ExponentialWithJitterBackoff:
+    return ExponentialWithJitterBackoff(base=0.05, cap=2.0)
 
 
 def _redis_client(redis_url: str | None = None) -> redis.Redis:
-    return redis.Redis.from_url(redis_url or settings.rq_redis_url)
+    """Return the process-wide pooled client for `redis_url`."""
+    url = redis_url or settings.rq_redis_url
+    client = _sync_clients.get(url)
+    if client is not None:
+        return client
+    with _clients_lock:
+        client = _sync_clients.get(url)
+        if client is None:
+            client = redis.Redis.from_url(
+                url,
+                health_check_interval=settings.rq_redis_health_check_seconds,
+                socket_keepalive=True,
+                retry=Retry(_backoff(), _RETRY_ATTEMPTS),
+                retry_on_error=_RETRY_ON_ERROR,
+            )
+            _sync_clients[url] = client
+    return client
+
+
+def async_redis_client(redis_url: str | None = None) -> redis_async.Redis:
+    """Return the pooled `redis.asyncio` client for `redis_url` on the running loop."""
+    url = redis_url or settings.rq_redis_url
+    loop = asyncio.get_running_loop()
+    clients = _async_clients.setdefault(loop, {})
+    client = clients.get(url)
+    if client is None:
+        client = redis_async.Redis.from_url(
+            url,
+            health_check_interval=settings.rq_redis_health_check_seconds,
+            socket_keepalive=True,
+            retry=AsyncRetry(_backoff(), _RETRY_ATTEMPTS),
+            retry_on_error=_RETRY_ON_ERROR,
+        )
+        clients[url] = client
+    return client
+
+
+def close_redis_clients() -> None:
+    """Disconnect and forget every pooled sync client (e.g. after fork or in tests)."""
+    with _clients_lock:
+        clients = list(_sync_clients.values())
+        _sync_clients.clear()
+    for client in clients:
+        client.close()
+
+
+async def aclose_redis_clients() -> None:
+    """Disconnect and forget the pooled async clients of the running loop."""
+    clients = _async_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
 
 
 def _scheduled_queue_name(queue_name: str) -> str:
@@ -58,47 +169,31 @@ def _drain_ready_scheduled_tasks(
     *,
     max_items: int = _DRY_RUN_BATCH_SIZE,
 ) -> float | None:
+    """Promote due scheduled tasks and return seconds until the next one is due.
+
+    Runs as a single Lua script, so concurrent workers never promote the same
+    item twice and the whole step costs one round trip.
+    """
     scheduled_queue = _scheduled_queue_name(queue_name)
     now = _now_seconds()
 
-    ready_items = cast(
-        list[str | bytes],
-        client.zrangebyscore(
-            scheduled_queue,
-            "-inf",
-            now,
-            start=0,
-            num=max_items,
-        ),
+    promote = client.register_script(_PROMOTE_SCHEDULED_LUA)
+    promoted, next_score = cast(
+        list[Any],
+        promote(keys=[scheduled_queue, queue_name], args=[repr(now), max_items]),
     )
-    if ready_items:
-        ready_values = tuple(ready_items)
-        client.lpush(queue_name, *ready_values)
-        client.zrem(scheduled_queue, *ready_values)
+    if promoted:
         logger.debug(
             "rq.queue.drain_ready_scheduled",
             extra={
                 "queue_name": queue_name,
-                "count": len(ready_items),
+                "count": int(promoted),
             },
         )
 
-    next_item = cast(
-        list[tuple[str | bytes, float]],
-        client.zrangebyscore(
-            scheduled_queue,
-            now,
-            "+inf",
-            start=0,
-            num=1,
-            withscores=True,
-        ),
-    )
-    if not next_item:
+    if next_score is None:
         return None
-
-    next_score = float(next_item[0][1])
-    return max(0.0, next_score - now)
+    return max(0.0, float(next_score) - now)
 
 
 def _schedule_for_later(
@@ -123,6 +218,19 @@ def _schedule_for_later(
     return True
 
 
+def defer_task(
+    task: QueuedTask,
+    queue_name: str,
+    delay_seconds: float,
+    *,
+    redis_url: str | None = None,
+) -> bool:
+    """Push a task back for later without counting it as a failed attempt."""
+    if delay_seconds <= 0:
+        return enqueue_task(task, queue_name, redis_url=redis_url)
+    return _schedule_for_later(task, queue_name, delay_seconds, redis_url=redis_url)
+
+
 def enqueue_task(
     task: QueuedTask,
     queue_name: str,
@@ -150,6 +258,33 @@ def enqueue_task(
         return False
 
 
+async def enqueue_task_async(
+    task: QueuedTask,
+    queue_name: str,
+    *,
+    redis_url: str | None = None,
+) -> bool:
+    """Async variant of `enqueue_task` for use inside request handlers."""
+    try:
+        client = async_redis_client(redis_url=redis_url)
+        await cast("Awaitable[int]", client.lpush(queue_name, task.to_json()))
+        logger.info(
+            "rq.queue.enqueued",
+            extra={
+                "task_type": task.task_type,
+                "queue_name": queue_name,
+                "attempt": task.attempts,
+            },
+        )
+        return True
+    except Exception as exc:
+        logger.warning(
+            "rq.queue.enqueue_failed",
+            extra={"task_type": task.task_type, "queue_name": queue_name, "error": str(exc)},
+        )
+        return False
+
+
 def _coerce_datetime(raw: object | None) -> datetime:
     if raw is None:
         return datetime.now(UTC)
@@ -166,6 +301,17 @@ def _coerce_datetime(raw: object | None) -> datetime:
     return datetime.now(UTC)
 
 
+def _blocking_timeout(client: redis.Redis, queue_name: str, block_timeout: float) -> float:
+    """Promote due scheduled tasks and cap a blocking pop at the next deadline."""
+    timeout = max(0.0, float(block_timeout))
+    next_delay = _drain_ready_scheduled_tasks(client, queue_name)
+    if next_delay is None:
+        return timeout
+    if timeout == 0:
+        return next_delay
+    return min(timeout, next_delay)
+
+
 def dequeue_task(
     queue_name: str,
     *,
@@ -175,14 +321,9 @@ def dequeue_task(
 ) -> QueuedTask | None:
     """Pop one task envelope from the queue."""
     client = _redis_client(redis_url=redis_url)
-    timeout = max(0.0, float(block_timeout))
     raw: str | bytes | None
     if block:
-        next_delay = _drain_ready_scheduled_tasks(client, queue_name)
-        if timeout == 0:
-            timeout = next_delay if next_delay is not None else 0
-        else:
-            timeout = min(timeout, next_delay) if next_delay is not None else timeout
+        timeout = _blocking_timeout(client, queue_name, block_timeout)
         raw_result = cast(
             tuple[bytes | str, bytes | str] | None,
             client.brpop([queue_name], timeout=timeout),
@@ -219,6 +360,7 @@ def _decode_task(raw: str | bytes, queue_name: str) -> QueuedTask:
             payload=payload["payload"],
             created_at=datetime.fromisoformat(payload["created_at"]),
             attempts=int(payload.get("attempts", 0)),
+            history=tuple(payload.get("history") or ()),
         )
     except Exception as exc:
         logger.error(
@@ -228,12 +370,455 @@ def _decode_task(raw: str | bytes, queue_name: str) -> QueuedTask:
         raise
 
 
+# Reliable delivery: a dequeued task is moved atomically onto `<queue>:processing`
+# and leased in `<queue>:leases` (score = lease deadline) until it is acked. Expired
+# leases, including items orphaned by a crash before their lease was written, are
+# put back at the head of the queue by `reap_expired_leases`.
+_PROCESSING_SUFFIX = ":processing"
+_LEASES_SUFFIX = ":leases"
+# KEYS[1]=processing list, KEYS[2]=leases zset; ARGV[1]=raw task.
+_ACK_LUA = """
+redis.call('LREM', KEYS[1], 1, ARGV[1])
+return redis.call('ZREM', KEYS[2], ARGV[1])
+"""
+# KEYS[1]=processing list, KEYS[2]=leases zset, KEYS[3]=ready list; ARGV[1]=raw task.
+_RELEASE_LUA = """
+local removed = redis.call('LREM', KEYS[1], 1, ARGV[1])
+redis.call('ZREM', KEYS[2], ARGV[1])
+if removed > 0 then
+  redis.call('RPUSH', KEYS[3], ARGV[1])
+end
+return removed
+"""
+# KEYS[1]=processing list, KEYS[2]=leases zset, KEYS[3]=ready list;
+# ARGV[1]=now, ARGV[2]=deadline assigned to unleased (orphaned) items.
+_REAP_LUA = """
+local now = tonumber(ARGV[1])
+local redelivered = 0
+for _, raw in ipairs(redis.call('LRANGE', KEYS[1], 0, -1)) do
+  local deadline = redis.call('ZSCORE', KEYS[2], raw)
+  if not deadline then
+    redis.call('ZADD', KEYS[2], ARGV[2], raw)
+  elseif tonumber(deadline) <= now then
+    redis.call('LREM', KEYS[1], 1, raw)
+    redis.call('ZREM', KEYS[2], raw)
+    redis.call('RPUSH', KEYS[3], raw)
+    redelivered = redelivered + 1
+  end
+end
+for _, raw in ipairs(redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', now)) do
+  redis.call('ZREM', KEYS[2], raw)
+end
+return redelivered
+"""
+
+
+@dataclass(frozen=True)
+class LeasedTask:
+    """A task held on the processing list until `ack_task` or `release_task`."""
+
+    task: QueuedTask
+    raw: str
+    queue_name: str
+    redis_url: str | None = None
+
+
+def _processing_queue_name(queue_name: str) -> str:
+    return f"{queue_name}{_PROCESSING_SUFFIX}"
+
+
+def _leases_name(queue_name: str) -> str:
+    return f"{queue_name}{_LEASES_SUFFIX}"
+
+
+def lease_task(
+    queue_name: str,
+    *,
+    lease_seconds: float,
+    redis_url: str | None = None,
+    block: bool = False,
+    block_timeout: float = 0,
+) -> LeasedTask | None:
+    """Move one task onto the processing list and lease it for `lease_seconds`."""
+    client = _redis_client(redis_url=redis_url)
+    processing = _processing_queue_name(queue_name)
+    raw: str | bytes | None
+    if block:
+        timeout = _blocking_timeout(client, queue_name, block_timeout)
+        raw = cast(
+            str | bytes | None,
+            client.blmove(queue_name, processing, timeout, "RIGHT", "LEFT"),  # type: ignore[arg-type]
+        )
+    else:
+        raw = cast(str | bytes | None, client.lmove(queue_name, processing, "RIGHT", "LEFT"))
+    if raw is None:
+        _drain_ready_scheduled_tasks(client, queue_name)
+        return None
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8")
+    client.zadd(_leases_name(queue_name), {raw: _now_seconds() + lease_seconds})
+    try:
+        task = _decode_task(raw, queue_name)
+    except Exception as exc:
+        # Undecodable payloads would otherwise be redelivered forever.
+        _dead_letter_raw(client, queue_name, raw, error=f"undecodable task: {exc}")
+        client.register_script(_ACK_LUA)(keys=[processing, _leases_name(queue_name)], args=[raw])
+        raise
+    return LeasedTask(task=task, raw=raw, queue_name=queue_name, redis_url=redis_url)
+
+
+def ack_task(lease: LeasedTask) -> bool:
+    """Drop a finished task from the processing list; return whether it was still leased."""
+    client = _redis_client(redis_url=lease.redis_url)
+    removed = client.register_script(_ACK_LUA)(
+        keys=[_processing_queue_name(lease.queue_name), _leases_name(lease.queue_name)],
+        args=[lease.raw],
+    )
+    return bool(removed)
+
+
+def release_task(lease: LeasedTask) -> bool:
+    """Hand an unfinished task back to the head of the queue without counting an attempt."""
+    client = _redis_client(redis_url=lease.redis_url)
+    released = client.register_script(_RELEASE_LUA)(
+        keys=[
+            _processing_queue_name(lease.queue_name),
+            _leases_name(lease.queue_name),
+            lease.queue_name,
+        ],
+        args=[lease.raw],
+    )
+    return bool(released)
+
+
+def extend_lease(lease: LeasedTask, *, lease_seconds: float) -> bool:
+    """Push a held lease's deadline out; return False once the task is no longer leased."""
+    client = _redis_client(redis_url=lease.redis_url)
+    updated = client.zadd(
+        _leases_name(lease.queue_name),
+        {lease.raw: _now_seconds() + lease_seconds},
+        xx=True,
+        ch=True,
+    )
+    return bool(updated)
+
+
+def reap_expired_leases(
+    queue_name: str,
+    *,
+    lease_seconds: float,
+    redis_url: str | None = None,
+) -> int:
+    """Redeliver tasks whose lease expired; return how many were put back."""
+    client = _redis_client(redis_url=redis_url)
+    now = _now_seconds()
+    redelivered = int(
+        client.register_script(_REAP_LUA)(
+            keys=[_processing_queue_name(queue_name), _leases_name(queue_name), queue_name],
+            args=[repr(now), repr(now + lease_seconds)],
+        ),
+    )
+    if redelivered:
+        logger.warning(
+            "rq.queue.leases_expired",
+            extra={"queue_name": queue_name, "count": redelivered},
+        )
+    return redelivered
+
+
 def _requeue_with_attempt(task: QueuedTask) -> QueuedTask:
-    return QueuedTask(
+    return replace(task, attempts=task.attempts + 1)
+
+
+# Dead letters: tasks that exhausted their retries are kept in the `<queue>:dead`
+# hash (entry id -> JSON) with a `<queue>:dead:index` sorted set (entry id ->
+# dead-lettered timestamp) for ordering and trimming to `RQ_DEAD_LETTER_MAX_ENTRIES`.
+_DEAD_SUFFIX = ":dead"
+_DEAD_INDEX_SUFFIX = ":dead:index"
+_DEAD_FETCH_CHUNK = 500
+# KEYS[1]=dead hash, KEYS[2]=dead index, KEYS[3]=ready list; ARGV=(id, raw) pairs.
+# Each entry is pushed back only by the caller that removed it, so concurrent
+# replays never duplicate a task.
+_REPLAY_DEAD_LUA = """
+local replayed = 0
+for i = 1, #ARGV, 2 do
+  if redis.call('HDEL', KEYS[1], ARGV[i]) == 1 then
+    redis.call('ZREM', KEYS[2], ARGV[i])
+    redis.call('LPUSH', KEYS[3], ARGV[i + 1])
+    replayed = replayed + 1
+  end
+end
+return replayed
+"""
+
+
+@dataclass(frozen=True)
+class DeadLetter:
+    """A task that exhausted its retries, with its failure history."""
+
+    id: str
+    queue_name: str
+    task_type: str
+    attempts: int
+    dead_at: datetime
+    last_error: str | None
+    board_id: str | None
+    task: dict[str, Any]
+    history: tuple[dict[str, Any], ...]
+    # Tasks without a board (gateway template syncs) are scoped by their gateway.
+    gateway_id: str | None = None
+
+    @classmethod
+    def from_json(cls, raw: str | bytes) -> DeadLetter:
+        data = json.loads(raw)
+        task = dict(data.get("task") or {})
+        payload = task.get("payload")
+        _, payload_gateway_id = _task_scope(payload if isinstance(payload, dict) else {})
+        return cls(
+            id=str(data["id"]),
+            queue_name=str(data["queue_name"]),
+            task_type=str(data["task_type"]),
+            attempts=int(data.get("attempts", 0)),
+            dead_at=datetime.fromisoformat(data["dead_at"]),
+            last_error=data.get("last_error"),
+            board_id=data.get("board_id"),
+            task=task,
+            history=tuple(data.get("history") or ()),
+            gateway_id=data.get("gateway_id") or payload_gateway_id,
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "id": self.id,
+                "queue_name": self.queue_name,
+                "task_type": self.task_type,
+                "attempts": self.attempts,
+                "dead_at": self.dead_at.isoformat(),
+                "last_error": self.last_error,
+                "board_id": self.board_id,
+                "gateway_id": self.gateway_id,
+                "task": self.task,
+                "history": list(self.history),
+            },
+            sort_keys=True,
+        )
+
+
+@dataclass(frozen=True)
+class QueueStats:
+    """Point-in-time sizes of a queue's Redis structures."""
+
+    queue_name: str
+    queued: int
+    scheduled: int
+    processing: int
+    dead: int
+
+
+def _dead_name(queue_name: str) -> str:
+    return f"{queue_name}{_DEAD_SUFFIX}"
+
+
+def _dead_index_name(queue_name: str) -> str:
+    return f"{queue_name}{_DEAD_INDEX_SUFFIX}"
+
+
+def _store_dead_letter(client: redis.Redis, entry: DeadLetter) -> None:
+    dead, index = _dead_name(entry.queue_name), _dead_index_name(entry.queue_name)
+    pipe = client.pipeline(transaction=True)
+    pipe.hset(dead, entry.id, entry.to_json())
+    pipe.zadd(index, {entry.id: entry.dead_at.timestamp()})
+    pipe.execute()
+    overflow = cast(int, client.zcard(index)) - settings.rq_dead_letter_max_entries
+    if overflow > 0:
+        expired = cast(list[str], client.zrange(index, 0, overflow - 1))
+        if expired:
+            pipe = client.pipeline(transaction=True)
+            pipe.hdel(dead, *expired)
+            pipe.zrem(index, *expired)
+            pipe.execute()
+    logger.warning(
+        "rq.queue.dead_lettered",
+        extra={
+            "queue_name": entry.queue_name,
+            "task_type": entry.task_type,
+            "attempts": entry.attempts,
+            "dead_letter_id": entry.id,
+        },
+    )
+
+
+def _task_scope(payload: dict[str, Any]) -> tuple[str | None, str | None]:
+    board_id, gateway_id = payload.get("board_id"), payload.get("gateway_id")
+    return (
+        board_id if isinstance(board_id, str) else None,
+        gateway_id if isinstance(gateway_id, str) else None,
+    )
+
+
+def _raw_task_scope(raw: str) -> tuple[str | None, str | None]:
+    # Undecodable tasks keep whatever scope their JSON still carries, if any.
+    try:
+        data = json.loads(raw)
+    except ValueError:
+        return None, None
+    if not isinstance(data, dict):
+        return None, None
+    payload = data.get("payload")
+    return _task_scope(payload if isinstance(payload, dict) else data)
+
+
+def _dead_letter_raw(client: redis.Redis, queue_name: str, raw: str, *, error: str) -> None:
+    board_id, gateway_id = _raw_task_scope(raw)
+    try:
+        _store_dead_letter(
+            client,
+            DeadLetter(
+                id=uuid4().hex,
+                queue_name=queue_name,
+                task_type="undecodable",
+                attempts=0,
+                dead_at=datetime.now(UTC),
+                last_error=error,
+                board_id=board_id,
+                task={"raw": raw},
+                history=(),
+                gateway_id=gateway_id,
+            ),
+        )
+    except Exception as exc:
+        logger.error(
+            "rq.queue.dead_letter_failed",
+            extra={"queue_name": queue_name, "error": str(exc)},
+        )
+
+
+def dead_letter_task(
+    task: QueuedTask,
+    queue_name: str,
+    *,
+    redis_url: str | None = None,
+) -> DeadLetter:
+    """Move a task that exhausted its retries to `<queue>:dead`."""
+    board_id, gateway_id = _task_scope(task.payload)
+    last_error = task.history[-1].get("error") if task.history else None
+    entry = DeadLetter(
+        id=uuid4().hex,
+        queue_name=queue_name,
         task_type=task.task_type,
-        payload=task.payload,
-        created_at=task.created_at,
-        attempts=task.attempts + 1,
+        attempts=task.attempts,
+        dead_at=datetime.now(UTC),
+        last_error=str(last_error) if last_error is not None else None,
+        board_id=board_id,
+        task=task.to_dict(),
+        history=task.history,
+        gateway_id=gateway_id,
+    )
+    _store_dead_letter(_redis_client(redis_url=redis_url), entry)
+    return entry
+
+
+def list_dead_letters(
+    queue_name: str,
+    *,
+    redis_url: str | None = None,
+    visible: Callable[[DeadLetter], bool] | None = None,
+) -> list[DeadLetter]:
+    """Return dead letters newest first, optionally only those `visible` accepts."""
+    client = _redis_client(redis_url=redis_url)
+    ids = cast(list[str | bytes], client.zrevrange(_dead_index_name(queue_name), 0, -1))
+    entries: list[DeadLetter] = []
+    for start in range(0, len(ids), _DEAD_FETCH_CHUNK):
+        chunk = ids[start : start + _DEAD_FETCH_CHUNK]
+        for raw in cast(list[str | bytes | None], client.hmget(_dead_name(queue_name), chunk)):
+            if raw is None:
+                continue
+            entry = DeadLetter.from_json(raw)
+            if visible is None or visible(entry):
+                entries.append(entry)
+    return entries
+
+
+def get_dead_letter(
+    queue_name: str,
+    entry_id: str,
+    *,
+    redis_url: str | None = None,
+) -> DeadLetter | None:
+    """Return one dead letter by id."""
+    raw = cast(
+        str | bytes | None,
+        _redis_client(redis_url=redis_url).hget(_dead_name(queue_name), entry_id),
+    )
+    return None if raw is None else DeadLetter.from_json(raw)
+
+
+def replay_dead_letters(
+    entries: list[DeadLetter],
+    *,
+    redis_url: str | None = None,
+) -> int:
+    """Push dead letters back onto their queue with a fresh retry budget."""
+    replayed = 0
+    client = _redis_client(redis_url=redis_url)
+    by_queue: dict[str, list[DeadLetter]] = {}
+    for entry in entries:
+        by_queue.setdefault(entry.queue_name, []).append(entry)
+    for queue_name, queue_entries in by_queue.items():
+        args: list[str] = []
+        for entry in queue_entries:
+            raw = entry.task.get("raw")
+            if entry.task_type == "undecodable" and isinstance(raw, str):
+                args.extend([entry.id, raw])
+                continue
+            task = _decode_task(json.dumps(entry.task), queue_name)
+            args.extend([entry.id, replace(task, attempts=0).to_json()])
+        replay = client.register_script(_REPLAY_DEAD_LUA)
+        replayed += int(
+            replay(
+                keys=[_dead_name(queue_name), _dead_index_name(queue_name), queue_name],
+                args=args,
+            ),
+        )
+    logger.info("rq.queue.dead_letters_replayed", extra={"count": replayed})
+    return replayed
+
+
+def purge_dead_letters(
+    queue_name: str,
+    entry_ids: list[str],
+    *,
+    redis_url: str | None = None,
+) -> int:
+    """Delete dead letters by id; return how many existed."""
+    if not entry_ids:
+        return 0
+    pipe = _redis_client(redis_url=redis_url).pipeline(transaction=True)
+    pipe.hdel(_dead_name(queue_name), *entry_ids)
+    pipe.zrem(_dead_index_name(queue_name), *entry_ids)
+    purged, _ = pipe.execute()
+    logger.info(
+        "rq.queue.dead_letters_purged",
+        extra={"queue_name": queue_name, "count": int(purged)},
+    )
+    return int(purged)
+
+
+def queue_stats(queue_name: str, *, redis_url: str | None = None) -> QueueStats:
+    """Return queue depth, scheduled, in-flight and dead-letter counts."""
+    pipe = _redis_client(redis_url=redis_url).pipeline(transaction=False)
+    pipe.llen(queue_name)
+    pipe.zcard(_scheduled_queue_name(queue_name))
+    pipe.llen(_processing_queue_name(queue_name))
+    pipe.zcard(_dead_index_name(queue_name))
+    queued, scheduled, processing, dead = pipe.execute()
+    return QueueStats(
+        queue_name=queue_name,
+        queued=int(queued),
+        scheduled=int(scheduled),
+        processing=int(processing),
+        dead=int(dead),
     )
 
 
@@ -247,7 +832,8 @@ def requeue_if_failed(
 ) -> bool:
     """Requeue a failed task with capped retries.
 
-    Returns True if requeued.
+    Returns True if requeued. Tasks past `max_retries` are moved to the dead-letter
+    queue instead.
     """
     requeued_task = _requeue_with_attempt(task)
     if requeued_task.attempts > max_retries:
@@ -259,6 +845,13 @@ def requeue_if_failed(
                 "attempts": requeued_task.attempts,
             },
         )
+        try:
+            dead_letter_task(task, queue_name, redis_url=redis_url)
+        except Exception as exc:
+            logger.error(
+                "rq.queue.dead_letter_failed",
+                extra={"task_type": task.task_type, "queue_name": queue_name, "error": str(exc)},
+            )
         return False
     if delay_seconds > 0:
         return _schedule_for_later(
@@ -1,29 +1,87 @@
-"""Generic queue worker with task-type dispatch."""
+"""Generic queue worker with task-type dispatch.
+
+Tasks are dequeued one at a time and handled concurrently, up to
+`RQ_WORKER_CONCURRENCY` per process. Instead of a global pause between tasks,
+handlers can name a rate-limit key (board or gateway); each key gets its own token
+bucket, and tasks over budget are deferred back to the scheduled queue so they do
+not hold a concurrency slot. On SIGTERM/SIGINT the worker stops dequeuing, lets
+in-flight tasks finish (bounded by `RQ_WORKER_DRAIN_SECONDS`) and exits.
+
+With `RQ_RELIABLE_DELIVERY` (the default) tasks are leased rather than popped and
+acked only once handled, retried or deferred; a background reaper redelivers
+leases left behind by crashed or hung workers.
+
+Handlers may also accept batches: webhook deliveries are buffered for
+`RQ_WEBHOOK_BATCH_WINDOW_SECONDS` and handed over together so each board lead
+gets one digest per window. Batches occupy one concurrency slot and take one
+rate-limit token per key they deliver to; tasks whose key has no token are
+deferred like single tasks.
+"""
 
 from __future__ import annotations
 
 import asyncio
 import random
+import signal
+import time
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from app.core.config import settings
 from app.core.logging import get_logger
-from app.services.queue import QueuedTask, dequeue_task
+from app.services.event_bridge import attach_event_bridge, detach_event_bridge
+from app.services.event_hub import event_hub
+from app.services.openclaw.gateway_rpc import close_gateway_connections
+from app.services.openclaw.template_sync_jobs import TASK_TYPE as TEMPLATE_SYNC_TASK_TYPE
+from app.services.openclaw.template_sync_jobs import (
+    process_template_sync_task,
+    requeue_template_sync_task,
+)
+from app.services.queue import (
+    LeasedTask,
+    QueuedTask,
+    ack_task,
+    defer_task,
+    dequeue_task,
+    extend_lease,
+    lease_task,
+    reap_expired_leases,
+    release_task,
+)
+from app.services.rate_limit import KeyedTokenBucket
 from app.services.webhooks.dispatch import (
+    process_webhook_queue_batch,
     process_webhook_queue_task,
     requeue_webhook_queue_task,
+    webhook_rate_limit_key,
 )
 from app.services.webhooks.queue import TASK_TYPE as WEBHOOK_TASK_TYPE
 
 logger = get_logger(__name__)
 
+# Blocking dequeues return at least this often so a stop request is noticed.
+_DEQUEUE_POLL_SECONDS = 1.0
+# Rate-limited tasks expecting a token sooner than this wait in place; longer
+# waits are deferred through the scheduled queue.
+_MAX_INLINE_RATE_WAIT_SECONDS = 1.0
+# Upper bound on how often each worker sweeps for expired leases.
+_REAP_INTERVAL_MAX_SECONDS = 30.0
+
 
 @dataclass(frozen=True)
 class _TaskHandler:
     handler: Callable[[QueuedTask], Awaitable[None]]
     attempts_to_delay: Callable[[int], float]
     requeue: Callable[[QueuedTask, float], bool]
+    rate_limit_key: Callable[[QueuedTask], Awaitable[str | None]] | None = None
+    # Optional batch mode: receives every task buffered within the window and
+    # returns the ones to retry. `batch_limits` gives (window_seconds, max_size);
+    # a window of 0 handles tasks one at a time through `handler`.
+    batch_handler: Callable[[list[QueuedTask]], Awaitable[list[QueuedTask]]] | None = None
+    batch_limits: Callable[[], tuple[float, int]] | None = None
+    # Long-running handlers keep extending their lease while they run, so the
+    # reaper does not redeliver a task that is still being worked on.
+    long_running: bool = False
 
 
 _TASK_HANDLERS: dict[str, _TaskHandler] = {
@@ -34,25 +92,425 @@ _TASK_HANDLERS: dict[str, _TaskHandler] = {
             settings.rq_dispatch_retry_max_seconds,
         ),
         requeue=lambda task, delay: requeue_webhook_queue_task(task, delay_seconds=delay),
+        rate_limit_key=webhook_rate_limit_key,
+        batch_handler=process_webhook_queue_batch,
+        batch_limits=lambda: (
+            settings.rq_webhook_batch_window_seconds,
+            settings.rq_webhook_batch_max_size,
+        ),
+    ),
+    TEMPLATE_SYNC_TASK_TYPE: _TaskHandler(
+        handler=process_template_sync_task,
+        attempts_to_delay=lambda attempts: min(
+            settings.rq_dispatch_retry_base_seconds * (2 ** max(0, attempts)),
+            settings.rq_dispatch_retry_max_seconds,
+        ),
+        requeue=lambda task, delay: requeue_template_sync_task(task, delay_seconds=delay),
+        long_running=True,
     ),
 }
 
+dispatch_rate_limiter = KeyedTokenBucket(
+    rate_per_second=settings.rq_dispatch_rate_per_minute / 60.0,
+    burst=settings.rq_dispatch_burst,
+)
+
 
 def _compute_jitter(base_delay: float) -> float:
     return random.uniform(0, min(settings.rq_dispatch_retry_max_seconds / 10, base_delay * 0.1))
 
 
-async def flush_queue(*, block: bool = False, block_timeout: float = 0) -> int:
-    """Consume one queue batch and dispatch by task type."""
-    processed = 0
+async def _defer(task: QueuedTask, delay_seconds: float) -> None:
+    await asyncio.to_thread(
+        defer_task,
+        task,
+        settings.rq_queue_name,
+        delay_seconds,
+        redis_url=settings.rq_redis_url,
+    )
+
+
+async def _wait_for_token(key: str) -> float:
+    """Take a token for `key`, waiting briefly; return the remaining wait if none is near."""
+    wait = dispatch_rate_limiter.try_acquire(key)
+    while 0 < wait <= _MAX_INLINE_RATE_WAIT_SECONDS:
+        await asyncio.sleep(wait)
+        wait = dispatch_rate_limiter.try_acquire(key)
+    return max(wait, 0.0)
+
+
+async def _acquire_rate_limit(task: QueuedTask, handler: _TaskHandler) -> bool:
+    """Wait briefly for a token; defer the task and return False if none is near."""
+    if handler.rate_limit_key is None or not dispatch_rate_limiter.enabled:
+        return True
+    key = await handler.rate_limit_key(task)
+    if key is None:
+        return True
+    wait = await _wait_for_token(key)
+    if wait <= 0:
+        return True
+    await _defer(task, wait)
+    logger.info(
+        "queue.worker.rate_limited",
+        extra={"task_type": task.task_type, "rate_key": key, "delay_seconds": wait},
+    )
+    return False
+
+
+_BatchItems = list[tuple[QueuedTask, LeasedTask | None]]
+
+
+async def _admit_batch(
+    items: _BatchItems,
+    handler: _TaskHandler,
+) -> tuple[_BatchItems, list[tuple[str, float, _BatchItems]]]:
+    """Take one token per rate key in a batch; return the admitted and the limited items.
+
+    Nothing is deferred here, so cancelling admission leaves the batch untouched.
+    """
+    if handler.rate_limit_key is None or not dispatch_rate_limiter.enabled:
+        return items, []
+    by_key: dict[str | None, _BatchItems] = {}
+    for task, lease in items:
+        by_key.setdefault(await handler.rate_limit_key(task), []).append((task, lease))
+    admitted: _BatchItems = []
+    limited: list[tuple[str, float, _BatchItems]] = []
+    for key, key_items in by_key.items():
+        wait = 0.0 if key is None else await _wait_for_token(key)
+        if key is None or wait <= 0:
+            admitted.extend(key_items)
+        else:
+            limited.append((key, wait, key_items))
+    return admitted, limited
+
+
+async def _defer_rate_limited(limited: list[tuple[str, float, _BatchItems]]) -> None:
+    for key, wait, key_items in limited:
+        for task, lease in key_items:
+            await _defer(task, wait)
+            await _ack(task, lease)
+        logger.info(
+            "queue.worker.rate_limited",
+            extra={
+                "task_type": key_items[0][0].task_type,
+                "rate_key": key,
+                "delay_seconds": wait,
+                "count": len(key_items),
+            },
+        )
+
+
+async def _settle_interrupted(items: list[tuple[QueuedTask, LeasedTask | None]]) -> None:
+    """Hand tasks back untouched so another worker retries them.
+
+    Used when draining times out and when a batch fails before reaching its handler.
+    """
+    for task, lease in items:
+        if lease is not None:
+            await asyncio.to_thread(release_task, lease)
+        else:
+            await _defer(task, 0)
+        logger.warning(
+            "queue.worker.task_interrupted",
+            extra={"task_type": task.task_type, "attempt": task.attempts},
+        )
+
+
+async def _ack(task: QueuedTask, lease: LeasedTask | None) -> None:
+    if lease is None:
+        return
+    try:
+        await asyncio.to_thread(ack_task, lease)
+    except Exception:
+        # The lease will expire and the task be redelivered (at-least-once).
+        logger.exception("queue.worker.ack_failed", extra={"task_type": task.task_type})
+
+
+async def _retry_or_drop(task: QueuedTask, handler: _TaskHandler, error: str) -> None:
+    task = task.with_failure(error)
+    base_delay = handler.attempts_to_delay(task.attempts)
+    delay = base_delay + _compute_jitter(base_delay)
+    if not await asyncio.to_thread(handler.requeue, task, delay):
+        logger.warning(
+            "queue.worker.drop_task",
+            extra={
+                "task_type": task.task_type,
+                "attempt": task.attempts,
+            },
+        )
+
+
+async def _handle_task(
+    task: QueuedTask,
+    handler: _TaskHandler,
+    lease: LeasedTask | None = None,
+) -> bool:
+    """Run one task and settle its lease; return True when the handler succeeded."""
+    heartbeat = (
+        asyncio.create_task(_keep_lease(lease))
+        if handler.long_running and lease is not None
+        else None
+    )
+    try:
+        succeeded = await _run_handler(task, handler)
+    except asyncio.CancelledError:
+        await asyncio.shield(_settle_interrupted([(task, lease)]))
+        raise
+    finally:
+        if heartbeat is not None:
+            heartbeat.cancel()
+    await _ack(task, lease)
+    return succeeded
+
+
+async def _keep_lease(lease: LeasedTask) -> None:
+    interval = settings.rq_lease_seconds / 3
     while True:
+        await asyncio.sleep(interval)
         try:
-            task = dequeue_task(
-                settings.rq_queue_name,
-                redis_url=settings.rq_redis_url,
-                block=block,
-                block_timeout=block_timeout,
+            held = await asyncio.to_thread(
+                extend_lease,
+                lease,
+                lease_seconds=settings.rq_lease_seconds,
+            )
+        except Exception:
+            logger.exception(
+                "queue.worker.lease_extend_failed",
+                extra={"task_type": lease.task.task_type},
+            )
+            continue
+        if not held:
+            return
+
+
+async def _run_handler(task: QueuedTask, handler: _TaskHandler) -> bool:
+    try:
+        if not await _acquire_rate_limit(task, handler):
+            return False
+        await handler.handler(task)
+    except Exception as exc:
+        logger.exception(
+            "queue.worker.failed",
+            extra={
+                "task_type": task.task_type,
+                "attempt": task.attempts,
+                "error": str(exc),
+            },
+        )
+        await _retry_or_drop(task, handler, f"{type(exc).__name__}: {exc}")
+        return False
+    logger.info(
+        "queue.worker.success",
+        extra={
+            "task_type": task.task_type,
+            "attempt": task.attempts,
+        },
+    )
+    return True
+
+
+async def _handle_batch(
+    items: list[tuple[QueuedTask, LeasedTask | None]],
+    handler: _TaskHandler,
+) -> int:
+    """Run a batch handler, retry the tasks it reports failed, and settle every lease."""
+    assert handler.batch_handler is not None
+    # Only tasks actually handed to the handler count as attempted; rate-limited
+    # ones are deferred and settled on their own.
+    tasks: list[QueuedTask] = []
+    try:
+        items, limited = await _admit_batch(items, handler)
+        if limited:
+            # Shielded: once deferred, those tasks are no longer this batch's to settle.
+            await asyncio.shield(_defer_rate_limited(limited))
+        if not items:
+            return 0
+        tasks = [task for task, _ in items]
+        failed = await handler.batch_handler(tasks)
+    except asyncio.CancelledError:
+        await asyncio.shield(_settle_interrupted(items))
+        raise
+    except Exception as exc:
+        if not tasks:
+            # Admission or deferral failed before delivery: hand the admitted tasks
+            # back untouched. Limited tasks that were not deferred yet keep their
+            # leases and are redelivered by the reaper.
+            logger.exception(
+                "queue.worker.batch_admission_failed",
+                extra={"count": len(items), "error": str(exc)},
             )
+            await _settle_interrupted(items)
+            return 0
+        logger.exception(
+            "queue.worker.batch_failed",
+            extra={"task_type": tasks[0].task_type, "count": len(tasks), "error": str(exc)},
+        )
+        failed = tasks
+        error = f"{type(exc).__name__}: {exc}"
+    else:
+        error = "batch delivery failed"
+    failed_ids = {id(task) for task in failed}
+    for task in failed:
+        await _retry_or_drop(task, handler, error)
+    for task, lease in items:
+        await _ack(task, lease)
+    succeeded = len(tasks) - len(failed_ids)
+    logger.info(
+        "queue.worker.batch_success",
+        extra={"task_type": tasks[0].task_type, "count": succeeded, "failed": len(failed_ids)},
+    )
+    return succeeded
+
+
+class _ConcurrentDispatcher:
+    """Runs units of work as tasks, never more than `concurrency` at once."""
+
+    def __init__(self, concurrency: int) -> None:
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        self._in_flight: set[asyncio.Task[None]] = set()
+        self.processed = 0
+
+    async def submit(
+        self,
+        task: QueuedTask,
+        handler: _TaskHandler,
+        lease: LeasedTask | None = None,
+    ) -> None:
+        """Start `task` once a slot is free."""
+
+        async def _work() -> int:
+            return int(await _handle_task(task, handler, lease))
+
+        await self._start(_work)
+
+    async def submit_batch(
+        self,
+        items: list[tuple[QueuedTask, LeasedTask | None]],
+        handler: _TaskHandler,
+    ) -> None:
+        """Start a batch (occupying one slot) once a slot is free."""
+
+        async def _work() -> int:
+            return await _handle_batch(items, handler)
+
+        await self._start(_work)
+
+    async def _start(self, work: Callable[[], Awaitable[int]]) -> None:
+        await self._semaphore.acquire()
+        runner = asyncio.create_task(self._run(work))
+        self._in_flight.add(runner)
+        runner.add_done_callback(self._in_flight.discard)
+
+    async def _run(self, work: Callable[[], Awaitable[int]]) -> None:
+        try:
+            succeeded = await work()
+        finally:
+            self._semaphore.release()
+        self.processed += succeeded
+
+    async def join(self, timeout: float | None = None) -> None:
+        """Wait for in-flight tasks; cancel (and requeue) any still running after `timeout`."""
+        if not self._in_flight:
+            return
+        _done, pending = await asyncio.wait(set(self._in_flight), timeout=timeout)
+        if not pending:
+            return
+        logger.warning("queue.worker.drain_timeout", extra={"in_flight": len(pending)})
+        for runner in pending:
+            runner.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+@dataclass
+class _BatchBuffer:
+    handler: _TaskHandler
+    opened_at: float
+    items: list[tuple[QueuedTask, LeasedTask | None]] = field(default_factory=list)
+
+
+class _TaskBatcher:
+    """Collects tasks of batchable types until their window elapses or the buffer fills."""
+
+    def __init__(self) -> None:
+        self._buffers: dict[str, _BatchBuffer] = {}
+
+    def add(self, task: QueuedTask, handler: _TaskHandler, lease: LeasedTask | None) -> None:
+        """Buffer `task` for its type's next batch."""
+        buffer = self._buffers.get(task.task_type)
+        if buffer is None:
+            buffer = _BatchBuffer(handler=handler, opened_at=time.monotonic())
+            self._buffers[task.task_type] = buffer
+        buffer.items.append((task, lease))
+
+    def take_due(
+        self,
+        *,
+        force: bool = False,
+    ) -> list[tuple[_TaskHandler, list[tuple[QueuedTask, LeasedTask | None]]]]:
+        """Remove and return buffers whose window elapsed or that reached their size cap."""
+        now = time.monotonic()
+        due: list[tuple[_TaskHandler, list[tuple[QueuedTask, LeasedTask | None]]]] = []
+        for task_type, buffer in list(self._buffers.items()):
+            window, max_size = _batch_limits(buffer.handler)
+            if force or len(buffer.items) >= max_size or now - buffer.opened_at >= window:
+                del self._buffers[task_type]
+                due.append((buffer.handler, buffer.items))
+        return due
+
+
+def _batch_limits(handler: _TaskHandler) -> tuple[float, int]:
+    if handler.batch_handler is None or handler.batch_limits is None:
+        return 0.0, 1
+    return handler.batch_limits()
+
+
+async def _submit_due_batches(
+    dispatcher: _ConcurrentDispatcher,
+    batcher: _TaskBatcher,
+    *,
+    force: bool = False,
+) -> None:
+    for handler, items in batcher.take_due(force=force):
+        await dispatcher.submit_batch(items, handler)
+
+
+async def _next_task(
+    *,
+    block: bool,
+    block_timeout: float,
+) -> tuple[QueuedTask, LeasedTask | None] | None:
+    if settings.rq_reliable_delivery:
+        lease = await asyncio.to_thread(
+            lease_task,
+            settings.rq_queue_name,
+            lease_seconds=settings.rq_lease_seconds,
+            redis_url=settings.rq_redis_url,
+            block=block,
+            block_timeout=block_timeout,
+        )
+        return None if lease is None else (lease.task, lease)
+    task = await asyncio.to_thread(
+        dequeue_task,
+        settings.rq_queue_name,
+        redis_url=settings.rq_redis_url,
+        block=block,
+        block_timeout=block_timeout,
+    )
+    return None if task is None else (task, None)
+
+
+async def _consume(
+    dispatcher: _ConcurrentDispatcher,
+    batcher: _TaskBatcher,
+    *,
+    block: bool,
+    block_timeout: float,
+    stop: asyncio.Event | None,
+) -> None:
+    """Dequeue and start tasks until the queue is idle or `stop` is set."""
+    while stop is None or not stop.is_set():
+        try:
+            dequeued = await _next_task(block=block, block_timeout=block_timeout)
         except Exception:
             logger.exception(
                 "queue.worker.dequeue_failed",
@@ -60,8 +518,9 @@ async def flush_queue(*, block: bool = False, block_timeout: float = 0) -> int:
             )
             continue
 
-        if task is None:
+        if dequeued is None:
             break
+        task, lease = dequeued
 
         handler = _TASK_HANDLERS.get(task.task_type)
         if handler is None:
@@ -72,50 +531,102 @@ async def flush_queue(*, block: bool = False, block_timeout: float = 0) -> int:
                     "queue_name": settings.rq_queue_name,
                 },
             )
+            await _ack(task, lease)
             continue
 
+        window, _max_size = _batch_limits(handler)
+        if window > 0:
+            batcher.add(task, handler, lease)
+        else:
+            await dispatcher.submit(task, handler, lease)
+        await _submit_due_batches(dispatcher, batcher)
+    await _submit_due_batches(dispatcher, batcher)
+
+
+async def flush_queue(
+    *,
+    block: bool = False,
+    block_timeout: float = 0,
+    stop: asyncio.Event | None = None,
+) -> int:
+    """Consume one queue batch and dispatch by task type.
+
+    Returns once the queue is empty (or `stop` is set) and every task started by
+    this batch has finished. Partially filled batch buffers are sent immediately.
+    """
+    dispatcher = _ConcurrentDispatcher(settings.rq_worker_concurrency)
+    batcher = _TaskBatcher()
+    await _consume(dispatcher, batcher, block=block, block_timeout=block_timeout, stop=stop)
+    await _submit_due_batches(dispatcher, batcher, force=True)
+    stopping = stop is not None and stop.is_set()
+    await dispatcher.join(timeout=settings.rq_worker_drain_seconds if stopping else None)
+    if dispatcher.processed > 0:
+        logger.info("queue.worker.batch_complete", extra={"count": dispatcher.processed})
+    return dispatcher.processed
+
+
+def _install_stop_handlers(stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
         try:
-            await handler.handler(task)
-            processed += 1
-            logger.info(
-                "queue.worker.success",
-                extra={
-                    "task_type": task.task_type,
-                    "attempt": task.attempts,
-                },
+            loop.add_signal_handler(sig, stop.set)
+        except (NotImplementedError, RuntimeError, ValueError):
+            # Not on the main thread / unsupported platform: rely on cancellation.
+            continue
+
+
+async def _reap_leases_forever() -> None:
+    interval = min(_REAP_INTERVAL_MAX_SECONDS, settings.rq_lease_seconds / 4)
+    while True:
+        try:
+            await asyncio.to_thread(
+                reap_expired_leases,
+                settings.rq_queue_name,
+                lease_seconds=settings.rq_lease_seconds,
+                redis_url=settings.rq_redis_url,
             )
-        except Exception as exc:
+        except Exception:
             logger.exception(
-                "queue.worker.failed",
-                extra={
-                    "task_type": task.task_type,
-                    "attempt": task.attempts,
-                    "error": str(exc),
-                },
+                "queue.worker.reap_failed",
+                extra={"queue_name": settings.rq_queue_name},
             )
-            base_delay = handler.attempts_to_delay(task.attempts)
-            delay = base_delay + _compute_jitter(base_delay)
-            if not handler.requeue(task, delay):
-                logger.warning(
-                    "queue.worker.drop_task",
-                    extra={
-                        "task_type": task.task_type,
-                        "attempt": task.attempts,
-                    },
-                )
-        await asyncio.sleep(settings.rq_dispatch_throttle_seconds)
-
-    if processed > 0:
-        logger.info("queue.worker.batch_complete", extra={"count": processed})
-    return processed
-
-
-async def _run_worker_loop() -> None:
-    while True:
+        await asyncio.sleep(interval)
+
+
+async def _run_worker_loop(stop: asyncio.Event | None = None) -> None:
+    if stop is None:
+        stop = asyncio.Event()
+        _install_stop_handlers(stop)
+    reaper: asyncio.Task[None] | None = None
+    if settings.rq_reliable_delivery:
+        reaper = asyncio.create_task(_reap_leases_forever(), name="queue-lease-reaper")
+    # Worker commits (digests, template sync, presence) must wake streams on the
+    # API replicas; the worker itself serves no streams, so no listener runs here.
+    attach_event_bridge(event_hub)
+    try:
+        await _consume_until_stopped(stop)
+    finally:
+        if reaper is not None:
+            reaper.cancel()
+            await asyncio.gather(reaper, return_exceptions=True)
+        await detach_event_bridge(event_hub)
+        await close_gateway_connections()
+    logger.info("queue.worker.drained", extra={"queue_name": settings.rq_queue_name})
+
+
+async def _consume_until_stopped(stop: asyncio.Event) -> None:
+    # One dispatcher and batcher for the worker's lifetime, so batch windows span
+    # idle polls instead of closing whenever the queue is momentarily empty.
+    dispatcher = _ConcurrentDispatcher(settings.rq_worker_concurrency)
+    batcher = _TaskBatcher()
+    while not stop.is_set():
         try:
-            await flush_queue(
+            await _consume(
+                dispatcher,
+                batcher,
                 block=True,
-                block_timeout=0,
+                block_timeout=_DEQUEUE_POLL_SECONDS,
+                stop=stop,
             )
         except Exception:
             logger.exception(
@@ -123,13 +634,20 @@ async def _run_worker_loop() -> None:
                 extra={"queue_name": settings.rq_queue_name},
             )
             await asyncio.sleep(1)
+    await _submit_due_batches(dispatcher, batcher, force=True)
+    await dispatcher.join(timeout=settings.rq_worker_drain_seconds)
 
 
 def run_worker() -> None:
     """RQ entrypoint for running continuous queue processing."""
     logger.info(
         "queue.worker.batch_started",
-        extra={"throttle_seconds": settings.rq_dispatch_throttle_seconds},
+        extra={
+            "concurrency": settings.rq_worker_concurrency,
+            "rate_per_minute": settings.rq_dispatch_rate_per_minute,
+            "rate_scope": settings.rq_dispatch_rate_scope,
+            "reliable_delivery": settings.rq_reliable_delivery,
+        },
     )
     try:
         asyncio.run(_run_worker_loop())
@@ -0,0 +1,55 @@
+"""Per-key token bucket rate limiting for background dispatch."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+
+
+class KeyedTokenBucket:
+    """Independent token buckets keyed by an arbitrary string (board, gateway, ...).
+
+    Each key refills at `rate_per_second` up to `burst` tokens. A non-positive rate
+    disables limiting. Buckets are kept in a bounded LRU; an evicted key simply
+    starts again with a full bucket.
+    """
+
+    def __init__(self, *, rate_per_second: float, burst: int, max_keys: int = 10_000) -> None:
+        self.rate_per_second = rate_per_second
+        self.burst = max(1, burst)
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any limiting is applied."""
+        return self.rate_per_second > 0
+
+    def try_acquire(self, key: str) -> float:
+        """Take one token for `key`.
+
+        Returns 0 when a token was taken, otherwise the seconds until one becomes
+        available (no token is consumed in that case).
+        """
+        if not self.enabled:
+            return 0.0
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.get(key, (float(self.burst), now))
+        tokens = min(float(self.burst), tokens + (now - updated_at) * self.rate_per_second)
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / self.rate_per_second
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return wait
+
+    def clear(self) -> None:
+        """Forget all buckets."""
+        self._buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
@@ -14,6 +14,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from app.db import crud
 from app.models.task_dependencies import TaskDependency
 from app.models.tasks import Task
+from app.services.board_versions import bump_board_version
 
 DONE_STATUS: Final[str] = "done"
 _RUNTIME_TYPE_REFERENCES = (UUID, AsyncSession, Mapping, Sequence)
@@ -214,6 +215,7 @@ async def replace_task_dependencies(
         col(TaskDependency.task_id) == task_id,
         commit=False,
     )
+    bump_board_version(session, board_id, [("task", task_id)])
     for dep_id in normalized:
         session.add(
             TaskDependency(
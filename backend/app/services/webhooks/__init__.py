@@ -8,6 +8,7 @@ from app.services.webhooks.queue import (
     QueuedInboundDelivery,
     dequeue_webhook_delivery,
     enqueue_webhook_delivery,
+    enqueue_webhook_delivery_async,
     requeue_if_failed,
 )
 
@@ -15,6 +16,7 @@ __all__ = [
     "QueuedInboundDelivery",
     "dequeue_webhook_delivery",
     "enqueue_webhook_delivery",
+    "enqueue_webhook_delivery_async",
     "requeue_if_failed",
     "run_flush_webhook_delivery_queue",
 ]
@@ -5,8 +5,11 @@ from __future__ import annotations
 import asyncio
 import random
 import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
 from uuid import UUID
 
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import settings
@@ -172,6 +175,195 @@ async def _process_single_item(item: QueuedInboundDelivery) -> None:
         await session.commit()
 
 
+# Digest messages include full previews for at most this many payloads, each cut
+# to this many characters; the remaining payloads are listed by id only.
+_DIGEST_MAX_PREVIEWS = 20
+_DIGEST_PREVIEW_CHARS = 1000
+
+
+@dataclass(frozen=True)
+class _WebhookDelivery:
+    task: QueuedTask
+    board: Board
+    webhook: BoardWebhook
+    payload: BoardWebhookPayload
+
+
+def _truncate_preview(preview: str) -> str:
+    if len(preview) <= _DIGEST_PREVIEW_CHARS:
+        return preview
+    return f"{preview[:_DIGEST_PREVIEW_CHARS]}\n... (truncated)"
+
+
+def _webhook_digest_message(*, board: Board, deliveries: list[_WebhookDelivery]) -> str:
+    if len(deliveries) == 1:
+        only = deliveries[0]
+        return _webhook_message(board=board, webhook=only.webhook, payload=only.payload)
+    lines = [
+        f"WEBHOOK EVENTS RECEIVED ({len(deliveries)})",
+        f"Board: {board.name}",
+        "",
+        "Take action:",
+        "1) Triage each payload against its webhook instruction.",
+        "2) Create/update tasks as needed.",
+        "3) Reference the payload ID in task descriptions.",
+    ]
+    by_webhook: dict[UUID, list[_WebhookDelivery]] = defaultdict(list)
+    for delivery in deliveries:
+        by_webhook[delivery.webhook.id].append(delivery)
+    previews_left = _DIGEST_MAX_PREVIEWS
+    for webhook_deliveries in by_webhook.values():
+        webhook = webhook_deliveries[0].webhook
+        lines.extend(["", f"Webhook ID: {webhook.id}", f"Instruction: {webhook.description}"])
+        for delivery in webhook_deliveries:
+            payload = delivery.payload
+            lines.append(f"- Payload ID: {payload.id} (received {payload.received_at.isoformat()})")
+            if previews_left > 0:
+                previews_left -= 1
+                lines.append(_truncate_preview(_build_payload_preview(payload.payload)))
+    if previews_left <= 0 and len(deliveries) > _DIGEST_MAX_PREVIEWS:
+        lines.extend(
+            ["", f"Previews omitted for {len(deliveries) - _DIGEST_MAX_PREVIEWS} payloads."]
+        )
+    lines.extend(
+        [
+            "",
+            "To inspect board memory entries:",
+            f"GET /api/v1/agent/boards/{board.id}/memory?is_chat=false",
+        ],
+    )
+    return "\n".join(lines)
+
+
+async def _load_webhook_deliveries(
+    session: AsyncSession,
+    tasks: list[QueuedTask],
+) -> list[_WebhookDelivery]:
+    """Load payload, board and webhook rows for a batch with one `IN` query each."""
+    items = [(task, decode_webhook_task(task)) for task in tasks]
+    payload_ids = {item.payload_id for _, item in items}
+    board_ids = {item.board_id for _, item in items}
+    webhook_ids = {item.webhook_id for _, item in items}
+    payloads = {
+        row.id: row
+        for row in await session.exec(
+            select(BoardWebhookPayload).where(col(BoardWebhookPayload.id).in_(payload_ids)),
+        )
+    }
+    boards = {
+        row.id: row for row in await session.exec(select(Board).where(col(Board.id).in_(board_ids)))
+    }
+    webhooks = {
+        row.id: row
+        for row in await session.exec(
+            select(BoardWebhook).where(col(BoardWebhook.id).in_(webhook_ids)),
+        )
+    }
+    deliveries: list[_WebhookDelivery] = []
+    for task, item in items:
+        payload = payloads.get(item.payload_id)
+        board = boards.get(item.board_id)
+        webhook = webhooks.get(item.webhook_id)
+        extra = {
+            "payload_id": str(item.payload_id),
+            "webhook_id": str(item.webhook_id),
+            "board_id": str(item.board_id),
+        }
+        if payload is None or board is None or webhook is None:
+            logger.warning("webhook.queue.batch_rows_missing", extra=extra)
+            continue
+        if (
+            payload.board_id != item.board_id
+            or payload.webhook_id != item.webhook_id
+            or webhook.board_id != item.board_id
+        ):
+            logger.warning("webhook.queue.batch_rows_mismatch", extra=extra)
+            continue
+        deliveries.append(
+            _WebhookDelivery(task=task, board=board, webhook=webhook, payload=payload)
+        )
+    return deliveries
+
+
+async def _resolve_target_agents(
+    session: AsyncSession,
+    deliveries: list[_WebhookDelivery],
+) -> dict[UUID, Agent | None]:
+    """Map payload id to its target agent: the webhook's agent, else the board lead."""
+    board_ids = {delivery.board.id for delivery in deliveries}
+    mapped_ids = {delivery.webhook.agent_id for delivery in deliveries if delivery.webhook.agent_id}
+    mapped: dict[UUID, Agent] = {}
+    if mapped_ids:
+        mapped = {
+            agent.id: agent
+            for agent in await session.exec(select(Agent).where(col(Agent.id).in_(mapped_ids)))
+        }
+    leads: dict[UUID, Agent] = {}
+    for agent in await session.exec(
+        select(Agent)
+        .where(col(Agent.board_id).in_(board_ids))
+        .where(col(Agent.is_board_lead).is_(True)),
+    ):
+        if agent.board_id is not None:
+            leads.setdefault(agent.board_id, agent)
+    targets: dict[UUID, Agent | None] = {}
+    for delivery in deliveries:
+        target = None
+        if delivery.webhook.agent_id is not None:
+            candidate = mapped.get(delivery.webhook.agent_id)
+            if candidate is not None and candidate.board_id == delivery.board.id:
+                target = candidate
+        targets[delivery.payload.id] = target or leads.get(delivery.board.id)
+    return targets
+
+
+async def process_webhook_queue_batch(tasks: list[QueuedTask]) -> list[QueuedTask]:
+    """Deliver a batch as one digest per (board, target agent); return tasks to retry."""
+    async with async_session_maker() as session:
+        deliveries = await _load_webhook_deliveries(session, tasks)
+        if not deliveries:
+            return []
+        targets = await _resolve_target_agents(session, deliveries)
+        groups: dict[tuple[UUID, UUID], list[_WebhookDelivery]] = defaultdict(list)
+        agents: dict[UUID, Agent] = {}
+        for delivery in deliveries:
+            agent = targets.get(delivery.payload.id)
+            if agent is None or not agent.openclaw_session_id:
+                continue
+            agents[agent.id] = agent
+            groups[(delivery.board.id, agent.id)].append(delivery)
+        if not groups:
+            return []
+
+        dispatch = GatewayDispatchService(session)
+        configs = await dispatch.optional_gateway_configs_for_boards(
+            {group[0].board.id: group[0].board for group in groups.values()}.values(),
+        )
+        failed: list[QueuedTask] = []
+        for (board_id, agent_id), group in groups.items():
+            config = configs.get(board_id)
+            if config is None:
+                continue
+            agent = agents[agent_id]
+            error = await dispatch.try_send_agent_message(
+                session_key=agent.openclaw_session_id or "",
+                config=config,
+                agent_name=agent.name,
+                message=_webhook_digest_message(board=group[0].board, deliveries=group),
+                deliver=False,
+            )
+            extra = {"board_id": str(board_id), "agent_id": str(agent_id), "count": len(group)}
+            if error is not None:
+                logger.warning(
+                    "webhook.dispatch.digest_failed", extra={**extra, "error": str(error)}
+                )
+                failed.extend(delivery.task for delivery in group)
+                continue
+            logger.info("webhook.dispatch.digest_sent", extra=extra)
+        await session.commit()
+    return failed
+
+
 def _compute_webhook_retry_delay(attempts: int) -> float:
     base = float(settings.rq_dispatch_retry_base_seconds) * (2 ** max(0, attempts))
     return float(min(base, float(settings.rq_dispatch_retry_max_seconds)))
@@ -189,9 +381,64 @@ async def process_webhook_queue_task(task: QueuedTask) -> None:
     await _process_single_item(item)
 
 
+class _BoardGatewayCache:
+    """Process-wide LRU of board -> gateway routes that expire after the TTL."""
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[UUID, tuple[float, UUID | None]] = OrderedDict()
+
+    def get(self, board_id: UUID) -> tuple[bool, UUID | None]:
+        entry = self._entries.get(board_id)
+        if entry is None:
+            return False, None
+        expires_at, gateway_id = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[board_id]
+            return False, None
+        self._entries.move_to_end(board_id)
+        return True, gateway_id
+
+    def set(self, board_id: UUID, gateway_id: UUID | None) -> None:
+        max_entries = settings.rq_dispatch_gateway_cache_size
+        if max_entries <= 0:
+            return
+        expires_at = time.monotonic() + settings.rq_dispatch_gateway_cache_ttl_seconds
+        self._entries[board_id] = (expires_at, gateway_id)
+        self._entries.move_to_end(board_id)
+        while len(self._entries) > max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_board_gateway_cache = _BoardGatewayCache()
+
+
+async def _gateway_id_for_board(board_id: UUID) -> UUID | None:
+    found, gateway_id = _board_gateway_cache.get(board_id)
+    if found:
+        return gateway_id
+    async with async_session_maker() as session:
+        board = await Board.objects.by_id(board_id).first(session)
+    gateway_id = board.gateway_id if board is not None else None
+    _board_gateway_cache.set(board_id, gateway_id)
+    return gateway_id
+
+
+async def webhook_rate_limit_key(task: QueuedTask) -> str | None:
+    """Token-bucket key for a webhook task, per `RQ_DISPATCH_RATE_SCOPE`."""
+    item = decode_webhook_task(task)
+    if settings.rq_dispatch_rate_scope == "gateway":
+        gateway_id = await _gateway_id_for_board(item.board_id)
+        if gateway_id is not None:
+            return f"gateway:{gateway_id}"
+    return f"board:{item.board_id}"
+
+
 def requeue_webhook_queue_task(task: QueuedTask, *, delay_seconds: float = 0) -> bool:
     payload = decode_webhook_task(task)
-    return requeue_if_failed(payload, delay_seconds=delay_seconds)
+    return requeue_if_failed(payload, delay_seconds=delay_seconds, history=task.history)
 
 
 async def flush_webhook_delivery_queue(*, block: bool = False, block_timeout: float = 0) -> int:
@@ -0,0 +1,43 @@
+"""Add indexed lookup digest for agent tokens.
+
+Revision ID: 3f9a1c7e2b4d
+Revises: e8f3a2b1c5d6
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3f9a1c7e2b4d"
+down_revision = "e8f3a2b1c5d6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add `agents.agent_token_lookup` with a unique index.
+
+    Existing rows keep a NULL lookup: plaintext tokens are not recoverable from
+    their PBKDF2 hashes, so the digest is backfilled lazily on the next
+    successful authentication or template sync (or by rotating the token).
+    """
+    op.add_column(
+        "agents",
+        sa.Column("agent_token_lookup", sa.String(), nullable=True),
+    )
+    op.create_index(
+        op.f("ix_agents_agent_token_lookup"),
+        "agents",
+        ["agent_token_lookup"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Drop the agent token lookup digest column."""
+    op.drop_index(op.f("ix_agents_agent_token_lookup"), table_name="agents")
+    op.drop_column("agents", "agent_token_lookup")
@@ -0,0 +1,31 @@
+"""Add a monotonically increasing change version to boards.
+
+Revision ID: b7e4d2a9c1f5
+Revises: 3f9a1c7e2b4d
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b7e4d2a9c1f5"
+down_revision = "3f9a1c7e2b4d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add `boards.version`, starting every existing board at 0."""
+    op.add_column(
+        "boards",
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the board change version column."""
+    op.drop_column("boards", "version")
@@ -0,0 +1,43 @@
+"""Add the board change log used by snapshot deltas.
+
+Revision ID: c3a8f1e6d2b7
+Revises: b7e4d2a9c1f5
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c3a8f1e6d2b7"
+down_revision = "b7e4d2a9c1f5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create `board_changes`, keyed by board, entity kind and entity id."""
+    op.create_table(
+        "board_changes",
+        sa.Column("board_id", sa.Uuid(), nullable=False),
+        sa.Column("kind", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("entity_id", sa.Uuid(), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("board_id", "kind", "entity_id"),
+    )
+    op.create_index(
+        "ix_board_changes_board_id_version",
+        "board_changes",
+        ["board_id", "version"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the board change log."""
+    op.drop_index("ix_board_changes_board_id_version", table_name="board_changes")
+    op.drop_table("board_changes")
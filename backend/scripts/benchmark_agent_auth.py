@@ -0,0 +1,130 @@
+"""Benchmark agent-token authentication latency as the agent count grows.
+
+Seeds an in-memory SQLite database with N agents and times
+`agent_auth._find_agent_for_token` for a valid token. With the indexed lookup
+digest the latency should stay flat (one query + one PBKDF2 verify); pass
+`--legacy` to time the pre-digest linear scan for comparison.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from uuid import uuid4
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark agent token authentication.")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1000],
+        help="Agent counts to benchmark (default: 10 100 1000)",
+    )
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=5,
+        help="Authentications timed per size (default: 5)",
+    )
+    parser.add_argument(
+        "--legacy",
+        action="store_true",
+        help="Seed agents without lookup digests to time the legacy linear scan",
+    )
+    return parser.parse_args()
+
+
+async def _bench_size(size: int, *, rounds: int, legacy: bool) -> float:
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlmodel import SQLModel
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    from app.core import agent_auth
+    from app.core.agent_tokens import agent_token_lookup, generate_agent_token, hash_agent_token
+    from app.models.agents import Agent
+    from app.models.gateways import Gateway
+    from app.models.organizations import Organization
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    # Decoys share one full-strength hash so seeding stays fast; only the lookup
+    # digest has to be unique per row.
+    decoy_hash = hash_agent_token(generate_agent_token())
+    target_token = generate_agent_token()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org_id = uuid4()
+            gateway_id = uuid4()
+            session.add(Organization(id=org_id, name="bench"))
+            session.add(
+                Gateway(
+                    id=gateway_id,
+                    organization_id=org_id,
+                    name="bench",
+                    url="https://gateway.local",
+                    workspace_root="/tmp/workspace",
+                ),
+            )
+            for i in range(size - 1):
+                session.add(
+                    Agent(
+                        name=f"agent-{i}",
+                        gateway_id=gateway_id,
+                        agent_token_hash=decoy_hash,
+                        agent_token_lookup=None if legacy else agent_token_lookup(f"decoy-{i}"),
+                    ),
+                )
+            target = Agent(
+                name="target",
+                gateway_id=gateway_id,
+                agent_token_hash=hash_agent_token(target_token),
+                agent_token_lookup=None if legacy else agent_token_lookup(target_token),
+            )
+            session.add(target)
+            await session.commit()
+
+            elapsed = 0.0
+            for _ in range(rounds):
+                if legacy:
+                    # Successful legacy lookups backfill the digest; clear it so
+                    # every round measures the scan.
+                    target.agent_token_lookup = None
+                    session.add(target)
+                    await session.commit()
+                started = time.perf_counter()
+                found = await agent_auth._find_agent_for_token(session, target_token)
+                elapsed += time.perf_counter() - started
+                if found is None:
+                    message = "benchmark token did not authenticate"
+                    raise RuntimeError(message)
+            return elapsed / rounds
+    finally:
+        await engine.dispose()
+
+
+async def _run() -> int:
+    args = _parse_args()
+    mode = "legacy-scan" if args.legacy else "indexed"
+    for size in args.sizes:
+        mean = await _bench_size(size, rounds=args.rounds, legacy=args.legacy)
+        sys.stdout.write(f"mode={mode} agents={size} mean_auth_ms={mean * 1000:.2f}\n")
+    return 0
+
+
+def main() -> None:
+    """Run the async benchmark and exit with its return code."""
+    raise SystemExit(asyncio.run(_run()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""Benchmark board snapshot latency on a large board.
+
+Seeds a board with N tasks (plus tags, dependencies, approvals and chat) and times
+`build_board_snapshot` for the whole board, for a task window, and with the
+independent reads forced onto one session. The default in-memory SQLite database
+always reads sequentially; pass `--database-url` pointing at a scratch Postgres
+database to measure the concurrent reads. Seeded rows are left in place.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    from app.models.boards import Board
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark board snapshot assembly.")
+    parser.add_argument(
+        "--tasks",
+        type=int,
+        default=5000,
+        help="Tasks seeded on the board (default: 5000)",
+    )
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=5,
+        help="Snapshots timed per scenario (default: 5)",
+    )
+    parser.add_argument(
+        "--window",
+        type=int,
+        default=200,
+        help="task_limit used by the windowed scenario (default: 200)",
+    )
+    parser.add_argument(
+        "--database-url",
+        default="sqlite+aiosqlite:///:memory:",
+        help="Async SQLAlchemy URL to seed and query (default: in-memory SQLite)",
+    )
+    return parser.parse_args()
+
+
+async def _seed(engine: AsyncEngine, task_count: int) -> Board:
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    from app.core.time import utcnow
+    from app.models.agents import Agent
+    from app.models.approval_task_links import ApprovalTaskLink
+    from app.models.approvals import Approval
+    from app.models.board_memory import BoardMemory
+    from app.models.boards import Board
+    from app.models.gateways import Gateway
+    from app.models.organizations import Organization
+    from app.models.tag_assignments import TagAssignment
+    from app.models.tags import Tag
+    from app.models.task_dependencies import TaskDependency
+    from app.models.tasks import Task
+
+    statuses = ("inbox", "in_progress", "review", "done")
+    org = Organization(name=f"bench-{uuid4().hex[:8]}")
+    gateway = Gateway(
+        organization_id=org.id,
+        name="bench",
+        url="https://gateway.local",
+        workspace_root="/tmp/workspace",
+    )
+    board = Board(organization_id=org.id, name="bench", slug="bench", gateway_id=gateway.id)
+    agents = [Agent(name=f"agent-{i}", board_id=board.id, gateway_id=gateway.id) for i in range(20)]
+    tags = [Tag(organization_id=org.id, name=f"tag-{i}", slug=f"tag-{i}") for i in range(10)]
+    started = utcnow() - timedelta(days=30)
+    tasks = [
+        Task(
+            board_id=board.id,
+            title=f"task-{i}",
+            status=statuses[i % len(statuses)],
+            assigned_agent_id=agents[i % len(agents)].id,
+            created_at=started + timedelta(seconds=i),
+        )
+        for i in range(task_count)
+    ]
+    approvals = [
+        Approval(board_id=board.id, action_type="bench", confidence=80, status="pending")
+        for _ in range(300)
+    ]
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add_all([org, gateway, board])
+        await session.flush()
+        session.add_all([*agents, *tags, *tasks, *approvals])
+        await session.flush()
+        for i, task in enumerate(tasks):
+            session.add(TagAssignment(task_id=task.id, tag_id=tags[i % len(tags)].id))
+            if i:
+                session.add(
+                    TaskDependency(
+                        board_id=board.id,
+                        task_id=task.id,
+                        depends_on_task_id=tasks[i - 1].id,
+                    ),
+                )
+        for i, approval in enumerate(approvals):
+            session.add(ApprovalTaskLink(approval_id=approval.id, task_id=tasks[i * 7].id))
+        for i in range(300):
+            session.add(BoardMemory(board_id=board.id, content=f"message {i}", is_chat=True))
+        await session.commit()
+    return board
+
+
+async def _time(
+    engine: AsyncEngine,
+    board: Board,
+    *,
+    rounds: int,
+    task_limit: int | None = None,
+) -> float:
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    from app.services.board_snapshot import build_board_snapshot
+
+    elapsed = 0.0
+    for _ in range(rounds):
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            started = time.perf_counter()
+            await build_board_snapshot(session, board, task_limit=task_limit)
+            elapsed += time.perf_counter() - started
+    return elapsed / rounds
+
+
+async def _run() -> int:
+    args = _parse_args()
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlmodel import SQLModel
+
+    from app.core.config import settings
+    from app.db.session import _normalize_database_url
+
+    engine = create_async_engine(_normalize_database_url(args.database_url))
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    try:
+        board = await _seed(engine, args.tasks)
+        concurrency = settings.board_snapshot_read_concurrency
+        try:
+            scenarios = {
+                "full": await _time(engine, board, rounds=args.rounds),
+                f"window={args.window}": await _time(
+                    engine,
+                    board,
+                    rounds=args.rounds,
+                    task_limit=args.window,
+                ),
+            }
+            settings.board_snapshot_read_concurrency = 1
+            scenarios["full-sequential"] = await _time(engine, board, rounds=args.rounds)
+        finally:
+            settings.board_snapshot_read_concurrency = concurrency
+    finally:
+        await engine.dispose()
+    for name, mean in scenarios.items():
+        sys.stdout.write(
+            f"dialect={engine.dialect.name} tasks={args.tasks} scenario={name} "
+            f"mean_snapshot_ms={mean * 1000:.1f}\n",
+        )
+    return 0
+
+
+def main() -> None:
+    """Run the async benchmark and exit with its return code."""
+    raise SystemExit(asyncio.run(_run()))
+
+
+if __name__ == "__main__":
+    main()
@@ -62,6 +62,17 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="Overwrite editable files (e.g. USER.md, MEMORY.md) during update sync",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Board agents synced at once (default: GATEWAY_TEMPLATE_SYNC_CONCURRENCY)",
+    )
+    parser.add_argument(
+        "--enqueue",
+        action="store_true",
+        help="Queue the sync for the background worker and print the job id",
+    )
     return parser.parse_args()
 
 
@@ -73,6 +84,8 @@ async def _run() -> int:
         GatewayTemplateSyncOptions,
         OpenClawProvisioningService,
     )
+    from app.services.openclaw.session_service import GatewayTemplateSyncQuery
+    from app.services.openclaw.template_sync_jobs import create_template_sync_job
 
     args = _parse_args()
     gateway_id = UUID(args.gateway_id)
@@ -89,6 +102,23 @@ async def _run() -> int:
             message = f"User not found: {user_id}"
             raise SystemExit(message)
 
+        if args.enqueue:
+            job = await create_template_sync_job(
+                gateway=gateway,
+                query=GatewayTemplateSyncQuery(
+                    include_main=bool(args.include_main),
+                    lead_only=bool(args.lead_only),
+                    reset_sessions=bool(args.reset_sessions),
+                    rotate_tokens=bool(args.rotate_tokens),
+                    force_bootstrap=bool(args.force_bootstrap),
+                    overwrite=bool(args.overwrite),
+                    board_id=board_id,
+                ),
+                user=template_user,
+            )
+            sys.stdout.write(f"job_id={job.id} status={job.status}\n")
+            return 1 if job.status == "failed" else 0
+
         result = await OpenClawProvisioningService(session).sync_gateway_templates(
             gateway,
             GatewayTemplateSyncOptions(
@@ -100,6 +130,7 @@ async def _run() -> int:
                 force_bootstrap=bool(args.force_bootstrap),
                 overwrite=bool(args.overwrite),
                 board_id=board_id,
+                concurrency=args.concurrency,
             ),
         )
 
@@ -13,3 +13,7 @@ if str(ROOT) not in sys.path:
 # defaults during import-time settings initialization, regardless of shell env.
 os.environ["AUTH_MODE"] = "local"
 os.environ["LOCAL_AUTH_TOKEN"] = "test-local-token-0123456789-0123456789-0123456789x"
+# Gateway calls are faked per test; cached gateway status must not leak between them.
+os.environ["GATEWAY_STATUS_CACHE_TTL_SECONDS"] = "0"
+# Likewise, fake gateways failing in one test must not trip the breaker for the next.
+os.environ["GATEWAY_CIRCUIT_FAILURE_THRESHOLD"] = "0"
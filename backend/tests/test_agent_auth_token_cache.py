@@ -0,0 +1,159 @@
+# ruff: noqa: INP001
+"""Tests for the verified agent-token cache used by agent authentication."""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core import agent_auth, agent_token_cache, agent_tokens
+from app.core.agent_token_cache import VerifiedAgentTokenCache, verified_agent_tokens
+from app.models.agents import Agent
+from app.models.gateways import Gateway
+from app.models.organizations import Organization
+from app.services.openclaw.db_agent_state import mint_agent_token
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed_agent(session: AsyncSession) -> tuple[Agent, str]:
+    org_id = uuid4()
+    gateway_id = uuid4()
+    session.add(Organization(id=org_id, name="org"))
+    session.add(
+        Gateway(
+            id=gateway_id,
+            organization_id=org_id,
+            name="gateway",
+            url="https://gateway.local",
+            workspace_root="/tmp/workspace",
+        ),
+    )
+    agent = Agent(name="agent", gateway_id=gateway_id)
+    token = mint_agent_token(agent)
+    session.add(agent)
+    await session.commit()
+    return agent, token
+
+
+@pytest.fixture
+def _verify_calls(monkeypatch: pytest.MonkeyPatch) -> dict[str, int]:
+    monkeypatch.setattr(agent_tokens, "ITERATIONS", 1)
+    verified_agent_tokens.clear()
+    calls = {"n": 0}
+    original = agent_auth.verify_agent_token
+
+    def _counting_verify(token: str, stored_hash: str) -> bool:
+        calls["n"] += 1
+        return original(token, stored_hash)
+
+    monkeypatch.setattr(agent_auth, "verify_agent_token", _counting_verify)
+    return calls
+
+
+def test_cache_evicts_least_recently_used_entry() -> None:
+    cache = VerifiedAgentTokenCache(max_size=2, ttl_seconds=60)
+    first, second, third = uuid4(), uuid4(), uuid4()
+    cache.put("a", first)
+    cache.put("b", second)
+    assert cache.get("a") == first
+
+    cache.put("c", third)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == first
+    assert cache.get("c") == third
+
+
+def test_cache_entries_expire_after_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = {"t": 100.0}
+    monkeypatch.setattr(agent_token_cache.time, "monotonic", lambda: now["t"])
+    cache = VerifiedAgentTokenCache(max_size=4, ttl_seconds=5)
+    agent_id = uuid4()
+    cache.put("a", agent_id)
+
+    now["t"] = 104.0
+    assert cache.get("a") == agent_id
+    now["t"] = 105.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_cache_invalidates_by_agent_id() -> None:
+    cache = VerifiedAgentTokenCache(max_size=4, ttl_seconds=60)
+    kept, dropped = uuid4(), uuid4()
+    cache.put("a", kept)
+    cache.put("b", dropped)
+
+    cache.invalidate_agents([dropped])
+
+    assert cache.get("a") == kept
+    assert cache.get("b") is None
+
+
+@pytest.mark.asyncio
+async def test_repeat_authentication_skips_pbkdf2(_verify_calls: dict[str, int]) -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            agent, token = await _seed_agent(session)
+
+            for _ in range(3):
+                found = await agent_auth._find_agent_for_token(session, token)
+                assert found is not None
+                assert found.id == agent.id
+
+            assert _verify_calls["n"] == 1
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_rotated_token_is_not_served_from_cache(_verify_calls: dict[str, int]) -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            agent, old_token = await _seed_agent(session)
+            assert await agent_auth._find_agent_for_token(session, old_token) is not None
+
+            new_token = mint_agent_token(agent)
+            session.add(agent)
+            await session.commit()
+
+            assert await agent_auth._find_agent_for_token(session, old_token) is None
+            found = await agent_auth._find_agent_for_token(session, new_token)
+            assert found is not None
+            assert found.id == agent.id
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_stale_cache_entry_is_rechecked_against_agent_row(
+    _verify_calls: dict[str, int],
+) -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            agent, token = await _seed_agent(session)
+            assert await agent_auth._find_agent_for_token(session, token) is not None
+
+            # Simulate a rotation performed by another process: the local cache
+            # still holds the old digest but the row no longer matches it.
+            agent.agent_token_lookup = agent_tokens.agent_token_lookup("rotated-elsewhere")
+            session.add(agent)
+            await session.commit()
+
+            assert await agent_auth._find_agent_for_token(session, token) is None
+            assert len(verified_agent_tokens) == 0
+    finally:
+        await engine.dispose()
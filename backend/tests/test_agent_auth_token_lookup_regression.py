@@ -1,56 +1,156 @@
 # ruff: noqa: INP001
-"""Regression test sketch for agent-token lookup complexity.
+"""Regression tests for agent-token lookup complexity.
 
-Context:
-- Current implementation performs PBKDF2 verification in a loop over *all* agents
-  that have a token hash (`agent_auth._find_agent_for_token`).
-- This is O(N_agents) *and* each verify is expensive (PBKDF2 200k iterations).
-
-This test is marked xfail to document the desired behavior after a hardening
-refactor: O(1) lookup + single hash verify.
-
-Once token lookup is refactored, flip this to a normal passing test.
+Agent tokens are located through the indexed `Agent.agent_token_lookup` digest, so
+authentication performs at most one PBKDF2 verification regardless of how many
+agents exist. Agents minted before the digest existed fall back to a legacy scan
+that backfills the digest on first successful use.
 """
 
 from __future__ import annotations
 
-from types import SimpleNamespace
+from uuid import uuid4
 
 import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.core import agent_auth
+from app.core import agent_auth, agent_tokens
+from app.core.agent_token_cache import verified_agent_tokens
+from app.core.config import settings
+from app.models.agents import Agent
+from app.models.gateways import Gateway
+from app.models.organizations import Organization
+from app.services.openclaw.db_agent_state import mint_agent_token
 
 
-@pytest.mark.asyncio
-@pytest.mark.xfail(
-    reason="Known DoS risk: agent token verification is currently O(N_agents)."
-    " Refactor token scheme/lookup to O(1) and make this pass.",
-    strict=False,
-)
-async def test_agent_token_lookup_should_not_verify_more_than_once(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    # Fake a session that returns many agents with token hashes.
-    class _FakeSession:
-        async def exec(self, _stmt: object) -> list[object]:
-            agents = []
-            for i in range(50):
-                agents.append(
-                    SimpleNamespace(agent_token_hash=f"pbkdf2_sha256$1$salt{i}$digest{i}")
-                )
-            return agents
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed_agents(
+    session: AsyncSession,
+    *,
+    count: int,
+    legacy: bool = False,
+) -> list[tuple[Agent, str]]:
+    org_id = uuid4()
+    gateway_id = uuid4()
+    session.add(Organization(id=org_id, name="org"))
+    session.add(
+        Gateway(
+            id=gateway_id,
+            organization_id=org_id,
+            name="gateway",
+            url="https://gateway.local",
+            workspace_root="/tmp/workspace",
+        ),
+    )
+    seeded: list[tuple[Agent, str]] = []
+    for i in range(count):
+        agent = Agent(name=f"agent-{i}", gateway_id=gateway_id)
+        token = mint_agent_token(agent)
+        if legacy:
+            agent.agent_token_lookup = None
+        session.add(agent)
+        seeded.append((agent, token))
+    await session.commit()
+    return seeded
+
 
+@pytest.fixture
+def _cheap_hashes(monkeypatch: pytest.MonkeyPatch) -> dict[str, int]:
+    monkeypatch.setattr(agent_tokens, "ITERATIONS", 1)
+    verified_agent_tokens.clear()
     calls = {"n": 0}
+    original = agent_auth.verify_agent_token
 
-    def _fake_verify(_token: str, _stored_hash: str) -> bool:
+    def _counting_verify(token: str, stored_hash: str) -> bool:
         calls["n"] += 1
-        # Always invalid
-        return False
+        return original(token, stored_hash)
+
+    monkeypatch.setattr(agent_auth, "verify_agent_token", _counting_verify)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_agent_token_lookup_verifies_once(_cheap_hashes: dict[str, int]) -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            seeded = await _seed_agents(session, count=50)
+            target, token = seeded[37]
+
+            found = await agent_auth._find_agent_for_token(session, token)
+
+            assert found is not None
+            assert found.id == target.id
+            assert _cheap_hashes["n"] == 1
+    finally:
+        await engine.dispose()
+
 
-    monkeypatch.setattr(agent_auth, "verify_agent_token", _fake_verify)
+@pytest.mark.asyncio
+async def test_agent_token_lookup_rejects_unknown_token_without_verifying(
+    _cheap_hashes: dict[str, int],
+) -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            await _seed_agents(session, count=50)
+
+            found = await agent_auth._find_agent_for_token(session, "invalid")
+
+            assert found is None
+            assert _cheap_hashes["n"] == 0
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_legacy_agent_token_is_backfilled_on_first_use(
+    _cheap_hashes: dict[str, int],
+) -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            seeded = await _seed_agents(session, count=5, legacy=True)
+            target, token = seeded[2]
+
+            found = await agent_auth._find_agent_for_token(session, token)
+            assert found is not None
+            assert found.id == target.id
+            assert found.agent_token_lookup == agent_tokens.agent_token_lookup(token)
+
+            verified_agent_tokens.clear()
+            _cheap_hashes["n"] = 0
+            again = await agent_auth._find_agent_for_token(session, token)
+            assert again is not None
+            assert again.id == target.id
+            assert _cheap_hashes["n"] == 1
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_legacy_agent_token_scan_can_be_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+    _cheap_hashes: dict[str, int],
+) -> None:
+    monkeypatch.setattr(settings, "agent_token_legacy_lookup", False)
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            seeded = await _seed_agents(session, count=5, legacy=True)
+            _target, token = seeded[0]
 
-    out = await agent_auth._find_agent_for_token(_FakeSession(), "invalid")  # type: ignore[arg-type]
-    assert out is None
+            found = await agent_auth._find_agent_for_token(session, token)
 
-    # Desired behavior after refactor: avoid linear scan.
-    assert calls["n"] <= 1
+            assert found is None
+            assert _cheap_hashes["n"] == 0
+    finally:
+        await engine.dispose()
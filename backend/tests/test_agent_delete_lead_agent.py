@@ -23,6 +23,10 @@ class _FakeSession:
     def add(self, _value: object) -> None:
         return None
 
+    async def exec(self, _statement: object) -> list[object]:
+        # Tasks assigned to the agent, whose boards get a version bump.
+        return []
+
     async def commit(self) -> None:
         self.committed += 1
 
@@ -78,6 +78,50 @@ def test_templates_root_points_to_repo_templates_dir():
     assert (root / "BOARD_AGENTS.md.j2").exists()
 
 
+def test_render_agent_files_reuses_environment_and_compiled_overrides(monkeypatch):
+    agent_provisioning.reload_templates()
+    environments = []
+    real_template_env = agent_provisioning._template_env
+
+    def _counting_template_env():
+        env = real_template_env()
+        environments.append(env)
+        return env
+
+    monkeypatch.setattr(agent_provisioning, "_template_env", _counting_template_env)
+    agents = [
+        _AgentStub(name=f"Agent {i}", identity_template="I am {{ agent_name }}.") for i in range(3)
+    ]
+
+    rendered = [
+        agent_provisioning._render_agent_files(
+            {"agent_name": agent.name},
+            agent,
+            {"IDENTITY.md"},
+            include_bootstrap=False,
+        )
+        for agent in agents
+    ]
+
+    assert [files["IDENTITY.md"] for files in rendered] == [
+        "I am Agent 0.",
+        "I am Agent 1.",
+        "I am Agent 2.",
+    ]
+    assert len(environments) == 1
+    assert len(agent_provisioning._templates._overrides) == 1
+
+    with pytest.raises(FileNotFoundError, match="Missing template file: NOPE.md.j2"):
+        agent_provisioning._render_agent_files(
+            {},
+            agents[0],
+            {"TOOLS.md"},
+            include_bootstrap=False,
+            template_overrides={"TOOLS.md": "NOPE.md.j2"},
+        )
+    agent_provisioning.reload_templates()
+
+
 def test_user_context_uses_email_fallback_when_name_is_missing():
     user = SimpleNamespace(
         name=None,
@@ -194,6 +238,9 @@ async def test_provision_overwrites_user_md_on_first_provision(monkeypatch):
     """Gateway may pre-create USER.md; we still want MC's template on first provision."""
 
     class _ControlPlaneStub:
+        # Bulk writes fall back to `set_agent_file`, as for any GatewayControlPlane.
+        set_agent_files = agent_provisioning.GatewayControlPlane.set_agent_files
+
         def __init__(self):
             self.writes: list[tuple[str, str]] = []
 
@@ -262,6 +309,9 @@ async def test_set_agent_files_update_preserves_user_md_even_when_size_zero():
     """Update should preserve editable files unless overwrite is explicitly requested."""
 
     class _ControlPlaneStub:
+        # Bulk writes fall back to `set_agent_file`, as for any GatewayControlPlane.
+        set_agent_files = agent_provisioning.GatewayControlPlane.set_agent_files
+
         def __init__(self):
             self.writes: list[tuple[str, str]] = []
 
@@ -326,6 +376,9 @@ async def test_set_agent_files_update_preserves_user_md_even_when_size_zero():
 @pytest.mark.asyncio
 async def test_set_agent_files_update_preserves_nonmissing_user_md():
     class _ControlPlaneStub:
+        # Bulk writes fall back to `set_agent_file`, as for any GatewayControlPlane.
+        set_agent_files = agent_provisioning.GatewayControlPlane.set_agent_files
+
         def __init__(self):
             self.writes: list[tuple[str, str]] = []
 
@@ -390,6 +443,9 @@ async def test_set_agent_files_update_preserves_nonmissing_user_md():
 @pytest.mark.asyncio
 async def test_set_agent_files_update_overwrite_writes_preserved_user_md():
     class _ControlPlaneStub:
+        # Bulk writes fall back to `set_agent_file`, as for any GatewayControlPlane.
+        set_agent_files = agent_provisioning.GatewayControlPlane.set_agent_files
+
         def __init__(self):
             self.writes: list[tuple[str, str]] = []
 
@@ -452,6 +508,159 @@ async def test_set_agent_files_update_overwrite_writes_preserved_user_md():
     assert ("USER.md", "filled") in cp.writes
 
 
+@pytest.mark.asyncio
+async def test_control_plane_set_agent_files_pipelines_writes(monkeypatch):
+    batches: list[list[tuple[str, dict[str, object] | None]]] = []
+
+    async def _fake_openclaw_call_many(requests, *, config=None):
+        _ = config
+        batches.append([(request.method, request.params) for request in requests])
+        return [
+            (
+                agent_provisioning.OpenClawGatewayError("unsupported file")
+                if request.params["name"] == "ODD.md"
+                else {"ok": True}
+            )
+            for request in requests
+        ]
+
+    monkeypatch.setattr(agent_provisioning, "openclaw_call_many", _fake_openclaw_call_many)
+    cp = agent_provisioning.OpenClawGatewayControlPlane(
+        agent_provisioning.GatewayClientConfig(url="ws://gateway.example/ws", token=None),
+    )
+
+    errors = await cp.set_agent_files(
+        agent_id="agent-x",
+        files={"AGENTS.md": "a", "ODD.md": "b", "TOOLS.md": "c"},
+    )
+
+    assert len(batches) == 1
+    assert [params["name"] for _, params in batches[0]] == ["AGENTS.md", "ODD.md", "TOOLS.md"]
+    assert {method for method, _ in batches[0]} == {"agents.files.set"}
+    assert list(errors) == ["ODD.md"]
+
+
+@pytest.mark.asyncio
+async def test_set_agent_files_sends_every_write_before_raising():
+    class _ControlPlaneStub:
+        def __init__(self):
+            self.batches: list[dict[str, str]] = []
+
+        async def set_agent_files(self, *, agent_id, files):
+            _ = agent_id
+            self.batches.append(dict(files))
+            return {
+                "AGENTS.md": agent_provisioning.OpenClawGatewayError("disk full"),
+                "ODD.md": agent_provisioning.OpenClawGatewayError("unsupported file"),
+            }
+
+    class _Manager(agent_provisioning.BaseAgentLifecycleManager):
+        def _agent_id(self, agent):
+            return "agent-x"
+
+        def _build_context(self, *, agent, auth_token, user, board):
+            return {}
+
+    cp = _ControlPlaneStub()
+    mgr = _Manager(SimpleNamespace(id=uuid4(), workspace_root="/tmp"), cp)  # type: ignore[arg-type]
+
+    with pytest.raises(agent_provisioning.OpenClawGatewayError, match="disk full"):
+        await mgr._set_agent_files(
+            agent_id="agent-x",
+            rendered={"AGENTS.md": "a", "ODD.md": "b", "TOOLS.md": "c", "EMPTY.md": ""},
+            existing_files={},
+            action="provision",
+        )
+    assert cp.batches == [{"AGENTS.md": "a", "ODD.md": "b", "TOOLS.md": "c"}]
+
+
+class _RecordingControlPlane:
+    def __init__(self):
+        self.batches: list[dict[str, str]] = []
+
+    async def set_agent_files(self, *, agent_id, files):
+        _ = agent_id
+        self.batches.append(dict(files))
+        return {}
+
+
+class _FilesManager(agent_provisioning.BaseAgentLifecycleManager):
+    def _agent_id(self, agent):
+        return "agent-x"
+
+    def _build_context(self, *, agent, auth_token, user, board):
+        return {}
+
+
+@pytest.mark.asyncio
+async def test_set_agent_files_skips_files_it_already_wrote():
+    cp = _RecordingControlPlane()
+    mgr = _FilesManager(SimpleNamespace(id=uuid4(), workspace_root="/tmp"), cp)  # type: ignore[arg-type]
+    rendered = {"AGENTS.md": "agents", "TOOLS.md": "tools"}
+
+    first = await mgr._set_agent_files(
+        agent_id="agent-x",
+        rendered=rendered,
+        existing_files={},
+        action="update",
+    )
+    listed = {name: {"name": name, "size": len(content)} for name, content in rendered.items()}
+    second = await mgr._set_agent_files(
+        agent_id="agent-x",
+        rendered={**rendered, "TOOLS.md": "tools v2"},
+        existing_files=listed,
+        action="update",
+    )
+
+    assert first == agent_provisioning.AgentFileSyncReport(written=("AGENTS.md", "TOOLS.md"))
+    assert second == agent_provisioning.AgentFileSyncReport(
+        written=("TOOLS.md",),
+        skipped=("AGENTS.md",),
+    )
+    assert cp.batches[1] == {"TOOLS.md": "tools v2"}
+
+
+@pytest.mark.asyncio
+async def test_set_agent_files_trusts_gateway_hashes_and_sizes():
+    cp = _RecordingControlPlane()
+    mgr = _FilesManager(SimpleNamespace(id=uuid4(), workspace_root="/tmp"), cp)  # type: ignore[arg-type]
+    rendered = {"AGENTS.md": "agents", "TOOLS.md": "tools"}
+    await mgr._set_agent_files(
+        agent_id="agent-x",
+        rendered=rendered,
+        existing_files={},
+        action="update",
+    )
+
+    report = await mgr._set_agent_files(
+        agent_id="agent-x",
+        rendered=rendered,
+        existing_files={
+            # Edited on the gateway since we wrote it: the size no longer matches.
+            "AGENTS.md": {"name": "AGENTS.md", "size": 99},
+            # Unknown to this process, but the gateway reports the same content hash.
+            "TOOLS.md": {
+                "name": "TOOLS.md",
+                "sha256": agent_provisioning._content_sha256("tools"),
+            },
+        },
+        action="update",
+    )
+    forced = await mgr._set_agent_files(
+        agent_id="agent-x",
+        rendered=rendered,
+        existing_files={name: {"name": name} for name in rendered},
+        action="update",
+        overwrite=True,
+    )
+
+    assert report == agent_provisioning.AgentFileSyncReport(
+        written=("AGENTS.md",),
+        skipped=("TOOLS.md",),
+    )
+    assert forced.written == ("AGENTS.md", "TOOLS.md")
+
+
 @pytest.mark.asyncio
 async def test_control_plane_upsert_agent_create_then_update(monkeypatch):
     calls: list[tuple[str, dict[str, object] | None]] = []
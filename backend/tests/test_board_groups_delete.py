@@ -8,6 +8,7 @@ from typing import Any
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import Select
 
 from app.api import board_groups
 from app.models.organization_members import OrganizationMember
@@ -20,8 +21,12 @@ class _FakeSession:
     executed: list[object] = field(default_factory=list)
     committed: int = 0
 
-    async def exec(self, statement: object) -> None:
+    async def exec(self, statement: object) -> list[object]:
+        if isinstance(statement, Select):
+            # Boards in the group whose version gets bumped; none here.
+            return []
         self.executed.append(statement)
+        return []
 
     async def execute(self, statement: object) -> None:
         self.executed.append(statement)
@@ -129,7 +129,7 @@ async def test_ingest_board_webhook_stores_payload_and_enqueues_for_lead_dispatc
     async with session_maker() as session:
         board, webhook = await _seed_webhook(session, enabled=True)
 
-    def _fake_enqueue(payload: QueuedInboundDelivery) -> bool:
+    async def _fake_enqueue(payload: QueuedInboundDelivery) -> bool:
         enqueued.append(
             {
                 "board_id": str(payload.board_id),
@@ -161,7 +161,7 @@ async def test_ingest_board_webhook_stores_payload_and_enqueues_for_lead_dispatc
 
     monkeypatch.setattr(
         board_webhooks,
-        "enqueue_webhook_delivery",
+        "enqueue_webhook_delivery_async",
         _fake_enqueue,
     )
     monkeypatch.setattr(
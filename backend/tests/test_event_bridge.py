@@ -0,0 +1,240 @@
+# ruff: noqa: INP001
+"""Tests for the cross-replica event hub bridge."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Callable
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.board_memory import BoardMemory
+from app.models.boards import Board
+from app.models.gateways import Gateway
+from app.models.organizations import Organization
+from app.services import event_bridge, queue_worker
+from app.services.event_bridge import (
+    EventBridge,
+    PostgresEventBridge,
+    RedisEventBridge,
+    decode_topics,
+    encode_topics,
+)
+from app.services.event_hub import board_topic, event_hub
+
+
+class _RecordingBridge(EventBridge):
+    def __init__(self) -> None:
+        super().__init__()
+        self.flushed: list[set[str]] = []
+        self.committed: list[set[str]] = []
+
+    def on_flush(self, session: object, topics: set[str]) -> None:
+        self.flushed.append(set(topics))
+
+    def on_commit(self, topics: set[str]) -> None:
+        self.committed.append(set(topics))
+
+    async def listen(self, handler: Callable[[set[str]], None]) -> None:
+        await asyncio.Event().wait()
+
+
+def test_encode_topics_splits_payloads_under_notify_limit() -> None:
+    topics = {f"board:{uuid4()}:tasks" for _ in range(500)}
+
+    payloads = list(encode_topics("origin", topics))
+
+    assert len(payloads) > 1
+    assert all(len(payload.encode("utf-8")) < 8000 for payload in payloads)
+    decoded: set[str] = set()
+    for payload in payloads:
+        decoded |= decode_topics(payload, origin="other")
+    assert decoded == topics
+
+
+def test_decode_topics_skips_own_origin_and_garbage() -> None:
+    payload = json.dumps({"origin": "me", "topics": ["board:x:tasks"]})
+
+    assert decode_topics(payload, origin="me") == set()
+    assert decode_topics(payload.encode("utf-8"), origin="you") == {"board:x:tasks"}
+    assert decode_topics("not json", origin="you") == set()
+    assert decode_topics(json.dumps({"origin": "x", "topics": "nope"}), origin="you") == set()
+
+
+@pytest.mark.asyncio
+async def test_commit_forwards_topics_to_attached_bridge() -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    bridge = _RecordingBridge()
+    event_hub.bridge = bridge
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            org_id, gateway_id, board_id = uuid4(), uuid4(), uuid4()
+            session.add(Organization(id=org_id, name="org"))
+            session.add(
+                Gateway(
+                    id=gateway_id,
+                    organization_id=org_id,
+                    name="gateway",
+                    url="https://gateway.local",
+                    workspace_root="/tmp/workspace",
+                ),
+            )
+            session.add(
+                Board(
+                    id=board_id,
+                    organization_id=org_id,
+                    name="board",
+                    slug="board",
+                    gateway_id=gateway_id,
+                ),
+            )
+            await session.commit()
+            bridge.flushed.clear()
+            bridge.committed.clear()
+
+            session.add(BoardMemory(board_id=board_id, content="hello"))
+            await session.commit()
+
+        expected = {board_topic(board_id, "memory")}
+        assert bridge.flushed == [expected]
+        assert bridge.committed == [expected]
+    finally:
+        event_hub.bridge = None
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_postgres_bridge_is_noop_on_other_dialects() -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        async with AsyncSession(engine) as session:
+            bridge = PostgresEventBridge("postgresql+psycopg://u:p@localhost/db")
+            await session.run_sync(lambda sync: bridge.on_flush(sync, {"board:x:tasks"}))
+        assert bridge.database_url == "postgresql://u:p@localhost/db"
+    finally:
+        await engine.dispose()
+
+
+def test_postgres_bridge_notifies_under_a_savepoint() -> None:
+    events: list[str] = []
+
+    class _Savepoint:
+        def __enter__(self) -> None:
+            events.append("savepoint")
+
+        def __exit__(self, exc_type: object, *_: object) -> None:
+            events.append("rollback" if exc_type else "release")
+
+    class _Connection:
+        dialect = SimpleNamespace(name="postgresql")
+
+        def begin_nested(self) -> _Savepoint:
+            return _Savepoint()
+
+        def execute(self, *_: object) -> None:
+            events.append("notify")
+            raise RuntimeError("payload string too long")
+
+    session = SimpleNamespace(connection=_Connection)
+    bridge = PostgresEventBridge("postgresql://u:p@localhost/db")
+
+    with pytest.raises(RuntimeError):
+        bridge.on_flush(session, {"board:x:tasks"})  # type: ignore[arg-type]
+
+    # Only the savepoint is rolled back, so the writer's transaction stays usable.
+    assert events == ["savepoint", "notify", "rollback"]
+
+
+@pytest.mark.asyncio
+async def test_run_reconnects_after_listener_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(event_bridge, "_RECONNECT_INITIAL_SECONDS", 0)
+    received: list[set[str]] = []
+    done = asyncio.Event()
+
+    class _FlakyBridge(EventBridge):
+        attempts = 0
+
+        async def listen(self, handler: Callable[[set[str]], None]) -> None:
+            self.attempts += 1
+            if self.attempts == 1:
+                raise ConnectionError("listener dropped")
+            handler({"board:x:tasks"})
+            done.set()
+            await asyncio.Event().wait()
+
+    bridge = _FlakyBridge()
+    task = asyncio.create_task(bridge.run(received.append))
+    await asyncio.wait_for(done.wait(), 1)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert bridge.attempts == 2
+    assert received == [{"board:x:tasks"}]
+
+
+@pytest.mark.asyncio
+async def test_redis_bridge_publishes_and_relays_remote_topics(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    published: list[tuple[str, str]] = []
+    remote = json.dumps({"origin": "remote", "topics": ["board:y:approvals"]})
+
+    class _FakePubSub:
+        async def subscribe(self, channel: str) -> None:
+            self.channel = channel
+
+        async def listen(self):  # type: ignore[no-untyped-def]
+            yield {"type": "message", "data": remote.encode("utf-8")}
+
+        async def aclose(self) -> None:
+            return None
+
+    class _FakeRedis:
+        async def publish(self, channel: str, payload: str) -> None:
+            published.append((channel, payload))
+
+        def pubsub(self, **_: object) -> _FakePubSub:
+            return _FakePubSub()
+
+        async def aclose(self) -> None:
+            return None
+
+    bridge = RedisEventBridge("redis://localhost:6379/0")
+    monkeypatch.setattr(bridge, "_client", lambda: _FakeRedis())
+    monkeypatch.setattr(event_bridge, "async_redis_client", lambda _url: _FakeRedis())
+
+    bridge.on_commit({"board:x:tasks"})
+    await asyncio.gather(*bridge._pending)
+    assert [channel for channel, _ in published] == [event_bridge.EVENT_CHANNEL]
+    assert decode_topics(published[0][1], origin="other") == {"board:x:tasks"}
+
+    received: list[set[str]] = []
+    await bridge.listen(received.append)
+    assert received == [{"board:y:approvals"}]
+
+
+@pytest.mark.asyncio
+async def test_worker_loop_attaches_publishing_bridge(monkeypatch: pytest.MonkeyPatch) -> None:
+    bridge = _RecordingBridge()
+    seen: list[EventBridge | None] = []
+    monkeypatch.setattr(event_bridge, "build_event_bridge", lambda: bridge)
+    monkeypatch.setattr(queue_worker.settings, "rq_reliable_delivery", False)
+
+    async def _consume(stop: asyncio.Event) -> None:
+        seen.append(event_hub.bridge)
+
+    monkeypatch.setattr(queue_worker, "_consume_until_stopped", _consume)
+
+    await queue_worker._run_worker_loop(asyncio.Event())
+
+    assert seen == [bridge]
+    assert event_hub.bridge is None
@@ -0,0 +1,166 @@
+# ruff: noqa: INP001
+"""Tests for the in-process SSE event hub and its commit hooks."""
+
+from __future__ import annotations
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.activity_events import ActivityEvent
+from app.models.board_memory import BoardMemory
+from app.models.boards import Board
+from app.models.gateways import Gateway
+from app.models.organizations import Organization
+from app.models.task_dependencies import TaskDependency
+from app.models.tasks import Task
+from app.services.event_hub import EventHub, board_topic, event_hub
+from app.services.task_dependencies import replace_task_dependencies
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed_board(session: AsyncSession) -> Board:
+    org_id = uuid4()
+    gateway_id = uuid4()
+    session.add(Organization(id=org_id, name="org"))
+    session.add(
+        Gateway(
+            id=gateway_id,
+            organization_id=org_id,
+            name="gateway",
+            url="https://gateway.local",
+            workspace_root="/tmp/workspace",
+        ),
+    )
+    board = Board(organization_id=org_id, name="board", slug="board", gateway_id=gateway_id)
+    session.add(board)
+    await session.commit()
+    return board
+
+
+class _FakeRequest:
+    def __init__(self) -> None:
+        self.disconnected = False
+
+    async def is_disconnected(self) -> bool:
+        return self.disconnected
+
+
+@pytest.mark.asyncio
+async def test_publish_wakes_only_matching_subscriptions() -> None:
+    hub = EventHub()
+    board_id = uuid4()
+    async with (
+        hub.subscribe([board_topic(board_id, "memory")]) as memory_sub,
+        hub.subscribe([board_topic(board_id, "approvals")]) as approvals_sub,
+    ):
+        # Subscriptions start signalled so streams run their catch-up query.
+        assert await memory_sub.wait(0)
+        assert await approvals_sub.wait(0)
+
+        hub.publish([board_topic(board_id, "memory")])
+
+        assert await memory_sub.wait(0.1)
+        assert not await approvals_sub.wait(0.01)
+    assert hub.subscriber_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_ready_returns_false_after_disconnect() -> None:
+    hub = EventHub()
+    request = _FakeRequest()
+    async with hub.subscribe([board_topic(uuid4(), "tasks")]) as subscription:
+        assert await subscription.ready(request)  # type: ignore[arg-type]
+        request.disconnected = True
+        assert not await subscription.ready(request)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_commit_publishes_board_memory_topic() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board_id = (await _seed_board(session)).id
+            topic = board_topic(board_id, "memory")
+            async with event_hub.subscribe([topic]) as subscription:
+                await subscription.wait(0)
+
+                session.add(BoardMemory(board_id=board_id, content="rolled back"))
+                await session.flush()
+                await session.rollback()
+                assert not await subscription.wait(0.01)
+
+                session.add(BoardMemory(board_id=board_id, content="hello"))
+                await session.commit()
+                assert await subscription.wait(0.1)
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_activity_event_resolves_board_from_task() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed_board(session)
+            task = Task(board_id=board.id, title="task")
+            session.add(task)
+            await session.commit()
+            task_id = task.id
+
+        # A fresh session has no Task in its identity map, forcing the lookup query.
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            topic = board_topic(board.id, "tasks")
+            async with event_hub.subscribe([topic]) as subscription:
+                await subscription.wait(0)
+                session.add(
+                    ActivityEvent(event_type="task.comment", message="hi", task_id=task_id),
+                )
+                await session.commit()
+                assert await asyncio.wait_for(subscription.wait(0.1), 1)
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_bulk_dependency_delete_publishes_board_tasks_topic() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board = await _seed_board(session)
+            task, dependency = Task(board_id=board.id, title="a"), Task(
+                board_id=board.id, title="b"
+            )
+            session.add_all([task, dependency])
+            await session.flush()
+            session.add(
+                TaskDependency(
+                    board_id=board.id, task_id=task.id, depends_on_task_id=dependency.id
+                ),
+            )
+            await session.commit()
+
+            topic = board_topic(board.id, "tasks")
+            async with event_hub.subscribe([topic]) as subscription:
+                await subscription.wait(0)
+                # Clearing every dependency is a bulk delete with nothing to flush.
+                await replace_task_dependencies(
+                    session,
+                    board_id=board.id,
+                    task_id=task.id,
+                    depends_on_task_ids=[],
+                )
+                await session.commit()
+                assert await subscription.wait(0.1)
+    finally:
+        await engine.dispose()
@@ -0,0 +1,163 @@
+# ruff: noqa: INP001
+"""Per-gateway circuit breaker in the gateway RPC client."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+import app.services.openclaw.gateway_rpc as gateway_rpc
+import app.services.openclaw.session_service as session_service
+from app.schemas.gateway_api import GatewayResolveQuery
+from app.services.openclaw.gateway_rpc import (
+    GatewayCircuitOpenError,
+    GatewayConfig,
+    OpenClawGatewayError,
+)
+from app.services.openclaw.gateway_status_cache import GatewayStatusSnapshot
+from app.services.openclaw.internal.retry import GatewayBackoff
+from app.services.openclaw.session_service import GatewaySessionService
+
+_CONFIG = GatewayConfig(url="ws://down.example/ws")
+
+
+@pytest.fixture(autouse=True)
+def _breaker_settings(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setattr(gateway_rpc.settings, "gateway_rpc_pool_enabled", False)
+    monkeypatch.setattr(gateway_rpc.settings, "gateway_circuit_failure_threshold", 3)
+    monkeypatch.setattr(gateway_rpc.settings, "gateway_circuit_reset_seconds", 0.05)
+    gateway_rpc._circuits.clear()
+    yield
+    gateway_rpc._circuits.clear()
+
+
+class _FakeGateway:
+    """Stands in for `_call_once`: fails at the transport level while `down`."""
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        self.down = True
+        self.calls = 0
+        monkeypatch.setattr(gateway_rpc, "_call_once", self._call_once)
+
+    async def _call_once(self, method: str, params: Any, config: GatewayConfig) -> object:
+        _ = (params, config)
+        self.calls += 1
+        if self.down:
+            raise ConnectionRefusedError("[Errno 111] Connection refused")
+        if method == "agents.missing":
+            raise OpenClawGatewayError("unknown agent")
+        return {"ok": True}
+
+
+async def _fail(method: str = "health") -> None:
+    with pytest.raises(OpenClawGatewayError):
+        await gateway_rpc.openclaw_call(method, config=_CONFIG)
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_after_consecutive_failures_and_fails_fast(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    gateway = _FakeGateway(monkeypatch)
+    for _ in range(3):
+        await _fail()
+
+    with pytest.raises(GatewayCircuitOpenError, match="circuit open after 3"):
+        await gateway_rpc.openclaw_call("health", config=_CONFIG)
+    with pytest.raises(GatewayCircuitOpenError):
+        await gateway_rpc.openclaw_call_many(
+            [gateway_rpc.GatewayRequest("health")],
+            config=_CONFIG,
+        )
+
+    assert gateway.calls == 3
+    status = gateway_rpc.gateway_circuit_status(_CONFIG)
+    assert status.state == "open"
+    assert status.retry_in_seconds is not None and status.retry_in_seconds > 0
+    assert "Connection refused" in (status.last_error or "")
+
+
+@pytest.mark.asyncio
+async def test_half_open_probe_closes_or_reopens_the_circuit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    gateway = _FakeGateway(monkeypatch)
+    for _ in range(3):
+        await _fail()
+    await asyncio.sleep(0.06)
+    assert gateway_rpc.gateway_circuit_status(_CONFIG).state == "half_open"
+
+    # The probe still fails: the circuit opens again straight away.
+    await _fail()
+    assert gateway_rpc.gateway_circuit_status(_CONFIG).state == "open"
+
+    await asyncio.sleep(0.06)
+    gateway.down = False
+    assert await gateway_rpc.openclaw_call("health", config=_CONFIG) == {"ok": True}
+    assert gateway_rpc.gateway_circuit_status(_CONFIG).state == "closed"
+    assert gateway.calls == 5
+
+
+@pytest.mark.asyncio
+async def test_error_replies_from_a_reachable_gateway_reset_the_count(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    gateway = _FakeGateway(monkeypatch)
+    await _fail()
+    await _fail()
+    gateway.down = False
+    await _fail("agents.missing")
+    gateway.down = True
+    await _fail()
+    await _fail()
+
+    status = gateway_rpc.gateway_circuit_status(_CONFIG)
+    assert (status.state, status.consecutive_failures) == ("closed", 2)
+
+
+@pytest.mark.asyncio
+async def test_backoff_gives_up_immediately_on_an_open_circuit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    gateway = _FakeGateway(monkeypatch)
+    backoff = GatewayBackoff(timeout_s=60, base_delay_s=0.001, max_delay_s=0.001)
+
+    with pytest.raises(TimeoutError, match="circuit open"):
+        await asyncio.wait_for(
+            backoff.run(lambda: gateway_rpc.openclaw_call("health", config=_CONFIG)),
+            timeout=2,
+        )
+    assert gateway.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_gateway_status_reports_the_circuit(monkeypatch: pytest.MonkeyPatch) -> None:
+    gateway = _FakeGateway(monkeypatch)
+    for _ in range(3):
+        await _fail()
+
+    async def _fetch(config: GatewayConfig, main_session: str | None) -> GatewayStatusSnapshot:
+        _ = main_session
+        try:
+            await gateway_rpc.openclaw_call("sessions.list", config=config)
+        except OpenClawGatewayError as exc:
+            return GatewayStatusSnapshot(error=str(exc))
+        return GatewayStatusSnapshot(sessions=[])
+
+    monkeypatch.setattr(session_service, "fetch_gateway_status", _fetch)
+    service = GatewaySessionService(session=object())  # type: ignore[arg-type]
+    response = await service.get_status(
+        params=GatewayResolveQuery(gateway_url=_CONFIG.url),
+        organization_id=uuid4(),
+        user=None,
+    )
+
+    assert response.connected is False
+    assert response.circuit is not None
+    assert response.circuit.state == "open"
+    assert response.circuit.consecutive_failures == 3
+    assert gateway.calls == 3
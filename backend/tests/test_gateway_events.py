@@ -0,0 +1,126 @@
+# ruff: noqa: INP001
+"""Gateway event subscribers: session key mapping and batched presence writes."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Callable
+from datetime import timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import app.services.openclaw.gateway_events as gateway_events
+from app.core.time import utcnow
+from app.models.agents import Agent
+from app.models.boards import Board
+from app.models.gateways import Gateway
+from app.models.organizations import Organization
+from app.services.event_hub import board_topic, event_hub
+from app.services.openclaw.gateway_events import GatewayEventSubscriber, event_session_key
+from app.services.openclaw.gateway_rpc import GatewayConfig, GatewayEvent
+
+_CONFIG = GatewayConfig(url="ws://gateway.example/ws")
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed(engine: AsyncEngine, *agents: Agent) -> tuple[UUID, UUID]:
+    org_id, gateway_id = uuid4(), uuid4()
+    board = Board(organization_id=org_id, name="board", slug="board", gateway_id=gateway_id)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add(Organization(id=org_id, name="org"))
+        session.add(
+            Gateway(
+                id=gateway_id,
+                organization_id=org_id,
+                name="gateway",
+                url=_CONFIG.url,
+                workspace_root="/tmp/workspace",
+            ),
+        )
+        session.add(board)
+        for agent in agents:
+            agent.gateway_id = gateway_id
+            agent.board_id = board.id
+            session.add(agent)
+        await session.commit()
+    return gateway_id, board.id
+
+
+def _events(*events: GatewayEvent) -> Callable[[GatewayConfig], AsyncIterator[GatewayEvent]]:
+    async def _stream(config: GatewayConfig) -> AsyncIterator[GatewayEvent]:
+        _ = config
+        for event in events:
+            yield event
+
+    return _stream
+
+
+def test_event_session_key_maps_sub_sessions_to_the_main_session() -> None:
+    def key(payload: dict[str, object]) -> str | None:
+        return event_session_key(GatewayEvent(event="chat", payload=payload))
+
+    assert key({"sessionKey": "agent:mc-1:main"}) == "agent:mc-1:main"
+    assert key({"sessionKey": "agent:lead-2:subagent:abc"}) == "agent:lead-2:main"
+    assert key({"agentId": "mc-3"}) == "agent:mc-3:main"
+    assert key({"state": "delta"}) is None
+
+
+@pytest.mark.asyncio
+async def test_a_burst_of_events_becomes_one_presence_write(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = await _make_engine()
+    stale = utcnow() - timedelta(minutes=10)
+    chatty = Agent(name="chatty", status="offline", openclaw_session_id="agent:mc-a:main")
+    quiet = Agent(
+        name="quiet",
+        status="online",
+        openclaw_session_id="agent:mc-b:main",
+        last_seen_at=stale,
+    )
+    busy = Agent(name="busy", status="updating", openclaw_session_id="agent:mc-c:main")
+    gateway_id, board_id = await _seed(engine, chatty, quiet, busy)
+    monkeypatch.setattr(
+        gateway_events,
+        "async_session_maker",
+        lambda: AsyncSession(engine, expire_on_commit=False),
+    )
+    stream = _events(
+        *(
+            GatewayEvent(event="agent", payload={"sessionKey": "agent:mc-a:main", "seq": n})
+            for n in range(50)
+        ),
+        GatewayEvent(event="chat", payload={"sessionKey": "agent:mc-c:thread:1"}),
+        GatewayEvent(event="presence", payload={"sessionKey": "agent:mc-b:main"}),
+    )
+    subscriber = GatewayEventSubscriber(gateway_id, _CONFIG, stream=stream)
+
+    async with event_hub.subscribe([board_topic(board_id, "agents")]) as subscription:
+        assert await subscription.wait(0)
+        await subscriber.consume()
+        assert await subscriber.flush() == 2
+        assert await subscription.wait(0.1)
+
+    # Sightings inside the minimum interval of an online agent are not written.
+    subscriber.handle(GatewayEvent(event="heartbeat", payload={"sessionKey": "agent:mc-a:main"}))
+    assert await subscriber.flush() == 0
+    assert subscriber.events_seen == 53
+
+    async with AsyncSession(engine) as session:
+        rows = {agent.name: agent for agent in await Agent.objects.all().all(session)}
+    assert rows["chatty"].status == "online"
+    assert rows["chatty"].last_seen_at is not None
+    assert rows["busy"].status == "updating"
+    assert rows["busy"].last_seen_at is not None
+    # `presence` frames describe gateway clients, not agent sessions.
+    assert rows["quiet"].last_seen_at == stale
+    await engine.dispose()
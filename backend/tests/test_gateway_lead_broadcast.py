@@ -0,0 +1,186 @@
+# ruff: noqa: INP001
+"""Concurrent fan-out tests for gateway-main lead broadcasts."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import HTTPException, status
+
+import app.services.openclaw.coordination_service as coordination_lifecycle
+from app.schemas.gateway_coordination import GatewayLeadBroadcastRequest
+from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
+
+
+@dataclass
+class _FakeSession:
+    boards: list[Any]
+    committed: int = 0
+    added: list[object] = field(default_factory=list)
+
+    async def exec(self, _statement: object) -> list[Any]:
+        return self.boards
+
+    def add(self, value: object) -> None:
+        self.added.append(value)
+
+    async def commit(self) -> None:
+        self.committed += 1
+
+
+def _boards(count: int) -> list[SimpleNamespace]:
+    return [SimpleNamespace(id=uuid4(), name=f"Board {i}") for i in range(count)]
+
+
+def _install_fakes(
+    monkeypatch: pytest.MonkeyPatch,
+    *,
+    delays: dict[str, float],
+    missing_lead: set[UUID] | None = None,
+) -> dict[str, int]:
+    """Stub lead resolution and sends; sends sleep per-board and track concurrency."""
+    gauge = {"in_flight": 0, "peak": 0}
+    missing_lead = missing_lead or set()
+
+    async def _require_gateway_main_actor(
+        self: coordination_lifecycle.GatewayCoordinationService,
+        _actor: object,
+    ) -> tuple[object, GatewayClientConfig]:
+        _ = self
+        return SimpleNamespace(id=uuid4()), GatewayClientConfig(url="ws://gw", token=None)
+
+    async def _ensure_board_lead(
+        self: coordination_lifecycle.GatewayCoordinationService,
+        *,
+        board: Any,
+        **_kwargs: object,
+    ) -> tuple[object, bool]:
+        _ = self
+        if board.id in missing_lead:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail="Lead agent has no session key",
+            )
+        lead = SimpleNamespace(
+            id=uuid4(),
+            name=f"Lead {board.name}",
+            openclaw_session_id=f"agent:{board.name}",
+        )
+        return lead, False
+
+    async def _send_agent_message(self: object, *, agent_name: str, **_kwargs: object) -> None:
+        _ = self
+        gauge["in_flight"] += 1
+        gauge["peak"] = max(gauge["peak"], gauge["in_flight"])
+        try:
+            await asyncio.sleep(delays.get(agent_name, 0.01))
+        finally:
+            gauge["in_flight"] -= 1
+
+    monkeypatch.setattr(
+        coordination_lifecycle.GatewayCoordinationService,
+        "require_gateway_main_actor",
+        _require_gateway_main_actor,
+    )
+    monkeypatch.setattr(
+        coordination_lifecycle.GatewayCoordinationService,
+        "_ensure_board_lead",
+        _ensure_board_lead,
+    )
+    monkeypatch.setattr(
+        coordination_lifecycle.GatewayDispatchService,
+        "send_agent_message",
+        _send_agent_message,
+    )
+    return gauge
+
+
+def _payload() -> GatewayLeadBroadcastRequest:
+    return GatewayLeadBroadcastRequest(content="Incident: freeze deploys")
+
+
+@pytest.mark.asyncio
+async def test_broadcast_fans_out_concurrently_within_the_limit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(coordination_lifecycle.settings, "gateway_broadcast_concurrency", 25)
+    boards = _boards(50)
+    gauge = _install_fakes(monkeypatch, delays={"Lead Board 7": 0.2})
+    session = _FakeSession(boards=boards)
+    service = coordination_lifecycle.GatewayCoordinationService(session)  # type: ignore[arg-type]
+
+    started = time.perf_counter()
+    response = await service.broadcast_gateway_lead_message(
+        actor_agent=SimpleNamespace(id=uuid4(), name="Main"),  # type: ignore[arg-type]
+        payload=_payload(),
+    )
+    elapsed = time.perf_counter() - started
+
+    assert (response.sent, response.failed) == (50, 0)
+    assert [result.board_id for result in response.results] == [board.id for board in boards]
+    assert gauge["peak"] == 25
+    # Sequential sends would take ~0.69s; the fan-out is bound by the slowest board.
+    assert elapsed < 0.45
+    assert session.committed == 1
+
+
+@pytest.mark.asyncio
+async def test_broadcast_reports_slow_boards_and_lead_failures_per_board(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        coordination_lifecycle.settings,
+        "gateway_broadcast_board_timeout_seconds",
+        0.05,
+    )
+    slow, missing, ok = _boards(3)
+    _install_fakes(
+        monkeypatch,
+        delays={f"Lead {slow.name}": 5.0},
+        missing_lead={missing.id},
+    )
+    service = coordination_lifecycle.GatewayCoordinationService(
+        _FakeSession(boards=[slow, missing, ok]),  # type: ignore[arg-type]
+    )
+    plan = await service.prepare_gateway_lead_broadcast(
+        actor_agent=SimpleNamespace(id=uuid4(), name="Main"),  # type: ignore[arg-type]
+        payload=_payload(),
+    )
+
+    streamed = [result async for result in service.iter_gateway_lead_broadcast(plan)]
+
+    # Failures from lead resolution stream first, then sends in completion order.
+    assert [result.board_id for result in streamed] == [missing.id, ok.id, slow.id]
+    by_board = {result.board_id: result for result in streamed}
+    assert by_board[ok.id].ok
+    assert by_board[missing.id].error == "Lead agent has no session key"
+    assert by_board[slow.id].error == (
+        "Gateway lead broadcast dispatch failed: no response within 0.05s"
+    )
+
+
+@pytest.mark.asyncio
+async def test_closing_the_stream_cancels_pending_sends(monkeypatch: pytest.MonkeyPatch) -> None:
+    fast, slow = _boards(2)
+    gauge = _install_fakes(monkeypatch, delays={f"Lead {slow.name}": 5.0})
+    service = coordination_lifecycle.GatewayCoordinationService(
+        _FakeSession(boards=[fast, slow]),  # type: ignore[arg-type]
+    )
+    plan = await service.prepare_gateway_lead_broadcast(
+        actor_agent=SimpleNamespace(id=uuid4(), name="Main"),  # type: ignore[arg-type]
+        payload=_payload(),
+    )
+
+    stream = service.iter_gateway_lead_broadcast(plan)
+    first = await anext(stream)
+    await stream.aclose()
+    await asyncio.sleep(0)
+
+    assert first.board_id == fast.id
+    assert gauge["in_flight"] == 0
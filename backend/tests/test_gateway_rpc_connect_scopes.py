@@ -1,12 +1,28 @@
 from __future__ import annotations
 
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+import app.services.openclaw.gateway_rpc as gateway_rpc
 from app.services.openclaw.gateway_rpc import (
     GATEWAY_OPERATOR_SCOPES,
     GatewayConfig,
     _build_connect_params,
+    reload_device_keypair,
 )
 
 
+@pytest.fixture
+def key_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    monkeypatch.setattr(gateway_rpc, "_DEVICE_KEY_DIR", tmp_path)
+    reload_device_keypair()
+    yield tmp_path
+    reload_device_keypair()
+
+
 def test_build_connect_params_sets_explicit_operator_role_and_scopes() -> None:
     params = _build_connect_params(GatewayConfig(url="ws://gateway.example/ws"))
 
@@ -48,3 +64,64 @@ def test_build_connect_params_includes_both_password_and_token_when_provided() -
     assert params["auth"]["password"] == "secret-password"
     assert params["auth"]["token"] == "secret-token"
     assert params["scopes"] == list(GATEWAY_OPERATOR_SCOPES)
+
+
+def test_device_keypair_is_loaded_once_and_reloadable(
+    key_dir: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    loads = 0
+    load = gateway_rpc._load_or_create_device_keypair
+
+    def _counting_load() -> object:
+        nonlocal loads
+        loads += 1
+        return load()
+
+    monkeypatch.setattr(gateway_rpc, "_load_or_create_device_keypair", _counting_load)
+    config = GatewayConfig(url="ws://gateway.example/ws", token="secret-token")
+
+    first = _build_connect_params(config, nonce="a")
+    second = _build_connect_params(config, nonce="b")
+
+    assert loads == 1
+    assert first["device"]["id"] == second["device"]["id"]
+    assert first["device"]["signature"] != second["device"]["signature"]
+    assert (key_dir / "device.key").stat().st_mode & 0o777 == 0o600
+
+    (key_dir / "device.key").unlink()
+    reload_device_keypair()
+    third = _build_connect_params(config, nonce="c")
+
+    assert loads == 2
+    assert third["device"]["id"] != first["device"]["id"]
+
+
+def test_concurrent_first_use_creates_a_single_keypair(key_dir: Path) -> None:
+    barrier = threading.Barrier(8)
+    device_ids: list[str] = []
+
+    def _worker() -> None:
+        barrier.wait()
+        device_ids.append(gateway_rpc._get_or_create_device_keypair()[2])
+
+    threads = [threading.Thread(target=_worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(device_ids)) == 1
+    assert [path.name for path in key_dir.iterdir()] == ["device.key"]
+
+
+def test_connect_params_are_not_shared_between_calls(key_dir: Path) -> None:
+    config = GatewayConfig(url="ws://gateway.example/ws", password="secret-password")
+
+    params = _build_connect_params(config)
+    params["auth"]["password"] = "mutated"
+    params["scopes"].append("operator.extra")
+
+    again = _build_connect_params(config)
+    assert again["auth"] == {"password": "secret-password"}
+    assert again["scopes"] == list(GATEWAY_OPERATOR_SCOPES)
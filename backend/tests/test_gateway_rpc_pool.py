@@ -0,0 +1,183 @@
+# ruff: noqa: INP001
+"""Pooled gateway RPC connection tests against a local websocket server."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import pytest
+from websockets.asyncio.server import Server, ServerConnection, serve
+
+import app.services.openclaw.gateway_rpc as gateway_rpc
+from app.services.openclaw.gateway_rpc import (
+    GatewayConfig,
+    GatewayRequest,
+    OpenClawGatewayError,
+    close_gateway_connections,
+    gateway_pool_stats,
+    openclaw_call,
+    openclaw_call_many,
+)
+
+
+class _FakeGateway:
+    """Minimal gateway: challenge, connect handshake, then echo-style methods."""
+
+    def __init__(self) -> None:
+        self.connections = 0
+        self.connects = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.sockets: list[ServerConnection] = []
+        self.server: Server | None = None
+
+    @property
+    def config(self) -> GatewayConfig:
+        assert self.server is not None
+        port = next(iter(self.server.sockets)).getsockname()[1]
+        return GatewayConfig(url=f"ws://127.0.0.1:{port}")
+
+    async def handler(self, ws: ServerConnection) -> None:
+        self.connections += 1
+        self.sockets.append(ws)
+        await ws.send(
+            json.dumps({"type": "event", "event": "connect.challenge", "payload": {"nonce": "n"}}),
+        )
+        async for raw in ws:
+            request = json.loads(raw)
+            asyncio.create_task(self._respond(ws, request))
+
+    async def _respond(self, ws: ServerConnection, request: dict[str, Any]) -> None:
+        method, params = request["method"], request["params"]
+        response: dict[str, Any] = {"type": "res", "id": request["id"], "ok": True}
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        if method == "connect":
+            self.connects += 1
+        elif method == "sleep":
+            await asyncio.sleep(params["seconds"])
+            response["payload"] = params["seconds"]
+        elif method == "fail":
+            response.update(ok=False, error={"message": "nope"})
+        else:
+            response["payload"] = {"method": method}
+        self.in_flight -= 1
+        await ws.send(json.dumps({"type": "event", "event": "tick"}))
+        await ws.send(json.dumps(response))
+
+
+@asynccontextmanager
+async def _running_gateway() -> AsyncIterator[_FakeGateway]:
+    fake = _FakeGateway()
+    async with serve(fake.handler, "127.0.0.1", 0) as server:
+        fake.server = server
+        try:
+            yield fake
+        finally:
+            await close_gateway_connections()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_authenticated_socket() -> None:
+    async with _running_gateway() as gateway:
+        results = await asyncio.gather(
+            openclaw_call("sleep", {"seconds": 0.05}, config=gateway.config),
+            openclaw_call("sleep", {"seconds": 0.01}, config=gateway.config),
+            *(openclaw_call("status", config=gateway.config) for _ in range(10)),
+        )
+
+        assert results[:2] == [0.05, 0.01]
+        assert results[2:] == [{"method": "status"}] * 10
+        assert gateway.connections == 1
+        assert gateway.connects == 1
+        stats = gateway_pool_stats()
+        assert stats.handshakes == 1
+        assert stats.calls == 12
+        assert stats.in_flight == 0
+        assert stats.open_connections == 1
+
+
+@pytest.mark.asyncio
+async def test_gateway_errors_do_not_poison_the_connection() -> None:
+    async with _running_gateway() as gateway:
+        with pytest.raises(OpenClawGatewayError, match="nope"):
+            await openclaw_call("fail", config=gateway.config)
+
+        assert await openclaw_call("status", config=gateway.config) == {"method": "status"}
+        assert gateway.connections == 1
+
+
+@pytest.mark.asyncio
+async def test_dropped_connection_fails_pending_calls_and_reconnects() -> None:
+    async with _running_gateway() as gateway:
+        pending = asyncio.create_task(openclaw_call("sleep", {"seconds": 5}, config=gateway.config))
+        while not gateway.sockets:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        await gateway.sockets[0].close()
+
+        with pytest.raises(OpenClawGatewayError):
+            await pending
+        assert await openclaw_call("status", config=gateway.config) == {"method": "status"}
+        assert gateway.connections == 2
+        assert gateway_pool_stats().dropped == 1
+
+
+@pytest.mark.asyncio
+async def test_idle_connection_is_closed_and_reopened_on_demand(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async with _running_gateway() as gateway:
+        monkeypatch.setattr(gateway_rpc.settings, "gateway_rpc_idle_timeout_seconds", 0.05)
+        await openclaw_call("status", config=gateway.config)
+
+        for _ in range(50):
+            if gateway_pool_stats().idle_closes:
+                break
+            await asyncio.sleep(0.02)
+
+        stats = gateway_pool_stats()
+        assert stats.idle_closes == 1
+        assert stats.open_connections == 0
+        await openclaw_call("status", config=gateway.config)
+        assert gateway.connections == 2
+
+
+@pytest.mark.asyncio
+async def test_pool_can_be_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async with _running_gateway() as gateway:
+        monkeypatch.setattr(gateway_rpc.settings, "gateway_rpc_pool_enabled", False)
+
+        await openclaw_call("status", config=gateway.config)
+        await openclaw_call("status", config=gateway.config)
+
+        assert gateway.connections == 2
+        assert gateway_pool_stats().calls == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("pooled", [True, False])
+async def test_call_many_pipelines_requests_with_per_item_errors(
+    monkeypatch: pytest.MonkeyPatch,
+    pooled: bool,
+) -> None:
+    monkeypatch.setattr(gateway_rpc.settings, "gateway_rpc_pool_enabled", pooled)
+    monkeypatch.setattr(gateway_rpc.settings, "gateway_rpc_max_pipelined", 4)
+    requests = [GatewayRequest("sleep", {"seconds": (5 - i) / 100}) for i in range(5)]
+    requests.insert(4, GatewayRequest("fail"))
+    async with _running_gateway() as gateway:
+        results = await openclaw_call_many(requests, config=gateway.config)
+
+        assert gateway.connections == (1 if pooled else 2)
+        assert gateway.peak_in_flight == 4
+
+    assert results[:4] == [0.05, 0.04, 0.03, 0.02]
+    assert isinstance(results[4], OpenClawGatewayError)
+    assert str(results[4]) == "nope"
+    assert results[5] == 0.01
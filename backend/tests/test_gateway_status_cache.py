@@ -0,0 +1,195 @@
+# ruff: noqa: INP001
+"""Per-gateway status cache: TTL, single-flight refreshes and background polling."""
+
+from __future__ import annotations
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+import app.services.openclaw.gateway_status_cache as status_cache
+import app.services.openclaw.session_service as session_service
+from app.schemas.gateway_api import GatewayResolveQuery
+from app.services.openclaw.gateway_compat import GatewayVersionCheckResult
+from app.services.openclaw.gateway_rpc import GatewayConfig
+from app.services.openclaw.gateway_status_cache import GatewayStatusCache, GatewayStatusSnapshot
+from app.services.openclaw.session_service import GatewaySessionService
+
+_CONFIG = GatewayConfig(url="ws://gateway.example/ws")
+
+
+class _CountingFetch:
+    def __init__(self, *, delay: float = 0.0) -> None:
+        self.calls = 0
+        self.delay = delay
+
+    async def __call__(
+        self,
+        config: GatewayConfig,
+        main_session: str | None,
+    ) -> GatewayStatusSnapshot:
+        _ = (config, main_session)
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return GatewayStatusSnapshot(sessions=[{"key": f"call-{self.calls}"}])
+
+
+@pytest.mark.asyncio
+async def test_concurrent_readers_share_one_refresh(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(status_cache.settings, "gateway_status_cache_ttl_seconds", 30.0)
+    cache = GatewayStatusCache()
+    fetch = _CountingFetch(delay=0.02)
+
+    snapshots = await asyncio.gather(
+        *(cache.get((_CONFIG, "agent:main"), fetch) for _ in range(20)),
+    )
+    cached = await cache.get((_CONFIG, "agent:main"), fetch)
+    forced = await cache.get((_CONFIG, "agent:main"), fetch, max_age=0)
+
+    assert fetch.calls == 2
+    assert {id(snapshot) for snapshot in snapshots} == {id(cached)}
+    assert forced.sessions == [{"key": "call-2"}]
+
+
+@pytest.mark.asyncio
+async def test_failed_snapshots_are_refetched_on_the_next_read(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(status_cache.settings, "gateway_status_cache_ttl_seconds", 30.0)
+    cache = GatewayStatusCache()
+    results = [
+        GatewayStatusSnapshot(error="connection refused"),
+        GatewayStatusSnapshot(compatibility_error="unsupported version"),
+        GatewayStatusSnapshot(sessions=[]),
+    ]
+    calls = 0
+
+    async def _fetch(config: GatewayConfig, main_session: str | None) -> GatewayStatusSnapshot:
+        nonlocal calls
+        _ = (config, main_session)
+        calls += 1
+        return results[calls - 1]
+
+    snapshots = [await cache.get((_CONFIG, None), _fetch) for _ in range(4)]
+
+    assert [snapshot.failed for snapshot in snapshots] == [True, True, False, False]
+    assert snapshots[3] is snapshots[2]
+    assert calls == 3
+
+
+@pytest.mark.asyncio
+async def test_a_cancelled_reader_does_not_cancel_the_shared_refresh() -> None:
+    cache = GatewayStatusCache()
+    fetch = _CountingFetch(delay=0.05)
+
+    impatient = asyncio.create_task(cache.get((_CONFIG, None), fetch))
+    await asyncio.sleep(0.01)
+    patient = asyncio.create_task(cache.get((_CONFIG, None), fetch))
+    await asyncio.sleep(0)
+    impatient.cancel()
+
+    snapshot = await patient
+    assert snapshot.sessions == [{"key": "call-1"}]
+    assert fetch.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_poller_refreshes_read_gateways_and_forgets_idle_ones(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(status_cache.settings, "gateway_status_cache_ttl_seconds", 30.0)
+    monkeypatch.setattr(status_cache.settings, "gateway_status_poll_idle_seconds", 60.0)
+    cache = GatewayStatusCache()
+    active, idle = _CountingFetch(), _CountingFetch()
+    idle_config = GatewayConfig(url="ws://idle.example/ws")
+    await cache.get((_CONFIG, None), active)
+    await cache.get((idle_config, None), idle)
+    cache._entries[(idle_config, None)].last_read -= 120
+
+    await cache.poll_once()
+
+    assert (active.calls, idle.calls) == (2, 1)
+    assert list(cache._entries) == [(_CONFIG, None)]
+
+
+@pytest.mark.asyncio
+async def test_gateway_status_reports_cache_age(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(status_cache.settings, "gateway_status_cache_ttl_seconds", 30.0)
+    monkeypatch.setattr(session_service, "gateway_status_cache", GatewayStatusCache())
+    calls: list[str] = []
+
+    async def _fake_check(config: GatewayConfig, *, minimum_version: str | None = None) -> object:
+        _ = (config, minimum_version)
+        calls.append("version")
+        return GatewayVersionCheckResult(
+            compatible=True,
+            minimum_version="2026.1.30",
+            current_version="2026.2.0",
+            message=None,
+        )
+
+    async def _fake_openclaw_call(method: str, params: object = None, *, config: object) -> object:
+        _ = (params, config)
+        calls.append(method)
+        return {"sessions": [{"key": "agent:main"}]}
+
+    monkeypatch.setattr(session_service, "check_gateway_runtime_compatibility", _fake_check)
+    monkeypatch.setattr(session_service, "openclaw_call", _fake_openclaw_call)
+    service = GatewaySessionService(session=object())  # type: ignore[arg-type]
+    params = GatewayResolveQuery(gateway_url=_CONFIG.url)
+
+    first = await service.get_status(params=params, organization_id=uuid4(), user=None)
+    await asyncio.sleep(0.02)
+    second = await service.get_status(params=params, organization_id=uuid4(), user=None)
+    refreshed = await service.get_status(
+        params=params,
+        organization_id=uuid4(),
+        user=None,
+        refresh=True,
+    )
+
+    assert calls == ["version", "sessions.list", "version", "sessions.list"]
+    assert first.connected and second.sessions_count == 1
+    assert second.cached_at == first.cached_at
+    assert second.cache_age_seconds is not None and second.cache_age_seconds >= 0.02
+    assert refreshed.cached_at is not None and first.cached_at is not None
+    assert refreshed.cached_at > first.cached_at
+
+
+@pytest.mark.asyncio
+async def test_session_miss_refetches_only_an_aging_listing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(status_cache.settings, "gateway_status_cache_ttl_seconds", 1.0)
+    monkeypatch.setattr(session_service, "gateway_status_cache", GatewayStatusCache())
+    fetch = _CountingFetch()
+    monkeypatch.setattr(session_service, "fetch_gateway_status", fetch)
+
+    async def _resolve(*_: object, **__: object) -> tuple[None, GatewayConfig, None]:
+        return None, _CONFIG, None
+
+    service = GatewaySessionService(session=object())  # type: ignore[arg-type]
+    monkeypatch.setattr(service, "resolve_gateway", _resolve)
+
+    async def _get(session_id: str) -> int:
+        try:
+            await service.get_session(
+                session_id=session_id,
+                board_id=None,
+                organization_id=uuid4(),
+                user=None,
+            )
+        except HTTPException as exc:
+            return exc.status_code
+        return 200
+
+    assert await _get("call-1") == 200
+    # A fresh listing is trusted: unknown sessions 404 without reaching the gateway.
+    assert [await _get("unknown") for _ in range(3)] == [404, 404, 404]
+    assert fetch.calls == 1
+    # Once the listing has aged past the threshold, a miss refetches it.
+    await asyncio.sleep(0.25)
+    assert await _get("call-2") == 200
+    assert fetch.calls == 2
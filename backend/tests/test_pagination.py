@@ -0,0 +1,182 @@
+# ruff: noqa: INP001
+"""Project pagination: limit/offset pages, keyset cursors and optional totals."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from fastapi import HTTPException
+from fastapi_pagination.api import set_page, set_params
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel, col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import app.db.pagination as pagination
+from app.core.time import utcnow
+from app.db.pagination import Keyset, paginate
+from app.models.activity_events import ActivityEvent
+from app.models.boards import Board
+from app.models.organizations import Organization
+from app.models.tasks import Task
+from app.schemas.pagination import DefaultLimitOffsetPage
+
+_TASK_KEYSET = Keyset(col(Task.created_at), col(Task.id))
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed(engine: AsyncEngine) -> Board:
+    """Seven tasks over four timestamps (ties included), each with one comment."""
+    org = Organization(name="org")
+    board = Board(organization_id=org.id, name="board", slug="board")
+    started = utcnow() - timedelta(hours=1)
+    tasks = [
+        Task(board_id=board.id, title=f"task-{n}", created_at=started + timedelta(minutes=n // 2))
+        for n in range(7)
+    ]
+    comments = [
+        ActivityEvent(
+            event_type="task.comment",
+            message=f"on {task.title}",
+            task_id=task.id,
+            created_at=task.created_at,
+        )
+        for task in tasks
+    ]
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add_all([org, board, *tasks, *comments])
+        await session.commit()
+    return board
+
+
+def _params(*, limit: int, offset: int = 0, cursor: str | None = None, **totals: bool) -> Any:
+    return DefaultLimitOffsetPage.__params_type__(
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        **totals,
+    )
+
+
+async def _walk(
+    session: AsyncSession,
+    statement: Any,
+    keyset: Keyset,
+    *,
+    limit: int,
+) -> list[list[Any]]:
+    pages: list[list[Any]] = []
+    cursor: str | None = ""
+    while cursor is not None:
+        with set_params(_params(limit=limit, cursor=cursor)):
+            page = await paginate(session, statement, keyset=keyset)
+        assert page.total is None
+        pages.append(list(page.items))
+        cursor = page.next_cursor
+    return pages
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_cover_every_row_once_across_timestamp_ties() -> None:
+    engine = await _make_engine()
+    board = await _seed(engine)
+    statement = (
+        select(Task).where(col(Task.board_id) == board.id).order_by(col(Task.created_at).desc())
+    )
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        expected = list(
+            (
+                await session.exec(
+                    statement.order_by(None).order_by(
+                        col(Task.created_at).desc(),
+                        col(Task.id).desc(),
+                    ),
+                )
+            ).all(),
+        )
+        pages = await _walk(session, statement, _TASK_KEYSET, limit=3)
+    await engine.dispose()
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert [task.id for page in pages for task in page] == [task.id for task in expected]
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_multi_entity_rows_in_ascending_order() -> None:
+    engine = await _make_engine()
+    await _seed(engine)
+    statement = (
+        select(ActivityEvent, Task)
+        .join(Task, col(ActivityEvent.task_id) == col(Task.id))
+        .order_by(col(ActivityEvent.created_at).asc())
+    )
+    keyset = Keyset(col(ActivityEvent.created_at), col(ActivityEvent.id), descending=False)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        pages = await _walk(session, statement, keyset, limit=4)
+    await engine.dispose()
+
+    rows = [row for page in pages for row in page]
+    assert [len(page) for page in pages] == [4, 3]
+    assert len({event.id for event, _task in rows}) == 7
+    assert [event.created_at for event, _task in rows] == sorted(
+        event.created_at for event, _task in rows
+    )
+
+
+@pytest.mark.asyncio
+async def test_offset_pages_still_count_and_cursor_needs_a_keyset() -> None:
+    engine = await _make_engine()
+    await _seed(engine)
+    statement = select(Task).order_by(col(Task.created_at).desc())
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        with set_page(DefaultLimitOffsetPage[Any]), set_params(_params(limit=5, offset=5)):
+            page = await paginate(session, statement, keyset=_TASK_KEYSET)
+        with set_params(_params(limit=5, cursor="")), pytest.raises(HTTPException) as unsupported:
+            await paginate(session, statement)
+        with (
+            set_params(_params(limit=5, cursor="not-a-cursor")),
+            pytest.raises(HTTPException) as invalid,
+        ):
+            await paginate(session, statement, keyset=_TASK_KEYSET)
+    await engine.dispose()
+
+    assert (page.total, len(page.items), page.next_cursor) == (7, 2, None)
+    assert unsupported.value.status_code == 422
+    assert invalid.value.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_offset_totals_can_be_skipped_or_estimated(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pagination, "_count_cache", pagination._CountCache())
+    engine = await _make_engine()
+    board = await _seed(engine)
+    statement = select(Task).order_by(col(Task.created_at).desc())
+
+    async def _page(**params: Any) -> Any:
+        with set_page(DefaultLimitOffsetPage[Any]), set_params(_params(**params)):
+            return await paginate(session, statement)
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        skipped = await _page(limit=2, include_total=False)
+        estimated = await _page(limit=2, approximate_total=True)
+        session.add(Task(board_id=board.id, title="late"))
+        await session.commit()
+        # Non-Postgres estimates reuse the cached count until its TTL expires.
+        cached = await _page(limit=2, offset=2, approximate_total=True)
+        last = await _page(limit=5, offset=5, approximate_total=True)
+        exact = await _page(limit=2)
+    await engine.dispose()
+
+    assert (skipped.total, len(skipped.items)) == (None, 2)
+    assert (estimated.total, estimated.total_is_estimate) == (7, True)
+    assert (cached.total, cached.total_is_estimate) == (7, True)
+    # A short page ends the list, so its total is exact without an estimate.
+    assert (last.total, last.total_is_estimate) == (8, False)
+    assert (exact.total, exact.total_is_estimate) == (8, False)
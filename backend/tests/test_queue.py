@@ -8,7 +8,14 @@ from datetime import UTC, datetime
 
 import pytest
 
-from app.services.queue import QueuedTask, dequeue_task, enqueue_task, requeue_if_failed
+from app.services import queue
+from app.services.queue import (
+    QueuedTask,
+    dequeue_task,
+    enqueue_task,
+    enqueue_task_async,
+    requeue_if_failed,
+)
 
 
 class _FakeRedis:
@@ -103,3 +110,73 @@ def test_dequeue_task_tolerates_legacy_payload_without_envelope(
     assert task.task_type == "legacy"
     assert task.attempts == 2
     assert task.payload["board_id"] == "6f3ab1ec-3ef6-4f4d-a6a7-e2d6e5d6f7a8"
+
+
+def test_redis_clients_are_pooled_per_url() -> None:
+    queue.close_redis_clients()
+    try:
+        first = queue._redis_client(redis_url="redis://localhost:6379/0")
+        again = queue._redis_client(redis_url="redis://localhost:6379/0")
+        other = queue._redis_client(redis_url="redis://localhost:6379/1")
+
+        assert first is again
+        assert other is not first
+        assert first.connection_pool.connection_kwargs["health_check_interval"] == (
+            queue.settings.rq_redis_health_check_seconds
+        )
+    finally:
+        queue.close_redis_clients()
+
+
+@pytest.mark.asyncio
+async def test_async_redis_clients_are_pooled_per_loop_and_url() -> None:
+    try:
+        first = queue.async_redis_client("redis://localhost:6379/0")
+
+        assert queue.async_redis_client("redis://localhost:6379/0") is first
+        assert queue.async_redis_client("redis://localhost:6379/1") is not first
+    finally:
+        await queue.aclose_redis_clients()
+
+
+@pytest.mark.asyncio
+async def test_enqueue_task_async_pushes_envelope(monkeypatch: pytest.MonkeyPatch) -> None:
+    pushed: list[tuple[str, str]] = []
+
+    class _FakeAsyncRedis:
+        async def lpush(self, key: str, value: str) -> None:
+            pushed.append((key, value))
+
+    monkeypatch.setattr(
+        queue,
+        "async_redis_client",
+        lambda redis_url=None: _FakeAsyncRedis(),
+    )
+    payload = QueuedTask(
+        task_type="generic-task",
+        payload={"name": "webhook.delivery"},
+        created_at=datetime.now(UTC),
+    )
+
+    assert await enqueue_task_async(payload, "generic-queue")
+    assert pushed == [("generic-queue", payload.to_json())]
+
+
+@pytest.mark.asyncio
+async def test_enqueue_task_async_reports_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    class _BrokenAsyncRedis:
+        async def lpush(self, key: str, value: str) -> None:
+            raise ConnectionError("redis down")
+
+    monkeypatch.setattr(
+        queue,
+        "async_redis_client",
+        lambda redis_url=None: _BrokenAsyncRedis(),
+    )
+    payload = QueuedTask(
+        task_type="generic-task",
+        payload={},
+        created_at=datetime.now(UTC),
+    )
+
+    assert await enqueue_task_async(payload, "generic-queue") is False
@@ -0,0 +1,306 @@
+# ruff: noqa: INP001
+"""Dead-letter queue storage, replay and admin API tests."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from dataclasses import replace
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi_pagination import add_pagination
+from httpx import ASGITransport, AsyncClient
+
+from app.api import queue as queue_api
+from app.api.deps import require_org_admin
+from app.core.auth import get_auth_context
+from app.db.session import get_session
+from app.services import queue
+from app.services.queue import QueuedTask
+
+
+class _FakeRedis:
+    """In-memory subset of the Redis commands used by the dead-letter helpers."""
+
+    def __init__(self) -> None:
+        self.lists: dict[str, list[str]] = {}
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+
+    # Lists
+    def lpush(self, key: str, *values: str) -> int:
+        items = self.lists.setdefault(key, [])
+        for value in values:
+            items.insert(0, value)
+        return len(items)
+
+    def llen(self, key: str) -> int:
+        return len(self.lists.get(key, []))
+
+    # Hashes
+    def hset(self, key: str, field: str, value: str) -> int:
+        self.hashes.setdefault(key, {})[field] = value
+        return 1
+
+    def hget(self, key: str, field: str) -> str | None:
+        return self.hashes.get(key, {}).get(field)
+
+    def hmget(self, key: str, fields: list[str]) -> list[str | None]:
+        values = self.hashes.get(key, {})
+        return [values.get(field) for field in fields]
+
+    def hdel(self, key: str, *fields: str) -> int:
+        values = self.hashes.get(key, {})
+        return sum(values.pop(field, None) is not None for field in fields)
+
+    # Sorted sets
+    def zadd(self, key: str, mapping: dict[str, float]) -> int:
+        self.zsets.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    def zcard(self, key: str) -> int:
+        return len(self.zsets.get(key, {}))
+
+    def zrem(self, key: str, *members: str) -> int:
+        values = self.zsets.get(key, {})
+        return sum(values.pop(member, None) is not None for member in members)
+
+    def _ordered(self, key: str) -> list[str]:
+        return [member for member, _ in sorted(self.zsets.get(key, {}).items(), key=lambda i: i[1])]
+
+    def zrange(self, key: str, start: int, end: int) -> list[str]:
+        ordered = self._ordered(key)
+        return ordered[start : None if end == -1 else end + 1]
+
+    def zrevrange(self, key: str, start: int, end: int) -> list[str]:
+        ordered = list(reversed(self._ordered(key)))
+        return ordered[start : None if end == -1 else end + 1]
+
+    def pipeline(self, *, transaction: bool = True) -> _FakePipeline:
+        del transaction
+        return _FakePipeline(self)
+
+    def register_script(self, source: str) -> Callable[..., int]:
+        assert source == queue._REPLAY_DEAD_LUA
+
+        def _replay(*, keys: list[str], args: list[str]) -> int:
+            dead, index, ready = keys
+            replayed = 0
+            for entry_id, raw in zip(args[::2], args[1::2], strict=True):
+                if self.hdel(dead, entry_id) == 1:
+                    self.zrem(index, entry_id)
+                    self.lpush(ready, raw)
+                    replayed += 1
+            return replayed
+
+        return _replay
+
+
+class _FakePipeline:
+    def __init__(self, client: _FakeRedis) -> None:
+        self.client = client
+        self.calls: list[tuple[str, tuple[Any, ...]]] = []
+
+    def __getattr__(self, name: str) -> Callable[..., _FakePipeline]:
+        def _queue(*args: Any) -> _FakePipeline:
+            self.calls.append((name, args))
+            return self
+
+        return _queue
+
+    def execute(self) -> list[Any]:
+        return [getattr(self.client, name)(*args) for name, args in self.calls]
+
+
+@pytest.fixture
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> _FakeRedis:
+    fake = _FakeRedis()
+    monkeypatch.setattr(queue, "_redis_client", lambda redis_url=None: fake)
+    return fake
+
+
+def _task(board_id: str, *, attempts: int = 3) -> QueuedTask:
+    task = QueuedTask(
+        task_type="webhook_delivery",
+        payload={"board_id": board_id, "payload_id": str(uuid4())},
+        created_at=datetime.now(UTC),
+        attempts=attempts,
+    )
+    return task.with_failure("RuntimeError: first").with_failure("RuntimeError: last")
+
+
+def test_exhausted_task_is_dead_lettered_with_history(fake_redis: _FakeRedis) -> None:
+    task = _task("board-a")
+
+    assert not queue.requeue_if_failed(task, "q", max_retries=3)
+
+    [entry] = queue.list_dead_letters("q")
+    assert entry.task_type == "webhook_delivery"
+    assert entry.board_id == "board-a"
+    assert entry.attempts == 3
+    assert entry.last_error == "RuntimeError: last"
+    assert [item["error"] for item in entry.history] == [
+        "RuntimeError: first",
+        "RuntimeError: last",
+    ]
+    assert queue.get_dead_letter("q", entry.id) == entry
+    assert queue.queue_stats("q").dead == 1
+    assert fake_redis.llen("q") == 0
+
+
+def test_failure_history_is_capped_and_survives_encoding() -> None:
+    task = _task("board-a")
+    for attempt in range(20):
+        task = replace(task, attempts=attempt).with_failure(f"error {attempt}")
+
+    assert len(task.history) == queue._HISTORY_MAX_ENTRIES
+    assert task.history[-1]["error"] == "error 19"
+    assert queue._decode_task(task.to_json(), "q") == task
+    assert "history" not in json.loads(replace(task, history=()).to_json())
+
+
+def test_dead_letters_are_trimmed_to_the_configured_size(
+    fake_redis: _FakeRedis,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(queue.settings, "rq_dead_letter_max_entries", 2)
+    ids = [queue.dead_letter_task(_task(f"board-{i}"), "q").id for i in range(3)]
+
+    remaining = {entry.id for entry in queue.list_dead_letters("q")}
+    assert remaining == set(ids[1:])
+    assert len(fake_redis.hashes["q:dead"]) == 2
+
+
+def test_replay_resets_attempts_and_is_idempotent(fake_redis: _FakeRedis) -> None:
+    entry = queue.dead_letter_task(_task("board-a"), "q")
+
+    assert queue.replay_dead_letters([entry]) == 1
+    assert queue.replay_dead_letters([entry]) == 0
+
+    [raw] = fake_redis.lists["q"]
+    replayed = queue._decode_task(raw, "q")
+    assert replayed.attempts == 0
+    assert replayed.payload == entry.task["payload"]
+    assert len(replayed.history) == 2
+    assert queue.list_dead_letters("q") == []
+
+
+def test_purge_removes_only_selected_entries(fake_redis: _FakeRedis) -> None:
+    keep = queue.dead_letter_task(_task("board-a"), "q")
+    drop = queue.dead_letter_task(_task("board-a"), "q")
+
+    assert queue.purge_dead_letters("q", [drop.id, "missing"]) == 1
+    assert [entry.id for entry in queue.list_dead_letters("q")] == [keep.id]
+    assert fake_redis.zcard("q:dead:index") == 1
+
+
+def _build_test_app(*, super_admin: bool = False) -> FastAPI:
+    app = FastAPI()
+    api_v1 = APIRouter(prefix="/api/v1")
+    api_v1.include_router(queue_api.router)
+    app.include_router(api_v1)
+    add_pagination(app)
+
+    async def _override_get_session() -> object:
+        yield object()
+
+    async def _override_require_org_admin() -> object:
+        return SimpleNamespace(member=SimpleNamespace(), organization=SimpleNamespace(id=uuid4()))
+
+    async def _override_get_auth_context() -> object:
+        return SimpleNamespace(user=SimpleNamespace(is_super_admin=super_admin))
+
+    app.dependency_overrides[get_session] = _override_get_session
+    app.dependency_overrides[require_org_admin] = _override_require_org_admin
+    app.dependency_overrides[get_auth_context] = _override_get_auth_context
+    return app
+
+
+def _template_sync_task(gateway_id: str) -> QueuedTask:
+    return QueuedTask(
+        task_type="gateway_template_sync",
+        payload={"job_id": uuid4().hex, "gateway_id": gateway_id},
+        created_at=datetime.now(UTC),
+        attempts=3,
+    )
+
+
+@pytest.fixture
+def scoped_api(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def _board_ids(*_: object, **__: object) -> list[str]:
+        return ["board-mine"]
+
+    async def _gateway_ids(*_: object) -> set[str]:
+        return {"gateway-mine"}
+
+    monkeypatch.setattr(queue_api.settings, "rq_queue_name", "q")
+    monkeypatch.setattr(queue_api, "list_accessible_board_ids", _board_ids)
+    monkeypatch.setattr(queue_api, "_organization_gateway_ids", _gateway_ids)
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("scoped_api")
+async def test_dead_letter_api_is_scoped_to_visible_boards_and_gateways(
+    fake_redis: _FakeRedis,
+) -> None:
+    mine = queue.dead_letter_task(_task("board-mine"), "q")
+    other = queue.dead_letter_task(_task("board-other"), "q")
+    sync_mine = queue.dead_letter_task(_template_sync_task("gateway-mine"), "q")
+    sync_other = queue.dead_letter_task(_template_sync_task("gateway-other"), "q")
+    queue._dead_letter_raw(fake_redis, "q", "not json", error="undecodable")
+    app = _build_test_app()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        listed = await client.get("/api/v1/queue/dead")
+        hidden = await client.get(f"/api/v1/queue/dead/{other.id}")
+        hidden_sync = await client.get(f"/api/v1/queue/dead/{sync_other.id}")
+        detail = await client.get(f"/api/v1/queue/dead/{mine.id}")
+        sync_detail = await client.get(f"/api/v1/queue/dead/{sync_mine.id}")
+        stats = await client.get("/api/v1/queue/stats")
+        replayed = await client.post("/api/v1/queue/dead/replay", json={"all": True})
+        empty = await client.post("/api/v1/queue/dead/purge", json={})
+
+    assert listed.status_code == 200
+    assert [item["id"] for item in listed.json()["items"]] == [sync_mine.id, mine.id]
+    assert hidden.status_code == 404
+    assert hidden_sync.status_code == 404
+    assert detail.json()["history"][-1]["error"] == "RuntimeError: last"
+    assert sync_detail.json()["gateway_id"] == "gateway-mine"
+    # Queue-wide counts span every organization.
+    assert stats.status_code == 403
+    assert replayed.json() == {"count": 2}
+    assert empty.status_code == 422
+    remaining = {entry.id for entry in queue.list_dead_letters("q")}
+    assert other.id in remaining
+    assert sync_other.id in remaining
+    assert len(remaining) == 3
+    assert fake_redis.llen("q") == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("scoped_api")
+async def test_super_admins_see_unscoped_dead_letters_and_queue_stats(
+    fake_redis: _FakeRedis,
+) -> None:
+    queue.dead_letter_task(_task("board-other"), "q")
+    queue._dead_letter_raw(fake_redis, "q", "not json", error="undecodable")
+    queue._dead_letter_raw(
+        fake_redis,
+        "q",
+        json.dumps({"task_type": "x", "payload": {"board_id": "board-mine"}, "created_at": 1}),
+        error="bad created_at",
+    )
+    app = _build_test_app(super_admin=True)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        listed = await client.get("/api/v1/queue/dead")
+        stats = await client.get("/api/v1/queue/stats")
+
+    # Undecodable entries keep the board their JSON still names.
+    assert [item["board_id"] for item in listed.json()["items"]] == ["board-mine", None]
+    assert stats.json()["dead"] == 3
@@ -0,0 +1,102 @@
+# ruff: noqa: INP001
+"""Reliable-delivery lease tests against a real Redis (`QUEUE_TEST_REDIS_URL`)."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from datetime import UTC, datetime
+
+import pytest
+import redis
+
+from app.services import queue
+from app.services.queue import (
+    QueuedTask,
+    ack_task,
+    enqueue_task,
+    lease_task,
+    reap_expired_leases,
+    release_task,
+)
+
+_REDIS_URL = os.environ.get("QUEUE_TEST_REDIS_URL")
+_QUEUE = "lease-test"
+
+pytestmark = pytest.mark.skipif(_REDIS_URL is None, reason="QUEUE_TEST_REDIS_URL not set")
+
+
+@pytest.fixture
+def client() -> Iterator[redis.Redis]:
+    assert _REDIS_URL is not None
+    conn = redis.Redis.from_url(_REDIS_URL)
+    keys = [
+        _QUEUE,
+        queue._scheduled_queue_name(_QUEUE),
+        queue._processing_queue_name(_QUEUE),
+        queue._leases_name(_QUEUE),
+    ]
+    conn.delete(*keys)
+    yield conn
+    conn.delete(*keys)
+    conn.close()
+
+
+def _enqueue(name: str) -> QueuedTask:
+    task = QueuedTask(task_type="lease", payload={"name": name}, created_at=datetime.now(UTC))
+    assert enqueue_task(task, _QUEUE, redis_url=_REDIS_URL)
+    return task
+
+
+def test_ack_removes_task_from_processing(client: redis.Redis) -> None:
+    _enqueue("a")
+
+    lease = lease_task(_QUEUE, lease_seconds=60, redis_url=_REDIS_URL)
+    assert lease is not None
+    assert client.llen(queue._processing_queue_name(_QUEUE)) == 1
+
+    assert ack_task(lease)
+    assert client.llen(queue._processing_queue_name(_QUEUE)) == 0
+    assert client.zcard(queue._leases_name(_QUEUE)) == 0
+    assert reap_expired_leases(_QUEUE, lease_seconds=60, redis_url=_REDIS_URL) == 0
+
+
+def test_expired_lease_is_redelivered_once(
+    client: redis.Redis,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    task = _enqueue("crashy")
+    lease = lease_task(_QUEUE, lease_seconds=60, redis_url=_REDIS_URL)
+    assert lease is not None
+
+    now = queue._now_seconds()
+    monkeypatch.setattr(queue, "_now_seconds", lambda: now + 120)
+    assert reap_expired_leases(_QUEUE, lease_seconds=60, redis_url=_REDIS_URL) == 1
+    assert reap_expired_leases(_QUEUE, lease_seconds=60, redis_url=_REDIS_URL) == 0
+
+    again = lease_task(_QUEUE, lease_seconds=60, redis_url=_REDIS_URL)
+    assert again is not None
+    assert again.task == task
+    assert ack_task(again)
+    assert client.llen(queue._processing_queue_name(_QUEUE)) == 0
+
+
+def test_orphaned_processing_item_gets_a_lease(client: redis.Redis) -> None:
+    _enqueue("orphan")
+    client.lmove(_QUEUE, queue._processing_queue_name(_QUEUE), "RIGHT", "LEFT")
+
+    assert reap_expired_leases(_QUEUE, lease_seconds=60, redis_url=_REDIS_URL) == 0
+    assert client.zcard(queue._leases_name(_QUEUE)) == 1
+
+
+def test_release_puts_task_back_at_the_head(client: redis.Redis) -> None:
+    _enqueue("first")
+    _enqueue("second")
+    lease = lease_task(_QUEUE, lease_seconds=60, redis_url=_REDIS_URL)
+    assert lease is not None
+    assert lease.task.payload == {"name": "first"}
+
+    assert release_task(lease)
+    again = lease_task(_QUEUE, lease_seconds=60, redis_url=_REDIS_URL)
+    assert again is not None
+    assert again.task.payload == {"name": "first"}
@@ -0,0 +1,111 @@
+# ruff: noqa: INP001
+"""Scheduled-task promotion tests.
+
+`QUEUE_TEST_REDIS_URL` (e.g. `redis://localhost:6379/15`) enables the stress test
+against a real Redis; the database it points at is flushed.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+import redis
+
+from app.services import queue
+
+_REDIS_URL = os.environ.get("QUEUE_TEST_REDIS_URL")
+
+
+class _ScriptedRedis:
+    """Fake client that runs the promotion script in Python, atomically."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.scheduled: dict[str, float] = {}
+        self.ready: list[str] = []
+        self.calls = 0
+
+    def register_script(self, source: str) -> Callable[..., list[Any]]:
+        assert source == queue._PROMOTE_SCHEDULED_LUA
+
+        def _run(*, keys: list[str], args: list[Any]) -> list[Any]:
+            del keys
+            now, limit = float(args[0]), int(args[1])
+            with self.lock:
+                self.calls += 1
+                due = sorted(
+                    (score, member) for member, score in self.scheduled.items() if score <= now
+                )[:limit]
+                for _score, member in due:
+                    self.ready.insert(0, member)
+                    del self.scheduled[member]
+                upcoming = min(self.scheduled.values(), default=None)
+                return [len(due), None if upcoming is None else str(upcoming).encode()]
+
+        return _run
+
+
+def test_drain_promotes_due_items_in_one_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(queue, "_now_seconds", lambda: 100.0)
+    fake = _ScriptedRedis()
+    fake.scheduled = {"a": 90.0, "b": 95.0, "later": 130.0}
+
+    next_delay = queue._drain_ready_scheduled_tasks(fake, "q")  # type: ignore[arg-type]
+
+    assert fake.calls == 1
+    assert fake.ready == ["b", "a"]
+    assert next_delay == 30.0
+
+
+def test_drain_returns_none_when_nothing_is_scheduled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(queue, "_now_seconds", lambda: 100.0)
+    fake = _ScriptedRedis()
+
+    assert queue._drain_ready_scheduled_tasks(fake, "q") is None  # type: ignore[arg-type]
+    assert fake.ready == []
+
+
+@pytest.mark.skipif(_REDIS_URL is None, reason="QUEUE_TEST_REDIS_URL not set")
+def test_concurrent_workers_promote_each_item_exactly_once() -> None:
+    assert _REDIS_URL is not None
+    client = redis.Redis.from_url(_REDIS_URL)
+    queue_name = "stress-promotion"
+    scheduled_queue = queue._scheduled_queue_name(queue_name)
+    client.delete(queue_name, scheduled_queue)
+    items = {f"task-{i}": float(i) for i in range(2_000)}
+    client.zadd(scheduled_queue, items)
+
+    workers = 8
+    barrier = threading.Barrier(workers)
+    errors: list[BaseException] = []
+
+    def _worker() -> None:
+        worker_client = redis.Redis.from_url(_REDIS_URL)
+        try:
+            barrier.wait()
+            while worker_client.zcard(scheduled_queue):
+                queue._drain_ready_scheduled_tasks(worker_client, queue_name, max_items=25)
+        except BaseException as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+        finally:
+            worker_client.close()
+
+    threads = [threading.Thread(target=_worker) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    try:
+        assert errors == []
+        promoted = [raw.decode() for raw in client.lrange(queue_name, 0, -1)]
+        assert len(promoted) == len(items)
+        assert set(promoted) == set(items)
+        assert client.zcard(scheduled_queue) == 0
+    finally:
+        client.delete(queue_name, scheduled_queue)
+        client.close()
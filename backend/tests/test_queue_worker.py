@@ -0,0 +1,508 @@
+# ruff: noqa: INP001
+"""Concurrent queue worker tests."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from datetime import UTC, datetime
+
+import pytest
+
+from app.services import queue_worker
+from app.services.queue import LeasedTask, QueuedTask
+from app.services.rate_limit import KeyedTokenBucket
+
+
+def _task(name: str, *, task_type: str = "test-task") -> QueuedTask:
+    return QueuedTask(task_type=task_type, payload={"name": name}, created_at=datetime.now(UTC))
+
+
+def _patch_dequeue(
+    monkeypatch: pytest.MonkeyPatch,
+    tasks: list[QueuedTask],
+    *,
+    gate: threading.Event | None = None,
+) -> list[LeasedTask]:
+    """Serve `tasks` as leases (after the first, only once `gate` is set or times out).
+
+    Returns the list of acked leases.
+    """
+    acked: list[LeasedTask] = []
+    served = 0
+
+    def _lease(queue_name: str, **_: object) -> LeasedTask | None:
+        nonlocal served
+        if gate is not None and served:
+            gate.wait(1)
+            return None
+        if not tasks:
+            return None
+        served += 1
+        task = tasks.pop(0)
+        return LeasedTask(task=task, raw=task.to_json(), queue_name=queue_name)
+
+    monkeypatch.setattr(queue_worker.settings, "rq_reliable_delivery", True)
+    monkeypatch.setattr(queue_worker, "lease_task", _lease)
+    monkeypatch.setattr(queue_worker, "ack_task", acked.append)
+    return acked
+
+
+def _patch_defer(monkeypatch: pytest.MonkeyPatch) -> list[tuple[QueuedTask, float]]:
+    deferred: list[tuple[QueuedTask, float]] = []
+
+    def _defer(task: QueuedTask, queue_name: str, delay: float, **_: object) -> bool:
+        del queue_name
+        deferred.append((task, delay))
+        return True
+
+    monkeypatch.setattr(queue_worker, "defer_task", _defer)
+    return deferred
+
+
+def _register(
+    monkeypatch: pytest.MonkeyPatch,
+    handler: queue_worker._TaskHandler,
+    task_type: str = "test-task",
+) -> None:
+    monkeypatch.setitem(queue_worker._TASK_HANDLERS, task_type, handler)
+
+
+def test_token_bucket_allows_burst_then_reports_wait() -> None:
+    bucket = KeyedTokenBucket(rate_per_second=1.0, burst=2)
+
+    assert bucket.try_acquire("board:a") == 0
+    assert bucket.try_acquire("board:a") == 0
+    wait = bucket.try_acquire("board:a")
+    assert 0 < wait <= 1.0
+    assert bucket.try_acquire("board:b") == 0
+
+
+def test_token_bucket_with_zero_rate_is_disabled() -> None:
+    bucket = KeyedTokenBucket(rate_per_second=0, burst=1)
+
+    assert not bucket.enabled
+    assert all(bucket.try_acquire("board:a") == 0 for _ in range(10))
+
+
+@pytest.mark.asyncio
+async def test_flush_queue_runs_handlers_concurrently_up_to_limit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(queue_worker.settings, "rq_worker_concurrency", 3)
+    _patch_dequeue(monkeypatch, [_task(str(i)) for i in range(7)])
+    running = 0
+    peak = 0
+
+    async def _handler(task: QueuedTask) -> None:
+        nonlocal running, peak
+        del task
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    _register(
+        monkeypatch,
+        queue_worker._TaskHandler(
+            handler=_handler,
+            attempts_to_delay=lambda attempts: 0,
+            requeue=lambda task, delay: True,
+        ),
+    )
+
+    processed = await queue_worker.flush_queue()
+
+    assert processed == 7
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_flush_queue_acks_every_lease_after_handling(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    tasks = [_task("ok"), _task("boom"), _task("unknown", task_type="other")]
+    acked = _patch_dequeue(monkeypatch, list(tasks))
+    requeued: list[QueuedTask] = []
+
+    async def _handler(task: QueuedTask) -> None:
+        if task.payload["name"] == "boom":
+            raise RuntimeError("boom")
+
+    def _requeue(task: QueuedTask, delay: float) -> bool:
+        del delay
+        requeued.append(task)
+        return True
+
+    _register(
+        monkeypatch,
+        queue_worker._TaskHandler(
+            handler=_handler,
+            attempts_to_delay=lambda attempts: 0,
+            requeue=_requeue,
+        ),
+    )
+
+    assert await queue_worker.flush_queue() == 1
+    assert sorted(lease.task.payload["name"] for lease in acked) == ["boom", "ok", "unknown"]
+    assert [task.payload for task in requeued] == [tasks[1].payload]
+
+
+@pytest.mark.asyncio
+async def test_flush_queue_pops_without_leases_when_reliable_delivery_is_off(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(queue_worker.settings, "rq_reliable_delivery", False)
+    tasks = [_task("a"), _task("b")]
+
+    def _dequeue(queue_name: str, **_: object) -> QueuedTask | None:
+        del queue_name
+        return tasks.pop(0) if tasks else None
+
+    monkeypatch.setattr(queue_worker, "dequeue_task", _dequeue)
+    handled: list[str] = []
+
+    async def _handler(task: QueuedTask) -> None:
+        handled.append(task.payload["name"])
+
+    _register(
+        monkeypatch,
+        queue_worker._TaskHandler(
+            handler=_handler,
+            attempts_to_delay=lambda attempts: 0,
+            requeue=lambda task, delay: True,
+        ),
+    )
+
+    assert await queue_worker.flush_queue() == 2
+    assert sorted(handled) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_flush_queue_defers_rate_limited_tasks(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        queue_worker,
+        "dispatch_rate_limiter",
+        KeyedTokenBucket(rate_per_second=1 / 60, burst=1),
+    )
+    tasks = [_task("a1"), _task("a2"), _task("b1")]
+    _patch_dequeue(monkeypatch, list(tasks))
+    deferred = _patch_defer(monkeypatch)
+    handled: list[str] = []
+
+    async def _handler(task: QueuedTask) -> None:
+        handled.append(task.payload["name"])
+
+    async def _key(task: QueuedTask) -> str:
+        return f"board:{task.payload['name'][0]}"
+
+    _register(
+        monkeypatch,
+        queue_worker._TaskHandler(
+            handler=_handler,
+            attempts_to_delay=lambda attempts: 0,
+            requeue=lambda task, delay: True,
+            rate_limit_key=_key,
+        ),
+    )
+
+    processed = await queue_worker.flush_queue()
+
+    assert processed == 2
+    assert sorted(handled) == ["a1", "b1"]
+    assert [task for task, _ in deferred] == [tasks[1]]
+    assert deferred[0][1] > queue_worker._MAX_INLINE_RATE_WAIT_SECONDS
+
+
+@pytest.mark.asyncio
+async def test_flush_queue_requeues_failed_tasks(monkeypatch: pytest.MonkeyPatch) -> None:
+    failing = _task("boom")
+    _patch_dequeue(monkeypatch, [failing])
+    requeued: list[QueuedTask] = []
+
+    async def _handler(task: QueuedTask) -> None:
+        raise RuntimeError(task.payload["name"])
+
+    def _requeue(task: QueuedTask, delay: float) -> bool:
+        del delay
+        requeued.append(task)
+        return True
+
+    _register(
+        monkeypatch,
+        queue_worker._TaskHandler(
+            handler=_handler,
+            attempts_to_delay=lambda attempts: 0,
+            requeue=_requeue,
+        ),
+    )
+
+    assert await queue_worker.flush_queue() == 0
+    assert [task.payload for task in requeued] == [failing.payload]
+    assert [entry["error"] for entry in requeued[0].history] == ["RuntimeError: boom"]
+    assert requeued[0].history[0]["attempt"] == 0
+
+
+@pytest.mark.asyncio
+async def test_long_running_handlers_keep_their_lease(monkeypatch: pytest.MonkeyPatch) -> None:
+    acked = _patch_dequeue(monkeypatch, [_task("sync", task_type="slow-task")])
+    monkeypatch.setattr(queue_worker.settings, "rq_lease_seconds", 0.03)
+    extended: list[float] = []
+
+    def _extend(lease: LeasedTask, *, lease_seconds: float) -> bool:
+        del lease
+        extended.append(lease_seconds)
+        return True
+
+    async def _handler(task: QueuedTask) -> None:
+        del task
+        await asyncio.sleep(0.1)
+
+    monkeypatch.setattr(queue_worker, "extend_lease", _extend)
+    _register(
+        monkeypatch,
+        queue_worker._TaskHandler(
+            handler=_handler,
+            attempts_to_delay=lambda attempts: 0,
+            requeue=lambda task, delay: True,
+            long_running=True,
+        ),
+        task_type="slow-task",
+    )
+
+    assert await queue_worker.flush_queue() == 1
+    extensions = len(extended)
+    await asyncio.sleep(0.05)
+
+    assert extensions >= 3
+    assert set(extended) == {0.03}
+    assert len(extended) == extensions
+    assert len(acked) == 1
+
+
+@pytest.mark.asyncio
+async def test_stop_finishes_in_flight_tasks_before_returning(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    stop = asyncio.Event()
+    started = threading.Event()
+    finished: list[str] = []
+    tasks = [_task("slow"), _task("never")]
+    acked = _patch_dequeue(monkeypatch, tasks, gate=started)
+    monkeypatch.setattr(queue_worker, "reap_expired_leases", lambda queue_name, **_: 0)
+
+    async def _handler(task: QueuedTask) -> None:
+        started.set()
+        stop.set()
+        await asyncio.sleep(0.05)
+        finished.append(task.payload["name"])
+
+    _register(
+        monkeypatch,
+        queue_worker._TaskHandler(
+            handler=_handler,
+            attempts_to_delay=lambda attempts: 0,
+            requeue=lambda task, delay: True,
+        ),
+    )
+    monkeypatch.setattr(queue_worker.settings, "rq_worker_concurrency", 1)
+
+    await asyncio.wait_for(queue_worker._run_worker_loop(stop), 1)
+
+    assert finished == ["slow"]
+    assert [lease.task.payload["name"] for lease in acked] == ["slow"]
+    assert [task.payload["name"] for task in tasks] == ["never"]
+
+
+@pytest.mark.asyncio
+async def test_drain_timeout_releases_interrupted_leases(monkeypatch: pytest.MonkeyPatch) -> None:
+    stop = asyncio.Event()
+    stuck = _task("stuck")
+    acked = _patch_dequeue(monkeypatch, [stuck])
+    released: list[LeasedTask] = []
+    monkeypatch.setattr(queue_worker, "release_task", released.append)
+    monkeypatch.setattr(queue_worker.settings, "rq_worker_drain_seconds", 0.01)
+
+    async def _handler(task: QueuedTask) -> None:
+        del task
+        stop.set()
+        await asyncio.Event().wait()
+
+    _register(
+        monkeypatch,
+        queue_worker._TaskHandler(
+            handler=_handler,
+            attempts_to_delay=lambda attempts: 0,
+            requeue=lambda task, delay: True,
+        ),
+    )
+
+    processed = await asyncio.wait_for(queue_worker.flush_queue(stop=stop), 1)
+
+    assert processed == 0
+    assert [lease.task for lease in released] == [stuck]
+    assert acked == []
+
+
+@pytest.mark.asyncio
+async def test_batch_handler_receives_buffered_tasks_together(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    tasks = [_task(str(i)) for i in range(5)]
+    acked = _patch_dequeue(monkeypatch, list(tasks))
+    batches: list[list[str]] = []
+    requeued: list[QueuedTask] = []
+
+    async def _single(task: QueuedTask) -> None:
+        raise AssertionError("batched tasks must not use the single handler")
+
+    async def _batch(batch: list[QueuedTask]) -> list[QueuedTask]:
+        batches.append([task.payload["name"] for task in batch])
+        return [task for task in batch if task.payload["name"] == "3"]
+
+    def _requeue(task: QueuedTask, delay: float) -> bool:
+        del delay
+        requeued.append(task)
+        return True
+
+    _register(
+        monkeypatch,
+        queue_worker._TaskHandler(
+            handler=_single,
+            attempts_to_delay=lambda attempts: 0,
+            requeue=_requeue,
+            batch_handler=_batch,
+            batch_limits=lambda: (60.0, 3),
+        ),
+    )
+
+    processed = await queue_worker.flush_queue()
+
+    assert batches == [["0", "1", "2"], ["3", "4"]]
+    assert processed == 4
+    assert [task.payload for task in requeued] == [tasks[3].payload]
+    assert requeued[0].history[0]["error"] == "batch delivery failed"
+    assert len(acked) == 5
+
+
+@pytest.mark.asyncio
+async def test_batches_take_one_token_per_rate_key_and_defer_the_rest(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    limiter = KeyedTokenBucket(rate_per_second=1 / 60, burst=1)
+    monkeypatch.setattr(queue_worker, "dispatch_rate_limiter", limiter)
+    assert limiter.try_acquire("board:c") <= 0
+    tasks = [_task("a1"), _task("a2"), _task("b1"), _task("c1")]
+    acked = _patch_dequeue(monkeypatch, list(tasks))
+    deferred = _patch_defer(monkeypatch)
+    batches: list[list[str]] = []
+
+    async def _single(task: QueuedTask) -> None:
+        raise AssertionError("batched tasks must not use the single handler")
+
+    async def _batch(batch: list[QueuedTask]) -> list[QueuedTask]:
+        batches.append([task.payload["name"] for task in batch])
+        return []
+
+    async def _key(task: QueuedTask) -> str:
+        return f"board:{task.payload['name'][0]}"
+
+    _register(
+        monkeypatch,
+        queue_worker._TaskHandler(
+            handler=_single,
+            attempts_to_delay=lambda attempts: 0,
+            requeue=lambda task, delay: True,
+            rate_limit_key=_key,
+            batch_handler=_batch,
+            batch_limits=lambda: (60.0, 10),
+        ),
+    )
+
+    processed = await queue_worker.flush_queue()
+
+    # One digest per key costs one token, however many tasks it folds together.
+    assert batches == [["a1", "a2", "b1"]]
+    assert processed == 3
+    assert [task for task, _ in deferred] == [tasks[3]]
+    assert deferred[0][1] > queue_worker._MAX_INLINE_RATE_WAIT_SECONDS
+    assert len(acked) == 4
+    assert limiter.try_acquire("board:a") > 0
+    assert limiter.try_acquire("board:b") > 0
+
+
+@pytest.mark.asyncio
+async def test_batch_failing_while_deferring_does_not_retry_deferred_tasks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    limiter = KeyedTokenBucket(rate_per_second=1 / 60, burst=1)
+    monkeypatch.setattr(queue_worker, "dispatch_rate_limiter", limiter)
+    assert limiter.try_acquire("board:b") <= 0
+    assert limiter.try_acquire("board:c") <= 0
+    tasks = [_task("a1"), _task("b1"), _task("c1")]
+    deferred: list[tuple[QueuedTask, float]] = []
+    requeued: list[QueuedTask] = []
+
+    def _defer(task: QueuedTask, queue_name: str, delay: float, **_: object) -> bool:
+        del queue_name
+        if task is tasks[2]:
+            raise ConnectionError("redis down")
+        deferred.append((task, delay))
+        return True
+
+    async def _single(task: QueuedTask) -> None:
+        raise AssertionError("batched tasks must not use the single handler")
+
+    async def _batch(batch: list[QueuedTask]) -> list[QueuedTask]:
+        raise AssertionError("the batch never reaches its handler")
+
+    async def _key(task: QueuedTask) -> str:
+        return f"board:{task.payload['name'][0]}"
+
+    def _requeue(task: QueuedTask, delay: float) -> bool:
+        del delay
+        requeued.append(task)
+        return True
+
+    monkeypatch.setattr(queue_worker, "defer_task", _defer)
+    handler = queue_worker._TaskHandler(
+        handler=_single,
+        attempts_to_delay=lambda attempts: 0,
+        requeue=_requeue,
+        rate_limit_key=_key,
+        batch_handler=_batch,
+    )
+
+    processed = await queue_worker._handle_batch([(task, None) for task in tasks], handler)
+
+    assert processed == 0
+    # b1 was deferred before the failure and a1 is handed back untouched; nothing
+    # is retried, so neither ends up queued twice.
+    assert [(task, delay > 0) for task, delay in deferred] == [(tasks[1], True), (tasks[0], False)]
+    assert requeued == []
+
+
+def test_batcher_releases_buffers_after_window(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(queue_worker.time, "monotonic", lambda: now[0])
+
+    async def _batch(batch: list[QueuedTask]) -> list[QueuedTask]:
+        return []
+
+    handler = queue_worker._TaskHandler(
+        handler=_batch,  # type: ignore[arg-type]
+        attempts_to_delay=lambda attempts: 0,
+        requeue=lambda task, delay: True,
+        batch_handler=_batch,
+        batch_limits=lambda: (10.0, 100),
+    )
+    batcher = queue_worker._TaskBatcher()
+    batcher.add(_task("a"), handler, None)
+    now[0] = 105.0
+    batcher.add(_task("b"), handler, None)
+
+    assert batcher.take_due() == []
+    now[0] = 110.0
+    due = batcher.take_due()
+    assert [[task.payload["name"] for task, _ in items] for _, items in due] == [["a", "b"]]
+    assert batcher.take_due(force=True) == []
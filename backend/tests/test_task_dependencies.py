@@ -8,6 +8,7 @@ from uuid import UUID, uuid4
 import pytest
 
 from app.services import task_dependencies
+from app.services.board_versions import PENDING_BOARD_CHANGES_KEY
 
 
 def test_dedupe_uuid_list_preserves_order_and_removes_duplicates():
@@ -68,6 +69,7 @@ class _FakeSession:
     exec_results: list[object]
     executed: list[object] = field(default_factory=list)
     added: list[object] = field(default_factory=list)
+    info: dict[str, object] = field(default_factory=dict)
 
     async def exec(self, _query):
         is_dml = _query.__class__.__name__ in {"Delete", "Update", "Insert"}
@@ -309,6 +311,7 @@ async def test_replace_task_dependencies_deletes_then_adds(monkeypatch):
     assert normalized == [dep1, dep2]
     assert len(session.executed) == 1
     assert len(session.added) == 2
+    assert session.info[PENDING_BOARD_CHANGES_KEY] == {board_id: {("task", task_id)}}
 
 
 @pytest.mark.asyncio
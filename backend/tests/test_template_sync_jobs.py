@@ -0,0 +1,529 @@
+# ruff: noqa: INP001
+"""Parallel template sync, queued sync jobs and their progress stream."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from types import SimpleNamespace
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import app.services.openclaw.provisioning_db as provisioning_db
+import app.services.openclaw.template_sync_jobs as template_sync_jobs
+from app.api import gateways as gateways_api
+from app.api.deps import require_org_admin
+from app.models.gateways import Gateway
+from app.models.organizations import Organization
+from app.schemas.gateways import GatewayTemplatesSyncResult
+from app.services.openclaw.provisioning import AgentFileSyncReport
+from app.services.openclaw.provisioning_db import TemplateSyncAgentStatus, TemplateSyncProgress
+from app.services.openclaw.session_service import GatewayTemplateSyncQuery
+from app.services.queue import QueuedTask
+
+
+class _FakeAsyncRedis:
+    """In-memory subset of the async Redis commands used by the job store."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.lists: dict[str, list[str]] = {}
+        self.locks: set[str] = set()
+
+    def lock(self, name: str, **_: object) -> _FakeLock:
+        return _FakeLock(self, name)
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: str, *, ex: int | None = None) -> bool:
+        del ex
+        self.values[key] = value
+        return True
+
+    async def rpush(self, key: str, *values: str) -> int:
+        self.lists.setdefault(key, []).extend(values)
+        return len(self.lists[key])
+
+    async def expire(self, key: str, ttl: int) -> bool:
+        del key, ttl
+        return True
+
+    async def lrange(self, key: str, start: int, end: int) -> list[str]:
+        items = self.lists.get(key, [])
+        return items[start : None if end == -1 else end + 1]
+
+    def pipeline(self, *, transaction: bool = True) -> _FakePipeline:
+        del transaction
+        return _FakePipeline(self)
+
+
+class _FakeLock:
+    def __init__(self, client: _FakeAsyncRedis, name: str) -> None:
+        self.client = client
+        self.name = name
+
+    async def acquire(self) -> bool:
+        if self.name in self.client.locks:
+            return False
+        self.client.locks.add(self.name)
+        return True
+
+    async def reacquire(self) -> bool:
+        return True
+
+    async def release(self) -> None:
+        self.client.locks.discard(self.name)
+
+
+class _FakePipeline:
+    def __init__(self, client: _FakeAsyncRedis) -> None:
+        self.client = client
+        self.calls: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Callable[..., _FakePipeline]:
+        def _queue(*args: Any, **kwargs: Any) -> _FakePipeline:
+            self.calls.append((name, args, kwargs))
+            return self
+
+        return _queue
+
+    async def execute(self) -> list[Any]:
+        return [
+            await getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.calls
+        ]
+
+
+class _RecordingProgress(TemplateSyncProgress):
+    def __init__(self) -> None:
+        self.total: int | None = None
+        self.finished: list[tuple[str, TemplateSyncAgentStatus]] = []
+        self.interruptions: list[str] = []
+
+    async def started(self, total: int) -> None:
+        self.total = total
+
+    async def agent_finished(
+        self,
+        agent: Any,
+        status: TemplateSyncAgentStatus,
+        message: str | None,
+    ) -> None:
+        del message
+        self.finished.append((agent.name, status))
+
+    async def interrupted(self, message: str) -> None:
+        self.interruptions.append(message)
+
+
+def _agent(name: str, board_id: UUID) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid4(),
+        name=name,
+        board_id=board_id,
+        openclaw_session_id=f"agent:{name}:main",
+        agent_token_hash=None,
+        agent_token_lookup=None,
+        is_board_lead=False,
+    )
+
+
+def _sync_context(
+    apply: Callable[..., Awaitable[AgentFileSyncReport]],
+    agents: list[SimpleNamespace],
+    *,
+    concurrency: int,
+) -> provisioning_db._SyncContext:
+    ctx = provisioning_db._SyncContext(
+        session=SimpleNamespace(),  # type: ignore[arg-type]
+        gateway=SimpleNamespace(id=uuid4()),  # type: ignore[arg-type]
+        control_plane=SimpleNamespace(),  # type: ignore[arg-type]
+        backoff=provisioning_db._template_sync_backoff(),
+        options=provisioning_db.GatewayTemplateSyncOptions(user=None, concurrency=concurrency),
+        provisioner=SimpleNamespace(apply_agent_lifecycle=apply),  # type: ignore[arg-type]
+    )
+    for agent in agents:
+        ctx.prefetched_tools[provisioning_db._agent_key(agent)] = "AUTH_TOKEN=secret\n"
+    return ctx
+
+
+def _result() -> GatewayTemplatesSyncResult:
+    return GatewayTemplatesSyncResult(
+        gateway_id=uuid4(),
+        include_main=False,
+        reset_sessions=False,
+        agents_updated=0,
+        agents_skipped=0,
+        main_updated=False,
+    )
+
+
+@pytest.mark.asyncio
+async def test_board_agents_sync_in_parallel_up_to_the_limit() -> None:
+    board = SimpleNamespace(id=uuid4(), name="Board")
+    paused = SimpleNamespace(id=uuid4(), name="Paused")
+    agents = [_agent(f"agent-{i}", board.id) for i in range(6)]
+    agents.append(_agent("paused-agent", paused.id))
+    gauge = {"in_flight": 0, "peak": 0}
+
+    async def _apply(**_kwargs: object) -> AgentFileSyncReport:
+        gauge["in_flight"] += 1
+        gauge["peak"] = max(gauge["peak"], gauge["in_flight"])
+        await asyncio.sleep(0.02)
+        gauge["in_flight"] -= 1
+        return AgentFileSyncReport(written=("TOOLS.md",), skipped=("SOUL.md", "AGENTS.md"))
+
+    ctx = _sync_context(_apply, agents, concurrency=3)
+    result = _result()
+    progress = _RecordingProgress()
+
+    completed = await provisioning_db._sync_board_agents(
+        ctx,
+        result,
+        progress,
+        agents=agents,  # type: ignore[arg-type]
+        boards_by_id={board.id: board, paused.id: paused},  # type: ignore[dict-item]
+        paused_board_ids={paused.id},
+    )
+
+    assert completed
+    assert gauge["peak"] == 3
+    assert (result.agents_updated, result.agents_skipped) == (6, 1)
+    assert (result.files_written, result.files_skipped) == (6, 12)
+    assert ("paused-agent", "skipped") in progress.finished
+    assert sorted(status for _, status in progress.finished).count("updated") == 6
+
+
+@pytest.mark.asyncio
+async def test_unreachable_gateway_interrupts_the_remaining_agents() -> None:
+    board = SimpleNamespace(id=uuid4(), name="Board")
+    agents = [_agent(f"agent-{i}", board.id) for i in range(4)]
+    started: list[str] = []
+
+    async def _apply(*, agent: Any, **_kwargs: object) -> AgentFileSyncReport:
+        started.append(agent.name)
+        if agent.name == "agent-1":
+            raise TimeoutError("gateway unreachable")
+        return AgentFileSyncReport()
+
+    ctx = _sync_context(_apply, agents, concurrency=1)
+    progress = _RecordingProgress()
+
+    completed = await provisioning_db._sync_board_agents(
+        ctx,
+        _result(),
+        progress,
+        agents=agents,  # type: ignore[arg-type]
+        boards_by_id={board.id: board},  # type: ignore[dict-item]
+        paused_board_ids=set(),
+    )
+
+    assert not completed
+    assert started == ["agent-0", "agent-1"]
+    assert progress.finished == [("agent-0", "updated")]
+    assert progress.interruptions == ["gateway unreachable"]
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+@pytest.fixture
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> _FakeAsyncRedis:
+    fake = _FakeAsyncRedis()
+    monkeypatch.setattr(template_sync_jobs, "async_redis_client", lambda _url=None: fake)
+    return fake
+
+
+def _query() -> GatewayTemplateSyncQuery:
+    return GatewayTemplateSyncQuery(
+        include_main=True,
+        lead_only=False,
+        reset_sessions=False,
+        rotate_tokens=False,
+        force_bootstrap=False,
+        overwrite=False,
+        board_id=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_interrupted_job_resumes_from_the_last_completed_agent(
+    fake_redis: _FakeAsyncRedis,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    del fake_redis
+    engine = await _make_engine()
+    org_id = uuid4()
+    gateway = Gateway(
+        organization_id=org_id,
+        name="gw",
+        url="ws://gateway.example/ws",
+        workspace_root="/tmp",
+    )
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add(Organization(id=org_id, name="org"))
+        session.add(gateway)
+        await session.commit()
+    monkeypatch.setattr(
+        template_sync_jobs,
+        "async_session_maker",
+        lambda: AsyncSession(engine, expire_on_commit=False),
+    )
+    enqueued: list[QueuedTask] = []
+
+    async def _enqueue(task: QueuedTask, *_args: object, **_kwargs: object) -> bool:
+        enqueued.append(task)
+        return True
+
+    monkeypatch.setattr(template_sync_jobs, "enqueue_task_async", _enqueue)
+    board_id = uuid4()
+    done, skipped, pending = (_agent(name, board_id) for name in ("done", "skipped", "pending"))
+    runs: list[frozenset[UUID]] = []
+
+    async def _fake_sync(
+        self: provisioning_db.OpenClawProvisioningService,
+        gateway: Gateway,
+        options: provisioning_db.GatewayTemplateSyncOptions,
+        *,
+        progress: TemplateSyncProgress,
+    ) -> GatewayTemplatesSyncResult:
+        del self
+        runs.append(options.completed_agent_ids)
+        remaining = [a for a in (done, skipped, pending) if a.id not in options.completed_agent_ids]
+        await progress.started(len(remaining))
+        if len(runs) == 1:
+            await progress.agent_finished(done, "updated", None)  # type: ignore[arg-type]
+            await progress.agent_finished(skipped, "skipped", "no token")  # type: ignore[arg-type]
+            await progress.interrupted("gateway unreachable")
+        else:
+            await progress.agent_finished(pending, "updated", None)  # type: ignore[arg-type]
+        result = _result()
+        result.gateway_id = gateway.id
+        return result
+
+    monkeypatch.setattr(
+        provisioning_db.OpenClawProvisioningService,
+        "sync_gateway_templates",
+        _fake_sync,
+    )
+
+    job = await template_sync_jobs.create_template_sync_job(
+        gateway=gateway,
+        query=_query(),
+        user=None,
+    )
+    [task] = enqueued
+    assert task.payload["job_id"] == job.id
+
+    with pytest.raises(template_sync_jobs.TemplateSyncInterruptedError):
+        await template_sync_jobs.process_template_sync_task(task)
+    retrying = await template_sync_jobs.get_template_sync_job(job.id)
+    assert retrying is not None
+    assert (retrying.status, retrying.error) == ("retrying", "gateway unreachable")
+
+    await template_sync_jobs.process_template_sync_task(task)
+
+    finished = await template_sync_jobs.get_template_sync_job(job.id)
+    assert finished is not None
+    assert runs == [frozenset(), frozenset({done.id, skipped.id})]
+    assert finished.status == "completed"
+    assert finished.runs == 2
+    assert finished.counters() == {"total": 3, "done": 2, "skipped": 1, "failed": 0}
+    events = await template_sync_jobs.list_template_sync_events(job.id)
+    assert [event["index"] for event in events] == list(range(finished.events))
+    assert [e["agent_name"] for e in events if e["type"] == "agent"] == [
+        "done",
+        "skipped",
+        "pending",
+    ]
+    assert events[-1]["status"] == "completed"
+
+
+async def _seed_gateway(monkeypatch: pytest.MonkeyPatch) -> Gateway:
+    engine = await _make_engine()
+    org_id = uuid4()
+    gateway = Gateway(
+        organization_id=org_id,
+        name="gw",
+        url="ws://gateway.example/ws",
+        workspace_root="/tmp",
+    )
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add(Organization(id=org_id, name="org"))
+        session.add(gateway)
+        await session.commit()
+    monkeypatch.setattr(
+        template_sync_jobs,
+        "async_session_maker",
+        lambda: AsyncSession(engine, expire_on_commit=False),
+    )
+
+    async def _enqueue(task: QueuedTask, *_args: object, **_kwargs: object) -> bool:
+        return True
+
+    monkeypatch.setattr(template_sync_jobs, "enqueue_task_async", _enqueue)
+    return gateway
+
+
+def _job_task(job: template_sync_jobs.TemplateSyncJob, *, attempts: int = 0) -> QueuedTask:
+    return QueuedTask(
+        task_type=template_sync_jobs.TASK_TYPE,
+        payload={"job_id": job.id, "gateway_id": str(job.gateway_id)},
+        created_at=job.created_at,
+        attempts=attempts,
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_run_is_retrying_until_retries_are_exhausted(
+    fake_redis: _FakeAsyncRedis,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    gateway = await _seed_gateway(monkeypatch)
+
+    async def _broken_sync(*_args: object, **_kwargs: object) -> GatewayTemplatesSyncResult:
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(
+        provisioning_db.OpenClawProvisioningService,
+        "sync_gateway_templates",
+        _broken_sync,
+    )
+    monkeypatch.setattr(template_sync_jobs.settings, "rq_dispatch_max_retries", 2)
+    job = await template_sync_jobs.create_template_sync_job(
+        gateway=gateway,
+        query=_query(),
+        user=None,
+    )
+
+    statuses: list[str] = []
+    for attempts in range(3):
+        with pytest.raises(RuntimeError):
+            await template_sync_jobs.process_template_sync_task(_job_task(job, attempts=attempts))
+        stored = await template_sync_jobs.get_template_sync_job(job.id)
+        assert stored is not None
+        statuses.append(stored.status)
+
+    assert statuses == ["retrying", "retrying", "failed"]
+    assert fake_redis.locks == set()
+
+
+@pytest.mark.asyncio
+async def test_duplicate_delivery_is_skipped_while_the_job_is_locked(
+    fake_redis: _FakeAsyncRedis,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    gateway = await _seed_gateway(monkeypatch)
+    calls: list[UUID] = []
+
+    async def _fake_sync(
+        self: provisioning_db.OpenClawProvisioningService,
+        gateway: Gateway,
+        options: provisioning_db.GatewayTemplateSyncOptions,
+        *,
+        progress: TemplateSyncProgress,
+    ) -> GatewayTemplatesSyncResult:
+        del self, options, progress
+        calls.append(gateway.id)
+        return _result()
+
+    monkeypatch.setattr(
+        provisioning_db.OpenClawProvisioningService,
+        "sync_gateway_templates",
+        _fake_sync,
+    )
+    job = await template_sync_jobs.create_template_sync_job(
+        gateway=gateway,
+        query=_query(),
+        user=None,
+    )
+    fake_redis.locks.add(template_sync_jobs._lock_key(job.id))
+
+    await template_sync_jobs.process_template_sync_task(_job_task(job))
+    skipped = await template_sync_jobs.get_template_sync_job(job.id)
+    assert skipped is not None
+    assert (skipped.status, skipped.runs, calls) == ("queued", 0, [])
+
+    fake_redis.locks.clear()
+    await template_sync_jobs.process_template_sync_task(_job_task(job))
+    finished = await template_sync_jobs.get_template_sync_job(job.id)
+    assert finished is not None
+    assert (finished.status, calls) == ("completed", [gateway.id])
+
+
+def _build_test_app(org_id: UUID) -> FastAPI:
+    app = FastAPI()
+    api_v1 = APIRouter(prefix="/api/v1")
+    api_v1.include_router(gateways_api.router)
+    app.include_router(api_v1)
+
+    async def _override_require_org_admin() -> object:
+        return SimpleNamespace(organization=SimpleNamespace(id=org_id), member=SimpleNamespace())
+
+    app.dependency_overrides[require_org_admin] = _override_require_org_admin
+    return app
+
+
+@pytest.mark.asyncio
+async def test_job_api_reads_streams_and_resumes_jobs(
+    fake_redis: _FakeAsyncRedis,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    del fake_redis
+    org_id = uuid4()
+    gateway = SimpleNamespace(id=uuid4(), organization_id=org_id)
+    enqueued: list[QueuedTask] = []
+
+    async def _enqueue(task: QueuedTask, *_args: object, **_kwargs: object) -> bool:
+        enqueued.append(task)
+        return True
+
+    monkeypatch.setattr(template_sync_jobs, "enqueue_task_async", _enqueue)
+    job = await template_sync_jobs.create_template_sync_job(
+        gateway=gateway,  # type: ignore[arg-type]
+        query=_query(),
+        user=None,
+    )
+    await template_sync_jobs._fail_job(job, "gateway unreachable", retrying=True)
+    base = f"/api/v1/gateways/{gateway.id}/templates/sync/jobs/{job.id}"
+
+    async with (
+        AsyncClient(
+            transport=ASGITransport(app=_build_test_app(org_id)),
+            base_url="http://test",
+        ) as client,
+        AsyncClient(
+            transport=ASGITransport(app=_build_test_app(uuid4())),
+            base_url="http://test",
+        ) as other_client,
+    ):
+        pending = await client.post(f"{base}/resume")
+        await template_sync_jobs._fail_job(job, "gateway unreachable")
+        read = await client.get(base)
+        stream = await client.get(f"{base}/events", params={"since": 1})
+        resumed = await client.post(f"{base}/resume")
+        conflict = await client.post(f"{base}/resume")
+        other_org = await other_client.get(base)
+
+    assert pending.status_code == 409
+    assert read.status_code == 200
+    assert (read.json()["status"], read.json()["error"]) == ("failed", "gateway unreachable")
+    data_lines = [line for line in stream.text.splitlines() if line.startswith("data:")]
+    assert [json.loads(line[5:])["status"] for line in data_lines] == ["retrying", "failed"]
+    assert resumed.status_code == 202
+    assert resumed.json()["status"] == "queued"
+    assert len(enqueued) == 2
+    assert conflict.status_code == 409
+    assert other_org.status_code == 404
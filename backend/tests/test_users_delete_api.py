@@ -19,6 +19,10 @@ from app.models.users import User
 class _FakeSession:
     committed: int = 0
 
+    async def exec(self, _statement: Any) -> list[Any]:
+        # Tasks created by the user, whose boards get a version bump.
+        return []
+
     async def commit(self) -> None:
         self.committed += 1
 
@@ -9,10 +9,20 @@ from types import SimpleNamespace
 from uuid import UUID, uuid4
 
 import pytest
-
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.agents import Agent
+from app.models.board_webhook_payloads import BoardWebhookPayload
+from app.models.board_webhooks import BoardWebhook
+from app.models.boards import Board
+from app.models.gateways import Gateway
+from app.models.organizations import Organization
 from app.services.webhooks import dispatch
 from app.services.webhooks.queue import (
     QueuedInboundDelivery,
+    _task_from_payload,
     dequeue_webhook_delivery,
     enqueue_webhook_delivery,
     requeue_if_failed,
@@ -356,3 +366,274 @@ def test_dispatch_run_entrypoint_calls_async_flush(monkeypatch: pytest.MonkeyPat
     dispatch.run_flush_webhook_delivery_queue()
 
     assert called == [True]
+
+
+@pytest.mark.asyncio
+async def test_process_webhook_queue_batch_sends_one_digest_per_target(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(dispatch, "async_session_maker", session_maker)
+
+    org_id, gateway_id, board_id = uuid4(), uuid4(), uuid4()
+    lead_id, mapped_id = uuid4(), uuid4()
+    lead_hook, mapped_hook = uuid4(), uuid4()
+    async with session_maker() as session:
+        session.add(Organization(id=org_id, name="org"))
+        session.add(
+            Gateway(
+                id=gateway_id,
+                organization_id=org_id,
+                name="gateway",
+                url="https://gateway.example.local",
+                workspace_root="/tmp/workspace",
+            ),
+        )
+        session.add(
+            Board(
+                id=board_id,
+                organization_id=org_id,
+                gateway_id=gateway_id,
+                name="Launch board",
+                slug="launch-board",
+            ),
+        )
+        for agent_id, name, is_lead in ((lead_id, "Lead", True), (mapped_id, "Mapped", False)):
+            session.add(
+                Agent(
+                    id=agent_id,
+                    board_id=board_id,
+                    gateway_id=gateway_id,
+                    name=name,
+                    openclaw_session_id=f"{name.lower()}:session",
+                    is_board_lead=is_lead,
+                ),
+            )
+        session.add(BoardWebhook(id=lead_hook, board_id=board_id, description="to lead"))
+        session.add(
+            BoardWebhook(
+                id=mapped_hook,
+                board_id=board_id,
+                agent_id=mapped_id,
+                description="to mapped",
+            ),
+        )
+        payloads = [
+            BoardWebhookPayload(board_id=board_id, webhook_id=hook, payload={"n": i})
+            for i, hook in enumerate([lead_hook, lead_hook, lead_hook, mapped_hook])
+        ]
+        session.add_all(payloads)
+        await session.commit()
+
+    sent: list[dict[str, str]] = []
+
+    async def _fake_send(self: object, **kwargs: object) -> None:
+        del self
+        sent.append({"session_key": str(kwargs["session_key"]), "message": str(kwargs["message"])})
+        return None
+
+    monkeypatch.setattr(dispatch.GatewayDispatchService, "try_send_agent_message", _fake_send)
+    tasks = [
+        _task_from_payload(
+            QueuedInboundDelivery(
+                board_id=board_id,
+                webhook_id=payload.webhook_id,
+                payload_id=payload.id,
+                received_at=payload.received_at,
+            ),
+        )
+        for payload in payloads
+    ]
+    tasks.append(
+        _task_from_payload(
+            QueuedInboundDelivery(
+                board_id=board_id,
+                webhook_id=lead_hook,
+                payload_id=uuid4(),
+                received_at=datetime.now(UTC),
+            ),
+        ),
+    )
+
+    try:
+        failed = await dispatch.process_webhook_queue_batch(tasks)
+    finally:
+        await engine.dispose()
+
+    assert failed == []
+    by_session = {message["session_key"]: message["message"] for message in sent}
+    assert len(sent) == 2
+    lead_message = by_session["lead:session"]
+    assert lead_message.startswith("WEBHOOK EVENTS RECEIVED (3)")
+    assert all(str(payload.id) in lead_message for payload in payloads[:3])
+    assert str(payloads[3].id) in by_session["mapped:session"]
+    assert str(payloads[3].id) not in lead_message
+
+
+@pytest.mark.asyncio
+async def test_process_webhook_queue_batch_returns_tasks_of_failed_sends(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    board = SimpleNamespace(id=uuid4(), name="Board", gateway_id=uuid4(), organization_id=uuid4())
+    webhook = SimpleNamespace(id=uuid4(), board_id=board.id, agent_id=None, description="d")
+    lead = SimpleNamespace(id=uuid4(), name="Lead", openclaw_session_id="lead:s", board_id=board.id)
+    tasks = [
+        _task_from_payload(
+            QueuedInboundDelivery(
+                board_id=board.id,
+                webhook_id=webhook.id,
+                payload_id=uuid4(),
+                received_at=datetime.now(UTC),
+            ),
+        )
+        for _ in range(2)
+    ]
+    deliveries = [
+        dispatch._WebhookDelivery(
+            task=task,
+            board=board,
+            webhook=webhook,
+            payload=SimpleNamespace(
+                id=UUID(task.payload["payload_id"]),
+                payload={},
+                received_at=datetime.now(UTC),
+            ),
+        )
+        for task in tasks
+    ]
+
+    class _FakeSession:
+        async def __aenter__(self) -> _FakeSession:
+            return self
+
+        async def __aexit__(self, *_: object) -> None:
+            return None
+
+        async def commit(self) -> None:
+            return None
+
+    async def _load(session: object, batch: list[object]) -> list[object]:
+        del session, batch
+        return deliveries
+
+    async def _targets(session: object, batch: list[object]) -> dict[UUID, object]:
+        del session
+        return {delivery.payload.id: lead for delivery in batch}
+
+    class _FailingDispatch:
+        def __init__(self, session: object) -> None:
+            del session
+
+        async def optional_gateway_configs_for_boards(self, boards: object) -> dict[UUID, object]:
+            return {b.id: object() for b in boards}
+
+        async def try_send_agent_message(self, **_: object) -> Exception:
+            return RuntimeError("gateway down")
+
+    monkeypatch.setattr(dispatch, "async_session_maker", _FakeSession)
+    monkeypatch.setattr(dispatch, "_load_webhook_deliveries", _load)
+    monkeypatch.setattr(dispatch, "_resolve_target_agents", _targets)
+    monkeypatch.setattr(dispatch, "GatewayDispatchService", _FailingDispatch)
+
+    assert await dispatch.process_webhook_queue_batch(tasks) == tasks
+
+
+def test_webhook_digest_caps_previews() -> None:
+    board = SimpleNamespace(id=uuid4(), name="Board")
+    webhook = SimpleNamespace(id=uuid4(), description="desc")
+    deliveries = [
+        dispatch._WebhookDelivery(
+            task=None,  # type: ignore[arg-type]
+            board=board,
+            webhook=webhook,
+            payload=SimpleNamespace(
+                id=uuid4(),
+                payload="x" * 5000,
+                received_at=datetime.now(UTC),
+            ),
+        )
+        for _ in range(dispatch._DIGEST_MAX_PREVIEWS + 5)
+    ]
+
+    message = dispatch._webhook_digest_message(board=board, deliveries=deliveries)
+
+    assert all(str(delivery.payload.id) in message for delivery in deliveries)
+    assert message.count("(truncated)") == dispatch._DIGEST_MAX_PREVIEWS
+    assert "Previews omitted for 5 payloads." in message
+
+
+@pytest.mark.asyncio
+async def test_gateway_rate_keys_follow_boards_that_move_gateways(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(dispatch, "async_session_maker", session_maker)
+    monkeypatch.setattr(dispatch, "_board_gateway_cache", dispatch._BoardGatewayCache())
+    monkeypatch.setattr(dispatch.settings, "rq_dispatch_rate_scope", "gateway")
+    monkeypatch.setattr(dispatch.settings, "rq_dispatch_gateway_cache_size", 1)
+    monkeypatch.setattr(dispatch.settings, "rq_dispatch_gateway_cache_ttl_seconds", 30.0)
+    now = [1000.0]
+    monkeypatch.setattr(dispatch.time, "monotonic", lambda: now[0])
+
+    org_id, old_gateway, new_gateway = uuid4(), uuid4(), uuid4()
+    board_id, other_board_id = uuid4(), uuid4()
+    async with session_maker() as session:
+        session.add(Organization(id=org_id, name="org"))
+        for gateway_id in (old_gateway, new_gateway):
+            session.add(
+                Gateway(
+                    id=gateway_id,
+                    organization_id=org_id,
+                    name=f"gateway-{gateway_id}",
+                    url="https://gateway.example.local",
+                    workspace_root="/tmp/workspace",
+                ),
+            )
+        for id_, gateway_id in ((board_id, old_gateway), (other_board_id, new_gateway)):
+            session.add(
+                Board(
+                    id=id_,
+                    organization_id=org_id,
+                    gateway_id=gateway_id,
+                    name=f"board-{id_}",
+                    slug=f"board-{id_}",
+                ),
+            )
+        await session.commit()
+
+    def _task(board: UUID) -> dispatch.QueuedTask:
+        return _task_from_payload(
+            QueuedInboundDelivery(
+                board_id=board,
+                webhook_id=uuid4(),
+                payload_id=uuid4(),
+                received_at=datetime.now(UTC),
+            ),
+        )
+
+    async def _move_board() -> None:
+        async with session_maker() as session:
+            board = await session.get(Board, board_id)
+            assert board is not None
+            board.gateway_id = new_gateway
+            session.add(board)
+            await session.commit()
+
+    try:
+        assert await dispatch.webhook_rate_limit_key(_task(board_id)) == f"gateway:{old_gateway}"
+        await _move_board()
+        # Still routed from the cache until the entry expires...
+        assert await dispatch.webhook_rate_limit_key(_task(board_id)) == f"gateway:{old_gateway}"
+        now[0] += 31.0
+        assert await dispatch.webhook_rate_limit_key(_task(board_id)) == f"gateway:{new_gateway}"
+        # ...and the cache never holds more than its configured size.
+        await dispatch.webhook_rate_limit_key(_task(other_board_id))
+        assert len(dispatch._board_gateway_cache._entries) == 1
+    finally:
+        await engine.dispose()
@@ -28,7 +28,7 @@ import type {
   GatewaySessionMessageRequest,
   GatewaySessionResponse,
   GatewaySessionsResponse,
-  GatewayTemplatesSyncResult,
+  GatewayTemplatesSyncJobRead,
   GatewayUpdate,
   GatewaysStatusApiV1GatewaysStatusGetParams,
   GatewaysStatusResponse,
@@ -41,6 +41,7 @@ import type {
   MainAgentRead,
   OkResponse,
   SendGatewaySessionMessageApiV1GatewaysSessionsSessionIdMessagePostParams,
+  StreamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetParams,
   SyncGatewayTemplatesApiV1GatewaysGatewayIdTemplatesSyncPostParams,
 } from ".././model";
 
@@ -2377,13 +2378,13 @@ export const useDeleteGatewayApiV1GatewaysGatewayIdDelete = <
   );
 };
 /**
- * Sync templates for a gateway and optionally rotate runtime settings.
+ * Queue a template sync for a gateway; poll or stream the returned job.
  * @summary Sync Gateway Templates
  */
-export type syncGatewayTemplatesApiV1GatewaysGatewayIdTemplatesSyncPostResponse200 =
+export type syncGatewayTemplatesApiV1GatewaysGatewayIdTemplatesSyncPostResponse202 =
   {
-    data: GatewayTemplatesSyncResult;
-    status: 200;
+    data: GatewayTemplatesSyncJobRead;
+    status: 202;
   };
 
 export type syncGatewayTemplatesApiV1GatewaysGatewayIdTemplatesSyncPostResponse422 =
@@ -2393,7 +2394,7 @@ export type syncGatewayTemplatesApiV1GatewaysGatewayIdTemplatesSyncPostResponse4
   };
 
 export type syncGatewayTemplatesApiV1GatewaysGatewayIdTemplatesSyncPostResponseSuccess =
-  syncGatewayTemplatesApiV1GatewaysGatewayIdTemplatesSyncPostResponse200 & {
+  syncGatewayTemplatesApiV1GatewaysGatewayIdTemplatesSyncPostResponse202 & {
     headers: Headers;
   };
 export type syncGatewayTemplatesApiV1GatewaysGatewayIdTemplatesSyncPostResponseError =
@@ -2566,3 +2567,791 @@ export const useSyncGatewayTemplatesApiV1GatewaysGatewayIdTemplatesSyncPost = <
     queryClient,
   );
 };
+/**
+ * Return a template sync job's status, progress counters and final result.
+ * @summary Get Gateway Template Sync Job
+ */
+export type getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGetResponse200 =
+  {
+    data: GatewayTemplatesSyncJobRead;
+    status: 200;
+  };
+
+export type getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGetResponse422 =
+  {
+    data: HTTPValidationError;
+    status: 422;
+  };
+
+export type getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGetResponseSuccess =
+  getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGetResponse200 & {
+    headers: Headers;
+  };
+export type getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGetResponseError =
+  getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGetResponse422 & {
+    headers: Headers;
+  };
+
+export type getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGetResponse =
+
+    | getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGetResponseSuccess
+    | getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGetResponseError;
+
+export const getGetGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGetUrl =
+  (gatewayId: string, jobId: string) => {
+    return `/api/v1/gateways/${gatewayId}/templates/sync/jobs/${jobId}`;
+  };
+
+export const getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGet =
+  async (
+    gatewayId: string,
+    jobId: string,
+    options?: RequestInit,
+  ): Promise<getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGetResponse> => {
+    return customFetch<getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGetResponse>(
+      getGetGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGetUrl(
+        gatewayId,
+        jobId,
+      ),
+      {
+        ...options,
+        method: "GET",
+      },
+    );
+  };
+
+export const getGetGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGetQueryKey =
+  (gatewayId: string, jobId: string) => {
+    return [
+      `/api/v1/gateways/${gatewayId}/templates/sync/jobs/${jobId}`,
+    ] as const;
+  };
+
+export const getGetGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGetQueryOptions =
+  <
+    TData = Awaited<
+      ReturnType<
+        typeof getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGet
+      >
+    >,
+    TError = HTTPValidationError,
+  >(
+    gatewayId: string,
+    jobId: string,
+    options?: {
+      query?: Partial<
+        UseQueryOptions<
+          Awaited<
+            ReturnType<
+              typeof getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGet
+            >
+          >,
+          TError,
+          TData
+        >
+      >;
+      request?: SecondParameter<typeof customFetch>;
+    },
+  ) => {
+    const { query: queryOptions, request: requestOptions } = options ?? {};
+
+    const queryKey =
+      queryOptions?.queryKey ??
+      getGetGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGetQueryKey(
+        gatewayId,
+        jobId,
+      );
+
+    const queryFn: QueryFunction<
+      Awaited<
+        ReturnType<
+          typeof getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGet
+        >
+      >
+    > = ({ signal }) =>
+      getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGet(
+        gatewayId,
+        jobId,
+        { signal, ...requestOptions },
+      );
+
+    return {
+      queryKey,
+      queryFn,
+      enabled: !!(gatewayId && jobId),
+      ...queryOptions,
+    } as UseQueryOptions<
+      Awaited<
+        ReturnType<
+          typeof getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGet
+        >
+      >,
+      TError,
+      TData
+    > & { queryKey: DataTag<QueryKey, TData, TError> };
+  };
+
+export type GetGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGetQueryResult =
+  NonNullable<
+    Awaited<
+      ReturnType<
+        typeof getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGet
+      >
+    >
+  >;
+export type GetGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGetQueryError =
+  HTTPValidationError;
+
+export function useGetGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGet<
+  TData = Awaited<
+    ReturnType<
+      typeof getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGet
+    >
+  >,
+  TError = HTTPValidationError,
+>(
+  gatewayId: string,
+  jobId: string,
+  options: {
+    query: Partial<
+      UseQueryOptions<
+        Awaited<
+          ReturnType<
+            typeof getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGet
+          >
+        >,
+        TError,
+        TData
+      >
+    > &
+      Pick<
+        DefinedInitialDataOptions<
+          Awaited<
+            ReturnType<
+              typeof getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGet
+            >
+          >,
+          TError,
+          Awaited<
+            ReturnType<
+              typeof getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGet
+            >
+          >
+        >,
+        "initialData"
+      >;
+    request?: SecondParameter<typeof customFetch>;
+  },
+  queryClient?: QueryClient,
+): DefinedUseQueryResult<TData, TError> & {
+  queryKey: DataTag<QueryKey, TData, TError>;
+};
+export function useGetGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGet<
+  TData = Awaited<
+    ReturnType<
+      typeof getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGet
+    >
+  >,
+  TError = HTTPValidationError,
+>(
+  gatewayId: string,
+  jobId: string,
+  options?: {
+    query?: Partial<
+      UseQueryOptions<
+        Awaited<
+          ReturnType<
+            typeof getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGet
+          >
+        >,
+        TError,
+        TData
+      >
+    > &
+      Pick<
+        UndefinedInitialDataOptions<
+          Awaited<
+            ReturnType<
+              typeof getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGet
+            >
+          >,
+          TError,
+          Awaited<
+            ReturnType<
+              typeof getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGet
+            >
+          >
+        >,
+        "initialData"
+      >;
+    request?: SecondParameter<typeof customFetch>;
+  },
+  queryClient?: QueryClient,
+): UseQueryResult<TData, TError> & {
+  queryKey: DataTag<QueryKey, TData, TError>;
+};
+export function useGetGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGet<
+  TData = Awaited<
+    ReturnType<
+      typeof getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGet
+    >
+  >,
+  TError = HTTPValidationError,
+>(
+  gatewayId: string,
+  jobId: string,
+  options?: {
+    query?: Partial<
+      UseQueryOptions<
+        Awaited<
+          ReturnType<
+            typeof getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGet
+          >
+        >,
+        TError,
+        TData
+      >
+    >;
+    request?: SecondParameter<typeof customFetch>;
+  },
+  queryClient?: QueryClient,
+): UseQueryResult<TData, TError> & {
+  queryKey: DataTag<QueryKey, TData, TError>;
+};
+/**
+ * @summary Get Gateway Template Sync Job
+ */
+
+export function useGetGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGet<
+  TData = Awaited<
+    ReturnType<
+      typeof getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGet
+    >
+  >,
+  TError = HTTPValidationError,
+>(
+  gatewayId: string,
+  jobId: string,
+  options?: {
+    query?: Partial<
+      UseQueryOptions<
+        Awaited<
+          ReturnType<
+            typeof getGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGet
+          >
+        >,
+        TError,
+        TData
+      >
+    >;
+    request?: SecondParameter<typeof customFetch>;
+  },
+  queryClient?: QueryClient,
+): UseQueryResult<TData, TError> & {
+  queryKey: DataTag<QueryKey, TData, TError>;
+} {
+  const queryOptions =
+    getGetGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdGetQueryOptions(
+      gatewayId,
+      jobId,
+      options,
+    );
+
+  const query = useQuery(queryOptions, queryClient) as UseQueryResult<
+    TData,
+    TError
+  > & { queryKey: DataTag<QueryKey, TData, TError> };
+
+  return { ...query, queryKey: queryOptions.queryKey };
+}
+
+/**
+ * Re-queue a failed job; agents it already synced or skipped are not redone.
+ * @summary Resume Gateway Template Sync Job
+ */
+export type resumeGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdResumePostResponse202 =
+  {
+    data: GatewayTemplatesSyncJobRead;
+    status: 202;
+  };
+
+export type resumeGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdResumePostResponse422 =
+  {
+    data: HTTPValidationError;
+    status: 422;
+  };
+
+export type resumeGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdResumePostResponseSuccess =
+  resumeGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdResumePostResponse202 & {
+    headers: Headers;
+  };
+export type resumeGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdResumePostResponseError =
+  resumeGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdResumePostResponse422 & {
+    headers: Headers;
+  };
+
+export type resumeGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdResumePostResponse =
+
+    | resumeGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdResumePostResponseSuccess
+    | resumeGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdResumePostResponseError;
+
+export const getResumeGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdResumePostUrl =
+  (gatewayId: string, jobId: string) => {
+    return `/api/v1/gateways/${gatewayId}/templates/sync/jobs/${jobId}/resume`;
+  };
+
+export const resumeGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdResumePost =
+  async (
+    gatewayId: string,
+    jobId: string,
+    options?: RequestInit,
+  ): Promise<resumeGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdResumePostResponse> => {
+    return customFetch<resumeGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdResumePostResponse>(
+      getResumeGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdResumePostUrl(
+        gatewayId,
+        jobId,
+      ),
+      {
+        ...options,
+        method: "POST",
+      },
+    );
+  };
+
+export const getResumeGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdResumePostMutationOptions =
+  <TError = HTTPValidationError, TContext = unknown>(options?: {
+    mutation?: UseMutationOptions<
+      Awaited<
+        ReturnType<
+          typeof resumeGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdResumePost
+        >
+      >,
+      TError,
+      { gatewayId: string; jobId: string },
+      TContext
+    >;
+    request?: SecondParameter<typeof customFetch>;
+  }): UseMutationOptions<
+    Awaited<
+      ReturnType<
+        typeof resumeGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdResumePost
+      >
+    >,
+    TError,
+    { gatewayId: string; jobId: string },
+    TContext
+  > => {
+    const mutationKey = [
+      "resumeGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdResumePost",
+    ];
+    const { mutation: mutationOptions, request: requestOptions } = options
+      ? options.mutation &&
+        "mutationKey" in options.mutation &&
+        options.mutation.mutationKey
+        ? options
+        : { ...options, mutation: { ...options.mutation, mutationKey } }
+      : { mutation: { mutationKey }, request: undefined };
+
+    const mutationFn: MutationFunction<
+      Awaited<
+        ReturnType<
+          typeof resumeGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdResumePost
+        >
+      >,
+      { gatewayId: string; jobId: string }
+    > = (props) => {
+      const { gatewayId, jobId } = props ?? {};
+
+      return resumeGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdResumePost(
+        gatewayId,
+        jobId,
+        requestOptions,
+      );
+    };
+
+    return { mutationFn, ...mutationOptions };
+  };
+
+export type ResumeGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdResumePostMutationResult =
+  NonNullable<
+    Awaited<
+      ReturnType<
+        typeof resumeGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdResumePost
+      >
+    >
+  >;
+
+export type ResumeGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdResumePostMutationError =
+  HTTPValidationError;
+
+/**
+ * @summary Resume Gateway Template Sync Job
+ */
+export const useResumeGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdResumePost = <
+  TError = HTTPValidationError,
+  TContext = unknown,
+>(
+  options?: {
+    mutation?: UseMutationOptions<
+      Awaited<
+        ReturnType<
+          typeof resumeGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdResumePost
+        >
+      >,
+      TError,
+      { gatewayId: string; jobId: string },
+      TContext
+    >;
+    request?: SecondParameter<typeof customFetch>;
+  },
+  queryClient?: QueryClient,
+): UseMutationResult<
+  Awaited<
+    ReturnType<
+      typeof resumeGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdResumePost
+    >
+  >,
+  TError,
+  { gatewayId: string; jobId: string },
+  TContext
+> => {
+  return useMutation(
+    getResumeGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdResumePostMutationOptions(
+      options,
+    ),
+    queryClient,
+  );
+};
+/**
+ * Stream a job's progress events over server-sent events until it finishes.
+ * @summary Stream Gateway Template Sync Job
+ */
+export type streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetResponse200 =
+  {
+    data: unknown;
+    status: 200;
+  };
+
+export type streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetResponse422 =
+  {
+    data: HTTPValidationError;
+    status: 422;
+  };
+
+export type streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetResponseSuccess =
+  streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetResponse200 & {
+    headers: Headers;
+  };
+export type streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetResponseError =
+  streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetResponse422 & {
+    headers: Headers;
+  };
+
+export type streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetResponse =
+
+    | streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetResponseSuccess
+    | streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetResponseError;
+
+export const getStreamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetUrl =
+  (
+    gatewayId: string,
+    jobId: string,
+    params?: StreamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetParams,
+  ) => {
+    const normalizedParams = new URLSearchParams();
+
+    Object.entries(params || {}).forEach(([key, value]) => {
+      if (value !== undefined) {
+        normalizedParams.append(
+          key,
+          value === null ? "null" : value.toString(),
+        );
+      }
+    });
+
+    const stringifiedParams = normalizedParams.toString();
+
+    return stringifiedParams.length > 0
+      ? `/api/v1/gateways/${gatewayId}/templates/sync/jobs/${jobId}/events?${stringifiedParams}`
+      : `/api/v1/gateways/${gatewayId}/templates/sync/jobs/${jobId}/events`;
+  };
+
+export const streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGet =
+  async (
+    gatewayId: string,
+    jobId: string,
+    params?: StreamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetParams,
+    options?: RequestInit,
+  ): Promise<streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetResponse> => {
+    return customFetch<streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetResponse>(
+      getStreamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetUrl(
+        gatewayId,
+        jobId,
+        params,
+      ),
+      {
+        ...options,
+        method: "GET",
+      },
+    );
+  };
+
+export const getStreamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetQueryKey =
+  (
+    gatewayId: string,
+    jobId: string,
+    params?: StreamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetParams,
+  ) => {
+    return [
+      `/api/v1/gateways/${gatewayId}/templates/sync/jobs/${jobId}/events`,
+      ...(params ? [params] : []),
+    ] as const;
+  };
+
+export const getStreamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetQueryOptions =
+  <
+    TData = Awaited<
+      ReturnType<
+        typeof streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGet
+      >
+    >,
+    TError = HTTPValidationError,
+  >(
+    gatewayId: string,
+    jobId: string,
+    params?: StreamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetParams,
+    options?: {
+      query?: Partial<
+        UseQueryOptions<
+          Awaited<
+            ReturnType<
+              typeof streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGet
+            >
+          >,
+          TError,
+          TData
+        >
+      >;
+      request?: SecondParameter<typeof customFetch>;
+    },
+  ) => {
+    const { query: queryOptions, request: requestOptions } = options ?? {};
+
+    const queryKey =
+      queryOptions?.queryKey ??
+      getStreamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetQueryKey(
+        gatewayId,
+        jobId,
+        params,
+      );
+
+    const queryFn: QueryFunction<
+      Awaited<
+        ReturnType<
+          typeof streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGet
+        >
+      >
+    > = ({ signal }) =>
+      streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGet(
+        gatewayId,
+        jobId,
+        params,
+        { signal, ...requestOptions },
+      );
+
+    return {
+      queryKey,
+      queryFn,
+      enabled: !!(gatewayId && jobId),
+      ...queryOptions,
+    } as UseQueryOptions<
+      Awaited<
+        ReturnType<
+          typeof streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGet
+        >
+      >,
+      TError,
+      TData
+    > & { queryKey: DataTag<QueryKey, TData, TError> };
+  };
+
+export type StreamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetQueryResult =
+  NonNullable<
+    Awaited<
+      ReturnType<
+        typeof streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGet
+      >
+    >
+  >;
+export type StreamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetQueryError =
+  HTTPValidationError;
+
+export function useStreamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGet<
+  TData = Awaited<
+    ReturnType<
+      typeof streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGet
+    >
+  >,
+  TError = HTTPValidationError,
+>(
+  gatewayId: string,
+  jobId: string,
+  params:
+    | undefined
+    | StreamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetParams,
+  options: {
+    query: Partial<
+      UseQueryOptions<
+        Awaited<
+          ReturnType<
+            typeof streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGet
+          >
+        >,
+        TError,
+        TData
+      >
+    > &
+      Pick<
+        DefinedInitialDataOptions<
+          Awaited<
+            ReturnType<
+              typeof streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGet
+            >
+          >,
+          TError,
+          Awaited<
+            ReturnType<
+              typeof streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGet
+            >
+          >
+        >,
+        "initialData"
+      >;
+    request?: SecondParameter<typeof customFetch>;
+  },
+  queryClient?: QueryClient,
+): DefinedUseQueryResult<TData, TError> & {
+  queryKey: DataTag<QueryKey, TData, TError>;
+};
+export function useStreamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGet<
+  TData = Awaited<
+    ReturnType<
+      typeof streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGet
+    >
+  >,
+  TError = HTTPValidationError,
+>(
+  gatewayId: string,
+  jobId: string,
+  params?: StreamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetParams,
+  options?: {
+    query?: Partial<
+      UseQueryOptions<
+        Awaited<
+          ReturnType<
+            typeof streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGet
+          >
+        >,
+        TError,
+        TData
+      >
+    > &
+      Pick<
+        UndefinedInitialDataOptions<
+          Awaited<
+            ReturnType<
+              typeof streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGet
+            >
+          >,
+          TError,
+          Awaited<
+            ReturnType<
+              typeof streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGet
+            >
+          >
+        >,
+        "initialData"
+      >;
+    request?: SecondParameter<typeof customFetch>;
+  },
+  queryClient?: QueryClient,
+): UseQueryResult<TData, TError> & {
+  queryKey: DataTag<QueryKey, TData, TError>;
+};
+export function useStreamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGet<
+  TData = Awaited<
+    ReturnType<
+      typeof streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGet
+    >
+  >,
+  TError = HTTPValidationError,
+>(
+  gatewayId: string,
+  jobId: string,
+  params?: StreamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetParams,
+  options?: {
+    query?: Partial<
+      UseQueryOptions<
+        Awaited<
+          ReturnType<
+            typeof streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGet
+          >
+        >,
+        TError,
+        TData
+      >
+    >;
+    request?: SecondParameter<typeof customFetch>;
+  },
+  queryClient?: QueryClient,
+): UseQueryResult<TData, TError> & {
+  queryKey: DataTag<QueryKey, TData, TError>;
+};
+/**
+ * @summary Stream Gateway Template Sync Job
+ */
+
+export function useStreamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGet<
+  TData = Awaited<
+    ReturnType<
+      typeof streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGet
+    >
+  >,
+  TError = HTTPValidationError,
+>(
+  gatewayId: string,
+  jobId: string,
+  params?: StreamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetParams,
+  options?: {
+    query?: Partial<
+      UseQueryOptions<
+        Awaited<
+          ReturnType<
+            typeof streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGet
+          >
+        >,
+        TError,
+        TData
+      >
+    >;
+    request?: SecondParameter<typeof customFetch>;
+  },
+  queryClient?: QueryClient,
+): UseQueryResult<TData, TError> & {
+  queryKey: DataTag<QueryKey, TData, TError>;
+} {
+  const queryOptions =
+    getStreamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetQueryOptions(
+      gatewayId,
+      jobId,
+      params,
+      options,
+    );
+
+  const query = useQuery(queryOptions, queryClient) as UseQueryResult<
+    TData,
+    TError
+  > & { queryKey: DataTag<QueryKey, TData, TError> };
+
+  return { ...query, queryKey: queryOptions.queryKey };
+}
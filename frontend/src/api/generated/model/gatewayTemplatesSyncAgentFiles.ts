@@ -0,0 +1,17 @@
+/**
+ * Generated by orval v8.3.0 🍺
+ * Do not edit manually.
+ * Mission Control API
+ * OpenAPI spec version: 0.1.0
+ */
+
+/**
+ * Workspace files a template sync wrote to, or left unchanged on, one agent.
+ */
+export interface GatewayTemplatesSyncAgentFiles {
+  agent_id: string;
+  agent_name: string;
+  board_id?: string | null;
+  written?: string[];
+  skipped?: string[];
+}
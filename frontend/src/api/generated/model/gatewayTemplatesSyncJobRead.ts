@@ -0,0 +1,26 @@
+/**
+ * Generated by orval v8.3.0 🍺
+ * Do not edit manually.
+ * Mission Control API
+ * OpenAPI spec version: 0.1.0
+ */
+import type { GatewayTemplatesSyncJobReadStatus } from "./gatewayTemplatesSyncJobReadStatus";
+import type { GatewayTemplatesSyncResult } from "./gatewayTemplatesSyncResult";
+
+/**
+ * Status and progress counters of a queued gateway template sync job.
+ */
+export interface GatewayTemplatesSyncJobRead {
+  id: string;
+  gateway_id: string;
+  status: GatewayTemplatesSyncJobReadStatus;
+  total?: number;
+  done?: number;
+  skipped?: number;
+  failed?: number;
+  runs?: number;
+  error?: string | null;
+  created_at: string;
+  updated_at: string;
+  result?: GatewayTemplatesSyncResult | null;
+}
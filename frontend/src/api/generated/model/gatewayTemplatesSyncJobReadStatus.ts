@@ -0,0 +1,17 @@
+/**
+ * Generated by orval v8.3.0 🍺
+ * Do not edit manually.
+ * Mission Control API
+ * OpenAPI spec version: 0.1.0
+ */
+
+export type GatewayTemplatesSyncJobReadStatus =
+  (typeof GatewayTemplatesSyncJobReadStatus)[keyof typeof GatewayTemplatesSyncJobReadStatus];
+
+export const GatewayTemplatesSyncJobReadStatus = {
+  queued: "queued",
+  running: "running",
+  retrying: "retrying",
+  completed: "completed",
+  failed: "failed",
+} as const;
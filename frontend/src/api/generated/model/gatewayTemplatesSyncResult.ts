@@ -4,6 +4,7 @@
  * Mission Control API
  * OpenAPI spec version: 0.1.0
  */
+import type { GatewayTemplatesSyncAgentFiles } from "./gatewayTemplatesSyncAgentFiles";
 import type { GatewayTemplatesSyncError } from "./gatewayTemplatesSyncError";
 
 /**
@@ -16,5 +17,8 @@ export interface GatewayTemplatesSyncResult {
   agents_updated: number;
   agents_skipped: number;
   main_updated: boolean;
+  files_written?: number;
+  files_skipped?: number;
+  agent_files?: GatewayTemplatesSyncAgentFiles[];
   errors?: GatewayTemplatesSyncError[];
 }
@@ -105,7 +105,10 @@ export * from "./gatewaySessionResponse";
 export * from "./gatewaySessionsResponse";
 export * from "./gatewaysStatusApiV1GatewaysStatusGetParams";
 export * from "./gatewaysStatusResponse";
+export * from "./gatewayTemplatesSyncAgentFiles";
 export * from "./gatewayTemplatesSyncError";
+export * from "./gatewayTemplatesSyncJobRead";
+export * from "./gatewayTemplatesSyncJobReadStatus";
 export * from "./gatewayTemplatesSyncResult";
 export * from "./gatewayUpdate";
 export * from "./getBoardGroupSnapshotApiV1BoardGroupsGroupIdSnapshotGetParams";
@@ -198,6 +201,7 @@ export * from "./streamApprovalsApiV1BoardsBoardIdApprovalsStreamGetParams";
 export * from "./streamBoardGroupMemoryApiV1BoardGroupsGroupIdMemoryStreamGetParams";
 export * from "./streamBoardGroupMemoryForBoardApiV1BoardsBoardIdGroupMemoryStreamGetParams";
 export * from "./streamBoardMemoryApiV1BoardsBoardIdMemoryStreamGetParams";
+export * from "./streamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetParams";
 export * from "./streamTaskCommentFeedApiV1ActivityTaskCommentsStreamGetParams";
 export * from "./streamTasksApiV1BoardsBoardIdTasksStreamGetParams";
 export * from "./syncGatewayTemplatesApiV1GatewaysGatewayIdTemplatesSyncPostParams";
@@ -0,0 +1,14 @@
+/**
+ * Generated by orval v8.3.0 🍺
+ * Do not edit manually.
+ * Mission Control API
+ * OpenAPI spec version: 0.1.0
+ */
+
+export type StreamGatewayTemplateSyncJobApiV1GatewaysGatewayIdTemplatesSyncJobsJobIdEventsGetParams =
+  {
+    /**
+     * @minimum 0
+     */
+    since?: number;
+  };